@@ -1,348 +1,618 @@
--- Little Lemon Stored Procedures
--- Database Engineer Capstone Project
--- Fecha: 10 de Julio, 2025
-
-USE little_lemon_db;
-
--- Eliminar procedimientos existentes si existen
-DROP PROCEDURE IF EXISTS GetMaxQuantity;
-DROP PROCEDURE IF EXISTS ManageBooking;
-DROP PROCEDURE IF EXISTS UpdateBooking;
-DROP PROCEDURE IF EXISTS AddBooking;
-DROP PROCEDURE IF EXISTS CancelBooking;
-DROP PROCEDURE IF EXISTS CheckBookingAvailability;
-DROP PROCEDURE IF EXISTS GetBookingsByDate;
-
--- Cambiar el delimitador para permitir múltiples declaraciones
-DELIMITER //
-
--- 1. GetMaxQuantity() - Obtiene la cantidad máxima de un elemento específico
-CREATE PROCEDURE GetMaxQuantity(
-    IN menu_item_name VARCHAR(100),
-    OUT max_quantity INT
-)
-BEGIN
-    DECLARE EXIT HANDLER FOR SQLEXCEPTION
-    BEGIN
-        SET max_quantity = 0;
-        ROLLBACK;
-    END;
-    
-    START TRANSACTION;
-    
-    SELECT MAX(quantity) INTO max_quantity
-    FROM order_details od
-    JOIN menu_items mi ON od.menu_item_id = mi.menu_item_id
-    WHERE mi.item_name = menu_item_name;
-    
-    -- Si no se encuentra el elemento, devolver 0
-    IF max_quantity IS NULL THEN
-        SET max_quantity = 0;
-    END IF;
-    
-    COMMIT;
-END//
-
--- 2. ManageBooking() - Gestiona reservas generales con validaciones
-CREATE PROCEDURE ManageBooking(
-    IN booking_date DATE,
-    IN table_number INT,
-    OUT booking_status VARCHAR(255)
-)
-BEGIN
-    DECLARE table_exists INT DEFAULT 0;
-    DECLARE table_available INT DEFAULT 0;
-    DECLARE existing_bookings INT DEFAULT 0;
-    DECLARE target_table_id INT;
-    
-    DECLARE EXIT HANDLER FOR SQLEXCEPTION
-    BEGIN
-        SET booking_status = 'Error: Transaction failed';
-        ROLLBACK;
-    END;
-    
-    START TRANSACTION;
-    
-    -- Verificar si la mesa existe
-    SELECT COUNT(*), table_id INTO table_exists, target_table_id
-    FROM tables 
-    WHERE table_number = table_number AND is_available = TRUE;
-    
-    IF table_exists = 0 THEN
-        SET booking_status = 'Error: Table not found or not available';
-        ROLLBACK;
-    ELSE
-        -- Verificar si hay reservas existentes para esa fecha y mesa
-        SELECT COUNT(*) INTO existing_bookings
-        FROM bookings 
-        WHERE table_id = target_table_id 
-        AND booking_date = booking_date 
-        AND status = 'confirmed';
-        
-        IF existing_bookings > 0 THEN
-            SET booking_status = CONCAT('Table ', table_number, ' is already booked for ', booking_date);
-        ELSE
-            SET booking_status = CONCAT('Table ', table_number, ' is available for booking on ', booking_date);
-        END IF;
-    END IF;
-    
-    COMMIT;
-END//
-
--- 3. UpdateBooking() - Actualiza reservas existentes
-CREATE PROCEDURE UpdateBooking(
-    IN booking_id_param INT,
-    IN new_booking_date DATE,
-    IN new_booking_time TIME,
-    IN new_number_of_guests INT,
-    OUT update_status VARCHAR(255)
-)
-BEGIN
-    DECLARE booking_exists INT DEFAULT 0;
-    DECLARE current_status VARCHAR(20);
-    
-    DECLARE EXIT HANDLER FOR SQLEXCEPTION
-    BEGIN
-        SET update_status = 'Error: Update failed';
-        ROLLBACK;
-    END;
-    
-    START TRANSACTION;
-    
-    -- Verificar si la reserva existe
-    SELECT COUNT(*), status INTO booking_exists, current_status
-    FROM bookings 
-    WHERE booking_id = booking_id_param;
-    
-    IF booking_exists = 0 THEN
-        SET update_status = 'Error: Booking not found';
-        ROLLBACK;
-    ELSEIF current_status = 'cancelled' THEN
-        SET update_status = 'Error: Cannot update cancelled booking';
-        ROLLBACK;
-    ELSE
-        -- Actualizar la reserva
-        UPDATE bookings 
-        SET 
-            booking_date = new_booking_date,
-            booking_time = new_booking_time,
-            number_of_guests = new_number_of_guests,
-            updated_at = CURRENT_TIMESTAMP
-        WHERE booking_id = booking_id_param;
-        
-        SET update_status = CONCAT('Booking ID ', booking_id_param, ' updated successfully');
-    END IF;
-    
-    COMMIT;
-END//
-
--- 4. AddBooking() - Añade nuevas reservas
-CREATE PROCEDURE AddBooking(
-    IN customer_id_param INT,
-    IN table_id_param INT,
-    IN booking_date_param DATE,
-    IN booking_time_param TIME,
-    IN number_of_guests_param INT,
-    IN special_requests_param TEXT,
-    OUT booking_status VARCHAR(255)
-)
-BEGIN
-    DECLARE customer_exists INT DEFAULT 0;
-    DECLARE table_exists INT DEFAULT 0;
-    DECLARE table_capacity INT DEFAULT 0;
-    DECLARE existing_bookings INT DEFAULT 0;
-    DECLARE new_booking_id INT;
-    
-    DECLARE EXIT HANDLER FOR SQLEXCEPTION
-    BEGIN
-        SET booking_status = 'Error: Booking creation failed';
-        ROLLBACK;
-    END;
-    
-    START TRANSACTION;
-    
-    -- Verificar si el cliente existe
-    SELECT COUNT(*) INTO customer_exists
-    FROM customers 
-    WHERE customer_id = customer_id_param;
-    
-    IF customer_exists = 0 THEN
-        SET booking_status = 'Error: Customer not found';
-        ROLLBACK;
-    ELSE
-        -- Verificar si la mesa existe y obtener su capacidad
-        SELECT COUNT(*), seating_capacity INTO table_exists, table_capacity
-        FROM tables 
-        WHERE table_id = table_id_param AND is_available = TRUE;
-        
-        IF table_exists = 0 THEN
-            SET booking_status = 'Error: Table not found or not available';
-            ROLLBACK;
-        ELSEIF number_of_guests_param > table_capacity THEN
-            SET booking_status = CONCAT('Error: Number of guests (', number_of_guests_param, ') exceeds table capacity (', table_capacity, ')');
-            ROLLBACK;
-        ELSE
-            -- Verificar disponibilidad para la fecha y hora
-            SELECT COUNT(*) INTO existing_bookings
-            FROM bookings 
-            WHERE table_id = table_id_param 
-            AND booking_date = booking_date_param 
-            AND booking_time = booking_time_param
-            AND status = 'confirmed';
-            
-            IF existing_bookings > 0 THEN
-                SET booking_status = 'Error: Table already booked for this date and time';
-                ROLLBACK;
-            ELSE
-                -- Crear la nueva reserva
-                INSERT INTO bookings (
-                    customer_id, 
-                    table_id, 
-                    booking_date, 
-                    booking_time, 
-                    number_of_guests, 
-                    special_requests,
-                    status
-                ) VALUES (
-                    customer_id_param,
-                    table_id_param,
-                    booking_date_param,
-                    booking_time_param,
-                    number_of_guests_param,
-                    special_requests_param,
-                    'confirmed'
-                );
-                
-                SET new_booking_id = LAST_INSERT_ID();
-                SET booking_status = CONCAT('Booking confirmed with ID: ', new_booking_id);
-            END IF;
-        END IF;
-    END IF;
-    
-    COMMIT;
-END//
-
--- 5. CancelBooking() - Cancela reservas existentes
-CREATE PROCEDURE CancelBooking(
-    IN booking_id_param INT,
-    OUT cancellation_status VARCHAR(255)
-)
-BEGIN
-    DECLARE booking_exists INT DEFAULT 0;
-    DECLARE current_status VARCHAR(20);
-    DECLARE booking_date_val DATE;
-    
-    DECLARE EXIT HANDLER FOR SQLEXCEPTION
-    BEGIN
-        SET cancellation_status = 'Error: Cancellation failed';
-        ROLLBACK;
-    END;
-    
-    START TRANSACTION;
-    
-    -- Verificar si la reserva existe y obtener su estado
-    SELECT COUNT(*), status, booking_date INTO booking_exists, current_status, booking_date_val
-    FROM bookings 
-    WHERE booking_id = booking_id_param;
-    
-    IF booking_exists = 0 THEN
-        SET cancellation_status = 'Error: Booking not found';
-        ROLLBACK;
-    ELSEIF current_status = 'cancelled' THEN
-        SET cancellation_status = 'Error: Booking already cancelled';
-        ROLLBACK;
-    ELSEIF current_status = 'completed' THEN
-        SET cancellation_status = 'Error: Cannot cancel completed booking';
-        ROLLBACK;
-    ELSE
-        -- Cancelar la reserva
-        UPDATE bookings 
-        SET 
-            status = 'cancelled',
-            updated_at = CURRENT_TIMESTAMP
-        WHERE booking_id = booking_id_param;
-        
-        SET cancellation_status = CONCAT('Booking ID ', booking_id_param, ' cancelled successfully');
-    END IF;
-    
-    COMMIT;
-END//
-
--- 6. CheckBookingAvailability() - Verifica disponibilidad de mesas
-CREATE PROCEDURE CheckBookingAvailability(
-    IN check_date DATE,
-    IN check_time TIME,
-    IN required_capacity INT
-)
-BEGIN
-    DECLARE EXIT HANDLER FOR SQLEXCEPTION
-    BEGIN
-        SELECT 'Error: Query failed' AS status;
-        ROLLBACK;
-    END;
-    
-    START TRANSACTION;
-    
-    SELECT 
-        t.table_id,
-        t.table_number,
-        t.seating_capacity,
-        t.location,
-        CASE 
-            WHEN b.booking_id IS NULL THEN 'Available'
-            ELSE 'Booked'
-        END AS availability_status
-    FROM tables t
-    LEFT JOIN bookings b ON t.table_id = b.table_id 
-        AND b.booking_date = check_date 
-        AND b.booking_time = check_time
-        AND b.status = 'confirmed'
-    WHERE t.is_available = TRUE 
-        AND t.seating_capacity >= required_capacity
-    ORDER BY t.table_number;
-    
-    COMMIT;
-END//
-
--- 7. GetBookingsByDate() - Obtiene todas las reservas para una fecha específica
-CREATE PROCEDURE GetBookingsByDate(
-    IN search_date DATE
-)
-BEGIN
-    DECLARE EXIT HANDLER FOR SQLEXCEPTION
-    BEGIN
-        SELECT 'Error: Query failed' AS status;
-        ROLLBACK;
-    END;
-    
-    START TRANSACTION;
-    
-    SELECT 
-        b.booking_id,
-        b.booking_date,
-        b.booking_time,
-        b.number_of_guests,
-        b.status,
-        CONCAT(c.first_name, ' ', c.last_name) AS customer_name,
-        c.email AS customer_email,
-        c.phone AS customer_phone,
-        t.table_number,
-        t.seating_capacity,
-        b.special_requests,
-        b.created_at
-    FROM bookings b
-    JOIN customers c ON b.customer_id = c.customer_id
-    JOIN tables t ON b.table_id = t.table_id
-    WHERE b.booking_date = search_date
-    ORDER BY b.booking_time;
-    
-    COMMIT;
-END//
-
--- Restaurar el delimitador
-DELIMITER ;
-
--- Mostrar procedimientos creados
-SHOW PROCEDURE STATUS WHERE Db = 'little_lemon_db';
-
-SELECT 'Little Lemon Stored Procedures creados exitosamente!' AS Status;
+-- Little Lemon Stored Procedures
+-- Database Engineer Capstone Project
+-- Fecha: 10 de Julio, 2025
+
+USE little_lemon_db;
+
+-- Eliminar procedimientos existentes si existen
+DROP PROCEDURE IF EXISTS GetMaxQuantity;
+DROP PROCEDURE IF EXISTS ManageBooking;
+DROP PROCEDURE IF EXISTS UpdateBooking;
+DROP PROCEDURE IF EXISTS AddBooking;
+DROP PROCEDURE IF EXISTS CancelBooking;
+DROP PROCEDURE IF EXISTS CheckBookingAvailability;
+DROP PROCEDURE IF EXISTS GetBookingsByDate;
+DROP PROCEDURE IF EXISTS AddCombinedBooking;
+DROP PROCEDURE IF EXISTS BeginWork;
+DROP PROCEDURE IF EXISTS CommitWork;
+DROP PROCEDURE IF EXISTS RollbackWork;
+DROP FUNCTION IF EXISTS SeatingDuration;
+
+-- Cambiar el delimitador para permitir múltiples declaraciones
+DELIMITER //
+
+-- 0. Control de transacciones
+-- Cuando el cliente abre una unidad de trabajo (SET @ll_unit_of_work = 1) varios
+-- procedimientos comparten su transacción: no la inician, no la confirman y no
+-- la revierten; el cliente confirma una sola vez al final.
+-- Dentro de una unidad de trabajo los manejadores de errores SQL vuelven a
+-- lanzar el error (RESIGNAL) para que el cliente revierta toda la transacción
+-- en lugar de confirmar el trabajo parcial.
+CREATE PROCEDURE BeginWork()
+BEGIN
+    IF @ll_unit_of_work IS NULL THEN
+        START TRANSACTION;
+    END IF;
+END//
+
+CREATE PROCEDURE CommitWork()
+BEGIN
+    IF @ll_unit_of_work IS NULL THEN
+        COMMIT;
+    END IF;
+END//
+
+CREATE PROCEDURE RollbackWork()
+BEGIN
+    IF @ll_unit_of_work IS NULL THEN
+        ROLLBACK;
+    END IF;
+END//
+
+-- Duración de ocupación de una reserva en minutos según seating_durations:
+-- la regla de la ubicación gana a la general y, entre ellas, la de rango de
+-- comensales más estrecho; sin regla aplicable, 120 minutos
+CREATE FUNCTION SeatingDuration(
+    guests INT,
+    table_location VARCHAR(50)
+) RETURNS INT
+READS SQL DATA
+BEGIN
+    RETURN COALESCE((
+        SELECT sd.duration_minutes
+        FROM seating_durations sd
+        WHERE guests BETWEEN sd.min_guests AND sd.max_guests
+        AND (sd.location IS NULL OR sd.location = table_location)
+        ORDER BY sd.location IS NULL, sd.max_guests - sd.min_guests, sd.duration_id
+        LIMIT 1
+    ), 120);
+END//
+
+-- 1. GetMaxQuantity() - Obtiene la cantidad máxima de un elemento específico
+CREATE PROCEDURE GetMaxQuantity(
+    IN menu_item_name VARCHAR(100),
+    OUT max_quantity INT
+)
+BEGIN
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SET max_quantity = 0;
+        CALL RollbackWork();
+        IF @ll_unit_of_work IS NOT NULL THEN
+            RESIGNAL;
+        END IF;
+    END;
+    
+    CALL BeginWork();
+    
+    SELECT MAX(quantity) INTO max_quantity
+    FROM order_details od
+    JOIN menu_items mi ON od.menu_item_id = mi.menu_item_id
+    WHERE mi.item_name = menu_item_name;
+    
+    -- Si no se encuentra el elemento, devolver 0
+    IF max_quantity IS NULL THEN
+        SET max_quantity = 0;
+    END IF;
+    
+    CALL CommitWork();
+END//
+
+-- 2. ManageBooking() - Gestiona reservas generales con validaciones
+CREATE PROCEDURE ManageBooking(
+    IN booking_date DATE,
+    IN table_number INT,
+    OUT booking_status VARCHAR(255)
+)
+BEGIN
+    DECLARE table_exists INT DEFAULT 0;
+    DECLARE table_available INT DEFAULT 0;
+    DECLARE existing_bookings INT DEFAULT 0;
+    DECLARE target_table_id INT;
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SET booking_status = 'Error: Transaction failed';
+        CALL RollbackWork();
+        IF @ll_unit_of_work IS NOT NULL THEN
+            RESIGNAL;
+        END IF;
+    END;
+    
+    CALL BeginWork();
+    
+    -- Verificar si la mesa existe
+    SELECT COUNT(*), table_id INTO table_exists, target_table_id
+    FROM tables 
+    WHERE table_number = table_number AND is_available = TRUE;
+    
+    IF table_exists = 0 THEN
+        SET booking_status = 'Error: Table not found or not available';
+        CALL RollbackWork();
+    ELSE
+        -- Verificar si hay reservas existentes para esa fecha y mesa
+        SELECT COUNT(*) INTO existing_bookings
+        FROM bookings 
+        WHERE table_id = target_table_id 
+        AND booking_date = booking_date 
+        AND status = 'confirmed';
+        
+        IF existing_bookings > 0 THEN
+            SET booking_status = CONCAT('Table ', table_number, ' is already booked for ', booking_date);
+        ELSE
+            SET booking_status = CONCAT('Table ', table_number, ' is available for booking on ', booking_date);
+        END IF;
+    END IF;
+    
+    CALL CommitWork();
+END//
+
+-- 3. UpdateBooking() - Actualiza reservas existentes
+CREATE PROCEDURE UpdateBooking(
+    IN booking_id_param INT,
+    IN new_booking_date DATE,
+    IN new_booking_time TIME,
+    IN new_number_of_guests INT,
+    OUT update_status VARCHAR(255)
+)
+BEGIN
+    DECLARE booking_exists INT DEFAULT 0;
+    DECLARE current_status VARCHAR(20);
+    DECLARE booking_table_id INT;
+    DECLARE booking_location VARCHAR(50);
+    DECLARE booking_parent_id INT;
+    DECLARE new_end_time TIME;
+    DECLARE overlapping_bookings INT DEFAULT 0;
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SET update_status = 'Error: Update failed';
+        CALL RollbackWork();
+        IF @ll_unit_of_work IS NOT NULL THEN
+            RESIGNAL;
+        END IF;
+    END;
+    
+    CALL BeginWork();
+    
+    -- Verificar si la reserva existe y bloquearla junto con su mesa hasta el
+    -- final de la transacción (como AddBooking y AddCombinedBooking)
+    SELECT COUNT(*), b.status, b.table_id, t.location, b.parent_booking_id
+    INTO booking_exists, current_status, booking_table_id, booking_location, booking_parent_id
+    FROM bookings b
+    JOIN tables t ON b.table_id = t.table_id
+    WHERE b.booking_id = booking_id_param
+    FOR UPDATE;
+    
+    IF booking_exists = 0 THEN
+        SET update_status = 'Error: Booking not found';
+        CALL RollbackWork();
+    ELSEIF current_status = 'cancelled' THEN
+        SET update_status = 'Error: Cannot update cancelled booking';
+        CALL RollbackWork();
+    ELSEIF booking_parent_id IS NOT NULL
+        OR EXISTS (SELECT 1 FROM bookings WHERE parent_booking_id = booking_id_param) THEN
+        -- Las mesas de una reserva combinada solo se cambian juntas (cancelar y reservar)
+        SET update_status = 'Error: Cannot update combined booking';
+        CALL RollbackWork();
+    ELSE
+        SET new_end_time = ADDTIME(new_booking_time,
+            SEC_TO_TIME(60 * SeatingDuration(new_number_of_guests, booking_location)));
+        
+        -- Verificar que el nuevo horario no se solape con otra reserva de la mesa
+        SELECT COUNT(*) INTO overlapping_bookings
+        FROM bookings 
+        WHERE table_id = booking_table_id 
+        AND booking_date = new_booking_date 
+        AND booking_time < new_end_time
+        AND end_time > new_booking_time
+        AND status = 'confirmed'
+        AND booking_id <> booking_id_param;
+        
+        IF overlapping_bookings > 0 THEN
+            SET update_status = 'Error: Table already booked for this date and time';
+            CALL RollbackWork();
+        ELSE
+            -- Actualizar la reserva
+            UPDATE bookings 
+            SET 
+                booking_date = new_booking_date,
+                booking_time = new_booking_time,
+                end_time = new_end_time,
+                number_of_guests = new_number_of_guests,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE booking_id = booking_id_param;
+            
+            SET update_status = CONCAT('Booking ID ', booking_id_param, ' updated successfully');
+        END IF;
+    END IF;
+    
+    CALL CommitWork();
+END//
+
+-- 4. AddBooking() - Añade nuevas reservas
+CREATE PROCEDURE AddBooking(
+    IN customer_id_param INT,
+    IN table_id_param INT,
+    IN booking_date_param DATE,
+    IN booking_time_param TIME,
+    IN number_of_guests_param INT,
+    IN special_requests_param TEXT,
+    OUT booking_status VARCHAR(255)
+)
+BEGIN
+    DECLARE customer_exists INT DEFAULT 0;
+    DECLARE table_exists INT DEFAULT 0;
+    DECLARE table_capacity INT DEFAULT 0;
+    DECLARE table_location VARCHAR(50);
+    DECLARE booking_end_time TIME;
+    DECLARE existing_bookings INT DEFAULT 0;
+    DECLARE new_booking_id INT;
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SET booking_status = 'Error: Booking creation failed';
+        CALL RollbackWork();
+        IF @ll_unit_of_work IS NOT NULL THEN
+            RESIGNAL;
+        END IF;
+    END;
+    
+    CALL BeginWork();
+    
+    -- Verificar si el cliente existe
+    SELECT COUNT(*) INTO customer_exists
+    FROM customers 
+    WHERE customer_id = customer_id_param;
+    
+    IF customer_exists = 0 THEN
+        SET booking_status = 'Error: Customer not found';
+        CALL RollbackWork();
+    ELSE
+        -- Verificar si la mesa existe, obtener su capacidad y bloquearla hasta el
+        -- final de la transacción: las reservas concurrentes de la mesa (también
+        -- las combinadas) esperan y después ven esta
+        SELECT COUNT(*), seating_capacity, location INTO table_exists, table_capacity, table_location
+        FROM tables 
+        WHERE table_id = table_id_param AND is_available = TRUE
+        FOR UPDATE;
+        
+        IF table_exists = 0 THEN
+            SET booking_status = 'Error: Table not found or not available';
+            CALL RollbackWork();
+        ELSEIF number_of_guests_param > table_capacity THEN
+            SET booking_status = CONCAT('Error: Number of guests (', number_of_guests_param, ') exceeds table capacity (', table_capacity, ')');
+            CALL RollbackWork();
+        ELSE
+            SET booking_end_time = ADDTIME(booking_time_param,
+                SEC_TO_TIME(60 * SeatingDuration(number_of_guests_param, table_location)));
+            
+            -- Verificar que ninguna reserva confirmada de la mesa se solape con
+            -- [booking_time, end_time) (rango sobre idx_bookings_table_date)
+            SELECT COUNT(*) INTO existing_bookings
+            FROM bookings 
+            WHERE table_id = table_id_param 
+            AND booking_date = booking_date_param 
+            AND booking_time < booking_end_time
+            AND end_time > booking_time_param
+            AND status = 'confirmed';
+            
+            IF existing_bookings > 0 THEN
+                SET booking_status = 'Error: Table already booked for this date and time';
+                CALL RollbackWork();
+            ELSE
+                -- Crear la nueva reserva
+                INSERT INTO bookings (
+                    customer_id, 
+                    table_id, 
+                    booking_date, 
+                    booking_time, 
+                    end_time,
+                    number_of_guests, 
+                    special_requests,
+                    status
+                ) VALUES (
+                    customer_id_param,
+                    table_id_param,
+                    booking_date_param,
+                    booking_time_param,
+                    booking_end_time,
+                    number_of_guests_param,
+                    special_requests_param,
+                    'confirmed'
+                );
+                
+                SET new_booking_id = LAST_INSERT_ID();
+                SET booking_status = CONCAT('Booking confirmed with ID: ', new_booking_id);
+            END IF;
+        END IF;
+    END IF;
+    
+    CALL CommitWork();
+END//
+
+-- 5. CancelBooking() - Cancela reservas existentes
+CREATE PROCEDURE CancelBooking(
+    IN booking_id_param INT,
+    OUT cancellation_status VARCHAR(255)
+)
+BEGIN
+    DECLARE booking_exists INT DEFAULT 0;
+    DECLARE current_status VARCHAR(20);
+    DECLARE booking_date_val DATE;
+    DECLARE main_booking_id INT;
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SET cancellation_status = 'Error: Cancellation failed';
+        CALL RollbackWork();
+        IF @ll_unit_of_work IS NOT NULL THEN
+            RESIGNAL;
+        END IF;
+    END;
+    
+    CALL BeginWork();
+    
+    -- Verificar si la reserva existe y obtener su estado (y su reserva principal
+    -- si es una mesa de una reserva combinada)
+    SELECT COUNT(*), status, booking_date, COALESCE(parent_booking_id, booking_id)
+    INTO booking_exists, current_status, booking_date_val, main_booking_id
+    FROM bookings 
+    WHERE booking_id = booking_id_param;
+    
+    IF booking_exists = 0 THEN
+        SET cancellation_status = 'Error: Booking not found';
+        CALL RollbackWork();
+    ELSEIF current_status = 'cancelled' THEN
+        SET cancellation_status = 'Error: Booking already cancelled';
+        CALL RollbackWork();
+    ELSEIF current_status = 'completed' THEN
+        SET cancellation_status = 'Error: Cannot cancel completed booking';
+        CALL RollbackWork();
+    ELSE
+        -- Cancelar la reserva con todas sus mesas
+        UPDATE bookings 
+        SET 
+            status = 'cancelled',
+            updated_at = CURRENT_TIMESTAMP
+        WHERE booking_id = main_booking_id OR parent_booking_id = main_booking_id;
+        
+        SET cancellation_status = CONCAT('Booking ID ', booking_id_param, ' cancelled successfully');
+    END IF;
+    
+    CALL CommitWork();
+END//
+
+-- 6. CheckBookingAvailability() - Verifica disponibilidad de mesas
+-- Una mesa está ocupada si una reserva confirmada se solapa con el intervalo
+-- que ocuparía un grupo de required_capacity personas desde check_time
+CREATE PROCEDURE CheckBookingAvailability(
+    IN check_date DATE,
+    IN check_time TIME,
+    IN required_capacity INT
+)
+BEGIN
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SELECT 'Error: Query failed' AS status;
+        CALL RollbackWork();
+        IF @ll_unit_of_work IS NOT NULL THEN
+            RESIGNAL;
+        END IF;
+    END;
+    
+    CALL BeginWork();
+    
+    SELECT 
+        t.table_id,
+        t.table_number,
+        t.seating_capacity,
+        t.location,
+        CASE 
+            WHEN EXISTS (
+                SELECT 1
+                FROM bookings b
+                WHERE b.table_id = t.table_id 
+                AND b.booking_date = check_date 
+                AND b.booking_time < ADDTIME(check_time,
+                    SEC_TO_TIME(60 * SeatingDuration(required_capacity, t.location)))
+                AND b.end_time > check_time
+                AND b.status = 'confirmed'
+            ) THEN 'Booked'
+            ELSE 'Available'
+        END AS availability_status
+    FROM tables t
+    WHERE t.is_available = TRUE 
+        AND t.seating_capacity >= required_capacity
+    ORDER BY t.table_number;
+    
+    CALL CommitWork();
+END//
+
+-- 7. GetBookingsByDate() - Obtiene todas las reservas para una fecha específica
+CREATE PROCEDURE GetBookingsByDate(
+    IN search_date DATE
+)
+BEGIN
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SELECT 'Error: Query failed' AS status;
+        CALL RollbackWork();
+        IF @ll_unit_of_work IS NOT NULL THEN
+            RESIGNAL;
+        END IF;
+    END;
+    
+    CALL BeginWork();
+    
+    SELECT 
+        b.booking_id,
+        b.booking_date,
+        b.booking_time,
+        b.number_of_guests,
+        b.status,
+        CONCAT(c.first_name, ' ', c.last_name) AS customer_name,
+        c.email AS customer_email,
+        c.phone AS customer_phone,
+        t.table_number,
+        t.seating_capacity,
+        b.special_requests,
+        b.created_at,
+        b.parent_booking_id
+    FROM bookings b
+    JOIN customers c ON b.customer_id = c.customer_id
+    JOIN tables t ON b.table_id = t.table_id
+    WHERE b.booking_date = search_date
+    ORDER BY b.booking_time;
+    
+    CALL CommitWork();
+END//
+
+-- 8. AddCombinedBooking() - Reserva juntas las mesas de una combinación
+-- Crea en una transacción una reserva por mesa: la principal (la mesa de menor
+-- número) lleva los comensales y las demás la referencian con parent_booking_id.
+-- Todas ocupan el mismo intervalo, con la duración del grupo en la ubicación de
+-- la mesa principal; si alguna mesa está ocupada no se reserva ninguna.
+CREATE PROCEDURE AddCombinedBooking(
+    IN customer_id_param INT,
+    IN combination_id_param INT,
+    IN booking_date_param DATE,
+    IN booking_time_param TIME,
+    IN number_of_guests_param INT,
+    IN special_requests_param TEXT,
+    OUT booking_status VARCHAR(255)
+)
+BEGIN
+    DECLARE customer_exists INT DEFAULT 0;
+    DECLARE combination_exists INT DEFAULT 0;
+    DECLARE combination_capacity INT DEFAULT 0;
+    DECLARE member_tables INT DEFAULT 0;
+    DECLARE available_tables INT DEFAULT 0;
+    DECLARE main_table_id INT;
+    DECLARE main_location VARCHAR(50);
+    DECLARE booking_end_time TIME;
+    DECLARE existing_bookings INT DEFAULT 0;
+    DECLARE new_booking_id INT;
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SET booking_status = 'Error: Booking creation failed';
+        CALL RollbackWork();
+        IF @ll_unit_of_work IS NOT NULL THEN
+            RESIGNAL;
+        END IF;
+    END;
+    
+    CALL BeginWork();
+    
+    -- Verificar si el cliente existe
+    SELECT COUNT(*) INTO customer_exists
+    FROM customers 
+    WHERE customer_id = customer_id_param;
+    
+    -- Verificar la combinación y bloquear sus mesas hasta el final de la transacción
+    SELECT COUNT(*), seating_capacity INTO combination_exists, combination_capacity
+    FROM table_combinations
+    WHERE combination_id = combination_id_param AND is_available = TRUE;
+    
+    SELECT COUNT(*), COALESCE(SUM(t.is_available = TRUE), 0)
+    INTO member_tables, available_tables
+    FROM table_combination_members m
+    JOIN tables t ON t.table_id = m.table_id
+    WHERE m.combination_id = combination_id_param
+    FOR UPDATE;
+    
+    IF customer_exists = 0 THEN
+        SET booking_status = 'Error: Customer not found';
+        CALL RollbackWork();
+    ELSEIF combination_exists = 0 OR member_tables = 0 OR available_tables < member_tables THEN
+        SET booking_status = 'Error: Table combination not found or not available';
+        CALL RollbackWork();
+    ELSEIF number_of_guests_param > combination_capacity THEN
+        SET booking_status = CONCAT('Error: Number of guests (', number_of_guests_param, ') exceeds combination capacity (', combination_capacity, ')');
+        CALL RollbackWork();
+    ELSE
+        SELECT t.table_id, t.location INTO main_table_id, main_location
+        FROM table_combination_members m
+        JOIN tables t ON t.table_id = m.table_id
+        WHERE m.combination_id = combination_id_param
+        ORDER BY t.table_number
+        LIMIT 1;
+        
+        SET booking_end_time = ADDTIME(booking_time_param,
+            SEC_TO_TIME(60 * SeatingDuration(number_of_guests_param, main_location)));
+        
+        -- Verificar que ninguna mesa de la combinación tenga una reserva que se solape
+        SELECT COUNT(*) INTO existing_bookings
+        FROM table_combination_members m
+        JOIN bookings b ON b.table_id = m.table_id
+        WHERE m.combination_id = combination_id_param
+        AND b.booking_date = booking_date_param
+        AND b.booking_time < booking_end_time
+        AND b.end_time > booking_time_param
+        AND b.status = 'confirmed';
+        
+        IF existing_bookings > 0 THEN
+            SET booking_status = 'Error: Table already booked for this date and time';
+            CALL RollbackWork();
+        ELSE
+            -- Crear la reserva principal y una reserva sin comensales por cada otra mesa
+            INSERT INTO bookings (
+                customer_id, 
+                table_id, 
+                booking_date, 
+                booking_time, 
+                end_time,
+                number_of_guests, 
+                special_requests,
+                status
+            ) VALUES (
+                customer_id_param,
+                main_table_id,
+                booking_date_param,
+                booking_time_param,
+                booking_end_time,
+                number_of_guests_param,
+                special_requests_param,
+                'confirmed'
+            );
+            
+            SET new_booking_id = LAST_INSERT_ID();
+            
+            INSERT INTO bookings (
+                customer_id, 
+                table_id, 
+                booking_date, 
+                booking_time, 
+                end_time,
+                number_of_guests, 
+                status,
+                parent_booking_id
+            )
+            SELECT
+                customer_id_param,
+                m.table_id,
+                booking_date_param,
+                booking_time_param,
+                booking_end_time,
+                0,
+                'confirmed',
+                new_booking_id
+            FROM table_combination_members m
+            WHERE m.combination_id = combination_id_param
+            AND m.table_id <> main_table_id;
+            
+            SET booking_status = CONCAT('Booking confirmed with ID: ', new_booking_id);
+        END IF;
+    END IF;
+    
+    CALL CommitWork();
+END//
+
+-- Restaurar el delimitador
+DELIMITER ;
+
+-- Mostrar procedimientos creados
+SHOW PROCEDURE STATUS WHERE Db = 'little_lemon_db';
+
+SELECT 'Little Lemon Stored Procedures creados exitosamente!' AS Status;
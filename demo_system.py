@@ -1,472 +1,522 @@
-"""
-Little Lemon System Demo Script
-Database Engineer Capstone Project
-Fecha: 10 de Julio, 2025
-
-Este script demuestra todas las funcionalidades del sistema Little Lemon
-"""
-
-import sys
-import os
-from datetime import datetime, date, time, timedelta
-from typing import Dict, List, Any
-import traceback
-
-# Agregar el directorio actual al path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from booking_system import LittleLemonBookingSystem
-from data_analysis import LittleLemonDataAnalyzer
-
-def print_section(title: str):
-    """Imprime una sección con formato"""
-    print("\n" + "="*60)
-    print(f"  {title}")
-    print("="*60)
-
-def print_subsection(title: str):
-    """Imprime una subsección con formato"""
-    print(f"\n--- {title} ---")
-
-def demonstrate_database_procedures():
-    """Demuestra todos los procedimientos almacenados"""
-    print_section("DEMOSTRACIÓN DE PROCEDIMIENTOS ALMACENADOS")
-    
-    try:
-        # Inicializar sistema
-        booking_system = LittleLemonBookingSystem("local")
-        print("✅ Sistema inicializado correctamente")
-        
-        # 1. GetMaxQuantity
-        print_subsection("1. GetMaxQuantity() - Obtener cantidad máxima")
-        items_to_test = ["Chicken Parmigiana", "Spaghetti Carbonara", "Grilled Salmon"]
-        
-        for item in items_to_test:
-            max_qty = booking_system.get_max_quantity(item)
-            print(f"   • {item}: {max_qty} unidades máximas")
-        
-        # 2. ManageBooking
-        print_subsection("2. ManageBooking() - Verificar disponibilidad")
-        test_dates = [
-            (date(2025, 7, 25), 1),
-            (date(2025, 7, 26), 3),
-            (date(2025, 7, 15), 1)  # Fecha con reserva existente
-        ]
-        
-        for test_date, table_num in test_dates:
-            status = booking_system.manage_booking(test_date, table_num)
-            print(f"   • Mesa {table_num} para {test_date}: {status}")
-        
-        # 3. CheckBookingAvailability
-        print_subsection("3. CheckBookingAvailability() - Verificar mesas disponibles")
-        availability = booking_system.check_booking_availability(
-            date(2025, 7, 25), time(19, 0), 4
-        )
-        print(f"   • Mesas disponibles para 4 personas el 2025-07-25 a las 19:00: {len(availability)}")
-        for table in availability[:5]:  # Mostrar solo las primeras 5
-            print(f"     - Mesa {table['table_number']}: {table['availability_status']} (Capacidad: {table['seating_capacity']})")
-        
-        # 4. AddBooking
-        print_subsection("4. AddBooking() - Crear nueva reserva")
-        
-        # Encontrar una mesa disponible
-        available_tables = booking_system.check_booking_availability(
-            date(2025, 7, 25), time(20, 0), 2
-        )
-        
-        if available_tables:
-            table_id = available_tables[0]['table_id']
-            new_booking_status = booking_system.add_booking(
-                customer_id=1,
-                table_id=table_id,
-                booking_date=date(2025, 7, 25),
-                booking_time=time(20, 0),
-                number_of_guests=2,
-                special_requests="Mesa romántica para aniversario"
-            )
-            print(f"   • Nueva reserva: {new_booking_status}")
-        else:
-            print("   • No hay mesas disponibles para la demo")
-        
-        # 5. GetBookingsByDate
-        print_subsection("5. GetBookingsByDate() - Obtener reservas por fecha")
-        bookings_today = booking_system.get_bookings_by_date(date(2025, 7, 15))
-        print(f"   • Reservas para 2025-07-15: {len(bookings_today)}")
-        
-        for booking in bookings_today[:3]:  # Mostrar solo las primeras 3
-            print(f"     - {booking['customer_name']} - Mesa {booking['table_number']} a las {booking['booking_time']} ({booking['status']})")
-        
-        # 6. UpdateBooking (si hay reservas)
-        print_subsection("6. UpdateBooking() - Actualizar reserva")
-        if bookings_today:
-            # Actualizar la primera reserva encontrada
-            booking_id = bookings_today[0]['booking_id']
-            update_status = booking_system.update_booking(
-                booking_id=booking_id,
-                new_booking_date=date(2025, 7, 15),
-                new_booking_time=time(20, 30),
-                new_number_of_guests=4
-            )
-            print(f"   • Actualización de reserva {booking_id}: {update_status}")
-        else:
-            print("   • No hay reservas para actualizar")
-        
-        # 7. CancelBooking
-        print_subsection("7. CancelBooking() - Cancelar reserva")
-        
-        # Crear una reserva temporal para cancelar
-        temp_booking = booking_system.add_booking(
-            customer_id=2,
-            table_id=2,
-            booking_date=date(2025, 7, 30),
-            booking_time=time(18, 0),
-            number_of_guests=3,
-            special_requests="Reserva temporal para demo"
-        )
-        
-        print(f"   • Reserva temporal creada: {temp_booking}")
-        
-        # Extraer ID de la reserva si fue exitosa
-        if "ID:" in temp_booking:
-            temp_booking_id = int(temp_booking.split("ID: ")[1])
-            cancel_status = booking_system.cancel_booking(temp_booking_id)
-            print(f"   • Cancelación: {cancel_status}")
-        
-        print("\n✅ Todos los procedimientos almacenados probados exitosamente!")
-        
-    except Exception as e:
-        print(f"❌ Error en demostración de procedimientos: {e}")
-        traceback.print_exc()
-    
-    finally:
-        if 'booking_system' in locals():
-            booking_system.close_connection()
-
-def demonstrate_data_analysis():
-    """Demuestra el análisis de datos"""
-    print_section("DEMOSTRACIÓN DE ANÁLISIS DE DATOS")
-    
-    try:
-        # Inicializar analizador
-        analyzer = LittleLemonDataAnalyzer("local")
-        print("✅ Analizador de datos inicializado")
-        
-        # 1. Obtener datos de ventas
-        print_subsection("1. Análisis de Ventas")
-        sales_df = analyzer.get_sales_data()
-        print(f"   • Registros de ventas obtenidos: {len(sales_df)}")
-        
-        if not sales_df.empty:
-            # Análisis de rendimiento
-            sales_analysis = analyzer.analyze_sales_performance(sales_df)
-            
-            print(f"   • Ingresos totales: ${sales_analysis.get('total_revenue', 0):,.2f}")
-            print(f"   • Órdenes totales: {sales_analysis.get('total_orders', 0)}")
-            print(f"   • Valor promedio por orden: ${sales_analysis.get('average_order_value', 0):,.2f}")
-            print(f"   • Ganancia total: ${sales_analysis.get('total_profit', 0):,.2f}")
-            print(f"   • Margen de ganancia: {sales_analysis.get('profit_margin', 0):.1f}%")
-            
-            # Top productos
-            top_items = sales_analysis.get('top_selling_items', {})
-            print(f"   • Top 3 productos más vendidos:")
-            for i, (item, qty) in enumerate(list(top_items.items())[:3], 1):
-                print(f"     {i}. {item}: {qty} unidades")
-        
-        # 2. Obtener datos de reservas
-        print_subsection("2. Análisis de Reservas")
-        bookings_df = analyzer.get_booking_data()
-        print(f"   • Registros de reservas obtenidos: {len(bookings_df)}")
-        
-        if not bookings_df.empty:
-            # Análisis de patrones
-            booking_analysis = analyzer.analyze_booking_patterns(bookings_df)
-            
-            print(f"   • Reservas totales: {booking_analysis.get('total_bookings', 0)}")
-            print(f"   • Reservas confirmadas: {booking_analysis.get('confirmed_bookings', 0)}")
-            print(f"   • Tasa de cancelación: {booking_analysis.get('cancellation_rate', 0):.1f}%")
-            print(f"   • Tamaño promedio de grupo: {booking_analysis.get('average_party_size', 0):.1f}")
-            print(f"   • Utilización promedio de capacidad: {booking_analysis.get('average_capacity_utilization', 0):.1f}")
-            
-            # Patrones por día
-            day_bookings = booking_analysis.get('bookings_by_day_of_week', {})
-            print(f"   • Día con más reservas: {max(day_bookings.items(), key=lambda x: x[1]) if day_bookings else 'N/A'}")
-        
-        # 3. Crear visualizaciones
-        print_subsection("3. Generación de Visualizaciones")
-        
-        if not sales_df.empty:
-            analyzer.create_sales_visualizations(sales_df, "demo_charts")
-            print("   • ✅ Visualizaciones de ventas creadas")
-        
-        if not bookings_df.empty:
-            analyzer.create_booking_visualizations(bookings_df, "demo_charts")
-            print("   • ✅ Visualizaciones de reservas creadas")
-        
-        # 4. Exportar datos para Tableau
-        print_subsection("4. Exportación de Datos para Tableau")
-        analyzer.export_data_for_tableau("demo_tableau_data")
-        print("   • ✅ Datos exportados para Tableau")
-        
-        # 5. Generar reporte completo
-        print_subsection("5. Generación de Reporte Completo")
-        report = analyzer.generate_comprehensive_report("demo_reports")
-        
-        if report:
-            print("   • ✅ Reporte completo generado")
-            print(f"   • Fecha de generación: {report['generated_at']}")
-            print(f"   • Registros de ventas: {report['data_summary']['total_sales_records']}")
-            print(f"   • Registros de reservas: {report['data_summary']['total_booking_records']}")
-        
-        print("\n✅ Análisis de datos completado exitosamente!")
-        
-    except Exception as e:
-        print(f"❌ Error en análisis de datos: {e}")
-        traceback.print_exc()
-    
-    finally:
-        if 'analyzer' in locals():
-            analyzer.close_connection()
-
-def demonstrate_business_scenarios():
-    """Demuestra escenarios de negocio reales"""
-    print_section("DEMOSTRACIÓN DE ESCENARIOS DE NEGOCIO")
-    
-    try:
-        booking_system = LittleLemonBookingSystem("local")
-        print("✅ Sistema inicializado para escenarios de negocio")
-        
-        # Escenario 1: Cliente busca mesa para cena romántica
-        print_subsection("Escenario 1: Cena Romántica")
-        
-        # Buscar mesas disponibles para 2 personas
-        romantic_dinner_date = date(2025, 7, 28)
-        romantic_dinner_time = time(19, 30)
-        
-        available_tables = booking_system.check_booking_availability(
-            romantic_dinner_date, romantic_dinner_time, 2
-        )
-        
-        print(f"   • Cliente busca mesa para 2 personas el {romantic_dinner_date} a las {romantic_dinner_time}")
-        print(f"   • Mesas disponibles: {len(available_tables)}")
-        
-        # Seleccionar mesa junto a la ventana si está disponible
-        window_tables = [t for t in available_tables if 'Window' in t.get('location', '')]
-        
-        if window_tables:
-            selected_table = window_tables[0]
-            print(f"   • Mesa seleccionada: Mesa {selected_table['table_number']} (Ventana)")
-            
-            # Crear reserva
-            booking_result = booking_system.add_booking(
-                customer_id=3,
-                table_id=selected_table['table_id'],
-                booking_date=romantic_dinner_date,
-                booking_time=romantic_dinner_time,
-                number_of_guests=2,
-                special_requests="Mesa romántica junto a la ventana, velas si es posible"
-            )
-            print(f"   • Resultado de reserva: {booking_result}")
-        
-        # Escenario 2: Evento corporativo
-        print_subsection("Escenario 2: Evento Corporativo")
-        
-        corporate_date = date(2025, 7, 29)
-        corporate_time = time(18, 0)
-        
-        # Buscar mesas para grupo grande
-        large_tables = booking_system.check_booking_availability(
-            corporate_date, corporate_time, 8
-        )
-        
-        print(f"   • Empresa busca mesa para 8 personas el {corporate_date} a las {corporate_time}")
-        print(f"   • Mesas disponibles para grupo grande: {len(large_tables)}")
-        
-        if large_tables:
-            corporate_table = large_tables[0]
-            print(f"   • Mesa seleccionada: Mesa {corporate_table['table_number']} (Capacidad: {corporate_table['seating_capacity']})")
-            
-            # Crear reserva corporativa
-            corporate_booking = booking_system.add_booking(
-                customer_id=4,
-                table_id=corporate_table['table_id'],
-                booking_date=corporate_date,
-                booking_time=corporate_time,
-                number_of_guests=8,
-                special_requests="Evento corporativo, necesitamos proyector y menú especial"
-            )
-            print(f"   • Resultado de reserva: {corporate_booking}")
-        
-        # Escenario 3: Gestión de cancelaciones
-        print_subsection("Escenario 3: Gestión de Cancelaciones")
-        
-        # Obtener reservas para hoy
-        today_bookings = booking_system.get_bookings_by_date(date.today())
-        print(f"   • Reservas para hoy: {len(today_bookings)}")
-        
-        # Simular cancelación
-        if today_bookings:
-            # Buscar una reserva confirmada para cancelar
-            confirmed_bookings = [b for b in today_bookings if b['status'] == 'confirmed']
-            
-            if confirmed_bookings:
-                booking_to_cancel = confirmed_bookings[0]
-                print(f"   • Procesando cancelación para {booking_to_cancel['customer_name']}")
-                
-                # Cancelar reserva
-                cancel_result = booking_system.cancel_booking(booking_to_cancel['booking_id'])
-                print(f"   • Resultado de cancelación: {cancel_result}")
-                
-                # Verificar disponibilidad después de cancelación
-                freed_table = booking_to_cancel['table_number']
-                print(f"   • Mesa {freed_table} ahora disponible para otros clientes")
-        
-        # Escenario 4: Análisis de ocupación
-        print_subsection("Escenario 4: Análisis de Ocupación")
-        
-        # Generar reporte de ocupación para fecha específica
-        analysis_date = date(2025, 7, 15)
-        daily_report = booking_system.generate_daily_report(analysis_date)
-        
-        print(f"   • Reporte de ocupación para {analysis_date}:")
-        print(f"     - Total de reservas: {daily_report['total_bookings']}")
-        print(f"     - Reservas confirmadas: {daily_report['confirmed_bookings']}")
-        print(f"     - Reservas canceladas: {daily_report['cancelled_bookings']}")
-        print(f"     - Tasa de ocupación: {daily_report['occupancy_rate']:.1f}%")
-        print(f"     - Mesas reservadas: {daily_report['tables_booked']}/{daily_report['total_tables']}")
-        
-        # Escenario 5: Análisis de productos populares
-        print_subsection("Escenario 5: Análisis de Productos Populares")
-        
-        # Analizar qué productos son más populares
-        popular_items = ["Chicken Parmigiana", "Spaghetti Carbonara", "Grilled Salmon", "Margherita Pizza"]
-        
-        print("   • Análisis de popularidad de productos:")
-        for item in popular_items:
-            max_qty = booking_system.get_max_quantity(item)
-            print(f"     - {item}: {max_qty} unidades máximas en una orden")
-        
-        print("\n✅ Escenarios de negocio completados exitosamente!")
-        
-    except Exception as e:
-        print(f"❌ Error en escenarios de negocio: {e}")
-        traceback.print_exc()
-    
-    finally:
-        if 'booking_system' in locals():
-            booking_system.close_connection()
-
-def demonstrate_system_integration():
-    """Demuestra la integración completa del sistema"""
-    print_section("DEMOSTRACIÓN DE INTEGRACIÓN COMPLETA")
-    
-    try:
-        # 1. Información del sistema
-        print_subsection("1. Información del Sistema")
-        print("   • Base de datos: little_lemon_db")
-        print("   • Tablas principales: customers, bookings, orders, menu_items")
-        print("   • Procedimientos almacenados: 5 implementados")
-        print("   • Vistas: 3 para análisis")
-        print("   • Conexión Python: Pool de conexiones optimizado")
-        
-        # 2. Verificar conectividad
-        print_subsection("2. Verificación de Conectividad")
-        
-        booking_system = LittleLemonBookingSystem("local")
-        print("   • ✅ Conexión a base de datos establecida")
-        
-        # Verificar tablas principales
-        customers = booking_system.get_customer_info(1)
-        menu_items = booking_system.get_menu_items()
-        tables_info = booking_system.get_tables_info()
-        
-        print(f"   • ✅ Clientes en sistema: {customers is not None}")
-        print(f"   • ✅ Elementos del menú: {len(menu_items)}")
-        print(f"   • ✅ Mesas disponibles: {len(tables_info)}")
-        
-        # 3. Prueba de integridad
-        print_subsection("3. Prueba de Integridad de Datos")
-        
-        # Verificar integridad referencial
-        bookings_today = booking_system.get_bookings_by_date(date.today())
-        valid_bookings = 0
-        
-        for booking in bookings_today:
-            customer = booking_system.get_customer_info(booking.get('customer_id', 0))
-            if customer:
-                valid_bookings += 1
-        
-        print(f"   • Reservas con integridad referencial: {valid_bookings}/{len(bookings_today)}")
-        
-        # 4. Rendimiento del sistema
-        print_subsection("4. Análisis de Rendimiento")
-        
-        start_time = datetime.now()
-        
-        # Ejecutar varias operaciones
-        for i in range(5):
-            booking_system.check_booking_availability(date.today(), time(19, 0), 2)
-            booking_system.get_max_quantity("Chicken Parmigiana")
-        
-        end_time = datetime.now()
-        execution_time = (end_time - start_time).total_seconds()
-        
-        print(f"   • Tiempo de ejecución (10 operaciones): {execution_time:.3f} segundos")
-        print(f"   • Promedio por operación: {execution_time/10:.3f} segundos")
-        
-        # 5. Capacidades de escalamiento
-        print_subsection("5. Capacidades de Escalamiento")
-        
-        print("   • Pool de conexiones: 5 conexiones simultáneas")
-        print("   • Índices optimizados: 9 índices principales")
-        print("   • Vistas materializadas: 3 vistas para análisis")
-        print("   • Procedimientos almacenados: Lógica de negocio en BD")
-        
-        print("\n✅ Integración completa del sistema verificada!")
-        
-    except Exception as e:
-        print(f"❌ Error en integración del sistema: {e}")
-        traceback.print_exc()
-    
-    finally:
-        if 'booking_system' in locals():
-            booking_system.close_connection()
-
-def main():
-    """Función principal de demostración"""
-    print("🍋 LITTLE LEMON DATABASE SYSTEM DEMO")
-    print("Database Engineer Capstone Project")
-    print("Meta/Coursera - 2025")
-    print("="*60)
-    
-    try:
-        # Ejecutar todas las demostraciones
-        demonstrate_database_procedures()
-        demonstrate_data_analysis()
-        demonstrate_business_scenarios()
-        demonstrate_system_integration()
-        
-        print_section("RESUMEN FINAL")
-        print("✅ Todos los procedimientos almacenados funcionan correctamente")
-        print("✅ Sistema de reservas completamente operativo")
-        print("✅ Análisis de datos implementado")
-        print("✅ Integración con Python exitosa")
-        print("✅ Exportación para Tableau completada")
-        print("✅ Escenarios de negocio validados")
-        print("✅ Sistema listo para producción")
-        
-        print("\n🎉 DEMOSTRACIÓN COMPLETADA EXITOSAMENTE 🎉")
-        print("\nEl sistema Little Lemon está listo para:")
-        print("• Gestionar reservas de restaurante")
-        print("• Procesar pedidos de clientes")
-        print("• Generar análisis de datos")
-        print("• Crear reportes en Tableau")
-        print("• Manejar operaciones diarias")
-        
-    except Exception as e:
-        print(f"\n❌ Error en demostración principal: {e}")
-        traceback.print_exc()
-    
-    print(f"\n📅 Demostración completada el {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-if __name__ == "__main__":
-    main()
+"""
+Little Lemon System Demo Script
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Este script demuestra todas las funcionalidades del sistema Little Lemon
+"""
+
+import sys
+import os
+from datetime import datetime, date, time, timedelta
+from typing import Dict, List, Any
+import traceback
+
+# Agregar el directorio actual al path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from booking_system import LittleLemonBookingSystem
+from data_analysis import LittleLemonDataAnalyzer
+from logging_config import configure_logging
+
+def print_section(title: str):
+    """Imprime una sección con formato"""
+    print("\n" + "="*60)
+    print(f"  {title}")
+    print("="*60)
+
+def print_subsection(title: str):
+    """Imprime una subsección con formato"""
+    print(f"\n--- {title} ---")
+
+def demonstrate_database_procedures():
+    """Demuestra todos los procedimientos almacenados"""
+    print_section("DEMOSTRACIÓN DE PROCEDIMIENTOS ALMACENADOS")
+    
+    try:
+        # Inicializar sistema
+        booking_system = LittleLemonBookingSystem("local")
+        print("✅ Sistema inicializado correctamente")
+        
+        # 1. GetMaxQuantity
+        print_subsection("1. GetMaxQuantity() - Obtener cantidad máxima")
+        items_to_test = ["Chicken Parmigiana", "Spaghetti Carbonara", "Grilled Salmon"]
+        
+        for item in items_to_test:
+            max_qty = booking_system.get_max_quantity(item)
+            print(f"   • {item}: {max_qty} unidades máximas")
+        
+        # 2. ManageBooking
+        print_subsection("2. ManageBooking() - Verificar disponibilidad")
+        test_dates = [
+            (date(2025, 7, 25), 1),
+            (date(2025, 7, 26), 3),
+            (date(2025, 7, 15), 1)  # Fecha con reserva existente
+        ]
+        
+        for test_date, table_num in test_dates:
+            status = booking_system.manage_booking(test_date, table_num)
+            print(f"   • Mesa {table_num} para {test_date}: {status}")
+        
+        # 3. CheckBookingAvailability
+        print_subsection("3. CheckBookingAvailability() - Verificar mesas disponibles")
+        availability = booking_system.check_booking_availability(
+            date(2025, 7, 25), time(19, 0), 4
+        )
+        print(f"   • Mesas disponibles para 4 personas el 2025-07-25 a las 19:00: {len(availability)}")
+        for table in availability[:5]:  # Mostrar solo las primeras 5
+            print(f"     - Mesa {table['table_number']}: {table['availability_status']} (Capacidad: {table['seating_capacity']})")
+        
+        # 4. AddBooking
+        print_subsection("4. AddBooking() - Crear nueva reserva")
+        
+        # Encontrar una mesa disponible
+        available_tables = booking_system.check_booking_availability(
+            date(2025, 7, 25), time(20, 0), 2
+        )
+        
+        if available_tables:
+            table_id = available_tables[0]['table_id']
+            new_booking_status = booking_system.add_booking(
+                customer_id=1,
+                table_id=table_id,
+                booking_date=date(2025, 7, 25),
+                booking_time=time(20, 0),
+                number_of_guests=2,
+                special_requests="Mesa romántica para aniversario"
+            )
+            print(f"   • Nueva reserva: {new_booking_status}")
+        else:
+            print("   • No hay mesas disponibles para la demo")
+        
+        # 5. GetBookingsByDate
+        print_subsection("5. GetBookingsByDate() - Obtener reservas por fecha")
+        bookings_today = booking_system.get_bookings_by_date(date(2025, 7, 15))
+        print(f"   • Reservas para 2025-07-15: {len(bookings_today)}")
+        
+        for booking in bookings_today[:3]:  # Mostrar solo las primeras 3
+            print(f"     - {booking['customer_name']} - Mesa {booking['table_number']} a las {booking['booking_time']} ({booking['status']})")
+        
+        # 6. UpdateBooking (si hay reservas)
+        print_subsection("6. UpdateBooking() - Actualizar reserva")
+        if bookings_today:
+            # Actualizar la primera reserva encontrada
+            booking_id = bookings_today[0]['booking_id']
+            update_status = booking_system.update_booking(
+                booking_id=booking_id,
+                new_booking_date=date(2025, 7, 15),
+                new_booking_time=time(20, 30),
+                new_number_of_guests=4
+            )
+            print(f"   • Actualización de reserva {booking_id}: {update_status}")
+        else:
+            print("   • No hay reservas para actualizar")
+        
+        # 7. CancelBooking
+        print_subsection("7. CancelBooking() - Cancelar reserva")
+        
+        # Crear una reserva temporal para cancelar
+        temp_booking = booking_system.add_booking(
+            customer_id=2,
+            table_id=2,
+            booking_date=date(2025, 7, 30),
+            booking_time=time(18, 0),
+            number_of_guests=3,
+            special_requests="Reserva temporal para demo"
+        )
+        
+        print(f"   • Reserva temporal creada: {temp_booking}")
+        
+        # Extraer ID de la reserva si fue exitosa
+        if "ID:" in temp_booking:
+            temp_booking_id = int(temp_booking.split("ID: ")[1])
+            cancel_status = booking_system.cancel_booking(temp_booking_id)
+            print(f"   • Cancelación: {cancel_status}")
+        
+        print("\n✅ Todos los procedimientos almacenados probados exitosamente!")
+        
+    except Exception as e:
+        print(f"❌ Error en demostración de procedimientos: {e}")
+        traceback.print_exc()
+    
+    finally:
+        if 'booking_system' in locals():
+            booking_system.close_connection()
+
+def demonstrate_data_analysis():
+    """Demuestra el análisis de datos"""
+    print_section("DEMOSTRACIÓN DE ANÁLISIS DE DATOS")
+    
+    try:
+        # Inicializar analizador
+        analyzer = LittleLemonDataAnalyzer("local")
+        print("✅ Analizador de datos inicializado")
+        
+        # 1. Obtener datos de ventas
+        print_subsection("1. Análisis de Ventas")
+        sales_df = analyzer.get_sales_data()
+        print(f"   • Registros de ventas obtenidos: {len(sales_df)}")
+        
+        if not sales_df.empty:
+            # Análisis de rendimiento
+            sales_analysis = analyzer.analyze_sales_performance(sales_df)
+            
+            print(f"   • Ingresos totales: ${sales_analysis.get('total_revenue', 0):,.2f}")
+            print(f"   • Órdenes totales: {sales_analysis.get('total_orders', 0)}")
+            print(f"   • Valor promedio por orden: ${sales_analysis.get('average_order_value', 0):,.2f}")
+            print(f"   • Ganancia total: ${sales_analysis.get('total_profit', 0):,.2f}")
+            print(f"   • Margen de ganancia: {sales_analysis.get('profit_margin', 0):.1f}%")
+            
+            # Top productos
+            top_items = sales_analysis.get('top_selling_items', {})
+            print(f"   • Top 3 productos más vendidos:")
+            for i, (item, qty) in enumerate(list(top_items.items())[:3], 1):
+                print(f"     {i}. {item}: {qty} unidades")
+        
+        # 2. Obtener datos de reservas
+        print_subsection("2. Análisis de Reservas")
+        bookings_df = analyzer.get_booking_data()
+        print(f"   • Registros de reservas obtenidos: {len(bookings_df)}")
+        
+        if not bookings_df.empty:
+            # Análisis de patrones
+            booking_analysis = analyzer.analyze_booking_patterns(bookings_df)
+            
+            print(f"   • Reservas totales: {booking_analysis.get('total_bookings', 0)}")
+            print(f"   • Reservas confirmadas: {booking_analysis.get('confirmed_bookings', 0)}")
+            print(f"   • Tasa de cancelación: {booking_analysis.get('cancellation_rate', 0):.1f}%")
+            print(f"   • Tamaño promedio de grupo: {booking_analysis.get('average_party_size', 0):.1f}")
+            print(f"   • Utilización promedio de capacidad: {booking_analysis.get('average_capacity_utilization', 0):.1f}")
+            
+            # Patrones por día
+            day_bookings = booking_analysis.get('bookings_by_day_of_week', {})
+            print(f"   • Día con más reservas: {max(day_bookings.items(), key=lambda x: x[1]) if day_bookings else 'N/A'}")
+        
+        # 3. Crear visualizaciones
+        print_subsection("3. Generación de Visualizaciones")
+        
+        if not sales_df.empty:
+            analyzer.create_sales_visualizations(sales_df, "demo_charts")
+            print("   • ✅ Visualizaciones de ventas creadas")
+        
+        if not bookings_df.empty:
+            analyzer.create_booking_visualizations(bookings_df, "demo_charts")
+            print("   • ✅ Visualizaciones de reservas creadas")
+        
+        # 4. Exportar datos para Tableau
+        print_subsection("4. Exportación de Datos para Tableau")
+        analyzer.export_data_for_tableau("demo_tableau_data")
+        print("   • ✅ Datos exportados para Tableau")
+        
+        # 5. Generar reporte completo
+        print_subsection("5. Generación de Reporte Completo")
+        report = analyzer.generate_comprehensive_report("demo_reports")
+        
+        if report:
+            print("   • ✅ Reporte completo generado")
+            print(f"   • Fecha de generación: {report['generated_at']}")
+            print(f"   • Registros de ventas: {report['data_summary']['total_sales_records']}")
+            print(f"   • Registros de reservas: {report['data_summary']['total_booking_records']}")
+        
+        print("\n✅ Análisis de datos completado exitosamente!")
+        
+    except Exception as e:
+        print(f"❌ Error en análisis de datos: {e}")
+        traceback.print_exc()
+    
+    finally:
+        if 'analyzer' in locals():
+            analyzer.close_connection()
+
+def demonstrate_business_scenarios():
+    """Demuestra escenarios de negocio reales"""
+    print_section("DEMOSTRACIÓN DE ESCENARIOS DE NEGOCIO")
+    
+    try:
+        booking_system = LittleLemonBookingSystem("local")
+        print("✅ Sistema inicializado para escenarios de negocio")
+        
+        # Escenario 1: Cliente busca mesa para cena romántica
+        print_subsection("Escenario 1: Cena Romántica")
+        
+        # Buscar mesas disponibles para 2 personas
+        romantic_dinner_date = date(2025, 7, 28)
+        romantic_dinner_time = time(19, 30)
+        
+        available_tables = booking_system.check_booking_availability(
+            romantic_dinner_date, romantic_dinner_time, 2
+        )
+        
+        print(f"   • Cliente busca mesa para 2 personas el {romantic_dinner_date} a las {romantic_dinner_time}")
+        print(f"   • Mesas disponibles: {len(available_tables)}")
+        
+        # Mesa libre más pequeña junto a la ventana (u otra si no queda ninguna)
+        selected_table = booking_system.assign_table(
+            romantic_dinner_date, romantic_dinner_time, 2, preferred_location="Window"
+        )
+        
+        if selected_table:
+            print(f"   • Mesa seleccionada: Mesa {selected_table['table_number']} ({selected_table['location']})")
+            
+            # Crear reserva
+            booking_result = booking_system.add_booking(
+                customer_id=3,
+                table_id=selected_table['table_id'],
+                booking_date=romantic_dinner_date,
+                booking_time=romantic_dinner_time,
+                number_of_guests=2,
+                special_requests="Mesa romántica junto a la ventana, velas si es posible"
+            )
+            print(f"   • Resultado de reserva: {booking_result}")
+        
+        # Escenario 2: Evento corporativo
+        print_subsection("Escenario 2: Evento Corporativo")
+        
+        corporate_date = date(2025, 7, 29)
+        corporate_time = time(18, 0)
+        
+        # Buscar mesas para grupo grande
+        large_tables = booking_system.check_booking_availability(
+            corporate_date, corporate_time, 8
+        )
+        
+        print(f"   • Empresa busca mesa para 8 personas el {corporate_date} a las {corporate_time}")
+        print(f"   • Mesas disponibles para grupo grande: {len(large_tables)}")
+        
+        # Mesa libre más pequeña con capacidad para el grupo
+        corporate_table = booking_system.assign_table(corporate_date, corporate_time, 8)
+        
+        if corporate_table:
+            print(f"   • Mesa seleccionada: Mesa {corporate_table['table_number']} (Capacidad: {corporate_table['seating_capacity']})")
+            
+            # Crear reserva corporativa
+            corporate_booking = booking_system.add_booking(
+                customer_id=4,
+                table_id=corporate_table['table_id'],
+                booking_date=corporate_date,
+                booking_time=corporate_time,
+                number_of_guests=8,
+                special_requests="Evento corporativo, necesitamos proyector y menú especial"
+            )
+            print(f"   • Resultado de reserva: {corporate_booking}")
+        
+        # Escenario 3: Gestión de cancelaciones
+        print_subsection("Escenario 3: Gestión de Cancelaciones")
+        
+        # Obtener reservas para hoy
+        today_bookings = booking_system.get_bookings_by_date(date.today())
+        print(f"   • Reservas para hoy: {len(today_bookings)}")
+        
+        # Simular cancelación
+        if today_bookings:
+            # Buscar una reserva confirmada para cancelar
+            confirmed_bookings = [b for b in today_bookings if b['status'] == 'confirmed']
+            
+            if confirmed_bookings:
+                booking_to_cancel = confirmed_bookings[0]
+                print(f"   • Procesando cancelación para {booking_to_cancel['customer_name']}")
+                
+                # Cancelar reserva
+                cancel_result = booking_system.cancel_booking(booking_to_cancel['booking_id'])
+                print(f"   • Resultado de cancelación: {cancel_result}")
+                
+                # Verificar disponibilidad después de cancelación
+                freed_table = booking_to_cancel['table_number']
+                print(f"   • Mesa {freed_table} ahora disponible para otros clientes")
+        
+        # Escenario 4: Análisis de ocupación
+        print_subsection("Escenario 4: Análisis de Ocupación")
+        
+        # Generar reporte de ocupación para fecha específica
+        analysis_date = date(2025, 7, 15)
+        daily_report = booking_system.generate_daily_report(analysis_date)
+        
+        print(f"   • Reporte de ocupación para {analysis_date}:")
+        print(f"     - Total de reservas: {daily_report['total_bookings']}")
+        print(f"     - Reservas confirmadas: {daily_report['confirmed_bookings']}")
+        print(f"     - Reservas canceladas: {daily_report['cancelled_bookings']}")
+        print(f"     - Tasa de ocupación: {daily_report['occupancy_rate']:.1f}%")
+        print(f"     - Mesas reservadas: {daily_report['tables_booked']}/{daily_report['total_tables']}")
+        
+        # Escenario 5: Análisis de productos populares
+        print_subsection("Escenario 5: Análisis de Productos Populares")
+        
+        # Analizar qué productos son más populares
+        popular_items = ["Chicken Parmigiana", "Spaghetti Carbonara", "Grilled Salmon", "Margherita Pizza"]
+        
+        print("   • Análisis de popularidad de productos:")
+        for item in popular_items:
+            max_qty = booking_system.get_max_quantity(item)
+            print(f"     - {item}: {max_qty} unidades máximas en una orden")
+        
+        print("\n✅ Escenarios de negocio completados exitosamente!")
+        
+    except Exception as e:
+        print(f"❌ Error en escenarios de negocio: {e}")
+        traceback.print_exc()
+    
+    finally:
+        if 'booking_system' in locals():
+            booking_system.close_connection()
+
+def demonstrate_system_integration():
+    """Demuestra la integración completa del sistema"""
+    print_section("DEMOSTRACIÓN DE INTEGRACIÓN COMPLETA")
+    
+    try:
+        # 1. Información del sistema
+        print_subsection("1. Información del Sistema")
+        print("   • Base de datos: little_lemon_db")
+        print("   • Tablas principales: customers, bookings, orders, menu_items")
+        print("   • Procedimientos almacenados: 5 implementados")
+        print("   • Vistas: 3 para análisis")
+        print("   • Conexión Python: Pool de conexiones optimizado")
+        
+        # 2. Verificar conectividad
+        print_subsection("2. Verificación de Conectividad")
+        
+        booking_system = LittleLemonBookingSystem("local", verify_connection=True)
+        print("   • ✅ Conexión a base de datos establecida")
+        
+        # Verificar tablas principales
+        customers = booking_system.get_customer_info(1)
+        menu_items = booking_system.get_menu_items()
+        tables_info = booking_system.get_tables_info()
+        
+        print(f"   • ✅ Clientes en sistema: {customers is not None}")
+        print(f"   • ✅ Elementos del menú: {len(menu_items)}")
+        print(f"   • ✅ Mesas disponibles: {len(tables_info)}")
+        
+        # 3. Prueba de integridad
+        print_subsection("3. Prueba de Integridad de Datos")
+        
+        # Verificar integridad referencial
+        bookings_today = booking_system.get_bookings_by_date(date.today())
+        valid_bookings = 0
+        
+        for booking in bookings_today:
+            customer = booking_system.get_customer_info(booking.get('customer_id', 0))
+            if customer:
+                valid_bookings += 1
+        
+        print(f"   • Reservas con integridad referencial: {valid_bookings}/{len(bookings_today)}")
+        
+        # Una llamada fallida dentro de una transacción no deja nada confirmado
+        check_date = date.today() + timedelta(days=365)
+        bookings_before = len(booking_system.get_bookings_by_date(check_date))
+        try:
+            with booking_system.transaction():
+                booking_system.add_booking(1, 1, check_date, time(19, 0), 2)
+                booking_system.add_booking(1, 2, check_date, time(19, 0), None)
+            print("   • ❌ La transacción con una llamada fallida se confirmó")
+        except Exception as e:
+            bookings_after = len(booking_system.get_bookings_by_date(check_date))
+            status = "✅" if bookings_after == bookings_before else "❌"
+            print(f"   • {status} Transacción revertida tras el error ({e}): "
+                  f"{bookings_after - bookings_before} reservas confirmadas")
+        
+        # Un estado de error no revierte la transacción: se convierte en excepción
+        try:
+            with booking_system.transaction():
+                for status in (booking_system.add_booking(1, 1, check_date, time(19, 0), 2),
+                               booking_system.add_booking(2, 1, check_date, time(19, 0), 2)):
+                    if status.startswith("Error"):
+                        raise RuntimeError(status)
+            print("   • ❌ La transacción con una reserva rechazada se confirmó")
+        except RuntimeError as e:
+            bookings_after = len(booking_system.get_bookings_by_date(check_date))
+            status = "✅" if bookings_after == bookings_before else "❌"
+            print(f"   • {status} Transacción revertida tras el estado \"{e}\": "
+                  f"{bookings_after - bookings_before} reservas confirmadas")
+        
+        # 4. Rendimiento del sistema
+        print_subsection("4. Análisis de Rendimiento")
+        
+        start_time = datetime.now()
+        
+        # Ejecutar varias operaciones
+        for i in range(5):
+            booking_system.check_booking_availability(date.today(), time(19, 0), 2)
+            booking_system.get_max_quantity("Chicken Parmigiana")
+        
+        end_time = datetime.now()
+        execution_time = (end_time - start_time).total_seconds()
+        
+        print(f"   • Tiempo de ejecución (10 operaciones): {execution_time:.3f} segundos")
+        print(f"   • Promedio por operación: {execution_time/10:.3f} segundos")
+        
+        # Percentiles por sentencia registrados por la capa de conexión
+        query_metrics = booking_system.db_connection.get_query_metrics()
+        for statement, metrics in sorted(query_metrics.items(),
+                                         key=lambda item: item[1]['total_ms']['p95'],
+                                         reverse=True)[:5]:
+            total = metrics['total_ms']
+            print(f"   • {statement[:50]}: {metrics['calls']} llamadas, "
+                  f"p50 {total['p50']:.1f} ms, p95 {total['p95']:.1f} ms, p99 {total['p99']:.1f} ms")
+        
+        slow_queries = booking_system.db_connection.get_slow_queries()
+        print(f"   • Consultas lentas registradas: {len(slow_queries)}")
+        
+        # 5. Capacidades de escalamiento
+        print_subsection("5. Capacidades de Escalamiento")
+        
+        pool_stats = booking_system.db_connection.get_pool_stats()
+        print(f"   • Pool de conexiones: {pool_stats['pool_size']} conexiones simultáneas "
+              f"({pool_stats['in_use']} en uso, {pool_stats['idle']} libres, {pool_stats['waiting']} en espera)")
+        print(f"   • Espera media por conexión: {pool_stats['average_wait_ms']:.2f} ms "
+              f"(timeouts: {pool_stats['timeouts']})")
+        print("   • Índices optimizados: 9 índices principales")
+        print("   • Vistas materializadas: 3 vistas para análisis")
+        print("   • Procedimientos almacenados: Lógica de negocio en BD")
+        
+        print("\n✅ Integración completa del sistema verificada!")
+        
+    except Exception as e:
+        print(f"❌ Error en integración del sistema: {e}")
+        traceback.print_exc()
+    
+    finally:
+        if 'booking_system' in locals():
+            booking_system.close_connection()
+
+def main():
+    """Función principal de demostración"""
+    configure_logging()
+    
+    print("🍋 LITTLE LEMON DATABASE SYSTEM DEMO")
+    print("Database Engineer Capstone Project")
+    print("Meta/Coursera - 2025")
+    print("="*60)
+    
+    try:
+        # Ejecutar todas las demostraciones
+        demonstrate_database_procedures()
+        demonstrate_data_analysis()
+        demonstrate_business_scenarios()
+        demonstrate_system_integration()
+        
+        print_section("RESUMEN FINAL")
+        print("✅ Todos los procedimientos almacenados funcionan correctamente")
+        print("✅ Sistema de reservas completamente operativo")
+        print("✅ Análisis de datos implementado")
+        print("✅ Integración con Python exitosa")
+        print("✅ Exportación para Tableau completada")
+        print("✅ Escenarios de negocio validados")
+        print("✅ Sistema listo para producción")
+        
+        print("\n🎉 DEMOSTRACIÓN COMPLETADA EXITOSAMENTE 🎉")
+        print("\nEl sistema Little Lemon está listo para:")
+        print("• Gestionar reservas de restaurante")
+        print("• Procesar pedidos de clientes")
+        print("• Generar análisis de datos")
+        print("• Crear reportes en Tableau")
+        print("• Manejar operaciones diarias")
+        
+    except Exception as e:
+        print(f"\n❌ Error en demostración principal: {e}")
+        traceback.print_exc()
+    
+    print(f"\n📅 Demostración completada el {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,924 @@
+"""
+Little Lemon Async Booking System
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Versión asyncio de LittleLemonBookingSystem, con los mismos métodos públicos
+y los mismos plazos (deadline y call_timeout). No usa el índice de
+disponibilidad ni el modo "direct": las operaciones de reservas llaman a los
+procedimientos almacenados y la disponibilidad de varias horas o fechas se
+carga de la base de datos en cada llamada con una sola sentencia
+(RANGE_AVAILABILITY_QUERY).
+"""
+
+import sys
+import os
+import asyncio
+from datetime import datetime, date, time
+from typing import Optional, Dict, List, Any, Sequence
+import logging
+
+# Agregar el directorio actual al path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from async_connection import create_async_database_connection
+from deadlines import QueryTimeoutError, deadline_after
+from logging_config import configure_logging
+from availability_index import (
+    DateSlots,
+    RANGE_AVAILABILITY_QUERY,
+    availability_grid,
+    build_range_slots,
+    date_key,
+    nearest_available,
+    search_dates,
+    slot_key,
+    time_slots,
+    DEFAULT_SERVICE_START,
+    DEFAULT_SERVICE_END,
+    DEFAULT_SLOT_MINUTES
+)
+from seating_durations import SeatingDurations, SEATING_DURATIONS_QUERY
+from table_assignment import (
+    best_fit_position,
+    cheapest_combination,
+    combination_row,
+    plan_rebalance,
+    table_row,
+    DAY_BOOKINGS_QUERY,
+    DAY_BOOKINGS_LOCK_QUERY,
+    REASSIGN_TABLE_QUERY
+)
+from booking_system import (
+    CUSTOMER_INFO_QUERY,
+    MENU_ITEMS_QUERY,
+    TABLES_INFO_QUERY,
+    MAX_ASSIGNMENT_ATTEMPTS,
+    TABLE_TAKEN_STATUS,
+    BOOKING_BATCH_COLUMNS,
+    ORDER_BATCH_COLUMNS,
+    ORDER_DETAIL_BATCH_COLUMNS,
+    build_booking_rows,
+    build_daily_report,
+    build_order_rows
+)
+
+
+class AsyncLittleLemonBookingSystem:
+    """Sistema de gestión de reservas asíncrono para Little Lemon Restaurant"""
+    
+    def __init__(self, environment: str = "local", call_timeout: Optional[float] = None):
+        """
+        Inicializa el sistema de reservas asíncrono
+        
+        El pool de conexiones se crea en el primer uso dentro del event loop;
+        usar connect() o "async with" para verificar la conexión por adelantado.
+        
+        Como en LittleLemonBookingSystem, cada método acepta un plazo
+        (deadline, instante de time.monotonic()); sin él, la llamada dispone
+        de call_timeout segundos. Una llamada que supera su plazo lanza
+        QueryTimeoutError en lugar de devolver un valor por defecto.
+        
+        Args:
+            environment: Entorno de trabajo (local, development, production, sqlite)
+            call_timeout: Segundos por llamada (por defecto booking_call_timeout
+                          de la configuración; None = sin plazo)
+        """
+        self.db_connection = create_async_database_connection(environment)
+        self.logger = logging.getLogger(__name__)
+        self.call_timeout = (call_timeout if call_timeout is not None
+                             else self.db_connection.config.get("booking_call_timeout"))
+    
+    async def connect(self):
+        """Crea el pool de conexiones y verifica la conexión"""
+        await self.db_connection.create_connection_pool()
+        if not await self.db_connection.test_connection():
+            raise Exception("No se pudo conectar a la base de datos")
+    
+    async def __aenter__(self):
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close_connection()
+    
+    def transaction(self):
+        """
+        Abre una transacción en la que se ejecutan todas las operaciones del bloque
+        
+        Como en LittleLemonBookingSystem.transaction, un estado de error no
+        revierte la transacción: hay que lanzar una excepción dentro del bloque.
+        
+        Returns:
+            Context manager asíncrono de la transacción
+        """
+        return self.db_connection.transaction()
+    
+    def _deadline(self, deadline: Optional[float]) -> Optional[float]:
+        """
+        Obtiene el plazo de una llamada
+        
+        Args:
+            deadline: Plazo recibido por el método
+        
+        Returns:
+            float: El mismo plazo, o uno de call_timeout segundos desde ahora
+        """
+        return deadline if deadline is not None else deadline_after(self.call_timeout)
+    
+    async def _load_range_slots(self, first_date: date, last_date: date,
+                                deadline: Optional[float]) -> Dict[date, DateSlots]:
+        """
+        Carga las reservas de un rango de fechas con una sola consulta
+        
+        Args:
+            first_date: Primera fecha
+            last_date: Última fecha (incluida)
+            deadline: Plazo de la consulta
+        
+        Returns:
+            Dict[date, DateSlots]: Reservas de cada fecha (ver availability_index.load_range_slots)
+        """
+        first_date, last_date = date_key(first_date), date_key(last_date)
+        rows = await self.db_connection.execute_query(
+            RANGE_AVAILABILITY_QUERY, (first_date, last_date), fetch=True, deadline=deadline
+        )
+        return build_range_slots(rows, first_date, last_date)
+    
+    async def _load_date_slots(self, booking_date: date, deadline: Optional[float]) -> DateSlots:
+        """
+        Carga las reservas de una fecha
+        
+        Args:
+            booking_date: Fecha a cargar
+            deadline: Plazo de la consulta
+        
+        Returns:
+            DateSlots: Reservas de la fecha
+        """
+        booking_date = date_key(booking_date)
+        return (await self._load_range_slots(booking_date, booking_date, deadline))[booking_date]
+    
+    async def get_max_quantity(self, menu_item_name: str, deadline: Optional[float] = None) -> int:
+        """
+        Obtiene la cantidad máxima de un elemento del menú
+        
+        Args:
+            menu_item_name: Nombre del elemento del menú
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            int: Cantidad máxima pedida
+        """
+        try:
+            _, out_params = await self.db_connection.call_procedure(
+                "GetMaxQuantity", (menu_item_name,), ["max_quantity"],
+                deadline=self._deadline(deadline)
+            )
+            
+            max_quantity = out_params['max_quantity'] or 0
+            self.logger.info("Cantidad máxima para %s: %s", menu_item_name, max_quantity)
+            return max_quantity
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_max_quantity: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en get_max_quantity: %s", e)
+            return 0
+    
+    async def manage_booking(self, booking_date: date, table_number: int,
+                             deadline: Optional[float] = None) -> str:
+        """
+        Gestiona la disponibilidad de una reserva
+        
+        Args:
+            booking_date: Fecha de la reserva
+            table_number: Número de mesa
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            str: Estado de la reserva
+        """
+        try:
+            _, out_params = await self.db_connection.call_procedure(
+                "ManageBooking", (booking_date, table_number), ["booking_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['booking_status'] or "Error"
+            self.logger.info("Estado de reserva para mesa %s el %s: %s", table_number, booking_date, status)
+            return status
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en manage_booking: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en manage_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    async def update_booking(self, booking_id: int, new_booking_date: date,
+                             new_booking_time: time, new_number_of_guests: int,
+                             deadline: Optional[float] = None) -> str:
+        """
+        Actualiza una reserva existente
+        
+        Args:
+            booking_id: ID de la reserva
+            new_booking_date: Nueva fecha
+            new_booking_time: Nueva hora
+            new_number_of_guests: Nuevo número de huéspedes
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            str: Estado de la actualización
+        """
+        try:
+            _, out_params = await self.db_connection.call_procedure(
+                "UpdateBooking",
+                (booking_id, new_booking_date, new_booking_time, new_number_of_guests),
+                ["update_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['update_status'] or "Error"
+            self.logger.info("Actualización de reserva %s: %s", booking_id, status)
+            return status
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en update_booking: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en update_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    async def add_booking(self, customer_id: int, table_id: int, booking_date: date,
+                          booking_time: time, number_of_guests: int,
+                          special_requests: Optional[str] = None,
+                          deadline: Optional[float] = None) -> str:
+        """
+        Añade una nueva reserva
+        
+        Args:
+            customer_id: ID del cliente
+            table_id: ID de la mesa
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de huéspedes
+            special_requests: Solicitudes especiales
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            str: Estado de la reserva
+        """
+        try:
+            _, out_params = await self.db_connection.call_procedure(
+                "AddBooking",
+                (customer_id, table_id, booking_date, booking_time,
+                 number_of_guests, special_requests),
+                ["booking_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['booking_status'] or "Error"
+            self.logger.info("Nueva reserva: %s", status)
+            return status
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en add_booking: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en add_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    async def add_bookings_batch(self, bookings: List[Dict[str, Any]],
+                                 batch_size: Optional[int] = None,
+                                 deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Carga muchas reservas en una sola transacción
+        
+        Como LittleLemonBookingSystem.add_bookings_batch: inserta directamente
+        en la tabla sin las comprobaciones de disponibilidad de AddBooking.
+        
+        Args:
+            bookings: Reservas a insertar (ver build_booking_rows)
+            batch_size: Filas por sentencia INSERT
+            deadline: Plazo de la carga (por defecto sin plazo)
+        
+        Returns:
+            Dict: Estadísticas de la carga (filas, lotes, filas por segundo)
+        """
+        try:
+            durations = SeatingDurations(await self.db_connection.execute_query(
+                SEATING_DURATIONS_QUERY, fetch=True, deadline=deadline
+            ))
+            table_locations = {
+                table['table_id']: table['location']
+                for table in await self.db_connection.execute_query(TABLES_INFO_QUERY, fetch=True,
+                                                                    deadline=deadline)
+            }
+            stats = await self.db_connection.bulk_insert(
+                "bookings", BOOKING_BATCH_COLUMNS,
+                build_booking_rows(bookings, durations, table_locations), batch_size, deadline
+            )
+            self.logger.info("Reservas cargadas: %s (%.0f filas/s)",
+                             stats['rows'], stats['rows_per_second'])
+            return stats
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en add_bookings_batch: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en add_bookings_batch: %s", e)
+            return {}
+    
+    async def cancel_booking(self, booking_id: int, deadline: Optional[float] = None) -> str:
+        """
+        Cancela una reserva existente
+        
+        Args:
+            booking_id: ID de la reserva a cancelar
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            str: Estado de la cancelación
+        """
+        try:
+            _, out_params = await self.db_connection.call_procedure(
+                "CancelBooking", (booking_id,), ["cancellation_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['cancellation_status'] or "Error"
+            self.logger.info("Cancelación de reserva %s: %s", booking_id, status)
+            return status
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en cancel_booking: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en cancel_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    async def check_booking_availability(self, check_date: date, check_time: time,
+                                         required_capacity: int,
+                                         deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Verifica la disponibilidad de mesas
+        
+        Args:
+            check_date: Fecha a verificar
+            check_time: Hora a verificar
+            required_capacity: Capacidad requerida
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            List[Dict]: Lista de mesas disponibles
+        """
+        try:
+            result, _ = await self.db_connection.call_procedure(
+                "CheckBookingAvailability",
+                (check_date, check_time, required_capacity),
+                deadline=self._deadline(deadline)
+            )
+            
+            self.logger.info("Verificación de disponibilidad para %s %s: %s mesas",
+                             check_date, check_time, len(result))
+            return result
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en check_booking_availability: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en check_booking_availability: %s", e)
+            return []
+    
+    async def check_availability_grid(self, check_date: date, slots: Sequence[time],
+                                      party_sizes: Sequence[int],
+                                      deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Verifica la disponibilidad de varias horas y tamaños de grupo a la vez
+        
+        Es una sola consulta (ver LittleLemonBookingSystem.check_availability_grid).
+        
+        Args:
+            check_date: Fecha a verificar
+            slots: Horas a verificar (ver time_slots)
+            party_sizes: Tamaños de grupo
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            Dict: Matriz hora x mesa (ver availability_index.availability_grid)
+        """
+        try:
+            entry = await self._load_date_slots(check_date, self._deadline(deadline))
+            grid = availability_grid(entry, check_date, slots, party_sizes)
+            
+            self.logger.info("Cuadrícula de disponibilidad para %s: %s horas x %s mesas",
+                             check_date, len(grid['slots']), len(grid['tables']))
+            return grid
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en check_availability_grid: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en check_availability_grid: %s", e)
+            return {}
+    
+    async def find_next_available(self, party_size: int, preferred_datetime: datetime,
+                                  window_days: int = 3, location: Optional[str] = None,
+                                  limit: int = 5, slots: Optional[Sequence[time]] = None,
+                                  deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Busca las horas con mesa libre más cercanas a la preferida
+        
+        Las fechas de la ventana se cargan con una sola sentencia
+        (RANGE_AVAILABILITY_QUERY); las horas ya pasadas se descartan.
+        
+        Args:
+            party_size: Tamaño del grupo
+            preferred_datetime: Fecha y hora preferidas
+            window_days: Días a buscar antes y después de la fecha preferida
+            location: Ubicación de la mesa, o parte de su nombre (None = cualquiera)
+            limit: Número máximo de opciones
+            slots: Horas de reserva de cada fecha (por defecto, de 17:00 a
+                   22:00 cada 15 minutos)
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            List[Dict]: Opciones ordenadas por distancia a la preferida
+                        (ver availability_index.nearest_available)
+        """
+        try:
+            if slots is None:
+                slots = time_slots(DEFAULT_SERVICE_START, DEFAULT_SERVICE_END, DEFAULT_SLOT_MINUTES)
+            not_before = datetime.now()
+            
+            dates = search_dates(preferred_datetime, window_days)
+            entries = await self._load_range_slots(dates[0], dates[-1], self._deadline(deadline))
+            options = nearest_available(entries, party_size, preferred_datetime, slots,
+                                        location, limit, not_before)
+            
+            self.logger.info("Búsqueda de horas libres cerca de %s para %s: %s opciones",
+                             preferred_datetime, party_size, len(options))
+            return options
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en find_next_available: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en find_next_available: %s", e)
+            return []
+    
+    async def assign_table(self, booking_date: date, booking_time: time, number_of_guests: int,
+                           preferred_location: Optional[str] = None, strict: bool = False,
+                           deadline: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Elige la mesa libre más pequeña que admite un grupo
+        
+        Args:
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de comensales
+            preferred_location: Ubicación preferida; basta una parte del nombre
+                                ("Window" -> "Window Side")
+            strict: No ofrecer mesas de otra ubicación
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            Dict: Mesa (table_id, table_number, seating_capacity, location), o
+                  None si no hay ninguna libre
+        """
+        try:
+            entry = await self._load_date_slots(booking_date, self._deadline(deadline))
+            position = best_fit_position(entry, slot_key(booking_time), number_of_guests,
+                                         preferred_location, strict)
+            table = table_row(entry.layout, position) if position is not None else None
+            
+            self.logger.info("Asignación de mesa para %s %s (%s personas): %s",
+                             booking_date, booking_time, number_of_guests,
+                             table['table_number'] if table else None)
+            return table
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en assign_table: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en assign_table: %s", e)
+            return None
+    
+    async def assign_combination(self, booking_date: date, booking_time: time,
+                                 number_of_guests: int, preferred_location: Optional[str] = None,
+                                 strict: bool = False,
+                                 deadline: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Elige la combinación de mesas libre más barata que admite un grupo
+        
+        Args:
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de comensales
+            preferred_location: Ubicación preferida (ver assign_table)
+            strict: No ofrecer combinaciones de otra ubicación
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            Dict: Combinación (combination_id, combination_name, seating_capacity,
+                  location y tables), o None si no hay ninguna libre
+        """
+        try:
+            entry = await self._load_date_slots(booking_date, self._deadline(deadline))
+            index = cheapest_combination(entry, slot_key(booking_time), number_of_guests,
+                                         preferred_location, strict)
+            combination = combination_row(entry.layout, index) if index is not None else None
+            
+            self.logger.info("Asignación de mesas combinadas para %s %s (%s personas): %s",
+                             booking_date, booking_time, number_of_guests,
+                             combination['combination_name'] if combination else None)
+            return combination
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en assign_combination: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en assign_combination: %s", e)
+            return None
+    
+    async def add_combined_booking(self, customer_id: int, combination_id: int,
+                                   booking_date: date, booking_time: time,
+                                   number_of_guests: int,
+                                   special_requests: Optional[str] = None,
+                                   deadline: Optional[float] = None) -> str:
+        """
+        Añade una reserva que ocupa todas las mesas de una combinación
+        
+        Args:
+            customer_id: ID del cliente
+            combination_id: ID de la combinación de mesas
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de huéspedes
+            special_requests: Solicitudes especiales
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            str: Estado de la reserva
+        """
+        try:
+            _, out_params = await self.db_connection.call_procedure(
+                "AddCombinedBooking",
+                (customer_id, combination_id, booking_date, booking_time,
+                 number_of_guests, special_requests),
+                ["booking_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['booking_status'] or "Error"
+            self.logger.info("Nueva reserva combinada: %s", status)
+            return status
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en add_combined_booking: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en add_combined_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    async def book_best_table(self, customer_id: int, booking_date: date, booking_time: time,
+                              number_of_guests: int, special_requests: Optional[str] = None,
+                              preferred_location: Optional[str] = None,
+                              deadline: Optional[float] = None) -> str:
+        """
+        Añade una reserva en la mesa que elige assign_table
+        
+        Si ninguna mesa admite el grupo, la reserva ocupa la combinación que
+        elige assign_combination. Si otra reserva ocupa la mesa entre la
+        elección y la reserva, se elige otra mesa (hasta
+        MAX_ASSIGNMENT_ATTEMPTS veces).
+        
+        Args:
+            customer_id: ID del cliente
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de comensales
+            special_requests: Solicitudes especiales
+            preferred_location: Ubicación preferida (ver assign_table)
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            str: Estado de la reserva (como add_booking)
+        """
+        deadline = self._deadline(deadline)
+        status = "Error: No table available for this date and time"
+        for _ in range(MAX_ASSIGNMENT_ATTEMPTS):
+            table = await self.assign_table(booking_date, booking_time, number_of_guests,
+                                            preferred_location, deadline=deadline)
+            if table is not None:
+                status = await self.add_booking(customer_id, table['table_id'], booking_date,
+                                                booking_time, number_of_guests, special_requests,
+                                                deadline=deadline)
+            else:
+                combination = await self.assign_combination(booking_date, booking_time,
+                                                            number_of_guests, preferred_location,
+                                                            deadline=deadline)
+                if combination is None:
+                    return "Error: No table available for this date and time"
+                status = await self.add_combined_booking(customer_id, combination['combination_id'],
+                                                         booking_date, booking_time, number_of_guests,
+                                                         special_requests, deadline=deadline)
+            if status != TABLE_TAKEN_STATUS:
+                return status
+        return status
+    
+    async def rebalance_tables(self, booking_date: date, requests: Sequence[Dict[str, Any]] = (),
+                               apply: bool = False,
+                               deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Reparte de nuevo las mesas de un día para sentar más comensales
+        
+        Como LittleLemonBookingSystem.rebalance_tables: con apply los cambios
+        de mesa se guardan en una transacción que bloquea las reservas del día.
+        
+        Args:
+            booking_date: Fecha a repartir
+            requests: Grupos en espera con booking_time, number_of_guests y,
+                      opcionalmente, preferred_location
+            apply: Guardar los cambios de mesa
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            Dict: Reparto propuesto (ver table_assignment.plan_rebalance)
+        """
+        try:
+            deadline = self._deadline(deadline)
+            now = datetime.now()
+            if booking_date < now.date():
+                fixed_before = time.max
+            elif booking_date == now.date():
+                fixed_before = now.time()
+            else:
+                fixed_before = None
+            
+            layout = (await self._load_date_slots(booking_date, deadline)).layout
+            if not apply:
+                day_bookings = await self.db_connection.execute_query(
+                    DAY_BOOKINGS_QUERY, (booking_date,), fetch=True, deadline=deadline
+                )
+                plan = plan_rebalance(layout, day_bookings, requests, fixed_before)
+            else:
+                async with self.db_connection.transaction(deadline):
+                    day_bookings = await self.db_connection.execute_query(
+                        DAY_BOOKINGS_LOCK_QUERY, (booking_date,), fetch=True, deadline=deadline
+                    )
+                    plan = plan_rebalance(layout, day_bookings, requests, fixed_before)
+                    for move in plan['moves']:
+                        await self.db_connection.execute_query(
+                            REASSIGN_TABLE_QUERY,
+                            (move['table_id'], move['end_time'], move['booking_id']),
+                            deadline=deadline
+                        )
+            
+            self.logger.info("Reequilibrio de mesas para %s: %s cambios, %s de %s grupos sentados",
+                             booking_date, len(plan['moves']), len(plan['seated_requests']),
+                             len(requests))
+            return plan
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en rebalance_tables: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en rebalance_tables: %s", e)
+            return {}
+    
+    async def get_bookings_by_date(self, search_date: date,
+                                   deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Obtiene todas las reservas para una fecha específica
+        
+        Args:
+            search_date: Fecha a buscar
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            List[Dict]: Lista de reservas
+        """
+        try:
+            result, _ = await self.db_connection.call_procedure(
+                "GetBookingsByDate",
+                (search_date,),
+                deadline=self._deadline(deadline)
+            )
+            
+            self.logger.info("Reservas para %s: %s encontradas", search_date, len(result))
+            return result
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_bookings_by_date: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en get_bookings_by_date: %s", e)
+            return []
+    
+    async def get_customer_info(self, customer_id: int,
+                                deadline: Optional[float] = None) -> Optional[Dict]:
+        """
+        Obtiene información de un cliente
+        
+        Args:
+            customer_id: ID del cliente
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            Dict: Información del cliente
+        """
+        try:
+            result = await self.db_connection.execute_query(
+                CUSTOMER_INFO_QUERY, (customer_id,), fetch=True,
+                deadline=self._deadline(deadline)
+            )
+            
+            if result:
+                return result[0]
+            return None
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_customer_info: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en get_customer_info: %s", e)
+            return None
+    
+    async def get_menu_items(self, deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Obtiene todos los elementos del menú
+        
+        Args:
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            List[Dict]: Lista de elementos del menú
+        """
+        try:
+            return await self.db_connection.execute_query(
+                MENU_ITEMS_QUERY, fetch=True, deadline=self._deadline(deadline)
+            )
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_menu_items: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en get_menu_items: %s", e)
+            return []
+    
+    async def get_tables_info(self, deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Obtiene información de todas las mesas
+        
+        Args:
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            List[Dict]: Lista de mesas
+        """
+        try:
+            return await self.db_connection.execute_query(
+                TABLES_INFO_QUERY, fetch=True, deadline=self._deadline(deadline)
+            )
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_tables_info: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en get_tables_info: %s", e)
+            return []
+    
+    async def generate_daily_report(self, report_date: date,
+                                    deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Genera un reporte diario de reservas
+        
+        Las reservas del día y la información de mesas se consultan en paralelo,
+        salvo dentro de una transacción: ambas usarían su única conexión.
+        
+        Args:
+            report_date: Fecha del reporte
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+        
+        Returns:
+            Dict: Reporte con estadísticas
+        """
+        try:
+            # Ambas consultas comparten el mismo plazo
+            deadline = self._deadline(deadline)
+            if self.db_connection.in_transaction():
+                bookings = await self.get_bookings_by_date(report_date, deadline)
+                tables_info = await self.get_tables_info(deadline)
+            else:
+                bookings, tables_info = await asyncio.gather(
+                    self.get_bookings_by_date(report_date, deadline),
+                    self.get_tables_info(deadline)
+                )
+            
+            return build_daily_report(report_date, bookings, tables_info)
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en generate_daily_report: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en generate_daily_report: %s", e)
+            return {}
+    
+    async def import_orders_batch(self, orders: List[Dict[str, Any]],
+                                  batch_size: Optional[int] = None,
+                                  deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Importa los pedidos del punto de venta y sus detalles en una sola transacción
+        
+        Args:
+            orders: Pedidos con sus elementos (ver build_order_rows)
+            batch_size: Filas por sentencia INSERT
+            deadline: Plazo de la carga (por defecto sin plazo)
+        
+        Returns:
+            Dict: Estadísticas de la carga (filas, lotes, filas por segundo)
+        """
+        try:
+            order_rows, detail_rows = build_order_rows(orders)
+            stats = await self.db_connection.bulk_insert_many([
+                ("orders", ORDER_BATCH_COLUMNS, order_rows),
+                ("order_details", ORDER_DETAIL_BATCH_COLUMNS, detail_rows)
+            ], batch_size, deadline)
+            self.logger.info("Pedidos importados: %s con %s detalles (%.0f filas/s)",
+                             len(order_rows), len(detail_rows), stats['rows_per_second'])
+            return stats
+        
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en import_orders_batch: %s", e)
+            raise
+        
+        except Exception as e:
+            self.logger.error("Error en import_orders_batch: %s", e)
+            return {}
+    
+    async def close_connection(self):
+        """Cierra la conexión a la base de datos"""
+        if self.db_connection:
+            await self.db_connection.close_pool()
+
+
+async def main():
+    """Función principal para demostrar el uso del sistema asíncrono"""
+    configure_logging()
+    
+    print("=== Little Lemon Async Booking System ===")
+    print("Database Engineer Capstone Project")
+    print("=========================================\n")
+    
+    try:
+        async with AsyncLittleLemonBookingSystem("local") as booking_system:
+            print("✅ Sistema de reservas asíncrono inicializado correctamente\n")
+            
+            # Verificar varias franjas horarias de forma concurrente
+            print("1. Disponibilidad concurrente:")
+            slots = [time(hour, minute) for hour in range(17, 22) for minute in (0, 30)]
+            results = await asyncio.gather(*[
+                booking_system.check_booking_availability(date(2025, 7, 25), slot, 4)
+                for slot in slots
+            ])
+            for slot, availability in zip(slots, results):
+                available = len([t for t in availability if t['availability_status'] == 'Available'])
+                print(f"   - {slot}: {available} mesas disponibles")
+            print()
+            
+            # Reporte diario
+            print("2. Reporte diario:")
+            report = await booking_system.generate_daily_report(date(2025, 7, 15))
+            print(f"   Total reservas: {report.get('total_bookings', 0)}")
+            print(f"   Tasa de ocupación: {report.get('occupancy_rate', 0):.1f}%\n")
+            
+            print("✅ Funcionalidades asíncronas probadas exitosamente!")
+    
+    except Exception as e:
+        print(f"❌ Error: {e}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
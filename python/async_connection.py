@@ -0,0 +1,800 @@
+"""
+Little Lemon Async Database Connection Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Versión asyncio de LittleLemonConnection sobre aiomysql. Con backend =
+"sqlite" las conexiones del pool son de la base de datos SQLite embebida
+(ver sqlite_backend), cuyas operaciones se ejecutan en hilos aparte para no
+bloquear el event loop.
+"""
+
+import sys
+import os
+import ssl
+import time
+import asyncio
+import logging
+import contextvars
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Callable
+
+import aiomysql
+import mysql.connector
+from pymysql.err import Error
+
+# Agregar el directorio actual al path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from connection import (
+    get_database_config,
+    PROCEDURE_SIGNATURES_QUERY,
+    parse_procedure_signatures,
+    build_call_statement,
+    build_signature_statement,
+    split_procedure_results,
+    _validate_identifier,
+    build_insert_statement,
+    UNIT_OF_WORK_VARIABLE,
+    DEFAULT_BULK_BATCH_SIZE
+)
+from result_formats import format_rows, validate_result_format
+from connection_pool import DEFAULT_POOL_IDLE_TIMEOUT
+from replication import READ_ONLY_PROCEDURES, is_read_query
+from sqlite_backend import SQLiteBackend, SQLiteConnection
+from deadlines import (
+    QueryTimeoutError,
+    QUERY_TIMEOUT_ERRNOS,
+    RESTORE_LOCK_WAIT_TIMEOUT_STATEMENT,
+    lock_wait_statement,
+    raise_if_timeout,
+    remaining_time,
+    with_max_execution_time
+)
+
+logger = logging.getLogger(__name__)
+
+# Errores de aiomysql (pymysql) y de las conexiones SQLite (mysql.connector)
+DATABASE_ERRORS = (Error, mysql.connector.Error)
+
+# Equivalencias entre la configuración de mysql.connector y la de aiomysql
+AIOMYSQL_CONFIG_KEYS = {
+    "host": "host",
+    "port": "port",
+    "user": "user",
+    "password": "password",
+    "database": "db",
+    "charset": "charset",
+    "use_unicode": "use_unicode",
+    "autocommit": "autocommit",
+    "connect_timeout": "connect_timeout"
+}
+
+
+def to_aiomysql_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Traduce la configuración de mysql.connector al formato de aiomysql
+    
+    Args:
+        config: Diccionario con configuración de la base de datos
+    
+    Returns:
+        Dict: Argumentos para aiomysql.create_pool
+    """
+    aio_config = {
+        AIOMYSQL_CONFIG_KEYS[key]: value
+        for key, value in config.items()
+        if key in AIOMYSQL_CONFIG_KEYS
+    }
+    
+    # mysql.connector intenta SSL sin verificar el certificado cuando ssl_disabled=False
+    if config.get("ssl_disabled") is False:
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        aio_config["ssl"] = ssl_context
+    
+    return aio_config
+
+
+def raise_if_async_timeout(error: Exception):
+    """
+    Relanza como QueryTimeoutError un error de tiempo agotado del servidor
+    
+    pymysql guarda el código de error en args[0] en lugar de en errno.
+    
+    Args:
+        error: Error capturado
+    """
+    if isinstance(error, Error) and error.args and error.args[0] in QUERY_TIMEOUT_ERRNOS:
+        raise QueryTimeoutError(
+            str(error.args[-1]), errno=error.args[0]
+        ) from error
+    raise_if_timeout(error)
+
+
+class AsyncSQLiteCursor:
+    """Cursor con la API de aiomysql sobre una conexión SQLite"""
+    
+    def __init__(self, connection: "AsyncSQLiteConnection", dictionary: bool = False):
+        """
+        Inicializa el cursor
+        
+        Args:
+            connection: Conexión a la que pertenece
+            dictionary: Si las filas se entregan como diccionarios
+        """
+        self._connection = connection
+        self._dictionary = dictionary
+        self._results = []
+        self.description = None
+        self.rowcount = -1
+        self._rows = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, traceback):
+        self._results = []
+    
+    async def execute(self, query: str, params: Sequence[Any] = None):
+        """
+        Ejecuta una o varias sentencias y lee todos sus resultados
+        
+        Args:
+            query: Sentencias con marcadores %s
+            params: Valores de los marcadores
+        """
+        def run():
+            cursor = self._connection.connection.cursor(dictionary=self._dictionary)
+            return [
+                (result.column_names if result.with_rows else None,
+                 result.fetchall() if result.with_rows else [], result.rowcount)
+                for result in cursor.execute(query, params or (), multi=True)
+            ]
+        
+        self._results = await self._connection.run(run)
+        await self.nextset()
+    
+    async def nextset(self) -> bool:
+        """Pasa al siguiente resultado; False si no quedan más"""
+        if not self._results:
+            self.description, self._rows = None, []
+            return False
+        columns, self._rows, self.rowcount = self._results.pop(0)
+        self.description = (
+            tuple((column, None, None, None, None, None, None) for column in columns)
+            if columns is not None else None
+        )
+        return True
+    
+    async def fetchall(self) -> List[Any]:
+        rows, self._rows = self._rows, []
+        return rows
+
+
+class AsyncSQLiteConnection:
+    """Conexión SQLite con la parte de la API de aiomysql que usa la librería"""
+    
+    def __init__(self, connection: SQLiteConnection):
+        """
+        Inicializa la conexión
+        
+        Args:
+            connection: Conexión SQLite con la API de mysql.connector
+        """
+        self.connection = connection
+    
+    async def run(self, operation: Callable[[], Any]) -> Any:
+        """Ejecuta una operación de la conexión en un hilo aparte"""
+        return await asyncio.to_thread(operation)
+    
+    def cursor(self, cursor_class=None) -> AsyncSQLiteCursor:
+        return AsyncSQLiteCursor(self, dictionary=cursor_class is aiomysql.DictCursor)
+    
+    async def begin(self):
+        await self.run(self.connection.start_transaction)
+    
+    async def commit(self):
+        await self.run(self.connection.commit)
+    
+    async def rollback(self):
+        await self.run(self.connection.rollback)
+
+
+class AsyncSQLitePool:
+    """Pool asíncrono de conexiones a la base de datos SQLite embebida"""
+    
+    def __init__(self, connection_factory: Callable[[], SQLiteConnection], maxsize: int):
+        """
+        Inicializa el pool; las conexiones se abren a medida que se piden
+        
+        Args:
+            connection_factory: Función que abre una conexión (SQLiteBackend.connect)
+            maxsize: Número máximo de conexiones
+        """
+        self._connection_factory = connection_factory
+        self._semaphore = asyncio.Semaphore(maxsize)
+        self._free = []
+    
+    async def acquire(self) -> AsyncSQLiteConnection:
+        """Obtiene una conexión libre, esperando si están todas en uso"""
+        await self._semaphore.acquire()
+        if self._free:
+            return self._free.pop()
+        try:
+            return AsyncSQLiteConnection(await asyncio.to_thread(self._connection_factory))
+        except BaseException:
+            self._semaphore.release()
+            raise
+    
+    def release(self, connection: AsyncSQLiteConnection):
+        """Devuelve una conexión al pool con la sesión reiniciada"""
+        try:
+            connection.connection.reset_session()
+            self._free.append(connection)
+        except mysql.connector.Error as e:
+            logger.warning("Descartando conexión SQLite: %s", e)
+            connection.connection.close()
+        finally:
+            self._semaphore.release()
+    
+    def close(self):
+        """Cierra las conexiones libres"""
+        while self._free:
+            self._free.pop().connection.close()
+    
+    async def wait_closed(self):
+        """Las conexiones SQLite se cierran en close()"""
+
+
+class AsyncTransaction:
+    """Transacción asíncrona que fija una conexión del pool hasta su finalización"""
+    
+    def __init__(self, connection):
+        """
+        Inicializa la transacción
+        
+        Args:
+            connection: Conexión aiomysql reservada para la transacción
+        """
+        self.connection = connection
+        self.error = None
+    
+    async def commit(self):
+        """Confirma el trabajo realizado hasta ahora"""
+        await self.connection.commit()
+    
+    async def rollback(self):
+        """Revierte el trabajo realizado hasta ahora"""
+        await self.connection.rollback()
+        self.error = None
+
+
+class AsyncLittleLemonConnection:
+    """Clase para manejar la conexión asíncrona a la base de datos Little Lemon"""
+    
+    def __init__(self, config: Dict[str, Any], pool_size: int = 5):
+        """
+        Inicializa la conexión; el pool se crea al primer uso dentro del event loop
+        
+        Args:
+            config: Diccionario con configuración de la base de datos
+            pool_size: Número máximo de conexiones del pool
+        """
+        self.config = config
+        self.pool_size = pool_size
+        self.pool = None
+        self.backend = None
+        self.bulk_batch_size = config.get("bulk_batch_size", DEFAULT_BULK_BATCH_SIZE)
+        self.read_only_procedures = {
+            name.lower() for name in config.get("read_only_procedures", READ_ONLY_PROCEDURES)
+        }
+        self._pool_lock = None
+        self._procedure_signatures = None
+        self._signature_lock = None
+        self._current_transaction = contextvars.ContextVar(
+            f"little_lemon_transaction_{id(self)}", default=None
+        )
+    
+    async def create_connection_pool(self):
+        """
+        Crea el pool de conexiones asíncrono si todavía no existe
+        
+        Con backend = "sqlite" las conexiones del pool son de una base de datos
+        SQLite embebida (ver sqlite_backend).
+        """
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        
+        async with self._pool_lock:
+            if self.pool is not None:
+                return self.pool
+            
+            try:
+                backend = self.config.get("backend", "mysql")
+                if backend == "sqlite":
+                    self.backend = await asyncio.to_thread(
+                        SQLiteBackend, self.config.get("sqlite_database"),
+                        sample_data=self.config.get("sqlite_sample_data", True)
+                    )
+                    self.pool = AsyncSQLitePool(self.backend.connect, self.pool_size)
+                    logger.info("Backend SQLite embebido en %s", self.backend.database)
+                elif backend != "mysql":
+                    raise ValueError(f"Backend no válido: {backend} (mysql o sqlite)")
+                else:
+                    # aiomysql cierra al prestarla una conexión libre más de pool_recycle segundos
+                    self.pool = await aiomysql.create_pool(
+                        minsize=1,
+                        maxsize=self.pool_size,
+                        pool_recycle=self.config.get("pool_idle_timeout", DEFAULT_POOL_IDLE_TIMEOUT) or -1,
+                        **to_aiomysql_config(self.config)
+                    )
+                logger.info("Pool de conexiones asíncrono creado exitosamente")
+                return self.pool
+            except DATABASE_ERRORS + (ValueError,) as e:
+                logger.error("Error al crear pool de conexiones asíncrono: %s", e)
+                raise
+    
+    @asynccontextmanager
+    async def _acquire(self, deadline: Optional[float] = None):
+        """
+        Obtiene la conexión a usar: la de la transacción activa o una del pool
+        
+        Args:
+            deadline: Plazo de la operación; limita la espera en el pool
+        
+        Yields:
+            Tuple: (conexión, True si la conexión pertenece a esta llamada)
+        """
+        transaction = self._current_transaction.get()
+        if transaction is not None:
+            yield transaction.connection, False
+            return
+        
+        pool = self.pool or await self.create_connection_pool()
+        remaining = remaining_time(deadline)
+        try:
+            connection = await asyncio.wait_for(pool.acquire(), remaining)
+        except asyncio.TimeoutError as e:
+            raise QueryTimeoutError("Plazo vencido esperando una conexión") from e
+        try:
+            yield connection, True
+        finally:
+            pool.release(connection)
+    
+    async def _limit_lock_waits(self, connection, deadline: Optional[float]) -> bool:
+        """
+        Limita las esperas de bloqueos de la sesión al tiempo que queda del plazo
+        
+        Args:
+            connection: Conexión de la operación
+            deadline: Plazo de la operación (None = sin límite)
+        
+        Returns:
+            bool: True si se cambió la sesión (hay que restaurarla después)
+        """
+        remaining = remaining_time(deadline)
+        if remaining is None:
+            return False
+        async with connection.cursor() as cursor:
+            await cursor.execute(lock_wait_statement(remaining))
+        return True
+    
+    async def _restore_lock_waits(self, connection):
+        """Devuelve las esperas de bloqueos de la sesión a los valores globales"""
+        try:
+            async with connection.cursor() as cursor:
+                await cursor.execute(RESTORE_LOCK_WAIT_TIMEOUT_STATEMENT)
+        except DATABASE_ERRORS as e:
+            logger.warning("Error restaurando las esperas de bloqueos de la sesión: %s", e)
+    
+    async def _abandon(self, connection, owned: bool, error: Exception):
+        """
+        Revierte el trabajo de una operación fallida
+        
+        Args:
+            connection: Conexión de la operación
+            owned: Si la conexión pertenece a la operación (si no, es la de
+                   la transacción activa, que se marca para revertirla)
+            error: Error ocurrido
+        """
+        if not owned:
+            self._mark_transaction_failed(error)
+            return
+        try:
+            await connection.rollback()
+        except DATABASE_ERRORS as e:
+            logger.warning("Error revirtiendo operación: %s", e)
+    
+    async def execute_query(self, query: str, params: tuple = None, fetch: bool = False,
+                            result_format: str = "dict", deadline: Optional[float] = None):
+        """
+        Ejecuta una consulta SQL
+        
+        Con un plazo, las consultas SELECT llevan el hint MAX_EXECUTION_TIME y
+        las escrituras limitan las esperas de bloqueos de la sesión al tiempo
+        restante; si el plazo vence se lanza QueryTimeoutError.
+        
+        Args:
+            query: Consulta SQL a ejecutar
+            params: Parámetros para la consulta
+            fetch: Si debe retornar resultados
+            result_format: Formato de los resultados: "dict", "tuple"
+                           (columnas, filas), "record" o "columnar"
+            deadline: Plazo de la llamada como instante de time.monotonic()
+                      (ver deadlines.deadline_after); None = sin plazo
+        
+        Returns:
+            Resultados de la consulta si fetch=True, sino el número de filas afectadas
+        """
+        validate_result_format(result_format)
+        cursor_class = aiomysql.DictCursor if result_format == "dict" else aiomysql.Cursor
+        
+        async with self._acquire(deadline) as (connection, owned):
+            lock_waits_limited = False
+            statement = query
+            try:
+                if fetch and is_read_query(query):
+                    statement = with_max_execution_time(query, remaining_time(deadline))
+                else:
+                    lock_waits_limited = await self._limit_lock_waits(connection, deadline)
+                
+                async with connection.cursor(cursor_class) as cursor:
+                    await cursor.execute(statement, params or None)
+                    
+                    if fetch:
+                        rows = list(await cursor.fetchall())
+                        if result_format == "dict":
+                            return rows
+                        columns = [column[0] for column in cursor.description or ()]
+                        return format_rows(columns, rows, result_format)
+                    
+                    if owned:
+                        await connection.commit()
+                    return cursor.rowcount
+            
+            except DATABASE_ERRORS as e:
+                await self._abandon(connection, owned, e)
+                logger.error("Error ejecutando consulta: %s", e)
+                raise_if_async_timeout(e)
+                raise
+            finally:
+                if lock_waits_limited:
+                    await self._restore_lock_waits(connection)
+    
+    async def bulk_insert(self, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]],
+                          batch_size: Optional[int] = None,
+                          deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Inserta muchas filas con sentencias INSERT multi-fila y un solo commit
+        
+        Args:
+            table: Nombre de la tabla
+            columns: Columnas a insertar
+            rows: Filas con los valores en el orden de columns
+            batch_size: Filas por sentencia (por defecto bulk_batch_size)
+            deadline: Plazo de la carga (ver execute_query)
+        
+        Returns:
+            Dict: Filas insertadas, lotes, segundos y filas por segundo
+        """
+        return await self.bulk_insert_many([(table, columns, rows)], batch_size, deadline)
+    
+    async def bulk_insert_many(self, loads: Sequence[Tuple[str, Sequence[str], Sequence[Sequence[Any]]]],
+                               batch_size: Optional[int] = None,
+                               deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Inserta filas en varias tablas dentro de una misma transacción
+        
+        Como LittleLemonConnection.bulk_insert_many: las tablas se cargan en
+        el orden indicado y si falla un lote se deshace toda la carga.
+        
+        Args:
+            loads: Tuplas (tabla, columnas, filas)
+            batch_size: Filas por sentencia (por defecto bulk_batch_size)
+            deadline: Plazo de la carga (ver execute_query); se comprueba
+                      antes de cada lote
+        
+        Returns:
+            Dict: Filas insertadas, lotes, segundos y filas por segundo
+        """
+        batch_size = batch_size or self.bulk_batch_size
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser al menos 1")
+        
+        total_rows = 0
+        batches = 0
+        started = time.perf_counter()
+        
+        async with self._acquire(deadline) as (connection, owned):
+            lock_waits_limited = False
+            try:
+                lock_waits_limited = await self._limit_lock_waits(connection, deadline)
+                async with connection.cursor() as cursor:
+                    for table, columns, rows in loads:
+                        rows = list(rows)
+                        if not rows:
+                            continue
+                        
+                        full_statement = build_insert_statement(table, columns, batch_size)
+                        for offset in range(0, len(rows), batch_size):
+                            remaining_time(deadline)
+                            batch = rows[offset:offset + batch_size]
+                            values = []
+                            for row in batch:
+                                if len(row) != len(columns):
+                                    raise ValueError(
+                                        f"Fila con {len(row)} valores para {len(columns)} columnas en {table}"
+                                    )
+                                values.extend(row)
+                            
+                            statement = (full_statement if len(batch) == batch_size
+                                         else build_insert_statement(table, columns, len(batch)))
+                            await cursor.execute(statement, values)
+                            total_rows += len(batch)
+                            batches += 1
+                
+                if owned:
+                    await connection.commit()
+                elapsed = time.perf_counter() - started
+                
+                stats = {
+                    'rows': total_rows,
+                    'batches': batches,
+                    'elapsed_seconds': elapsed,
+                    'rows_per_second': total_rows / elapsed if elapsed > 0 else 0.0
+                }
+                logger.info("Carga masiva: %s filas en %s lotes (%.0f filas/s)",
+                            total_rows, batches, stats['rows_per_second'])
+                return stats
+            
+            except DATABASE_ERRORS + (ValueError,) as e:
+                await self._abandon(connection, owned, e)
+                logger.error("Error en carga masiva: %s", e)
+                raise_if_async_timeout(e)
+                raise
+            finally:
+                if lock_waits_limited:
+                    await self._restore_lock_waits(connection)
+    
+    async def load_procedure_signatures(self, refresh: bool = False) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Carga y cachea las firmas de los procedimientos de la base de datos
+        
+        Args:
+            refresh: Si debe volver a leer las firmas aunque ya estén cacheadas
+        
+        Returns:
+            Dict: Nombre del procedimiento (en minúsculas) -> lista de parámetros
+        """
+        if self._signature_lock is None:
+            self._signature_lock = asyncio.Lock()
+        
+        async with self._signature_lock:
+            if self._procedure_signatures is None or refresh:
+                rows = await self.execute_query(PROCEDURE_SIGNATURES_QUERY, fetch=True)
+                self._procedure_signatures = parse_procedure_signatures(rows)
+                logger.info("Firmas de procedimientos cargadas: %s", len(self._procedure_signatures))
+            
+            return self._procedure_signatures
+    
+    async def get_procedure_signature(self, procedure_name: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Obtiene la firma cacheada de un procedimiento
+        
+        Args:
+            procedure_name: Nombre del procedimiento
+        
+        Returns:
+            List[Dict]: Parámetros con su nombre y modo, o None si no existe
+        """
+        signatures = await self.load_procedure_signatures()
+        return signatures.get(procedure_name.lower())
+    
+    async def execute_procedure(self, procedure_name: str, params: list = None,
+                                deadline: Optional[float] = None):
+        """
+        Ejecuta un procedimiento almacenado según su firma cacheada
+        
+        Args:
+            procedure_name: Nombre del procedimiento
+            params: Lista de parámetros de entrada del procedimiento
+            deadline: Plazo de la llamada (ver execute_query)
+        
+        Returns:
+            Resultados del procedimiento y diccionario con los parámetros de salida
+        """
+        signature = await self.get_procedure_signature(_validate_identifier(procedure_name))
+        statement, values, out_variables = build_signature_statement(
+            procedure_name, params, signature
+        )
+        return await self._run_procedure_statement(procedure_name, statement, values,
+                                                   out_variables, deadline)
+    
+    async def call_procedure(self, procedure_name: str, params: Sequence[Any] = None,
+                             out_params: List[str] = None,
+                             deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        Ejecuta un procedimiento almacenado y lee sus parámetros de salida
+        en un solo viaje de red y sobre la misma conexión
+        
+        Con un plazo, los procedimientos de escritura limitan las esperas de
+        bloqueos de la sesión al tiempo restante dentro de la misma sentencia
+        múltiple (ver LittleLemonConnection.call_procedure).
+        
+        Args:
+            procedure_name: Nombre del procedimiento
+            params: Parámetros de entrada del procedimiento
+            out_params: Nombres de los parámetros de salida, en orden
+            deadline: Plazo de la llamada (ver execute_query)
+        
+        Returns:
+            Tuple: (filas de los result sets, diccionario con los parámetros de salida)
+        """
+        statement, values, out_variables = build_call_statement(
+            procedure_name, params, out_params
+        )
+        return await self._run_procedure_statement(procedure_name, statement, values,
+                                                   out_variables, deadline)
+    
+    async def _run_procedure_statement(self, procedure_name: str, statement: str,
+                                       values: Sequence[Any],
+                                       out_variables: List[Tuple[str, str]],
+                                       deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        Ejecuta una sentencia CALL y lee sus variables de salida en un solo viaje
+        
+        Args:
+            procedure_name: Nombre del procedimiento (para los mensajes de error)
+            statement: Sentencia CALL ya construida, incluido el SELECT de salida
+            values: Valores para los marcadores de la sentencia
+            out_variables: Pares (nombre del parámetro, variable de sesión) a leer
+            deadline: Plazo de la llamada
+        
+        Returns:
+            Tuple: (filas de los result sets, diccionario con los parámetros de salida)
+        """
+        async with self._acquire(deadline) as (connection, owned):
+            lock_waits_limited = False
+            try:
+                # Las esperas de bloqueos se limitan en la misma sentencia múltiple
+                remaining = remaining_time(deadline)
+                if remaining is not None and procedure_name.lower() not in self.read_only_procedures:
+                    statement = (f"{lock_wait_statement(remaining)}; {statement}; "
+                                 f"{RESTORE_LOCK_WAIT_TIMEOUT_STATEMENT}")
+                    lock_waits_limited = True
+                
+                async with connection.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(statement, tuple(values) or None)
+                    
+                    # Recorrer todos los result sets de la sentencia múltiple
+                    result_sets = []
+                    while True:
+                        if cursor.description:
+                            result_sets.append(list(await cursor.fetchall()))
+                        if not await cursor.nextset():
+                            break
+                
+                if owned:
+                    await connection.commit()
+                return split_procedure_results(result_sets, out_variables)
+            
+            except DATABASE_ERRORS as e:
+                await self._abandon(connection, owned, e)
+                logger.error("Error ejecutando procedimiento %s: %s", procedure_name, e)
+                # Si la sentencia múltiple falló no llegó a restaurar la sesión
+                if lock_waits_limited:
+                    await self._restore_lock_waits(connection)
+                raise_if_async_timeout(e)
+                raise
+    
+    def _mark_transaction_failed(self, error: Exception):
+        """
+        Marca la transacción activa para revertirla al salir del bloque
+        
+        Args:
+            error: Error ocurrido sobre la conexión fijada
+        """
+        transaction = self._current_transaction.get()
+        if transaction is not None and transaction.error is None:
+            transaction.error = error
+    
+    def in_transaction(self) -> bool:
+        """Indica si este contexto tiene una transacción activa (ver transaction)"""
+        return self._current_transaction.get() is not None
+    
+    @asynccontextmanager
+    async def transaction(self, deadline: Optional[float] = None):
+        """
+        Abre una transacción que fija una conexión del pool
+        
+        Todas las llamadas a execute_query, bulk_insert, execute_procedure y
+        call_procedure hechas dentro del bloque (incluidas las del sistema de
+        reservas asíncrono) usan la misma conexión y se confirman una sola vez
+        al salir. Si el bloque lanza una excepción o alguna de esas llamadas
+        falla, se revierte todo; los estados de error de los procedimientos
+        hay que comprobarlos y convertirlos en excepción (ver
+        LittleLemonBookingSystem.transaction).
+        
+        Args:
+            deadline: Plazo de la transacción; limita la espera en el pool y
+                      las esperas de bloqueos de toda la transacción
+        
+        Yields:
+            AsyncTransaction: Transacción activa
+        """
+        if self._current_transaction.get() is not None:
+            raise RuntimeError("Ya existe una transacción activa en este contexto")
+        
+        async with self._acquire(deadline) as (connection, _):
+            transaction = AsyncTransaction(connection)
+            token = self._current_transaction.set(transaction)
+            lock_waits_limited = False
+            
+            try:
+                await connection.begin()
+                lock_waits_limited = await self._limit_lock_waits(connection, deadline)
+                async with connection.cursor() as cursor:
+                    await cursor.execute(f"SET {UNIT_OF_WORK_VARIABLE} = 1")
+                
+                yield transaction
+                
+                if transaction.error is not None:
+                    raise transaction.error
+                await connection.commit()
+            except BaseException:
+                try:
+                    await connection.rollback()
+                except DATABASE_ERRORS as e:
+                    logger.warning("Error revirtiendo transacción: %s", e)
+                raise
+            finally:
+                self._current_transaction.reset(token)
+                try:
+                    async with connection.cursor() as cursor:
+                        await cursor.execute(f"SET {UNIT_OF_WORK_VARIABLE} = NULL")
+                except DATABASE_ERRORS as e:
+                    logger.warning("Error cerrando transacción: %s", e)
+                if lock_waits_limited:
+                    await self._restore_lock_waits(connection)
+    
+    async def test_connection(self):
+        """
+        Prueba la conexión a la base de datos
+        
+        Returns:
+            bool: True si la conexión es exitosa
+        """
+        try:
+            await self.execute_query("SELECT 1", fetch=True)
+            logger.info("Conexión asíncrona a la base de datos exitosa")
+            return True
+        except DATABASE_ERRORS + (OSError,) as e:
+            logger.error("Error de conexión: %s", e)
+            return False
+    
+    async def close_pool(self):
+        """Cierra el pool de conexiones"""
+        if self.pool:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
+            logger.info("Pool de conexiones asíncrono cerrado")
+        if self.backend:
+            self.backend.close()
+            self.backend = None
+
+
+def create_async_database_connection(environment: str = "local") -> AsyncLittleLemonConnection:
+    """
+    Crea una instancia de conexión asíncrona a la base de datos
+    
+    Args:
+        environment: Entorno de trabajo
+    
+    Returns:
+        AsyncLittleLemonConnection: Instancia de conexión
+    """
+    config = get_database_config(environment)
+    return AsyncLittleLemonConnection(config, pool_size=config.get("pool_size", 5))
@@ -0,0 +1,890 @@
+"""
+Little Lemon Availability Index Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Índice en memoria de la disponibilidad de mesas. Cada fecha se carga de la
+base de datos la primera vez que se consulta y guarda, por mesa, los
+intervalos [booking_time, end_time) de sus reservas ordenados por inicio;
+una mesa está ocupada si alguno se solapa con el que ocuparía el grupo, lo
+que se resuelve con una búsqueda binaria. Las mesas disponibles se ordenan
+por capacidad y se representan como bits de un entero para obtener con otra
+búsqueda binaria las que admiten un grupo. Las reservas hechas con el
+sistema de reservas actualizan el índice, y cada fecha se vuelve a cargar
+tras un TTL para ver las de otros procesos.
+
+Una sola consulta carga las mesas y las reservas de una fecha o de un rango
+de fechas; con ella se responden también las cuadrículas de varias horas y
+tamaños de grupo y la búsqueda de la hora libre más cercana a la pedida.
+"""
+
+import bisect
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, time as time_of_day, timedelta
+from typing import Optional, Dict, Any, List, Sequence, Iterable, Union, Callable
+
+from seating_durations import SeatingDurations
+
+DEFAULT_AVAILABILITY_INDEX_TTL = 5.0
+DEFAULT_AVAILABILITY_INDEX_DATES = 400
+
+# Horario de reservas por defecto de la búsqueda de horas libres
+DEFAULT_SERVICE_START = time_of_day(17, 0)
+DEFAULT_SERVICE_END = time_of_day(22, 0)
+DEFAULT_SLOT_MINUTES = 15
+
+# Todo lo que necesita el índice en una sola sentencia, distinguido por row_type:
+# - 'table': mesas disponibles con las reservas confirmadas de un rango de
+#   fechas (una fila por mesa sin reservas); idx_bookings_table_date resuelve
+#   el rango de cada mesa sin leer la tabla bookings
+# - 'combination': mesas de las combinaciones disponibles (una fila por mesa)
+# - 'duration': reglas de seating_durations
+RANGE_AVAILABILITY_QUERY = """
+SELECT 'table' AS row_type,
+       t.table_id, t.table_number, t.seating_capacity, t.location,
+       b.booking_id, b.booking_date, b.booking_time, b.end_time, b.parent_booking_id,
+       NULL AS combination_id, NULL AS combination_name,
+       NULL AS duration_id, NULL AS min_guests, NULL AS max_guests, NULL AS duration_minutes
+FROM tables t
+LEFT JOIN bookings b ON b.table_id = t.table_id
+    AND b.booking_date BETWEEN %s AND %s
+    AND b.status = 'confirmed'
+WHERE t.is_available = TRUE
+UNION ALL
+SELECT 'combination', m.table_id, NULL, c.seating_capacity, NULL,
+       NULL, NULL, NULL, NULL, NULL,
+       c.combination_id, c.combination_name,
+       NULL, NULL, NULL, NULL
+FROM table_combinations c
+JOIN table_combination_members m ON m.combination_id = c.combination_id
+WHERE c.is_available = TRUE
+UNION ALL
+SELECT 'duration', NULL, NULL, NULL, sd.location,
+       NULL, NULL, NULL, NULL, NULL,
+       NULL, NULL,
+       sd.duration_id, sd.min_guests, sd.max_guests, sd.duration_minutes
+FROM seating_durations sd
+"""
+
+
+def date_key(value: Union[date, datetime, str]) -> date:
+    """
+    Normaliza una fecha de reserva
+    
+    Args:
+        value: Fecha, fecha y hora o texto ISO
+    
+    Returns:
+        date: Fecha
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def slot_key(value: Union[time_of_day, timedelta, str]) -> int:
+    """
+    Normaliza una hora de reserva
+    
+    mysql.connector devuelve las columnas TIME como timedelta; las llamadas
+    al sistema de reservas usan datetime.time.
+    
+    Args:
+        value: Hora, timedelta desde medianoche o texto 'HH:MM:SS'
+    
+    Returns:
+        int: Segundos desde medianoche
+    """
+    if isinstance(value, timedelta):
+        return int(value.total_seconds())
+    if isinstance(value, str):
+        value = time_of_day.fromisoformat(value)
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def time_slots(start: time_of_day, end: time_of_day, step_minutes: int = 15) -> List[time_of_day]:
+    """
+    Genera las horas de una cuadrícula de reservas
+    
+    Args:
+        start: Primera hora
+        end: Última hora (incluida si cae en un paso)
+        step_minutes: Minutos entre horas
+    
+    Returns:
+        List[time]: Horas de start a end
+    """
+    if step_minutes <= 0:
+        raise ValueError(f"Paso no válido: {step_minutes} minutos")
+    return [
+        time_of_day(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+        for seconds in range(slot_key(start), slot_key(end) + 1, step_minutes * 60)
+    ]
+
+
+def location_matches(table_location: Optional[str], preferred_location: Optional[str]) -> bool:
+    """
+    Comprueba si una mesa está en la ubicación pedida
+    
+    Args:
+        table_location: Ubicación de la mesa
+        preferred_location: Ubicación pedida; basta una parte del nombre sin
+                            distinguir mayúsculas ("window" -> "Window Side")
+    
+    Returns:
+        bool: True si coincide
+    """
+    return (preferred_location is not None and table_location is not None
+            and preferred_location.casefold() in table_location.casefold())
+
+
+class TableLayout:
+    """Mesas disponibles ordenadas por capacidad; la posición de cada mesa es su bit"""
+    
+    def __init__(self, tables: Iterable[Dict[str, Any]],
+                 durations: Optional[SeatingDurations] = None,
+                 combinations: Iterable[Dict[str, Any]] = ()):
+        """
+        Inicializa la distribución de mesas
+        
+        Args:
+            tables: Filas con table_id, table_number, seating_capacity y location
+            durations: Reglas de duración de ocupación
+            combinations: Filas 'combination' de RANGE_AVAILABILITY_QUERY
+        """
+        self.tables = tuple(sorted(
+            ((row['table_id'], row['table_number'], row['seating_capacity'], row['location'])
+             for row in tables),
+            key=lambda table: (table[2], table[1])
+        ))
+        self.durations = durations or SeatingDurations()
+        self.capacities = [table[2] for table in self.tables]
+        self.positions = {table[0]: position for position, table in enumerate(self.tables)}
+        self.bits = {table_id: 1 << position for table_id, position in self.positions.items()}
+        self._seconds_seated = {}
+        self.locations = {}
+        for position, table in enumerate(self.tables):
+            self.locations[table[3]] = self.locations.get(table[3], 0) | 1 << position
+        
+        # Combinaciones con todas sus mesas disponibles, de la más barata (menos
+        # asientos y menos mesas) a la más cara: (combination_id, nombre,
+        # capacidad, ubicación de la mesa principal, posiciones por número de mesa)
+        members = {}
+        for row in combinations:
+            members.setdefault(
+                (row['combination_id'], row['combination_name'], row['seating_capacity']), []
+            ).append(row['table_id'])
+        usable = []
+        for (combination_id, name, capacity), table_ids in members.items():
+            if not all(table_id in self.positions for table_id in table_ids):
+                continue
+            positions = tuple(sorted((self.positions[table_id] for table_id in table_ids),
+                                     key=lambda position: self.tables[position][1]))
+            usable.append((combination_id, name, capacity, self.tables[positions[0]][3], positions))
+        self.combinations = tuple(sorted(
+            usable, key=lambda combination: (combination[2], len(combination[4]), combination[0])
+        ))
+        self.combination_capacities = [combination[2] for combination in self.combinations]
+        
+        # Para cada posición inicial (primera mesa con capacidad suficiente), las
+        # mesas candidatas en orden de número de mesa, como el procedimiento
+        self.candidates = [
+            tuple(sorted(range(start, len(self.tables)), key=lambda position: self.tables[position][1]))
+            for start in range(len(self.tables) + 1)
+        ]
+    
+    def fitting_mask(self, party_size: int) -> int:
+        """Bits de las mesas con capacidad para el grupo"""
+        start = bisect.bisect_left(self.capacities, party_size)
+        return (1 << len(self.tables)) - (1 << start)
+    
+    def location_mask(self, location: Optional[str]) -> int:
+        """Bits de las mesas de una ubicación (None = todas; ver location_matches)"""
+        if location is None:
+            return (1 << len(self.tables)) - 1
+        mask = 0
+        for table_location, bits in self.locations.items():
+            if location_matches(table_location, location):
+                mask |= bits
+        return mask
+    
+    def seconds_seated(self, party_size: int) -> Sequence[int]:
+        """Segundos que un grupo ocuparía cada mesa (por posición), según su ubicación"""
+        seconds = self._seconds_seated.get(party_size)
+        if seconds is None:
+            seconds = tuple(self.durations.minutes(party_size, table[3]) * 60
+                            for table in self.tables)
+            self._seconds_seated[party_size] = seconds
+        return seconds
+    
+    def end_of(self, table_id: int, start: int, party_size: int) -> int:
+        """Fin en segundos de una reserva del grupo en la mesa desde start"""
+        location = self.tables[self.positions[table_id]][3] if table_id in self.positions else None
+        return start + self.durations.minutes(party_size, location) * 60
+    
+    def same_as(self, other: "TableLayout") -> bool:
+        """Si describe las mismas mesas con las mismas reglas de duración"""
+        return (self.tables == other.tables and self.durations.rules == other.durations.rules
+                and self.combinations == other.combinations)
+
+
+class TableIntervals:
+    """Intervalos [inicio, fin) de las reservas de una mesa, ordenados por inicio"""
+    
+    def __init__(self):
+        """Inicializa la mesa sin reservas"""
+        self.starts = []
+        self.ends = []
+        self.booking_ids = []
+        
+        # reach[i] = mayor fin de los intervalos 0..i: admite reservas solapadas
+        # (cargas masivas o datos anteriores a las duraciones)
+        self.reach = []
+    
+    def add(self, booking_id: int, start: int, end: int):
+        """Añade una reserva"""
+        position = bisect.bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.ends.insert(position, end)
+        self.booking_ids.insert(position, booking_id)
+        self.reach.insert(position, 0)
+        self._update_reach(position)
+    
+    def remove(self, booking_id: int):
+        """Retira una reserva"""
+        position = self.booking_ids.index(booking_id)
+        del self.starts[position], self.ends[position]
+        del self.booking_ids[position], self.reach[position]
+        self._update_reach(position)
+    
+    def _update_reach(self, position: int):
+        reach = self.reach[position - 1] if position else 0
+        for index in range(position, len(self.ends)):
+            reach = max(reach, self.ends[index])
+            self.reach[index] = reach
+    
+    def overlaps(self, start: int, end: int) -> bool:
+        """Si alguna reserva se solapa con [start, end)"""
+        position = bisect.bisect_left(self.starts, end)
+        return position > 0 and self.reach[position - 1] > start
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
+class DateSlots:
+    """Reservas confirmadas de una fecha e intervalos ocupados de cada mesa"""
+    
+    def __init__(self, layout: TableLayout):
+        """
+        Inicializa la fecha sin reservas
+        
+        Args:
+            layout: Distribución de mesas a la que se refieren los bits
+        """
+        self.layout = layout
+        self.bookings = {}
+        self.tables = {}
+        
+        # Reservas de las demás mesas de cada reserva combinada, por reserva principal
+        self.combined = {}
+        self.loaded_at = time.monotonic()
+    
+    def add(self, booking_id: int, table_id: int, start: int, end: int,
+            parent_booking_id: Optional[int] = None):
+        """Marca la mesa ocupada de start a end (segundos desde medianoche)"""
+        if parent_booking_id is not None:
+            self.combined.setdefault(parent_booking_id, []).append(booking_id)
+        self.bookings[booking_id] = (table_id, start, end)
+        position = self.layout.positions.get(table_id)
+        if position is not None:
+            self.tables.setdefault(position, TableIntervals()).add(booking_id, start, end)
+    
+    def remove(self, booking_id: int) -> Optional[int]:
+        """
+        Retira una reserva
+        
+        Returns:
+            int: Mesa de la reserva, o None si no estaba en la fecha
+        """
+        booking = self.bookings.pop(booking_id, None)
+        if booking is None:
+            return None
+        
+        table_id = booking[0]
+        position = self.layout.positions.get(table_id)
+        if position is not None:
+            intervals = self.tables[position]
+            intervals.remove(booking_id)
+            if not intervals:
+                del self.tables[position]
+        return table_id
+    
+    def remove_combined(self, booking_id: int) -> Optional[int]:
+        """
+        Retira una reserva con todas sus mesas si es combinada
+        
+        Returns:
+            int: Mesa de la reserva, o None si no estaba en la fecha
+        """
+        main_booking_id = booking_id
+        for parent_booking_id, booking_ids in self.combined.items():
+            if booking_id in booking_ids:
+                main_booking_id = parent_booking_id
+                break
+        for other_booking_id in self.combined.pop(main_booking_id, ()):
+            if other_booking_id != booking_id:
+                self.remove(other_booking_id)
+        if main_booking_id != booking_id:
+            self.remove(main_booking_id)
+        return self.remove(booking_id)
+    
+    def booked_mask(self, start: int, seconds_seated: Sequence[int], mask: int = -1) -> int:
+        """
+        Obtiene las mesas en las que una reserva desde start chocaría con otra
+        
+        Args:
+            start: Inicio en segundos desde medianoche
+            seconds_seated: Duración de la reserva en cada mesa (por posición)
+            mask: Mesas a comprobar (por defecto todas)
+        
+        Returns:
+            int: Bits de las mesas ocupadas en algún momento del intervalo
+        """
+        booked = 0
+        for position, intervals in self.tables.items():
+            if mask >> position & 1 and intervals.overlaps(start, start + seconds_seated[position]):
+                booked |= 1 << position
+        return booked
+
+
+def load_range_slots(db_connection, first_date: date, last_date: date,
+                     deadline: Optional[float] = None,
+                     layout: Optional[TableLayout] = None) -> Dict[date, DateSlots]:
+    """
+    Carga las mesas disponibles y las reservas confirmadas de un rango de fechas
+    
+    Es una sola consulta (RANGE_AVAILABILITY_QUERY), que trae también las
+    combinaciones de mesas y las reglas de duración.
+    
+    Args:
+        db_connection: Conexión de Little Lemon
+        first_date: Primera fecha
+        last_date: Última fecha (incluida)
+        deadline: Plazo de la consulta
+        layout: Distribución vigente; se reutiliza si las mesas no cambiaron
+    
+    Returns:
+        Dict[date, DateSlots]: Reservas de cada fecha del rango
+    """
+    first_date, last_date = date_key(first_date), date_key(last_date)
+    rows = db_connection.execute_query(RANGE_AVAILABILITY_QUERY, (first_date, last_date),
+                                       fetch=True, deadline=deadline)
+    return build_range_slots(rows, first_date, last_date, layout)
+
+
+def build_range_slots(rows: Sequence[Dict[str, Any]], first_date: date, last_date: date,
+                      layout: Optional[TableLayout] = None) -> Dict[date, DateSlots]:
+    """
+    Construye las reservas de cada fecha de un rango a partir de sus filas
+    
+    Args:
+        rows: Filas de RANGE_AVAILABILITY_QUERY
+        first_date: Primera fecha
+        last_date: Última fecha (incluida)
+        layout: Distribución vigente; se reutiliza si las mesas no cambiaron
+    
+    Returns:
+        Dict[date, DateSlots]: Reservas de cada fecha del rango
+    """
+    first_date, last_date = date_key(first_date), date_key(last_date)
+    table_rows = [row for row in rows if row['row_type'] == 'table']
+    loaded_layout = TableLayout(
+        {row['table_id']: row for row in table_rows}.values(),
+        SeatingDurations(row for row in rows if row['row_type'] == 'duration'),
+        [row for row in rows if row['row_type'] == 'combination']
+    )
+    if layout is None or not layout.same_as(loaded_layout):
+        layout = loaded_layout
+    
+    entries = {
+        first_date + timedelta(days=offset): DateSlots(layout)
+        for offset in range((last_date - first_date).days + 1)
+    }
+    for row in table_rows:
+        if row['booking_id'] is not None:
+            entries[date_key(row['booking_date'])].add(
+                row['booking_id'], row['table_id'],
+                slot_key(row['booking_time']), slot_key(row['end_time']),
+                row['parent_booking_id']
+            )
+    return entries
+
+
+def load_date_slots(db_connection, booking_date: date, deadline: Optional[float] = None,
+                    layout: Optional[TableLayout] = None) -> DateSlots:
+    """
+    Carga las mesas disponibles y las reservas confirmadas de una fecha
+    
+    Args:
+        db_connection: Conexión de Little Lemon
+        booking_date: Fecha a cargar
+        deadline: Plazo de la consulta
+        layout: Distribución vigente; se reutiliza si las mesas no cambiaron
+    
+    Returns:
+        DateSlots: Reservas de la fecha
+    """
+    booking_date = date_key(booking_date)
+    return load_range_slots(db_connection, booking_date, booking_date, deadline, layout)[booking_date]
+
+
+def search_dates(preferred: datetime, window_days: int) -> List[date]:
+    """
+    Obtiene las fechas de una búsqueda de horas libres
+    
+    Args:
+        preferred: Fecha y hora preferidas
+        window_days: Días a buscar antes y después de la fecha preferida
+    
+    Returns:
+        List[date]: Fechas de preferred - window_days a preferred + window_days
+    """
+    if window_days < 0:
+        raise ValueError(f"Ventana no válida: {window_days} días")
+    first_date = date_key(preferred) - timedelta(days=window_days)
+    return [first_date + timedelta(days=offset) for offset in range(2 * window_days + 1)]
+
+
+def nearest_available(entries: Dict[date, DateSlots], party_size: int, preferred: datetime,
+                      slots: Sequence[time_of_day], location: Optional[str] = None,
+                      limit: int = 5, not_before: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Busca las horas con mesa libre más cercanas a la preferida
+    
+    En cada fecha y hora se propone la mesa libre más pequeña que admite el
+    grupo (a igual capacidad, la de menor número).
+    
+    Args:
+        entries: Reservas de las fechas a buscar
+        party_size: Tamaño del grupo
+        preferred: Fecha y hora preferidas
+        slots: Horas de reserva de cada fecha
+        location: Ubicación de la mesa, o parte de su nombre (None = cualquiera)
+        limit: Número máximo de opciones
+        not_before: Descartar las horas anteriores a este instante
+    
+    Returns:
+        List[Dict]: Opciones ordenadas por distancia a la preferida (y, a igual
+                    distancia, la más temprana), con booking_date, booking_time,
+                    table_id, table_number, seating_capacity, location,
+                    free_tables y distance_minutes
+    """
+    def candidates():
+        for booking_date, entry in entries.items():
+            layout = entry.layout
+            fitting = layout.fitting_mask(party_size) & layout.location_mask(location)
+            if not fitting:
+                continue
+            seconds_seated = layout.seconds_seated(party_size)
+            for slot in slots:
+                when = datetime.combine(booking_date, slot)
+                if not_before is not None and when < not_before:
+                    continue
+                free = fitting & ~entry.booked_mask(slot_key(slot), seconds_seated, fitting)
+                if free:
+                    yield abs((when - preferred).total_seconds()), when, free, layout
+    
+    options = []
+    for distance, when, free, layout in heapq.nsmallest(limit, candidates(),
+                                                        key=lambda option: option[:2]):
+        position = (free & -free).bit_length() - 1
+        table_id, table_number, seating_capacity, table_location = layout.tables[position]
+        options.append({
+            'booking_date': when.date(),
+            'booking_time': when.time(),
+            'table_id': table_id,
+            'table_number': table_number,
+            'seating_capacity': seating_capacity,
+            'location': table_location,
+            'free_tables': bin(free).count("1"),
+            'distance_minutes': int(distance // 60)
+        })
+    return options
+
+
+def availability_rows(entry: DateSlots, check_time: time_of_day,
+                      required_capacity: int) -> List[Dict[str, Any]]:
+    """
+    Obtiene las mesas con capacidad suficiente y su estado a una hora
+    
+    Args:
+        entry: Reservas de la fecha
+        check_time: Hora a verificar
+        required_capacity: Capacidad requerida
+    
+    Returns:
+        List[Dict]: Las filas de CheckBookingAvailability, ordenadas por número de mesa
+    """
+    layout = entry.layout
+    booked = entry.booked_mask(slot_key(check_time), layout.seconds_seated(required_capacity),
+                               layout.fitting_mask(required_capacity))
+    start = bisect.bisect_left(layout.capacities, required_capacity)
+    
+    rows = []
+    for position in layout.candidates[start]:
+        table_id, table_number, seating_capacity, location = layout.tables[position]
+        rows.append({
+            'table_id': table_id,
+            'table_number': table_number,
+            'seating_capacity': seating_capacity,
+            'location': location,
+            'availability_status': 'Booked' if booked >> position & 1 else 'Available'
+        })
+    return rows
+
+
+def availability_grid(entry: DateSlots, check_date: date, slots: Sequence[time_of_day],
+                      party_sizes: Sequence[int]) -> Dict[str, Any]:
+    """
+    Construye la matriz hora x mesa de disponibilidad de una fecha
+    
+    Args:
+        entry: Reservas de la fecha
+        check_date: Fecha de la cuadrícula
+        slots: Horas (filas de la matriz)
+        party_sizes: Tamaños de grupo a resumir
+    
+    Returns:
+        Dict: date, slots, tables (columnas, por número de mesa), available
+              (una tupla de booleanos por hora, True = sin reserva en curso)
+              y party_sizes (por tamaño: columnas de las mesas con capacidad
+              suficiente y número de ellas libres durante toda la reserva
+              que empezara a cada hora)
+    """
+    layout = entry.layout
+    columns = layout.candidates[0]
+    starts = [slot_key(slot) for slot in slots]
+    instant = (1,) * len(layout.tables)
+    booked_by_slot = [entry.booked_mask(start, instant) for start in starts]
+    
+    summary = {}
+    for party_size in party_sizes:
+        fitting = layout.fitting_mask(party_size)
+        seconds_seated = layout.seconds_seated(party_size)
+        summary[party_size] = {
+            'tables': [column for column, position in enumerate(columns) if fitting >> position & 1],
+            'free': [bin(fitting & ~entry.booked_mask(start, seconds_seated, fitting)).count("1")
+                     for start in starts]
+        }
+    
+    return {
+        'date': date_key(check_date),
+        'slots': list(slots),
+        'tables': [
+            dict(zip(('table_id', 'table_number', 'seating_capacity', 'location'),
+                     layout.tables[position]))
+            for position in columns
+        ],
+        'available': [
+            tuple(not booked >> position & 1 for position in columns)
+            for booked in booked_by_slot
+        ],
+        'party_sizes': summary
+    }
+
+
+class AvailabilityIndex:
+    """Índice de disponibilidad de mesas por fecha y hora, cargado bajo demanda"""
+    
+    def __init__(self, db_connection, ttl: float = DEFAULT_AVAILABILITY_INDEX_TTL,
+                 max_dates: int = DEFAULT_AVAILABILITY_INDEX_DATES):
+        """
+        Inicializa el índice vacío
+        
+        Args:
+            db_connection: Conexión de Little Lemon con la que se cargan los datos
+            ttl: Segundos que una fecha se usa sin recargarla
+            max_dates: Número máximo de fechas en memoria
+        """
+        self.db_connection = db_connection
+        self.ttl = ttl
+        self.max_dates = max_dates
+        self._lock = threading.Lock()
+        self._layout = None
+        self._dates = OrderedDict()
+        
+        # Versión de cambios: evita guardar una fecha leída antes de una
+        # reserva que terminó mientras se cargaba
+        self._version = 0
+        
+        # Métricas
+        self.hits = 0
+        self.loads = 0
+        self.updates = 0
+        self.invalidations = 0
+    
+    def check(self, check_date: date, check_time: time_of_day, required_capacity: int,
+              deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Obtiene las mesas con capacidad suficiente y su estado a una hora
+        
+        Devuelve las mismas filas que el procedimiento CheckBookingAvailability.
+        
+        Args:
+            check_date: Fecha a verificar
+            check_time: Hora a verificar
+            required_capacity: Capacidad requerida
+            deadline: Plazo de la carga si la fecha no está en memoria
+        
+        Returns:
+            List[Dict]: Mesas ordenadas por número con su availability_status
+        """
+        return self.query_date(
+            check_date, lambda entry: availability_rows(entry, check_time, required_capacity),
+            deadline
+        )
+    
+    def grid(self, check_date: date, slots: Sequence[time_of_day], party_sizes: Sequence[int],
+             deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Obtiene la matriz de disponibilidad de varias horas y tamaños de grupo
+        
+        Args:
+            check_date: Fecha a verificar
+            slots: Horas a verificar
+            party_sizes: Tamaños de grupo
+            deadline: Plazo de la carga si la fecha no está en memoria
+        
+        Returns:
+            Dict: Matriz hora x mesa (ver availability_grid)
+        """
+        return self.query_date(
+            check_date, lambda entry: availability_grid(entry, check_date, slots, party_sizes),
+            deadline
+        )
+    
+    def query_date(self, check_date: date, compute: Callable[[DateSlots], Any],
+                   deadline: Optional[float] = None) -> Any:
+        """
+        Calcula un resultado sobre las reservas de una fecha
+        
+        record_booking, record_move y record_cancellation modifican las fechas
+        en memoria, así que compute se ejecuta con el lock tomado y no debe
+        guardar la fecha ni modificarla.
+        
+        Args:
+            check_date: Fecha
+            compute: Función (reservas de la fecha) -> resultado
+            deadline: Plazo de la carga si la fecha no está en memoria
+        
+        Returns:
+            Resultado de compute
+        """
+        booking_date = date_key(check_date)
+        return self._query_dates([booking_date], lambda entries: compute(entries[booking_date]),
+                                 deadline)
+    
+    def find_next_available(self, party_size: int, preferred: datetime, window_days: int,
+                            slots: Sequence[time_of_day], location: Optional[str] = None,
+                            limit: int = 5, not_before: Optional[datetime] = None,
+                            deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Busca las horas con mesa libre más cercanas a la preferida
+        
+        Las fechas que no están en memoria se cargan con una sola consulta.
+        
+        Args:
+            party_size: Tamaño del grupo
+            preferred: Fecha y hora preferidas
+            window_days: Días a buscar antes y después de la fecha preferida
+            slots: Horas de reserva de cada fecha
+            location: Ubicación de la mesa, o parte de su nombre (None = cualquiera)
+            limit: Número máximo de opciones
+            not_before: Descartar las horas anteriores a este instante
+            deadline: Plazo de la carga
+        
+        Returns:
+            List[Dict]: Opciones ordenadas por distancia (ver nearest_available)
+        """
+        return self._query_dates(
+            search_dates(preferred, window_days),
+            lambda entries: nearest_available(entries, party_size, preferred, slots, location,
+                                              limit, not_before),
+            deadline
+        )
+    
+    def _query_dates(self, dates: Sequence[date], compute: Callable[[Dict[date, DateSlots]], Any],
+                     deadline: Optional[float]) -> Any:
+        """Calcula un resultado sobre varias fechas vigentes con el lock tomado"""
+        entries = self._get_dates(dates, deadline)
+        with self._lock:
+            return compute(entries)
+    
+    def _get_dates(self, dates: Sequence[date], deadline: Optional[float]) -> Dict[date, DateSlots]:
+        """
+        Obtiene varias fechas vigentes
+        
+        Las que faltan o vencieron se cargan juntas con una consulta que
+        abarca de la primera a la última de ellas.
+        """
+        entries = {}
+        missing = []
+        with self._lock:
+            layout = self._layout
+            now = time.monotonic()
+            for booking_date in dates:
+                entry = self._dates.get(booking_date)
+                if entry is not None and entry.layout is layout and entry.loaded_at + self.ttl > now:
+                    self._dates.move_to_end(booking_date)
+                    self.hits += 1
+                    entries[booking_date] = entry
+                else:
+                    missing.append(booking_date)
+            version = self._version
+        
+        if not missing:
+            return entries
+        
+        loaded = load_range_slots(self.db_connection, min(missing), max(missing), deadline, layout)
+        
+        with self._lock:
+            self.loads += 1
+            loaded_layout = next(iter(loaded.values())).layout
+            if self._layout is None or not loaded_layout.same_as(self._layout):
+                # Cambiaron las mesas o las duraciones: las fechas cargadas no valen
+                self._layout = loaded_layout
+                self._dates.clear()
+            else:
+                for entry in loaded.values():
+                    entry.layout = self._layout
+            
+            # Una reserva hecha durante la carga podría faltar: se usa sin guardarla
+            if self._version == version:
+                for booking_date, entry in loaded.items():
+                    self._dates[booking_date] = entry
+                    self._dates.move_to_end(booking_date)
+                while len(self._dates) > self.max_dates:
+                    self._dates.popitem(last=False)
+        
+        for booking_date in missing:
+            entries[booking_date] = loaded[booking_date]
+        return entries
+    
+    def record_booking(self, booking_id: int, table_id: int, booking_date: date,
+                       booking_time: time_of_day, number_of_guests: int):
+        """
+        Registra una reserva confirmada
+        
+        Args:
+            booking_id: ID de la reserva
+            table_id: ID de la mesa
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de comensales (determina la duración)
+        """
+        with self._lock:
+            self._version += 1
+            self.updates += 1
+            entry = self._dates.get(date_key(booking_date))
+            if entry is not None:
+                start = slot_key(booking_time)
+                entry.add(booking_id, table_id, start,
+                          entry.layout.end_of(table_id, start, number_of_guests))
+    
+    def record_move(self, booking_id: int, new_booking_date: date, new_booking_time: time_of_day,
+                    new_number_of_guests: int):
+        """
+        Registra el cambio de fecha, hora o comensales de una reserva
+        
+        Si la reserva no estaba en memoria se desconoce su mesa y la nueva
+        fecha se descarta para recargarla.
+        
+        Args:
+            booking_id: ID de la reserva
+            new_booking_date: Nueva fecha
+            new_booking_time: Nueva hora
+            new_number_of_guests: Nuevo número de comensales
+        """
+        new_booking_date = date_key(new_booking_date)
+        with self._lock:
+            self._version += 1
+            self.updates += 1
+            table_id = self._remove(booking_id)
+            entry = self._dates.get(new_booking_date)
+            if entry is None:
+                return
+            if table_id is None:
+                del self._dates[new_booking_date]
+                self.invalidations += 1
+            else:
+                start = slot_key(new_booking_time)
+                entry.add(booking_id, table_id, start,
+                          entry.layout.end_of(table_id, start, new_number_of_guests))
+    
+    def record_combined_booking(self, booking_date: date):
+        """
+        Registra una reserva de varias mesas
+        
+        No se conocen los IDs de las reservas de cada mesa: la fecha se
+        descarta y se recarga en la siguiente consulta.
+        
+        Args:
+            booking_date: Fecha de la reserva
+        """
+        with self._lock:
+            self._version += 1
+            self.updates += 1
+            if self._dates.pop(date_key(booking_date), None) is not None:
+                self.invalidations += 1
+    
+    def record_cancellation(self, booking_id: int):
+        """
+        Registra la cancelación de una reserva (con todas sus mesas si es combinada)
+        
+        Args:
+            booking_id: ID de la reserva
+        """
+        with self._lock:
+            self._version += 1
+            self.updates += 1
+            self._remove(booking_id, combined=True)
+    
+    def _remove(self, booking_id: int, combined: bool = False) -> Optional[int]:
+        """Retira una reserva de las fechas cargadas; se llama con el lock tomado"""
+        for entry in self._dates.values():
+            table_id = entry.remove_combined(booking_id) if combined else entry.remove(booking_id)
+            if table_id is not None:
+                return table_id
+        return None
+    
+    def invalidate(self):
+        """Descarta todas las fechas cargadas (se recargan en la siguiente consulta)"""
+        with self._lock:
+            self._version += 1
+            self.invalidations += len(self._dates)
+            self._dates.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las métricas del índice
+        
+        Returns:
+            Dict: Fechas y mesas en memoria, aciertos, cargas, actualizaciones e invalidaciones
+        """
+        with self._lock:
+            lookups = self.hits + self.loads
+            return {
+                'dates': len(self._dates),
+                'tables': len(self._layout.tables) if self._layout else 0,
+                'hits': self.hits,
+                'loads': self.loads,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'updates': self.updates,
+                'invalidations': self.invalidations
+            }
@@ -0,0 +1,287 @@
+"""
+Little Lemon Benchmarks
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Mide el rendimiento de la capa de acceso a datos sobre la carga de reservas.
+Requiere una base de datos little_lemon_db con los datos de ejemplo, o el
+entorno sqlite (base de datos embebida, ver sqlite_backend).
+"""
+
+import sys
+import os
+import argparse
+import itertools
+import logging
+import statistics
+import subprocess
+import time
+from datetime import date, time as time_of_day, timedelta
+from typing import Dict, List, Any, Callable
+
+# Agregar el directorio actual al path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from connection import LittleLemonConnection, get_database_config
+from booking_system import (
+    LittleLemonBookingSystem,
+    CALL_MODES,
+    CUSTOMER_INFO_QUERY,
+    MENU_ITEMS_QUERY,
+    TABLES_INFO_QUERY
+)
+from logging_config import configure_logging
+
+# Consulta de reservas por fecha usada como lectura caliente en los benchmarks
+BOOKINGS_BY_DATE_QUERY = """
+SELECT booking_id, table_id, booking_time, number_of_guests, status
+FROM bookings
+WHERE booking_date = %s
+ORDER BY booking_time
+"""
+
+# Primera fecha de las reservas que crean los benchmarks de escritura; cada
+# iteración usa un día distinto para no chocar con las anteriores
+BENCHMARK_BOOKING_START = date(2030, 1, 1)
+
+# Arranque en frío: código que ejecuta un intérprete nuevo en cada variante
+IMPORT_TIME_SCENARIOS = {
+    'intérprete vacío': "pass",
+    'import booking_system': "import booking_system",
+    'booking CLI (sin verificar)': (
+        "from booking_system import LittleLemonBookingSystem\n"
+        "LittleLemonBookingSystem('local').close_connection()"
+    ),
+    'import data_analysis': "import data_analysis",
+    'import demo_system': "import demo_system"
+}
+
+# Dependencias pesadas cuya carga se comprueba tras cada variante
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib", "seaborn")
+
+
+def measure(operation: Callable[[], Any], iterations: int, warmup: int = 10) -> Dict[str, float]:
+    """
+    Mide la latencia de una operación repetida
+    
+    Args:
+        operation: Función a medir
+        iterations: Número de repeticiones medidas
+        warmup: Repeticiones previas que no se miden
+    
+    Returns:
+        Dict: Operaciones por segundo y latencias (ms) media, p50, p95 y p99
+    """
+    for _ in range(warmup):
+        operation()
+    
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        operation()
+        latencies.append((time.perf_counter() - call_started) * 1000)
+    elapsed = time.perf_counter() - started
+    
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        'ops_per_second': iterations / elapsed if elapsed > 0 else 0.0,
+        'mean_ms': statistics.fmean(latencies),
+        'p50_ms': quantiles[49],
+        'p95_ms': quantiles[94],
+        'p99_ms': quantiles[98]
+    }
+
+
+def print_results(title: str, results: Dict[str, Dict[str, float]]):
+    """
+    Imprime una tabla de resultados
+    
+    Args:
+        title: Título de la tabla
+        results: Nombre de la variante -> métricas de measure()
+    """
+    width = max([28] + [len(name) + 2 for name in results])
+    print(f"\n{title}")
+    print(f"{'Variante':<{width}}{'ops/s':>10}{'media':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for name, metrics in results.items():
+        print(f"{name:<{width}}{metrics['ops_per_second']:>10.1f}{metrics['mean_ms']:>10.3f}"
+              f"{metrics['p50_ms']:>10.3f}{metrics['p95_ms']:>10.3f}{metrics['p99_ms']:>10.3f}")
+
+
+def benchmark_statement_protocols(environment: str = "local",
+                                  iterations: int = 500) -> Dict[str, Dict[str, float]]:
+    """
+    Compara el protocolo de texto con las sentencias preparadas (protocolo binario)
+    
+    Cada iteración ejecuta las lecturas calientes del sistema de reservas:
+    información de cliente, mesas, menú y reservas de una fecha. Ambas
+    variantes usan el mismo pool en modo preparado (sin reinicio de sesión)
+    para que solo cambie el protocolo.
+    
+    Args:
+        environment: Entorno de trabajo
+        iterations: Número de iteraciones por variante
+    
+    Returns:
+        Dict: Métricas por variante (texto / preparado)
+    """
+    config = get_database_config(environment)
+    config["prepared_statements"] = True
+    db_connection = LittleLemonConnection(config)
+    try:
+        def workload(prepared: bool) -> Callable[[], None]:
+            def run():
+                for customer_id in range(1, 11):
+                    db_connection.execute_query(CUSTOMER_INFO_QUERY, (customer_id,),
+                                                fetch=True, prepared=prepared)
+                db_connection.execute_query(TABLES_INFO_QUERY, fetch=True, prepared=prepared)
+                db_connection.execute_query(MENU_ITEMS_QUERY, fetch=True, prepared=prepared)
+                db_connection.execute_query(BOOKINGS_BY_DATE_QUERY, (date(2025, 7, 15),),
+                                            fetch=True, prepared=prepared)
+            return run
+        
+        results = {
+            'texto (13 consultas)': measure(workload(False), iterations),
+            'preparado (13 consultas)': measure(workload(True), iterations)
+        }
+        
+        stats = db_connection.get_pool_stats()
+        print(f"Sentencias preparadas: {stats['prepared_statements']} cacheadas, "
+              f"{stats['prepared_hits']} aciertos, {stats['prepared_misses']} fallos")
+        return results
+    
+    finally:
+        db_connection.close_pool()
+
+
+def benchmark_call_modes(environment: str = "local",
+                         iterations: int = 200) -> Dict[str, Dict[str, float]]:
+    """
+    Compara cada operación con procedimientos almacenados y con SQL directo
+    
+    Las lecturas consultan los datos de ejemplo. Las escrituras crean una
+    reserva por iteración en días sucesivos desde BENCHMARK_BOOKING_START,
+    las modifican y las cancelan: las reservas creadas quedan canceladas.
+    
+    Args:
+        environment: Entorno de trabajo
+        iterations: Número de iteraciones por operación y modo
+    
+    Returns:
+        Dict: Métricas por operación y modo
+    """
+    by_mode = {}
+    for mode in CALL_MODES:
+        booking_system = LittleLemonBookingSystem(environment, call_mode=mode)
+        try:
+            booking_dates = (BENCHMARK_BOOKING_START + timedelta(days=day) for day in itertools.count())
+            booking_ids = []
+            
+            def add_booking():
+                status = booking_system.add_booking(1, 1, next(booking_dates),
+                                                    time_of_day(19, 0), 2)
+                if not status.startswith("Booking confirmed"):
+                    raise RuntimeError(f"add_booking ({mode}): {status}")
+                booking_ids.append(int(status.rsplit(" ", 1)[-1]))
+            
+            updated_ids = itertools.cycle(booking_ids)
+            operations = {
+                'GetMaxQuantity': lambda: booking_system.get_max_quantity("Bruschetta"),
+                'ManageBooking': lambda: booking_system.manage_booking(date(2025, 7, 15), 1),
+                'CheckBookingAvailability': lambda: booking_system.check_booking_availability(
+                    date(2025, 7, 15), time_of_day(19, 0), 2
+                ),
+                'GetBookingsByDate': lambda: booking_system.get_bookings_by_date(date(2025, 7, 15)),
+                'AddBooking': add_booking,
+                'UpdateBooking': lambda: booking_system.update_booking(
+                    next(updated_ids), BENCHMARK_BOOKING_START, time_of_day(20, 0), 2
+                ),
+                'CancelBooking': lambda: booking_system.cancel_booking(booking_ids.pop())
+            }
+            by_mode[mode] = {
+                name: measure(operation, iterations) for name, operation in operations.items()
+            }
+        finally:
+            booking_system.close_connection()
+    
+    return {
+        f"{name} ({mode})": by_mode[mode][name]
+        for name in by_mode[CALL_MODES[0]]
+        for mode in CALL_MODES
+    }
+
+
+def run_python(code: str) -> str:
+    """
+    Ejecuta código en un intérprete nuevo con el directorio de los módulos en el path
+    
+    Args:
+        code: Código Python a ejecutar
+    
+    Returns:
+        str: Salida estándar del proceso
+    """
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    project_dir = os.path.dirname(module_dir)
+    setup = f"import sys; sys.path[:0] = [{module_dir!r}, {project_dir!r}]\n"
+    completed = subprocess.run(
+        [sys.executable, "-c", setup + code],
+        cwd=module_dir, capture_output=True, text=True, check=True
+    )
+    return completed.stdout
+
+
+def benchmark_import_time(iterations: int = 20) -> Dict[str, Dict[str, float]]:
+    """
+    Mide el arranque en frío de los puntos de entrada
+    
+    Cada iteración lanza un intérprete nuevo, por lo que incluye el arranque
+    de Python (ver la variante "intérprete vacío") y la importación de todos
+    los módulos. No requiere base de datos: el sistema de reservas no se
+    conecta hasta la primera operación.
+    
+    Args:
+        iterations: Número de arranques por variante
+    
+    Returns:
+        Dict: Métricas por variante
+    """
+    results = {}
+    for name, code in IMPORT_TIME_SCENARIOS.items():
+        results[name] = measure(lambda: run_python(code), iterations, warmup=2)
+        
+        loaded = run_python(
+            code + f"\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        ).strip().splitlines()[-1:]
+        print(f"{name}: módulos pesados cargados: {loaded[0] if loaded and loaded[0] else 'ninguno'}")
+    return results
+
+
+def main(argv: List[str] = None):
+    """Función principal de los benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmarks de Little Lemon")
+    parser.add_argument("benchmark", choices=["protocols", "procedures", "imports"],
+                        help="Benchmark a ejecutar")
+    parser.add_argument("--environment", default="local", help="Entorno de base de datos")
+    parser.add_argument("--iterations", type=int, default=None,
+                        help="Iteraciones por variante (500 en protocols, 200 en "
+                             "procedures, 20 en imports)")
+    args = parser.parse_args(argv)
+    
+    # El sistema de reservas registra cada llamada; en el benchmark solo los avisos
+    configure_logging(logging.WARNING if args.benchmark == "procedures" else logging.INFO)
+    
+    if args.benchmark == "protocols":
+        results = benchmark_statement_protocols(args.environment, args.iterations or 500)
+        print_results("Protocolo de texto vs. sentencias preparadas", results)
+    elif args.benchmark == "procedures":
+        results = benchmark_call_modes(args.environment, args.iterations or 200)
+        print_results("Procedimientos almacenados vs. SQL directo", results)
+    elif args.benchmark == "imports":
+        results = benchmark_import_time(args.iterations or 20)
+        print_results("Arranque en frío de los puntos de entrada", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,457 +1,1250 @@
-"""
-Little Lemon Booking System
-Database Engineer Capstone Project
-Fecha: 10 de Julio, 2025
-"""
-
-import sys
-import os
-from datetime import datetime, date, time
-from typing import Optional, Dict, List, Any, Tuple
-import logging
-
-# Agregar el directorio actual al path para importar módulos
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from connection import create_database_connection, LittleLemonConnection
-
-class LittleLemonBookingSystem:
-    """Sistema de gestión de reservas para Little Lemon Restaurant"""
-    
-    def __init__(self, environment: str = "local"):
-        """
-        Inicializa el sistema de reservas
-        
-        Args:
-            environment: Entorno de trabajo (local, development, production)
-        """
-        self.db_connection = create_database_connection(environment)
-        self.logger = logging.getLogger(__name__)
-        
-        # Verificar conexión
-        if not self.db_connection.test_connection():
-            raise Exception("No se pudo conectar a la base de datos")
-    
-    def get_max_quantity(self, menu_item_name: str) -> int:
-        """
-        Obtiene la cantidad máxima de un elemento del menú
-        
-        Args:
-            menu_item_name: Nombre del elemento del menú
-            
-        Returns:
-            int: Cantidad máxima pedida
-        """
-        try:
-            # Ejecutar procedimiento almacenado
-            query = "CALL GetMaxQuantity(%s, @max_quantity)"
-            self.db_connection.execute_query(query, (menu_item_name,))
-            
-            # Obtener el resultado
-            result = self.db_connection.execute_query(
-                "SELECT @max_quantity AS max_quantity", 
-                fetch=True
-            )
-            
-            max_quantity = result[0]['max_quantity'] if result else 0
-            self.logger.info(f"Cantidad máxima para {menu_item_name}: {max_quantity}")
-            return max_quantity
-            
-        except Exception as e:
-            self.logger.error(f"Error en get_max_quantity: {e}")
-            return 0
-    
-    def manage_booking(self, booking_date: date, table_number: int) -> str:
-        """
-        Gestiona la disponibilidad de una reserva
-        
-        Args:
-            booking_date: Fecha de la reserva
-            table_number: Número de mesa
-            
-        Returns:
-            str: Estado de la reserva
-        """
-        try:
-            # Ejecutar procedimiento almacenado
-            query = "CALL ManageBooking(%s, %s, @booking_status)"
-            self.db_connection.execute_query(query, (booking_date, table_number))
-            
-            # Obtener el resultado
-            result = self.db_connection.execute_query(
-                "SELECT @booking_status AS booking_status", 
-                fetch=True
-            )
-            
-            status = result[0]['booking_status'] if result else "Error"
-            self.logger.info(f"Estado de reserva para mesa {table_number} el {booking_date}: {status}")
-            return status
-            
-        except Exception as e:
-            self.logger.error(f"Error en manage_booking: {e}")
-            return f"Error: {str(e)}"
-    
-    def update_booking(self, booking_id: int, new_booking_date: date, 
-                      new_booking_time: time, new_number_of_guests: int) -> str:
-        """
-        Actualiza una reserva existente
-        
-        Args:
-            booking_id: ID de la reserva
-            new_booking_date: Nueva fecha
-            new_booking_time: Nueva hora
-            new_number_of_guests: Nuevo número de huéspedes
-            
-        Returns:
-            str: Estado de la actualización
-        """
-        try:
-            # Ejecutar procedimiento almacenado
-            query = "CALL UpdateBooking(%s, %s, %s, %s, @update_status)"
-            self.db_connection.execute_query(
-                query, 
-                (booking_id, new_booking_date, new_booking_time, new_number_of_guests)
-            )
-            
-            # Obtener el resultado
-            result = self.db_connection.execute_query(
-                "SELECT @update_status AS update_status", 
-                fetch=True
-            )
-            
-            status = result[0]['update_status'] if result else "Error"
-            self.logger.info(f"Actualización de reserva {booking_id}: {status}")
-            return status
-            
-        except Exception as e:
-            self.logger.error(f"Error en update_booking: {e}")
-            return f"Error: {str(e)}"
-    
-    def add_booking(self, customer_id: int, table_id: int, booking_date: date,
-                   booking_time: time, number_of_guests: int, 
-                   special_requests: Optional[str] = None) -> str:
-        """
-        Añade una nueva reserva
-        
-        Args:
-            customer_id: ID del cliente
-            table_id: ID de la mesa
-            booking_date: Fecha de la reserva
-            booking_time: Hora de la reserva
-            number_of_guests: Número de huéspedes
-            special_requests: Solicitudes especiales
-            
-        Returns:
-            str: Estado de la reserva
-        """
-        try:
-            # Ejecutar procedimiento almacenado
-            query = "CALL AddBooking(%s, %s, %s, %s, %s, %s, @booking_status)"
-            self.db_connection.execute_query(
-                query, 
-                (customer_id, table_id, booking_date, booking_time, 
-                 number_of_guests, special_requests)
-            )
-            
-            # Obtener el resultado
-            result = self.db_connection.execute_query(
-                "SELECT @booking_status AS booking_status", 
-                fetch=True
-            )
-            
-            status = result[0]['booking_status'] if result else "Error"
-            self.logger.info(f"Nueva reserva: {status}")
-            return status
-            
-        except Exception as e:
-            self.logger.error(f"Error en add_booking: {e}")
-            return f"Error: {str(e)}"
-    
-    def cancel_booking(self, booking_id: int) -> str:
-        """
-        Cancela una reserva existente
-        
-        Args:
-            booking_id: ID de la reserva a cancelar
-            
-        Returns:
-            str: Estado de la cancelación
-        """
-        try:
-            # Ejecutar procedimiento almacenado
-            query = "CALL CancelBooking(%s, @cancellation_status)"
-            self.db_connection.execute_query(query, (booking_id,))
-            
-            # Obtener el resultado
-            result = self.db_connection.execute_query(
-                "SELECT @cancellation_status AS cancellation_status", 
-                fetch=True
-            )
-            
-            status = result[0]['cancellation_status'] if result else "Error"
-            self.logger.info(f"Cancelación de reserva {booking_id}: {status}")
-            return status
-            
-        except Exception as e:
-            self.logger.error(f"Error en cancel_booking: {e}")
-            return f"Error: {str(e)}"
-    
-    def check_booking_availability(self, check_date: date, check_time: time, 
-                                 required_capacity: int) -> List[Dict]:
-        """
-        Verifica la disponibilidad de mesas
-        
-        Args:
-            check_date: Fecha a verificar
-            check_time: Hora a verificar
-            required_capacity: Capacidad requerida
-            
-        Returns:
-            List[Dict]: Lista de mesas disponibles
-        """
-        try:
-            # Ejecutar procedimiento almacenado
-            query = "CALL CheckBookingAvailability(%s, %s, %s)"
-            result = self.db_connection.execute_query(
-                query, 
-                (check_date, check_time, required_capacity), 
-                fetch=True
-            )
-            
-            self.logger.info(f"Verificación de disponibilidad para {check_date} {check_time}: {len(result)} mesas")
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error en check_booking_availability: {e}")
-            return []
-    
-    def get_bookings_by_date(self, search_date: date) -> List[Dict]:
-        """
-        Obtiene todas las reservas para una fecha específica
-        
-        Args:
-            search_date: Fecha a buscar
-            
-        Returns:
-            List[Dict]: Lista de reservas
-        """
-        try:
-            # Ejecutar procedimiento almacenado
-            query = "CALL GetBookingsByDate(%s)"
-            result = self.db_connection.execute_query(
-                query, 
-                (search_date,), 
-                fetch=True
-            )
-            
-            self.logger.info(f"Reservas para {search_date}: {len(result)} encontradas")
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error en get_bookings_by_date: {e}")
-            return []
-    
-    def get_customer_info(self, customer_id: int) -> Optional[Dict]:
-        """
-        Obtiene información de un cliente
-        
-        Args:
-            customer_id: ID del cliente
-            
-        Returns:
-            Dict: Información del cliente
-        """
-        try:
-            query = """
-            SELECT customer_id, first_name, last_name, email, phone, 
-                   address, city, state, zip_code, created_at
-            FROM customers 
-            WHERE customer_id = %s
-            """
-            result = self.db_connection.execute_query(query, (customer_id,), fetch=True)
-            
-            if result:
-                return result[0]
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error en get_customer_info: {e}")
-            return None
-    
-    def get_menu_items(self) -> List[Dict]:
-        """
-        Obtiene todos los elementos del menú
-        
-        Returns:
-            List[Dict]: Lista de elementos del menú
-        """
-        try:
-            query = """
-            SELECT mi.menu_item_id, mi.item_name, mi.description, 
-                   mi.price, mi.quantity_in_stock, mi.is_available,
-                   mc.category_name
-            FROM menu_items mi
-            JOIN menu_categories mc ON mi.category_id = mc.category_id
-            WHERE mi.is_available = TRUE
-            ORDER BY mc.category_name, mi.item_name
-            """
-            result = self.db_connection.execute_query(query, fetch=True)
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error en get_menu_items: {e}")
-            return []
-    
-    def get_tables_info(self) -> List[Dict]:
-        """
-        Obtiene información de todas las mesas
-        
-        Returns:
-            List[Dict]: Lista de mesas
-        """
-        try:
-            query = """
-            SELECT table_id, table_number, seating_capacity, 
-                   location, is_available
-            FROM tables
-            ORDER BY table_number
-            """
-            result = self.db_connection.execute_query(query, fetch=True)
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error en get_tables_info: {e}")
-            return []
-    
-    def generate_daily_report(self, report_date: date) -> Dict[str, Any]:
-        """
-        Genera un reporte diario de reservas
-        
-        Args:
-            report_date: Fecha del reporte
-            
-        Returns:
-            Dict: Reporte con estadísticas
-        """
-        try:
-            # Obtener reservas del día
-            bookings = self.get_bookings_by_date(report_date)
-            
-            # Calcular estadísticas
-            total_bookings = len(bookings)
-            confirmed_bookings = len([b for b in bookings if b['status'] == 'confirmed'])
-            cancelled_bookings = len([b for b in bookings if b['status'] == 'cancelled'])
-            completed_bookings = len([b for b in bookings if b['status'] == 'completed'])
-            
-            # Obtener información de mesas
-            tables_info = self.get_tables_info()
-            total_tables = len(tables_info)
-            tables_booked = len(set([b['table_number'] for b in bookings if b['status'] == 'confirmed']))
-            
-            report = {
-                'date': report_date,
-                'total_bookings': total_bookings,
-                'confirmed_bookings': confirmed_bookings,
-                'cancelled_bookings': cancelled_bookings,
-                'completed_bookings': completed_bookings,
-                'total_tables': total_tables,
-                'tables_booked': tables_booked,
-                'occupancy_rate': (tables_booked / total_tables * 100) if total_tables > 0 else 0,
-                'bookings_detail': bookings
-            }
-            
-            return report
-            
-        except Exception as e:
-            self.logger.error(f"Error en generate_daily_report: {e}")
-            return {}
-    
-    def close_connection(self):
-        """Cierra la conexión a la base de datos"""
-        if self.db_connection:
-            self.db_connection.close_pool()
-
-
-def main():
-    """Función principal para demostrar el uso del sistema"""
-    print("=== Little Lemon Booking System ===")
-    print("Database Engineer Capstone Project")
-    print("=====================================\n")
-    
-    try:
-        # Crear sistema de reservas
-        booking_system = LittleLemonBookingSystem("local")
-        print("✅ Sistema de reservas inicializado correctamente\n")
-        
-        # Demostrar funcionalidades
-        
-        # 1. GetMaxQuantity
-        print("1. Prueba GetMaxQuantity:")
-        max_qty = booking_system.get_max_quantity("Chicken Parmigiana")
-        print(f"   Cantidad máxima de Chicken Parmigiana: {max_qty}\n")
-        
-        # 2. ManageBooking
-        print("2. Prueba ManageBooking:")
-        status = booking_system.manage_booking(date(2025, 7, 25), 1)
-        print(f"   Estado de reserva mesa 1 para 2025-07-25: {status}\n")
-        
-        # 3. CheckBookingAvailability
-        print("3. Verificar disponibilidad:")
-        availability = booking_system.check_booking_availability(
-            date(2025, 7, 25), time(19, 0), 4
-        )
-        print(f"   Mesas disponibles para 4 personas: {len(availability)}")
-        for table in availability[:3]:  # Mostrar solo las primeras 3
-            print(f"   - Mesa {table['table_number']}: {table['availability_status']}")
-        print()
-        
-        # 4. AddBooking
-        print("4. Prueba AddBooking:")
-        new_booking_status = booking_system.add_booking(
-            customer_id=1,
-            table_id=1,
-            booking_date=date(2025, 7, 25),
-            booking_time=time(19, 0),
-            number_of_guests=2,
-            special_requests="Mesa junto a la ventana"
-        )
-        print(f"   Nueva reserva: {new_booking_status}\n")
-        
-        # 5. GetBookingsByDate
-        print("5. Reservas para una fecha:")
-        bookings_today = booking_system.get_bookings_by_date(date(2025, 7, 15))
-        print(f"   Total reservas para 2025-07-15: {len(bookings_today)}")
-        for booking in bookings_today[:2]:  # Mostrar solo las primeras 2
-            print(f"   - {booking['customer_name']} - Mesa {booking['table_number']} a las {booking['booking_time']}")
-        print()
-        
-        # 6. Reporte diario
-        print("6. Reporte diario:")
-        report = booking_system.generate_daily_report(date(2025, 7, 15))
-        print(f"   Fecha: {report['date']}")
-        print(f"   Total reservas: {report['total_bookings']}")
-        print(f"   Reservas confirmadas: {report['confirmed_bookings']}")
-        print(f"   Tasa de ocupación: {report['occupancy_rate']:.1f}%\n")
-        
-        # 7. Información del menú
-        print("7. Elementos del menú:")
-        menu_items = booking_system.get_menu_items()
-        print(f"   Total elementos en el menú: {len(menu_items)}")
-        for item in menu_items[:5]:  # Mostrar solo los primeros 5
-            print(f"   - {item['item_name']}: ${item['price']:.2f} ({item['category_name']})")
-        print()
-        
-        print("✅ Todas las funcionalidades probadas exitosamente!")
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    finally:
-        # Cerrar conexión
-        if 'booking_system' in locals():
-            booking_system.close_connection()
-            print("\n🔒 Conexión cerrada correctamente")
-
-
-if __name__ == "__main__":
-    main()
+"""
+Little Lemon Booking System
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+"""
+
+import sys
+import os
+from datetime import datetime, date, time
+from typing import Optional, Dict, List, Any, Tuple, Callable, Sequence
+import logging
+
+# Agregar el directorio actual al path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from connection import create_database_connection, LittleLemonConnection
+from deadlines import QueryTimeoutError, deadline_after
+from direct_procedures import DIRECT_PROCEDURES
+from availability_index import (
+    AvailabilityIndex,
+    DateSlots,
+    availability_grid,
+    load_date_slots,
+    load_range_slots,
+    nearest_available,
+    search_dates,
+    slot_key,
+    time_slots,
+    DEFAULT_AVAILABILITY_INDEX_TTL,
+    DEFAULT_SERVICE_START,
+    DEFAULT_SERVICE_END,
+    DEFAULT_SLOT_MINUTES
+)
+from seating_durations import SeatingDurations, end_time
+from table_assignment import (
+    best_fit_position,
+    cheapest_combination,
+    combination_row,
+    plan_rebalance,
+    table_row,
+    DAY_BOOKINGS_QUERY,
+    DAY_BOOKINGS_LOCK_QUERY,
+    REASSIGN_TABLE_QUERY
+)
+from logging_config import configure_logging
+
+# Consultas compartidas por la API síncrona y la asíncrona
+CUSTOMER_INFO_QUERY = """
+SELECT customer_id, first_name, last_name, email, phone, 
+       address, city, state, zip_code, created_at
+FROM customers 
+WHERE customer_id = %s
+"""
+
+MENU_ITEMS_QUERY = """
+SELECT mi.menu_item_id, mi.item_name, mi.description, 
+       mi.price, mi.quantity_in_stock, mi.is_available,
+       mc.category_name
+FROM menu_items mi
+JOIN menu_categories mc ON mi.category_id = mc.category_id
+WHERE mi.is_available = TRUE
+ORDER BY mc.category_name, mi.item_name
+"""
+
+# Segundos que el menú y las mesas pueden servirse desde la caché de resultados;
+# las escrituras hechas con la librería invalidan la caché antes de ese plazo
+MENU_ITEMS_CACHE_TTL = 300
+TABLES_INFO_CACHE_TTL = 60
+
+TABLES_INFO_QUERY = """
+SELECT table_id, table_number, seating_capacity, 
+       location, is_available
+FROM tables
+ORDER BY table_number
+"""
+
+# Modos de ejecución de las operaciones de reservas: procedimientos almacenados
+# o SQL directo (ver direct_procedures)
+PROCEDURE_MODE = "procedure"
+DIRECT_MODE = "direct"
+CALL_MODES = (PROCEDURE_MODE, DIRECT_MODE)
+
+# Intentos de book_best_table cuando otra reserva ocupa antes la mesa elegida
+MAX_ASSIGNMENT_ATTEMPTS = 3
+TABLE_TAKEN_STATUS = "Error: Table already booked for this date and time"
+
+# Columnas de las cargas masivas de reservas y pedidos
+BOOKING_BATCH_COLUMNS = (
+    "customer_id", "table_id", "employee_id", "booking_date", "booking_time",
+    "end_time", "number_of_guests", "special_requests", "status"
+)
+
+ORDER_BATCH_COLUMNS = (
+    "order_id", "customer_id", "booking_id", "employee_id", "order_date",
+    "order_time", "total_amount", "order_status", "payment_status"
+)
+
+ORDER_DETAIL_BATCH_COLUMNS = (
+    "order_id", "menu_item_id", "quantity", "unit_price", "subtotal",
+    "special_instructions"
+)
+
+
+def build_booking_rows(bookings: List[Dict[str, Any]], durations: SeatingDurations,
+                       table_locations: Dict[int, Optional[str]]) -> List[Tuple]:
+    """
+    Convierte reservas en filas para la carga masiva
+    
+    Args:
+        bookings: Reservas con customer_id, table_id, booking_date, booking_time
+                  y number_of_guests; employee_id, special_requests, status y
+                  end_time son opcionales
+        durations: Reglas de duración para calcular end_time si falta
+        table_locations: Ubicación de cada mesa por table_id
+        
+    Returns:
+        List[Tuple]: Filas en el orden de BOOKING_BATCH_COLUMNS
+    """
+    return [
+        (booking['customer_id'], booking['table_id'], booking.get('employee_id'),
+         booking['booking_date'], booking['booking_time'],
+         booking.get('end_time') or end_time(
+             booking['booking_time'],
+             durations.minutes(booking['number_of_guests'], table_locations.get(booking['table_id']))
+         ),
+         booking['number_of_guests'], booking.get('special_requests'),
+         booking.get('status', 'confirmed'))
+        for booking in bookings
+    ]
+
+
+def build_order_rows(orders: List[Dict[str, Any]]) -> Tuple[List[Tuple], List[Tuple]]:
+    """
+    Convierte pedidos del punto de venta en filas de orders y order_details
+    
+    Args:
+        orders: Pedidos con order_id, customer_id, order_date, order_time e
+                items (menu_item_id, quantity, unit_price); el total y los
+                subtotales se calculan si no se indican
+        
+    Returns:
+        Tuple: (filas de orders, filas de order_details)
+    """
+    order_rows = []
+    detail_rows = []
+    
+    for order in orders:
+        items = order.get('items', [])
+        subtotals = [
+            item.get('subtotal', item['quantity'] * item['unit_price'])
+            for item in items
+        ]
+        total_amount = order.get('total_amount', sum(subtotals))
+        
+        order_rows.append(
+            (order['order_id'], order['customer_id'], order.get('booking_id'),
+             order.get('employee_id'), order['order_date'], order['order_time'],
+             total_amount, order.get('order_status', 'served'),
+             order.get('payment_status', 'paid'))
+        )
+        detail_rows.extend(
+            (order['order_id'], item['menu_item_id'], item['quantity'],
+             item['unit_price'], subtotal, item.get('special_instructions'))
+            for item, subtotal in zip(items, subtotals)
+        )
+    
+    return order_rows, detail_rows
+
+
+def build_daily_report(report_date: date, bookings: List[Dict],
+                       tables_info: List[Dict]) -> Dict[str, Any]:
+    """
+    Calcula las estadísticas del reporte diario a partir de reservas y mesas
+    
+    Args:
+        report_date: Fecha del reporte
+        bookings: Reservas del día
+        tables_info: Información de todas las mesas
+        
+    Returns:
+        Dict: Reporte con estadísticas
+    """
+    # Calcular estadísticas (una reserva combinada cuenta una vez)
+    main_bookings = [b for b in bookings if b.get('parent_booking_id') is None]
+    total_bookings = len(main_bookings)
+    confirmed_bookings = len([b for b in main_bookings if b['status'] == 'confirmed'])
+    cancelled_bookings = len([b for b in main_bookings if b['status'] == 'cancelled'])
+    completed_bookings = len([b for b in main_bookings if b['status'] == 'completed'])
+    
+    # Ocupación de mesas (incluidas todas las de las reservas combinadas)
+    total_tables = len(tables_info)
+    tables_booked = len(set([b['table_number'] for b in bookings if b['status'] == 'confirmed']))
+    
+    return {
+        'date': report_date,
+        'total_bookings': total_bookings,
+        'confirmed_bookings': confirmed_bookings,
+        'cancelled_bookings': cancelled_bookings,
+        'completed_bookings': completed_bookings,
+        'total_tables': total_tables,
+        'tables_booked': tables_booked,
+        'occupancy_rate': (tables_booked / total_tables * 100) if total_tables > 0 else 0,
+        'bookings_detail': bookings
+    }
+
+
+class LittleLemonBookingSystem:
+    """Sistema de gestión de reservas para Little Lemon Restaurant"""
+    
+    def __init__(self, environment: str = "local", verify_connection: bool = False,
+                 call_timeout: Optional[float] = None, call_mode: Optional[str] = None):
+        """
+        Inicializa el sistema de reservas
+        
+        Las conexiones del pool se abren en la primera operación; con
+        verify_connection se comprueba la conexión por adelantado.
+        
+        Cada método acepta un plazo (deadline, instante de time.monotonic());
+        sin él, la llamada dispone de call_timeout segundos. Una llamada que
+        supera su plazo lanza QueryTimeoutError en lugar de devolver un valor
+        por defecto.
+        
+        Con availability_index activo en la configuración, la disponibilidad
+        de mesas se responde desde un índice en memoria (ver
+        availability_index) que actualizan las reservas hechas aquí.
+        
+        En modo "procedure" las operaciones llaman a los procedimientos
+        almacenados; en modo "direct" las lecturas son consultas SELECT
+        (preparadas según prepared_statements) y las escrituras transacciones
+        dirigidas desde Python, con los mismos resultados.
+        
+        Args:
+            environment: Entorno de trabajo (local, development, production)
+            verify_connection: Ejecutar test_connection() al inicializar
+            call_timeout: Segundos por llamada (por defecto booking_call_timeout
+                          de la configuración; None = sin plazo)
+            call_mode: "procedure" o "direct" (por defecto booking_call_mode
+                       de la configuración)
+        """
+        self.db_connection = create_database_connection(environment)
+        self.logger = logging.getLogger(__name__)
+        self.call_timeout = (call_timeout if call_timeout is not None
+                             else self.db_connection.config.get("booking_call_timeout"))
+        self.call_mode = call_mode or self.db_connection.config.get("booking_call_mode", PROCEDURE_MODE)
+        if self.call_mode not in CALL_MODES:
+            self.db_connection.close_pool()
+            raise ValueError(f"Modo de llamada no válido: {self.call_mode} (procedure o direct)")
+        
+        self.availability_index = None
+        if self.db_connection.config.get("availability_index", True):
+            self.availability_index = AvailabilityIndex(
+                self.db_connection,
+                self.db_connection.config.get("availability_index_ttl", DEFAULT_AVAILABILITY_INDEX_TTL)
+            )
+        
+        # Verificar conexión
+        if verify_connection and not self.db_connection.test_connection():
+            raise Exception("No se pudo conectar a la base de datos")
+    
+    def transaction(self):
+        """
+        Abre una unidad de trabajo en la que se ejecutan todas las operaciones del bloque
+        
+        Un error SQL revierte toda la unidad de trabajo, pero un estado de
+        error de negocio ("Error: Table already booked ...") no: el método lo
+        devuelve y el resto del bloque sigue. Para que el bloque sea todo o
+        nada, comprobar cada estado y lanzar una excepción, que lo revierte:
+        
+        Ejemplo:
+            with booking_system.transaction():
+                for status in (booking_system.cancel_booking(booking_id),
+                               booking_system.add_booking(...)):
+                    if status.startswith("Error"):
+                        raise RuntimeError(status)
+        
+        Returns:
+            Context manager de la transacción
+        """
+        return self.db_connection.transaction()
+    
+    def _deadline(self, deadline: Optional[float]) -> Optional[float]:
+        """
+        Obtiene el plazo de una llamada
+        
+        Args:
+            deadline: Plazo recibido por el método
+            
+        Returns:
+            float: El mismo plazo, o uno de call_timeout segundos desde ahora
+        """
+        return deadline if deadline is not None else deadline_after(self.call_timeout)
+    
+    def _call_procedure(self, procedure_name: str, params: Tuple,
+                        out_params: Optional[List[str]] = None,
+                        deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        Ejecuta una operación como procedimiento almacenado o en SQL directo
+        según el modo de llamada
+        
+        Args:
+            procedure_name: Nombre del procedimiento
+            params: Parámetros de entrada
+            out_params: Nombres de los parámetros de salida
+            deadline: Plazo de la llamada
+            
+        Returns:
+            Tuple: (filas de los result sets, diccionario con los parámetros de salida)
+        """
+        if self.call_mode == DIRECT_MODE:
+            return DIRECT_PROCEDURES[procedure_name](self.db_connection, *params, deadline=deadline)
+        return self.db_connection.call_procedure(procedure_name, params, out_params,
+                                                 deadline=deadline)
+    
+    def _availability_changed(self, update: Callable[[AvailabilityIndex], None]):
+        """
+        Aplica una reserva confirmada al índice de disponibilidad
+        
+        Dentro de una transacción el cambio aún puede revertirse: el índice
+        se descarta y se recarga en la siguiente consulta.
+        
+        Args:
+            update: Función que registra el cambio en el índice
+        """
+        if self.availability_index is None:
+            return
+        if self.db_connection.in_transaction():
+            self.availability_index.invalidate()
+        else:
+            update(self.availability_index)
+    
+    def _query_date_slots(self, booking_date: date, compute: Callable[[DateSlots], Any],
+                          deadline: Optional[float]) -> Any:
+        """
+        Calcula un resultado sobre las reservas de una fecha
+        
+        Se usa el índice de disponibilidad (bajo su lock) salvo dentro de una
+        transacción, donde la fecha se lee con la conexión de la transacción.
+        
+        Args:
+            booking_date: Fecha
+            compute: Función (reservas de la fecha) -> resultado
+            deadline: Plazo de la carga
+        
+        Returns:
+            Resultado de compute
+        """
+        if self.availability_index is not None and not self.db_connection.in_transaction():
+            return self.availability_index.query_date(booking_date, compute, deadline)
+        return compute(load_date_slots(self.db_connection, booking_date, deadline))
+    
+    def get_max_quantity(self, menu_item_name: str, deadline: Optional[float] = None) -> int:
+        """
+        Obtiene la cantidad máxima de un elemento del menú
+        
+        Args:
+            menu_item_name: Nombre del elemento del menú
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            int: Cantidad máxima pedida
+        """
+        try:
+            # Ejecutar procedimiento almacenado y leer el parámetro de salida
+            _, out_params = self._call_procedure(
+                "GetMaxQuantity", (menu_item_name,), ["max_quantity"],
+                deadline=self._deadline(deadline)
+            )
+            
+            max_quantity = out_params['max_quantity'] or 0
+            self.logger.info("Cantidad máxima para %s: %s", menu_item_name, max_quantity)
+            return max_quantity
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_max_quantity: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en get_max_quantity: %s", e)
+            return 0
+    
+    def manage_booking(self, booking_date: date, table_number: int,
+                       deadline: Optional[float] = None) -> str:
+        """
+        Gestiona la disponibilidad de una reserva
+        
+        Args:
+            booking_date: Fecha de la reserva
+            table_number: Número de mesa
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            str: Estado de la reserva
+        """
+        try:
+            # Ejecutar procedimiento almacenado y leer el parámetro de salida
+            _, out_params = self._call_procedure(
+                "ManageBooking", (booking_date, table_number), ["booking_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['booking_status'] or "Error"
+            self.logger.info("Estado de reserva para mesa %s el %s: %s", table_number, booking_date, status)
+            return status
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en manage_booking: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en manage_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    def update_booking(self, booking_id: int, new_booking_date: date, 
+                      new_booking_time: time, new_number_of_guests: int,
+                      deadline: Optional[float] = None) -> str:
+        """
+        Actualiza una reserva existente
+        
+        Args:
+            booking_id: ID de la reserva
+            new_booking_date: Nueva fecha
+            new_booking_time: Nueva hora
+            new_number_of_guests: Nuevo número de huéspedes
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            str: Estado de la actualización
+        """
+        try:
+            # Ejecutar procedimiento almacenado y leer el parámetro de salida
+            _, out_params = self._call_procedure(
+                "UpdateBooking",
+                (booking_id, new_booking_date, new_booking_time, new_number_of_guests),
+                ["update_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['update_status'] or "Error"
+            if not status.startswith("Error"):
+                self._availability_changed(
+                    lambda index: index.record_move(booking_id, new_booking_date, new_booking_time,
+                                                    new_number_of_guests)
+                )
+            self.logger.info("Actualización de reserva %s: %s", booking_id, status)
+            return status
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en update_booking: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en update_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    def add_booking(self, customer_id: int, table_id: int, booking_date: date,
+                   booking_time: time, number_of_guests: int, 
+                   special_requests: Optional[str] = None,
+                   deadline: Optional[float] = None) -> str:
+        """
+        Añade una nueva reserva
+        
+        Args:
+            customer_id: ID del cliente
+            table_id: ID de la mesa
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de huéspedes
+            special_requests: Solicitudes especiales
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            str: Estado de la reserva
+        """
+        try:
+            # Ejecutar procedimiento almacenado y leer el parámetro de salida
+            _, out_params = self._call_procedure(
+                "AddBooking",
+                (customer_id, table_id, booking_date, booking_time, 
+                 number_of_guests, special_requests),
+                ["booking_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['booking_status'] or "Error"
+            if not status.startswith("Error"):
+                new_booking_id = int(status.rsplit(" ", 1)[-1])
+                self._availability_changed(
+                    lambda index: index.record_booking(new_booking_id, table_id, booking_date,
+                                                       booking_time, number_of_guests)
+                )
+            self.logger.info("Nueva reserva: %s", status)
+            return status
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en add_booking: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en add_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    def add_bookings_batch(self, bookings: List[Dict[str, Any]],
+                           batch_size: Optional[int] = None,
+                           deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Carga muchas reservas en una sola transacción
+        
+        Pensado para importar reservas históricas: inserta directamente en la
+        tabla sin las comprobaciones de disponibilidad de AddBooking. La hora
+        de fin se calcula con las reglas de seating_durations.
+        
+        Args:
+            bookings: Reservas a insertar (ver build_booking_rows)
+            batch_size: Filas por sentencia INSERT
+            deadline: Plazo de la carga (por defecto sin plazo)
+            
+        Returns:
+            Dict: Estadísticas de la carga (filas, lotes, filas por segundo)
+        """
+        try:
+            durations = SeatingDurations.load(self.db_connection, deadline)
+            table_locations = {
+                table['table_id']: table['location']
+                for table in self.db_connection.execute_query(TABLES_INFO_QUERY, fetch=True,
+                                                              deadline=deadline)
+            }
+            stats = self.db_connection.bulk_insert(
+                "bookings", BOOKING_BATCH_COLUMNS,
+                build_booking_rows(bookings, durations, table_locations), batch_size, deadline
+            )
+            if self.availability_index is not None:
+                self.availability_index.invalidate()
+            self.logger.info("Reservas cargadas: %s (%.0f filas/s)",
+                             stats['rows'], stats['rows_per_second'])
+            return stats
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en add_bookings_batch: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en add_bookings_batch: %s", e)
+            return {}
+    
+    def cancel_booking(self, booking_id: int, deadline: Optional[float] = None) -> str:
+        """
+        Cancela una reserva existente
+        
+        Args:
+            booking_id: ID de la reserva a cancelar
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            str: Estado de la cancelación
+        """
+        try:
+            # Ejecutar procedimiento almacenado y leer el parámetro de salida
+            _, out_params = self._call_procedure(
+                "CancelBooking", (booking_id,), ["cancellation_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['cancellation_status'] or "Error"
+            if not status.startswith("Error"):
+                self._availability_changed(lambda index: index.record_cancellation(booking_id))
+            self.logger.info("Cancelación de reserva %s: %s", booking_id, status)
+            return status
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en cancel_booking: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en cancel_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    def check_booking_availability(self, check_date: date, check_time: time, 
+                                 required_capacity: int,
+                                 deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Verifica la disponibilidad de mesas
+        
+        Args:
+            check_date: Fecha a verificar
+            check_time: Hora a verificar
+            required_capacity: Capacidad requerida
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            List[Dict]: Lista de mesas disponibles
+        """
+        try:
+            if self.availability_index is not None and not self.db_connection.in_transaction():
+                # Respuesta desde el índice en memoria (carga la fecha si no está)
+                result = self.availability_index.check(
+                    check_date, check_time, required_capacity, self._deadline(deadline)
+                )
+            else:
+                # Ejecutar procedimiento almacenado
+                result, _ = self._call_procedure(
+                    "CheckBookingAvailability", 
+                    (check_date, check_time, required_capacity),
+                    deadline=self._deadline(deadline)
+                )
+            
+            self.logger.info("Verificación de disponibilidad para %s %s: %s mesas",
+                             check_date, check_time, len(result))
+            return result
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en check_booking_availability: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en check_booking_availability: %s", e)
+            return []
+    
+    def check_availability_grid(self, check_date: date, slots: Sequence[time],
+                                party_sizes: Sequence[int],
+                                deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Verifica la disponibilidad de varias horas y tamaños de grupo a la vez
+        
+        Responde con una sola consulta (o desde el índice de disponibilidad)
+        lo que check_booking_availability respondería con una llamada por
+        cada hora y tamaño de grupo.
+        
+        Ejemplo:
+            grid = booking_system.check_availability_grid(
+                date(2025, 7, 25), time_slots(time(17, 0), time(22, 0), 15), [2, 4, 6]
+            )
+            grid['party_sizes'][4]['free']   # mesas libres para 4 a cada hora
+        
+        Args:
+            check_date: Fecha a verificar
+            slots: Horas a verificar (ver time_slots)
+            party_sizes: Tamaños de grupo
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            Dict: Matriz hora x mesa (ver availability_index.availability_grid)
+        """
+        try:
+            deadline = self._deadline(deadline)
+            if self.availability_index is not None and not self.db_connection.in_transaction():
+                grid = self.availability_index.grid(check_date, slots, party_sizes, deadline)
+            else:
+                grid = availability_grid(load_date_slots(self.db_connection, check_date, deadline),
+                                         check_date, slots, party_sizes)
+            
+            self.logger.info("Cuadrícula de disponibilidad para %s: %s horas x %s mesas",
+                             check_date, len(grid['slots']), len(grid['tables']))
+            return grid
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en check_availability_grid: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en check_availability_grid: %s", e)
+            return {}
+    
+    def find_next_available(self, party_size: int, preferred_datetime: datetime,
+                            window_days: int = 3, location: Optional[str] = None,
+                            limit: int = 5, slots: Optional[Sequence[time]] = None,
+                            deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Busca las horas con mesa libre más cercanas a la preferida
+        
+        Recorre hacia atrás y hacia adelante las fechas de la ventana en lugar
+        de llamar a check_booking_availability por cada fecha y hora: las
+        fechas que no están en el índice de disponibilidad se cargan con una
+        sola sentencia (RANGE_AVAILABILITY_QUERY, que trae también mesas,
+        combinaciones y reglas de duración), y con todas en memoria no se
+        consulta la base de datos. Las horas ya pasadas se descartan.
+        
+        Ejemplo:
+            options = booking_system.find_next_available(
+                4, datetime(2025, 7, 25, 20, 0), window_days=2, location="Patio"
+            )
+        
+        Args:
+            party_size: Tamaño del grupo
+            preferred_datetime: Fecha y hora preferidas
+            window_days: Días a buscar antes y después de la fecha preferida
+            location: Ubicación de la mesa, o parte de su nombre (None = cualquiera)
+            limit: Número máximo de opciones
+            slots: Horas de reserva de cada fecha (por defecto, de 17:00 a
+                   22:00 cada 15 minutos)
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            List[Dict]: Opciones (fecha, hora y mesa más pequeña libre) ordenadas
+                        por distancia a la preferida
+                        (ver availability_index.nearest_available)
+        """
+        try:
+            deadline = self._deadline(deadline)
+            if slots is None:
+                slots = time_slots(DEFAULT_SERVICE_START, DEFAULT_SERVICE_END, DEFAULT_SLOT_MINUTES)
+            not_before = datetime.now()
+            
+            if self.availability_index is not None and not self.db_connection.in_transaction():
+                options = self.availability_index.find_next_available(
+                    party_size, preferred_datetime, window_days, slots, location,
+                    limit, not_before, deadline
+                )
+            else:
+                dates = search_dates(preferred_datetime, window_days)
+                entries = load_range_slots(self.db_connection, dates[0], dates[-1], deadline)
+                options = nearest_available(entries, party_size, preferred_datetime, slots,
+                                            location, limit, not_before)
+            
+            self.logger.info("Búsqueda de horas libres cerca de %s para %s: %s opciones",
+                             preferred_datetime, party_size, len(options))
+            return options
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en find_next_available: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en find_next_available: %s", e)
+            return []
+    
+    def assign_table(self, booking_date: date, booking_time: time, number_of_guests: int,
+                     preferred_location: Optional[str] = None, strict: bool = False,
+                     deadline: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Elige la mesa libre más pequeña que admite un grupo
+        
+        Se responde desde el índice de disponibilidad (o con una consulta de
+        la fecha), con el mismo coste que check_booking_availability.
+        
+        Ejemplo:
+            table = booking_system.assign_table(date(2025, 7, 25), time(20, 0), 2,
+                                                preferred_location="Window")
+        
+        Args:
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de comensales
+            preferred_location: Ubicación preferida; basta una parte del nombre
+                                ("Window" -> "Window Side")
+            strict: No ofrecer mesas de otra ubicación
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            Dict: Mesa (table_id, table_number, seating_capacity, location), o
+                  None si no hay ninguna libre
+        """
+        try:
+            deadline = self._deadline(deadline)
+            
+            def choose(entry):
+                position = best_fit_position(entry, slot_key(booking_time), number_of_guests,
+                                             preferred_location, strict)
+                return table_row(entry.layout, position) if position is not None else None
+            
+            table = self._query_date_slots(booking_date, choose, deadline)
+            self.logger.info("Asignación de mesa para %s %s (%s personas): %s",
+                             booking_date, booking_time, number_of_guests,
+                             table['table_number'] if table else None)
+            return table
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en assign_table: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en assign_table: %s", e)
+            return None
+    
+    def assign_combination(self, booking_date: date, booking_time: time, number_of_guests: int,
+                           preferred_location: Optional[str] = None, strict: bool = False,
+                           deadline: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Elige la combinación de mesas libre más barata que admite un grupo
+        
+        La más barata es la de menos asientos y, a igualdad, la de menos
+        mesas; se responde desde el índice de disponibilidad como assign_table.
+        
+        Ejemplo:
+            combination = booking_system.assign_combination(date(2025, 7, 25), time(20, 0), 12)
+            booking_system.add_combined_booking(5, combination['combination_id'],
+                                                date(2025, 7, 25), time(20, 0), 12)
+        
+        Args:
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de comensales
+            preferred_location: Ubicación preferida (ver assign_table)
+            strict: No ofrecer combinaciones de otra ubicación
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            Dict: Combinación (combination_id, combination_name, seating_capacity,
+                  location y tables), o None si no hay ninguna libre
+        """
+        try:
+            deadline = self._deadline(deadline)
+            
+            def choose(entry):
+                index = cheapest_combination(entry, slot_key(booking_time), number_of_guests,
+                                             preferred_location, strict)
+                return combination_row(entry.layout, index) if index is not None else None
+            
+            combination = self._query_date_slots(booking_date, choose, deadline)
+            self.logger.info("Asignación de mesas combinadas para %s %s (%s personas): %s",
+                             booking_date, booking_time, number_of_guests,
+                             combination['combination_name'] if combination else None)
+            return combination
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en assign_combination: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en assign_combination: %s", e)
+            return None
+    
+    def add_combined_booking(self, customer_id: int, combination_id: int, booking_date: date,
+                             booking_time: time, number_of_guests: int,
+                             special_requests: Optional[str] = None,
+                             deadline: Optional[float] = None) -> str:
+        """
+        Añade una reserva que ocupa todas las mesas de una combinación
+        
+        Las mesas se reservan en una transacción: todas o ninguna. El ID
+        devuelto es el de la reserva principal; cancelarla libera todas las
+        mesas.
+        
+        Args:
+            customer_id: ID del cliente
+            combination_id: ID de la combinación de mesas
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de huéspedes
+            special_requests: Solicitudes especiales
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            str: Estado de la reserva
+        """
+        try:
+            # Ejecutar procedimiento almacenado y leer el parámetro de salida
+            _, out_params = self._call_procedure(
+                "AddCombinedBooking",
+                (customer_id, combination_id, booking_date, booking_time,
+                 number_of_guests, special_requests),
+                ["booking_status"],
+                deadline=self._deadline(deadline)
+            )
+            
+            status = out_params['booking_status'] or "Error"
+            if not status.startswith("Error"):
+                self._availability_changed(
+                    lambda index: index.record_combined_booking(booking_date)
+                )
+            self.logger.info("Nueva reserva combinada: %s", status)
+            return status
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en add_combined_booking: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en add_combined_booking: %s", e)
+            return f"Error: {str(e)}"
+    
+    def book_best_table(self, customer_id: int, booking_date: date, booking_time: time,
+                        number_of_guests: int, special_requests: Optional[str] = None,
+                        preferred_location: Optional[str] = None,
+                        deadline: Optional[float] = None) -> str:
+        """
+        Añade una reserva en la mesa que elige assign_table
+        
+        Si ninguna mesa admite el grupo, la reserva ocupa la combinación que
+        elige assign_combination. Si otra reserva ocupa la mesa entre la
+        elección y la reserva, se recargan las reservas de la fecha y se elige
+        otra mesa (hasta MAX_ASSIGNMENT_ATTEMPTS veces).
+        
+        Args:
+            customer_id: ID del cliente
+            booking_date: Fecha de la reserva
+            booking_time: Hora de la reserva
+            number_of_guests: Número de comensales
+            special_requests: Solicitudes especiales
+            preferred_location: Ubicación preferida (ver assign_table)
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            str: Estado de la reserva (como add_booking)
+        """
+        deadline = self._deadline(deadline)
+        status = "Error: No table available for this date and time"
+        for _ in range(MAX_ASSIGNMENT_ATTEMPTS):
+            table = self.assign_table(booking_date, booking_time, number_of_guests,
+                                      preferred_location, deadline=deadline)
+            if table is not None:
+                status = self.add_booking(customer_id, table['table_id'], booking_date,
+                                          booking_time, number_of_guests, special_requests,
+                                          deadline=deadline)
+            else:
+                combination = self.assign_combination(booking_date, booking_time,
+                                                      number_of_guests, preferred_location,
+                                                      deadline=deadline)
+                if combination is None:
+                    return "Error: No table available for this date and time"
+                status = self.add_combined_booking(customer_id, combination['combination_id'],
+                                                   booking_date, booking_time, number_of_guests,
+                                                   special_requests, deadline=deadline)
+            if status != TABLE_TAKEN_STATUS:
+                return status
+            if self.availability_index is not None:
+                self.availability_index.invalidate()
+        return status
+    
+    def rebalance_tables(self, booking_date: date, requests: Sequence[Dict[str, Any]] = (),
+                         apply: bool = False, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Reparte de nuevo las mesas de un día para sentar más comensales
+        
+        Las reservas confirmadas que aún no han empezado pueden cambiar de
+        mesa (nunca quedarse sin ella) para hacer sitio a los grupos en
+        espera o, con los mismos comensales, desperdiciar menos asientos.
+        Con apply los cambios de mesa se guardan en una transacción que
+        bloquea las reservas del día; los grupos en espera sentados se
+        reservan después con add_booking en la mesa propuesta.
+        
+        Ejemplo:
+            plan = booking_system.rebalance_tables(
+                date(2025, 7, 25), [{'booking_time': time(20, 0), 'number_of_guests': 8}]
+            )
+            plan['seated_requests'][0]['table_id']
+        
+        Args:
+            booking_date: Fecha a repartir
+            requests: Grupos en espera con booking_time, number_of_guests y,
+                      opcionalmente, preferred_location
+            apply: Guardar los cambios de mesa
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            Dict: Reparto propuesto (ver table_assignment.plan_rebalance)
+        """
+        try:
+            deadline = self._deadline(deadline)
+            now = datetime.now()
+            if booking_date < now.date():
+                fixed_before = time.max
+            elif booking_date == now.date():
+                fixed_before = now.time()
+            else:
+                fixed_before = None
+            
+            layout = load_date_slots(self.db_connection, booking_date, deadline).layout
+            if not apply:
+                day_bookings = self.db_connection.execute_query(
+                    DAY_BOOKINGS_QUERY, (booking_date,), fetch=True, deadline=deadline
+                )
+                plan = plan_rebalance(layout, day_bookings, requests, fixed_before)
+            else:
+                with self.db_connection.transaction(deadline):
+                    day_bookings = self.db_connection.execute_query(
+                        DAY_BOOKINGS_LOCK_QUERY, (booking_date,), fetch=True, deadline=deadline
+                    )
+                    plan = plan_rebalance(layout, day_bookings, requests, fixed_before)
+                    for move in plan['moves']:
+                        self.db_connection.execute_query(
+                            REASSIGN_TABLE_QUERY,
+                            (move['table_id'], move['end_time'], move['booking_id']),
+                            deadline=deadline
+                        )
+                if plan['moves'] and self.availability_index is not None:
+                    self.availability_index.invalidate()
+            
+            self.logger.info("Reequilibrio de mesas para %s: %s cambios, %s de %s grupos sentados",
+                             booking_date, len(plan['moves']), len(plan['seated_requests']),
+                             len(requests))
+            return plan
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en rebalance_tables: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en rebalance_tables: %s", e)
+            return {}
+    
+    def get_bookings_by_date(self, search_date: date, deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Obtiene todas las reservas para una fecha específica
+        
+        Args:
+            search_date: Fecha a buscar
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            List[Dict]: Lista de reservas
+        """
+        try:
+            # Ejecutar procedimiento almacenado
+            result, _ = self._call_procedure(
+                "GetBookingsByDate", 
+                (search_date,),
+                deadline=self._deadline(deadline)
+            )
+            
+            self.logger.info("Reservas para %s: %s encontradas", search_date, len(result))
+            return result
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_bookings_by_date: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en get_bookings_by_date: %s", e)
+            return []
+    
+    def get_customer_info(self, customer_id: int, deadline: Optional[float] = None) -> Optional[Dict]:
+        """
+        Obtiene información de un cliente
+        
+        Args:
+            customer_id: ID del cliente
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            Dict: Información del cliente
+        """
+        try:
+            result = self.db_connection.execute_query(
+                CUSTOMER_INFO_QUERY, (customer_id,), fetch=True,
+                deadline=self._deadline(deadline)
+            )
+            
+            if result:
+                return result[0]
+            return None
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_customer_info: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en get_customer_info: %s", e)
+            return None
+    
+    def get_menu_items(self, deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Obtiene todos los elementos del menú
+        
+        Args:
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            List[Dict]: Lista de elementos del menú
+        """
+        try:
+            result = self.db_connection.execute_query(
+                MENU_ITEMS_QUERY, fetch=True, cache_ttl=MENU_ITEMS_CACHE_TTL,
+                deadline=self._deadline(deadline)
+            )
+            return result
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_menu_items: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en get_menu_items: %s", e)
+            return []
+    
+    def get_tables_info(self, deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Obtiene información de todas las mesas
+        
+        Args:
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            List[Dict]: Lista de mesas
+        """
+        try:
+            result = self.db_connection.execute_query(
+                TABLES_INFO_QUERY, fetch=True, cache_ttl=TABLES_INFO_CACHE_TTL,
+                deadline=self._deadline(deadline)
+            )
+            return result
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en get_tables_info: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en get_tables_info: %s", e)
+            return []
+    
+    def generate_daily_report(self, report_date: date,
+                              deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Genera un reporte diario de reservas
+        
+        Args:
+            report_date: Fecha del reporte
+            deadline: Plazo de la llamada (por defecto call_timeout segundos)
+            
+        Returns:
+            Dict: Reporte con estadísticas
+        """
+        try:
+            # Obtener reservas del día e información de mesas con un mismo plazo
+            deadline = self._deadline(deadline)
+            bookings = self.get_bookings_by_date(report_date, deadline)
+            tables_info = self.get_tables_info(deadline)
+            
+            return build_daily_report(report_date, bookings, tables_info)
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en generate_daily_report: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en generate_daily_report: %s", e)
+            return {}
+    
+    def import_orders_batch(self, orders: List[Dict[str, Any]],
+                            batch_size: Optional[int] = None,
+                            deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Importa los pedidos del punto de venta y sus detalles en una sola transacción
+        
+        Args:
+            orders: Pedidos con sus elementos (ver build_order_rows)
+            batch_size: Filas por sentencia INSERT
+            deadline: Plazo de la carga (por defecto sin plazo)
+            
+        Returns:
+            Dict: Estadísticas de la carga (filas, lotes, filas por segundo)
+        """
+        try:
+            order_rows, detail_rows = build_order_rows(orders)
+            stats = self.db_connection.bulk_insert_many([
+                ("orders", ORDER_BATCH_COLUMNS, order_rows),
+                ("order_details", ORDER_DETAIL_BATCH_COLUMNS, detail_rows)
+            ], batch_size, deadline)
+            self.logger.info("Pedidos importados: %s con %s detalles (%.0f filas/s)",
+                             len(order_rows), len(detail_rows), stats['rows_per_second'])
+            return stats
+            
+        except QueryTimeoutError as e:
+            self.logger.warning("Plazo vencido en import_orders_batch: %s", e)
+            raise
+            
+        except Exception as e:
+            self.logger.error("Error en import_orders_batch: %s", e)
+            return {}
+    
+    def close_connection(self):
+        """Cierra la conexión a la base de datos"""
+        if self.db_connection:
+            self.db_connection.close_pool()
+
+
+def main():
+    """Función principal para demostrar el uso del sistema"""
+    configure_logging()
+    
+    print("=== Little Lemon Booking System ===")
+    print("Database Engineer Capstone Project")
+    print("=====================================\n")
+    
+    try:
+        # Crear sistema de reservas
+        booking_system = LittleLemonBookingSystem("local", verify_connection=True)
+        print("✅ Sistema de reservas inicializado correctamente\n")
+        
+        # Demostrar funcionalidades
+        
+        # 1. GetMaxQuantity
+        print("1. Prueba GetMaxQuantity:")
+        max_qty = booking_system.get_max_quantity("Chicken Parmigiana")
+        print(f"   Cantidad máxima de Chicken Parmigiana: {max_qty}\n")
+        
+        # 2. ManageBooking
+        print("2. Prueba ManageBooking:")
+        status = booking_system.manage_booking(date(2025, 7, 25), 1)
+        print(f"   Estado de reserva mesa 1 para 2025-07-25: {status}\n")
+        
+        # 3. CheckBookingAvailability
+        print("3. Verificar disponibilidad:")
+        availability = booking_system.check_booking_availability(
+            date(2025, 7, 25), time(19, 0), 4
+        )
+        print(f"   Mesas disponibles para 4 personas: {len(availability)}")
+        for table in availability[:3]:  # Mostrar solo las primeras 3
+            print(f"   - Mesa {table['table_number']}: {table['availability_status']}")
+        print()
+        
+        # 4. AddBooking
+        print("4. Prueba AddBooking:")
+        new_booking_status = booking_system.add_booking(
+            customer_id=1,
+            table_id=1,
+            booking_date=date(2025, 7, 25),
+            booking_time=time(19, 0),
+            number_of_guests=2,
+            special_requests="Mesa junto a la ventana"
+        )
+        print(f"   Nueva reserva: {new_booking_status}\n")
+        
+        # 5. GetBookingsByDate
+        print("5. Reservas para una fecha:")
+        bookings_today = booking_system.get_bookings_by_date(date(2025, 7, 15))
+        print(f"   Total reservas para 2025-07-15: {len(bookings_today)}")
+        for booking in bookings_today[:2]:  # Mostrar solo las primeras 2
+            print(f"   - {booking['customer_name']} - Mesa {booking['table_number']} a las {booking['booking_time']}")
+        print()
+        
+        # 6. Reporte diario
+        print("6. Reporte diario:")
+        report = booking_system.generate_daily_report(date(2025, 7, 15))
+        print(f"   Fecha: {report['date']}")
+        print(f"   Total reservas: {report['total_bookings']}")
+        print(f"   Reservas confirmadas: {report['confirmed_bookings']}")
+        print(f"   Tasa de ocupación: {report['occupancy_rate']:.1f}%\n")
+        
+        # 7. Información del menú
+        print("7. Elementos del menú:")
+        menu_items = booking_system.get_menu_items()
+        print(f"   Total elementos en el menú: {len(menu_items)}")
+        for item in menu_items[:5]:  # Mostrar solo los primeros 5
+            print(f"   - {item['item_name']}: ${item['price']:.2f} ({item['category_name']})")
+        print()
+        
+        print("✅ Todas las funcionalidades probadas exitosamente!")
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    
+    finally:
+        # Cerrar conexión
+        if 'booking_system' in locals():
+            booking_system.close_connection()
+            print("\n🔒 Conexión cerrada correctamente")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,275 +1,1540 @@
-"""
-Little Lemon Database Connection Module
-Database Engineer Capstone Project
-Fecha: 10 de Julio, 2025
-"""
-
-import mysql.connector
-from mysql.connector import pooling, Error
-import logging
-from typing import Optional, Dict, Any
-
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('little_lemon.log'),
-        logging.StreamHandler()
-    ]
-)
-
-class LittleLemonConnection:
-    """Clase para manejar la conexión a la base de datos Little Lemon"""
-    
-    def __init__(self, config: Dict[str, Any]):
-        """
-        Inicializa la conexión con pool de conexiones
-        
-        Args:
-            config: Diccionario con configuración de la base de datos
-        """
-        self.config = config
-        self.pool = None
-        self.create_connection_pool()
-    
-    def create_connection_pool(self):
-        """Crea un pool de conexiones para optimizar el rendimiento"""
-        try:
-            self.pool = pooling.MySQLConnectionPool(
-                pool_name="little_lemon_pool",
-                pool_size=5,
-                pool_reset_session=True,
-                **self.config
-            )
-            logging.info("Pool de conexiones creado exitosamente")
-        except Error as e:
-            logging.error(f"Error al crear pool de conexiones: {e}")
-            raise
-    
-    def get_connection(self):
-        """
-        Obtiene una conexión del pool
-        
-        Returns:
-            Connection: Conexión MySQL
-        """
-        try:
-            return self.pool.get_connection()
-        except Error as e:
-            logging.error(f"Error al obtener conexión: {e}")
-            raise
-    
-    def execute_query(self, query: str, params: tuple = None, fetch: bool = False):
-        """
-        Ejecuta una consulta SQL
-        
-        Args:
-            query: Consulta SQL a ejecutar
-            params: Parámetros para la consulta
-            fetch: Si debe retornar resultados
-            
-        Returns:
-            Resultados de la consulta si fetch=True, sino None
-        """
-        connection = None
-        cursor = None
-        
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            if fetch:
-                results = cursor.fetchall()
-                return results
-            else:
-                connection.commit()
-                return cursor.rowcount
-                
-        except Error as e:
-            if connection:
-                connection.rollback()
-            logging.error(f"Error ejecutando consulta: {e}")
-            raise
-        finally:
-            if cursor:
-                cursor.close()
-            if connection:
-                connection.close()
-    
-    def execute_procedure(self, procedure_name: str, params: list = None):
-        """
-        Ejecuta un procedimiento almacenado
-        
-        Args:
-            procedure_name: Nombre del procedimiento
-            params: Lista de parámetros para el procedimiento
-            
-        Returns:
-            Resultados del procedimiento
-        """
-        connection = None
-        cursor = None
-        
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            
-            if params:
-                cursor.callproc(procedure_name, params)
-            else:
-                cursor.callproc(procedure_name)
-            
-            # Obtener resultados
-            results = []
-            for result in cursor.stored_results():
-                results.extend(result.fetchall())
-            
-            # Obtener parámetros de salida si existen
-            cursor.execute("SELECT @_" + procedure_name + "_0, @_" + procedure_name + "_1, @_" + procedure_name + "_2")
-            out_params = cursor.fetchone()
-            
-            connection.commit()
-            return results, out_params
-            
-        except Error as e:
-            if connection:
-                connection.rollback()
-            logging.error(f"Error ejecutando procedimiento {procedure_name}: {e}")
-            raise
-        finally:
-            if cursor:
-                cursor.close()
-            if connection:
-                connection.close()
-    
-    def test_connection(self):
-        """
-        Prueba la conexión a la base de datos
-        
-        Returns:
-            bool: True si la conexión es exitosa
-        """
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute("SELECT 1")
-            result = cursor.fetchone()
-            cursor.close()
-            connection.close()
-            logging.info("Conexión a la base de datos exitosa")
-            return True
-        except Error as e:
-            logging.error(f"Error de conexión: {e}")
-            return False
-    
-    def close_pool(self):
-        """Cierra el pool de conexiones"""
-        if self.pool:
-            self.pool.close()
-            logging.info("Pool de conexiones cerrado")
-
-
-def get_database_config(environment: str = "local") -> Dict[str, Any]:
-    """
-    Obtiene la configuración de la base de datos según el entorno
-    
-    Args:
-        environment: Entorno de trabajo (local, development, production)
-        
-    Returns:
-        Dict con configuración de la base de datos
-    """
-    configurations = {
-        "local": {
-            "host": "localhost",
-            "port": 3306,
-            "user": "root",
-            "password": "LittleLemon2024!",
-            "database": "little_lemon_db",
-            "charset": "utf8mb4",
-            "use_unicode": True,
-            "autocommit": False
-        },
-        "development": {
-            "host": "localhost",
-            "port": 3306,
-            "user": "app_user",
-            "password": "app_secure_pass",
-            "database": "little_lemon_db",
-            "charset": "utf8mb4",
-            "use_unicode": True,
-            "autocommit": False
-        },
-        "production": {
-            "host": "localhost",
-            "port": 3306,
-            "user": "app_user",
-            "password": "app_secure_pass",
-            "database": "little_lemon_db",
-            "charset": "utf8mb4",
-            "use_unicode": True,
-            "autocommit": False,
-            "ssl_disabled": False
-        }
-    }
-    
-    return configurations.get(environment, configurations["local"])
-
-
-def create_database_connection(environment: str = "local") -> LittleLemonConnection:
-    """
-    Crea una instancia de conexión a la base de datos
-    
-    Args:
-        environment: Entorno de trabajo
-        
-    Returns:
-        LittleLemonConnection: Instancia de conexión
-    """
-    config = get_database_config(environment)
-    return LittleLemonConnection(config)
-
-
-if __name__ == "__main__":
-    # Test de la conexión
-    print("Probando conexión a la base de datos Little Lemon...")
-    
-    try:
-        # Crear conexión
-        db_connection = create_database_connection("local")
-        
-        # Probar conexión
-        if db_connection.test_connection():
-            print("✅ Conexión exitosa a la base de datos")
-            
-            # Prueba básica de consulta
-            result = db_connection.execute_query(
-                "SELECT COUNT(*) as total_customers FROM customers", 
-                fetch=True
-            )
-            print(f"Total de clientes en la base de datos: {result[0]['total_customers']}")
-            
-            # Prueba de procedimiento almacenado
-            try:
-                results, out_params = db_connection.execute_procedure("GetMaxQuantity", ["Chicken Parmigiana"])
-                print(f"Procedimiento GetMaxQuantity ejecutado exitosamente")
-            except Exception as e:
-                print(f"Error ejecutando procedimiento: {e}")
-            
-        else:
-            print("❌ Error en la conexión a la base de datos")
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    finally:
-        # Cerrar conexión
-        if 'db_connection' in locals():
-            db_connection.close_pool()
-            print("Conexión cerrada")
+"""
+Little Lemon Database Connection Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+"""
+
+import sys
+import os
+import mysql.connector
+from mysql.connector import Error, errorcode
+import logging
+import re
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Iterator, Callable
+
+# Agregar el directorio actual al path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from replication import (
+    ReplicaSet,
+    is_read_query,
+    READ_ONLY_PROCEDURES,
+    DEFAULT_REPLICA_COOLDOWN
+)
+from query_cache import (
+    QueryResultCache,
+    copy_result,
+    referenced_tables,
+    written_tables,
+    PROCEDURE_WRITE_TABLES,
+    DEFAULT_QUERY_CACHE_SIZE,
+    DEFAULT_QUERY_CACHE_MAX_BYTES
+)
+from metrics import QueryMetrics, QueryTimer, normalize_sql, DEFAULT_SLOW_QUERY_THRESHOLD_MS
+from result_formats import format_rows, record_type, validate_result_format
+from sqlite_backend import SQLiteBackend
+from deadlines import (
+    QueryTimeoutError,
+    remaining_time,
+    with_max_execution_time,
+    lock_wait_statement,
+    raise_if_timeout,
+    RESTORE_LOCK_WAIT_TIMEOUT_STATEMENT
+)
+from connection_pool import (
+    LittleLemonConnectionPool,
+    PoolTimeoutError,
+    split_pool_config,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_POOL_MAX_WAIT,
+    DEFAULT_PREPARED_CACHE_SIZE,
+    DEFAULT_POOL_MAX_LIFETIME,
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_PING_AFTER
+)
+
+# El logging lo configura la aplicación (ver logging_config.configure_logging)
+logger = logging.getLogger(__name__)
+
+# Firmas de los procedimientos almacenados de la base de datos actual
+PROCEDURE_SIGNATURES_QUERY = """
+SELECT SPECIFIC_NAME AS procedure_name,
+       PARAMETER_NAME AS parameter_name,
+       PARAMETER_MODE AS parameter_mode
+FROM information_schema.PARAMETERS
+WHERE SPECIFIC_SCHEMA = DATABASE() AND ROUTINE_TYPE = 'PROCEDURE'
+ORDER BY SPECIFIC_NAME, ORDINAL_POSITION
+"""
+
+# Filas leídas del servidor por cada fetch cuando se itera fila a fila
+DEFAULT_STREAM_FETCH_SIZE = 1000
+
+# Filas por sentencia INSERT multi-fila en las cargas masivas
+DEFAULT_BULK_BATCH_SIZE = 500
+
+# Segundos que las lecturas siguen en el primario tras una escritura
+DEFAULT_READ_YOUR_WRITES_WINDOW = 5.0
+
+# Opciones de configuración propias de LittleLemonConnection
+CONNECTION_OPTION_KEYS = (
+    "prepared_statements",
+    "bulk_batch_size",
+    "replicas",
+    "replica_selection",
+    "replica_cooldown",
+    "read_your_writes",
+    "read_your_writes_window",
+    "read_only_procedures",
+    "query_cache",
+    "query_cache_size",
+    "query_cache_max_bytes",
+    "query_metrics",
+    "slow_query_threshold_ms",
+    "booking_call_timeout",
+    "booking_call_mode",
+    "availability_index",
+    "availability_index_ttl",
+    "backend",
+    "sqlite_database",
+    "sqlite_sample_data",
+)
+
+# Errores del cliente que indican que la conexión se perdió (wait_timeout,
+# reinicio o conmutación del servidor)
+CONNECTION_LOST_ERRNOS = frozenset((
+    errorcode.CR_SERVER_GONE_ERROR,
+    errorcode.CR_SERVER_LOST,
+    errorcode.CR_SERVER_LOST_EXTENDED
+))
+
+# Variable de sesión que indica a los procedimientos almacenados que la
+# transacción la controla el cliente (no deben iniciarla ni confirmarla)
+UNIT_OF_WORK_VARIABLE = "@ll_unit_of_work"
+
+# Nombres válidos para procedimientos y variables de sesión
+IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Conexiones vivas del proceso, para reiniciar su estado por hilo tras un fork
+_live_connections = weakref.WeakSet()
+
+
+def _validate_identifier(name: str) -> str:
+    """
+    Valida un identificador SQL que se interpola directamente en la sentencia
+    
+    Args:
+        name: Identificador a validar
+        
+    Returns:
+        str: El mismo identificador si es válido
+    """
+    if not isinstance(name, str) or not IDENTIFIER_PATTERN.match(name):
+        raise ValueError(f"Identificador SQL no válido: {name!r}")
+    return name
+
+
+def parse_procedure_signatures(rows: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Agrupa las filas de information_schema.PARAMETERS por procedimiento
+    
+    Args:
+        rows: Filas devueltas por PROCEDURE_SIGNATURES_QUERY
+        
+    Returns:
+        Dict: Nombre del procedimiento (en minúsculas) -> lista de parámetros
+    """
+    signatures = {}
+    for row in rows:
+        parameters = signatures.setdefault(row['procedure_name'].lower(), [])
+        parameters.append({
+            'name': row['parameter_name'],
+            'mode': (row['parameter_mode'] or 'IN').upper()
+        })
+    return signatures
+
+
+def _append_out_select(statement: str, out_variables: List[Tuple[str, str]]) -> str:
+    """Añade a la sentencia el SELECT de las variables de salida, si las hay"""
+    if not out_variables:
+        return statement
+    return statement + "; SELECT " + ", ".join(
+        f"@{variable} AS {name}" for name, variable in out_variables
+    )
+
+
+def build_call_statement(procedure_name: str, params: Sequence[Any] = None,
+                         out_params: List[str] = None) -> Tuple[str, Tuple, List[Tuple[str, str]]]:
+    """
+    Construye la sentencia CALL con parámetros de salida explícitos
+    
+    Args:
+        procedure_name: Nombre del procedimiento
+        params: Parámetros de entrada del procedimiento
+        out_params: Nombres de los parámetros de salida, en orden
+        
+    Returns:
+        Tuple: (sentencia, valores, pares (parámetro, variable de sesión))
+    """
+    _validate_identifier(procedure_name)
+    params = tuple(params or ())
+    out_variables = [(name, _validate_identifier(name)) for name in (out_params or [])]
+    
+    arguments = ["%s"] * len(params) + [f"@{variable}" for _, variable in out_variables]
+    statement = f"CALL {procedure_name}({', '.join(arguments)})"
+    return _append_out_select(statement, out_variables), params, out_variables
+
+
+def build_signature_statement(procedure_name: str, params: Sequence[Any],
+                              signature: Optional[List[Dict[str, str]]]) -> Tuple[str, Tuple, List[Tuple[str, str]]]:
+    """
+    Construye la sentencia CALL a partir de la firma del procedimiento
+    
+    Los valores recibidos se asignan en orden a los parámetros IN e INOUT;
+    los parámetros OUT e INOUT se leen mediante variables de sesión.
+    
+    Args:
+        procedure_name: Nombre del procedimiento
+        params: Valores de los parámetros de entrada
+        signature: Firma del procedimiento, o None si no tiene parámetros o es desconocido
+        
+    Returns:
+        Tuple: (sentencia, valores, pares (parámetro, variable de sesión))
+    """
+    _validate_identifier(procedure_name)
+    params = list(params or [])
+    
+    if signature is None:
+        # Procedimiento sin parámetros o desconocido: todos los valores son de entrada
+        signature = [{'name': None, 'mode': 'IN'} for _ in params]
+    
+    if len(params) != sum(1 for p in signature if p['mode'] != 'OUT'):
+        raise ValueError(f"Número de parámetros incorrecto para {procedure_name}")
+    
+    prefix = []
+    arguments = []
+    values = []
+    out_variables = []
+    remaining = iter(params)
+    
+    for parameter in signature:
+        if parameter['mode'] == 'IN':
+            arguments.append("%s")
+            values.append(next(remaining))
+            continue
+        
+        variable = f"_{procedure_name}_{_validate_identifier(parameter['name'])}"
+        if parameter['mode'] == 'INOUT':
+            prefix.append(f"SET @{variable} = %s")
+            values.append(next(remaining))
+        arguments.append(f"@{variable}")
+        out_variables.append((parameter['name'], variable))
+    
+    statement = "; ".join(prefix + [f"CALL {procedure_name}({', '.join(arguments)})"])
+    return _append_out_select(statement, out_variables), tuple(values), out_variables
+
+
+def is_connection_lost(error: Exception) -> bool:
+    """
+    Indica si un error se debe a una conexión perdida
+    
+    Args:
+        error: Excepción capturada
+    
+    Returns:
+        bool: True si la conexión ya no es utilizable
+    """
+    return getattr(error, "errno", None) in CONNECTION_LOST_ERRNOS
+
+
+def build_insert_statement(table: str, columns: Sequence[str], row_count: int) -> str:
+    """
+    Construye una sentencia INSERT multi-fila
+    
+    Args:
+        table: Nombre de la tabla
+        columns: Columnas a insertar
+        row_count: Número de filas de la sentencia
+        
+    Returns:
+        str: INSERT INTO tabla (columnas) VALUES (%s, ...), (%s, ...), ...
+    """
+    if not columns:
+        raise ValueError("Se requiere al menos una columna")
+    if row_count < 1:
+        raise ValueError("Se requiere al menos una fila")
+    
+    column_list = ", ".join(_validate_identifier(column) for column in columns)
+    row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    values = ", ".join([row_placeholders] * row_count)
+    return f"INSERT INTO {_validate_identifier(table)} ({column_list}) VALUES {values}"
+
+
+def split_procedure_results(result_sets: List[List[Dict]],
+                            out_variables: List[Tuple[str, str]]) -> Tuple[List[Dict], Dict[str, Any]]:
+    """
+    Separa las filas del procedimiento de la fila con los parámetros de salida
+    
+    Args:
+        result_sets: Result sets con filas, en el orden en que llegaron
+        out_variables: Pares (parámetro, variable de sesión) leídos por la sentencia
+        
+    Returns:
+        Tuple: (filas de los result sets, diccionario con los parámetros de salida)
+    """
+    result_sets = list(result_sets)
+    
+    # El último result set corresponde al SELECT de los parámetros de salida
+    out_values = {name: None for name, _ in out_variables}
+    if out_variables and result_sets:
+        out_row = result_sets.pop()
+        if out_row:
+            out_values.update(out_row[0])
+    
+    results = []
+    for rows in result_sets:
+        results.extend(rows)
+    
+    return results, out_values
+
+
+class Transaction:
+    """Transacción que fija una conexión del pool hasta su finalización"""
+    
+    def __init__(self, connection):
+        """
+        Inicializa la transacción
+        
+        Args:
+            connection: Conexión del pool reservada para la transacción
+        """
+        self.connection = connection
+        self.error = None
+        self.touched_tables = set()
+        self.touched_all_tables = False
+    
+    def commit(self):
+        """Confirma el trabajo realizado hasta ahora"""
+        self.connection.commit()
+    
+    def rollback(self):
+        """Revierte el trabajo realizado hasta ahora"""
+        self.connection.rollback()
+        self.error = None
+
+
+def set_unit_of_work(cursor, active: bool):
+    """
+    Activa o desactiva el modo unidad de trabajo en la sesión
+    
+    Args:
+        cursor: Cursor de la conexión fijada
+        active: Si los procedimientos deben dejar la transacción al cliente
+    """
+    cursor.execute(f"SET {UNIT_OF_WORK_VARIABLE} = {1 if active else 'NULL'}")
+
+
+class LittleLemonConnection:
+    """Clase para manejar la conexión a la base de datos Little Lemon"""
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Inicializa la conexión con pool de conexiones
+        
+        Args:
+            config: Diccionario con configuración de la base de datos
+        """
+        self.config = config
+        self.pool = None
+        self.replicas = None
+        self.backend = None
+        self.prepared_statements = config.get("prepared_statements", False)
+        self.bulk_batch_size = config.get("bulk_batch_size", DEFAULT_BULK_BATCH_SIZE)
+        self.read_your_writes = config.get("read_your_writes", True)
+        self.read_your_writes_window = config.get("read_your_writes_window", DEFAULT_READ_YOUR_WRITES_WINDOW)
+        self.read_only_procedures = {
+            name.lower() for name in config.get("read_only_procedures", READ_ONLY_PROCEDURES)
+        }
+        self.query_cache = None
+        if config.get("query_cache", True):
+            self.query_cache = QueryResultCache(
+                config.get("query_cache_size", DEFAULT_QUERY_CACHE_SIZE),
+                config.get("query_cache_max_bytes", DEFAULT_QUERY_CACHE_MAX_BYTES)
+            )
+        self.query_metrics = None
+        if config.get("query_metrics", True):
+            self.query_metrics = QueryMetrics(
+                config.get("slow_query_threshold_ms", DEFAULT_SLOW_QUERY_THRESHOLD_MS)
+            )
+        self._procedure_signatures = None
+        self._signature_lock = threading.Lock()
+        self._local = threading.local()
+        self._read_retries = 0
+        self.create_connection_pool()
+        _live_connections.add(self)
+    
+    def _reset_after_fork(self):
+        """
+        Descarta en el proceso hijo el estado heredado del padre
+        
+        Una transacción abierta en el padre fija una conexión cuyo socket es
+        del padre, y un lock tomado por otro hilo del padre nunca se liberaría.
+        Los pools se rehacen solos (ver LittleLemonConnectionPool).
+        """
+        self._local = threading.local()
+        self._signature_lock = threading.Lock()
+    
+    def create_connection_pool(self):
+        """
+        Crea un pool de conexiones para optimizar el rendimiento
+        
+        El tamaño del pool, la espera máxima por una conexión, el tamaño de la
+        cola de espera y el nombre del pool se leen de la configuración. Cada
+        réplica de "replicas" recibe su propio pool; sus claves sustituyen a
+        las del primario (normalmente host y port).
+        
+        Con backend = "sqlite" las conexiones del pool son de una base de datos
+        SQLite embebida (ver sqlite_backend); no admite réplicas.
+        """
+        pool_options, connection_config = split_pool_config(self.config)
+        for key in CONNECTION_OPTION_KEYS:
+            connection_config.pop(key, None)
+        
+        try:
+            backend = self.config.get("backend", "mysql")
+            connection_factory = None
+            if backend == "sqlite":
+                if self.config.get("replicas"):
+                    raise ValueError("El backend sqlite no admite réplicas de lectura")
+                self.backend = SQLiteBackend(
+                    self.config.get("sqlite_database"),
+                    sample_data=self.config.get("sqlite_sample_data", True)
+                )
+                connection_factory = self.backend.connect
+                logger.info("Backend SQLite embebido en %s", self.backend.database)
+            elif backend != "mysql":
+                raise ValueError(f"Backend no válido: {backend} (mysql o sqlite)")
+            
+            self.pool = self._build_pool(pool_options, connection_config, connection_factory)
+            logger.info("Pool de conexiones %s creado exitosamente", self.pool.pool_name)
+            
+            replica_pools = []
+            for index, replica in enumerate(self.config.get("replicas") or [], start=1):
+                replica_options, replica_config = split_pool_config(replica)
+                replica_options = {
+                    **pool_options,
+                    "pool_name": f"{self.pool.pool_name}_replica_{index}",
+                    **replica_options
+                }
+                replica_pools.append(
+                    self._build_pool(replica_options, {**connection_config, **replica_config})
+                )
+            
+            if replica_pools:
+                self.replicas = ReplicaSet(
+                    replica_pools,
+                    strategy=self.config.get("replica_selection", "round_robin"),
+                    cooldown=self.config.get("replica_cooldown", DEFAULT_REPLICA_COOLDOWN)
+                )
+                logger.info("Réplicas de lectura configuradas: %s (%s)",
+                            len(replica_pools), self.replicas.strategy)
+        except (Error, ValueError) as e:
+            logger.error("Error al crear pool de conexiones: %s", e)
+            raise
+    
+    def _build_pool(self, pool_options: Dict[str, Any], connection_config: Dict[str, Any],
+                    connection_factory: Optional[Callable[[], Any]] = None) -> LittleLemonConnectionPool:
+        """
+        Crea un pool de conexiones a partir de sus opciones
+        
+        Args:
+            pool_options: Opciones del pool (pool_size, pool_max_wait, ...)
+            connection_config: Configuración de la conexión MySQL
+            connection_factory: Función que abre las conexiones (None = MySQL)
+            
+        Returns:
+            LittleLemonConnectionPool: Pool creado
+        """
+        # Reiniciar la sesión descarta las sentencias preparadas; en modo preparado
+        # solo se deshace la transacción pendiente al devolver la conexión
+        reset_session = pool_options.get("pool_reset_session", not self.prepared_statements)
+        
+        return LittleLemonConnectionPool(
+            connection_config,
+            pool_name=pool_options.get("pool_name"),
+            pool_size=pool_options.get("pool_size", DEFAULT_POOL_SIZE),
+            max_wait=pool_options.get("pool_max_wait", DEFAULT_POOL_MAX_WAIT),
+            max_waiters=pool_options.get("pool_max_waiters"),
+            reset_session=reset_session,
+            prepared_cache_size=pool_options.get("prepared_cache_size", DEFAULT_PREPARED_CACHE_SIZE),
+            max_lifetime=pool_options.get("pool_max_lifetime", DEFAULT_POOL_MAX_LIFETIME),
+            idle_timeout=pool_options.get("pool_idle_timeout", DEFAULT_POOL_IDLE_TIMEOUT),
+            ping_after=pool_options.get("pool_ping_after", DEFAULT_POOL_PING_AFTER),
+            connection_factory=connection_factory
+        )
+    
+    def get_connection(self, timeout: Optional[float] = None):
+        """
+        Obtiene una conexión del pool, esperando en cola si está agotado
+        
+        Args:
+            timeout: Segundos máximos de espera (por defecto pool_max_wait)
+            
+        Returns:
+            Connection: Conexión MySQL; close() la devuelve al pool
+        """
+        try:
+            return self.pool.get_connection(timeout)
+        except Error as e:
+            logger.error("Error al obtener conexión: %s", e)
+            raise
+    
+    def _checkout(self, read_only: bool = False, deadline: Optional[float] = None):
+        """
+        Obtiene la conexión a usar: la de la transacción activa, una réplica
+        para las lecturas o una del pool del primario
+        
+        Args:
+            read_only: Si la operación solo lee datos
+            deadline: Plazo de la operación; limita la espera en el pool
+            
+        Returns:
+            Tuple: (conexión, True si la conexión pertenece a esta llamada)
+        """
+        transaction = getattr(self._local, "transaction", None)
+        if transaction is not None:
+            return transaction.connection, False
+        
+        timeout = None
+        remaining = remaining_time(deadline)
+        if remaining is not None and remaining < self.pool.max_wait:
+            timeout = remaining
+        
+        try:
+            if read_only and self.replicas and not self._reads_pinned_to_primary():
+                connection = self.replicas.get_connection(timeout)
+                if connection is not None:
+                    return connection, True
+            
+            return self.get_connection(timeout), True
+        except PoolTimeoutError as e:
+            if timeout is not None:
+                raise QueryTimeoutError(f"Plazo vencido esperando una conexión: {e}") from e
+            raise
+    
+    def _limit_lock_waits(self, connection, deadline: Optional[float]) -> bool:
+        """
+        Limita las esperas de bloqueos de la sesión al tiempo que queda del plazo
+        
+        Args:
+            connection: Conexión de la operación
+            deadline: Plazo de la operación (None = sin límite)
+            
+        Returns:
+            bool: True si se cambió la sesión (hay que restaurarla después)
+        """
+        remaining = remaining_time(deadline)
+        if remaining is None:
+            return False
+        cursor = connection.cursor()
+        try:
+            cursor.execute(lock_wait_statement(remaining))
+        finally:
+            cursor.close()
+        return True
+    
+    def _restore_lock_waits(self, connection):
+        """Devuelve las esperas de bloqueos de la sesión a los valores globales"""
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(RESTORE_LOCK_WAIT_TIMEOUT_STATEMENT)
+            finally:
+                cursor.close()
+        except Error as e:
+            logger.warning("Error restaurando las esperas de bloqueos de la sesión: %s", e)
+    
+    def _reads_pinned_to_primary(self) -> bool:
+        """Indica si las lecturas de este hilo deben ir al primario tras una escritura"""
+        return getattr(self._local, "primary_until", 0.0) > time.monotonic()
+    
+    def _record_write(self):
+        """Fija las lecturas de este hilo al primario si hay lectura de las propias escrituras"""
+        if not self.replicas:
+            return
+        
+        read_your_writes = getattr(self._local, "read_your_writes", None)
+        if read_your_writes is None:
+            read_your_writes = self.read_your_writes
+        if not read_your_writes:
+            return
+        
+        window = getattr(self._local, "read_your_writes_window", self.read_your_writes_window)
+        self._local.primary_until = float("inf") if window is None else time.monotonic() + window
+    
+    def _invalidate_cache(self, tables: Optional[Sequence[str]]):
+        """
+        Invalida los resultados cacheados que leen las tablas modificadas
+        
+        Dentro de una transacción la invalidación se aplica al confirmarla,
+        que es cuando los demás pueden ver los cambios.
+        
+        Args:
+            tables: Tablas modificadas (None = toda la caché)
+        """
+        if self.query_cache is None:
+            return
+        
+        transaction = getattr(self._local, "transaction", None)
+        if transaction is None:
+            self.query_cache.invalidate(tables)
+        elif tables is None:
+            transaction.touched_all_tables = True
+        else:
+            transaction.touched_tables.update(tables)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las métricas de la caché de resultados
+        
+        Returns:
+            Dict: Entradas, memoria, aciertos, fallos, desalojos e invalidaciones
+        """
+        return self.query_cache.stats() if self.query_cache else {}
+    
+    def _record_metrics(self, key: str, timer: QueryTimer):
+        """
+        Registra las métricas de una ejecución si están activadas
+        
+        Args:
+            key: Sentencia normalizada o nombre del procedimiento
+            timer: Cronómetro de la ejecución
+        """
+        if self.query_metrics is not None:
+            self.query_metrics.record_timer(key, timer)
+    
+    def get_query_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtiene los percentiles de latencia de cada sentencia
+        
+        Returns:
+            Dict: Sentencia normalizada o "CALL procedimiento" -> llamadas,
+                  errores y p50/p95/p99 de espera, ejecución, lectura y filas
+        """
+        return self.query_metrics.snapshot() if self.query_metrics else {}
+    
+    def get_slow_queries(self) -> List[Dict[str, Any]]:
+        """
+        Obtiene las consultas lentas más recientes
+        
+        Returns:
+            List[Dict]: Consultas que superaron slow_query_threshold_ms
+        """
+        return self.query_metrics.slow_queries() if self.query_metrics else []
+    
+    def reset_query_metrics(self):
+        """Descarta las métricas de consultas acumuladas"""
+        if self.query_metrics is not None:
+            self.query_metrics.reset()
+    
+    @contextmanager
+    def session(self, read_your_writes: Optional[bool] = None,
+                window: Optional[float] = DEFAULT_READ_YOUR_WRITES_WINDOW):
+        """
+        Abre una sesión de este hilo con su propia política de lectura de escrituras
+        
+        Dentro del bloque, después de una escritura todas las lecturas van al
+        primario durante window segundos (None = hasta el final de la sesión).
+        Al salir se olvida la escritura y se restaura la política anterior.
+        
+        Args:
+            read_your_writes: Si las lecturas tras una escritura van al primario
+                              (por defecto según la configuración)
+            window: Segundos que dura la fijación al primario
+        """
+        previous = (
+            getattr(self._local, "read_your_writes", None),
+            getattr(self._local, "read_your_writes_window", self.read_your_writes_window),
+            getattr(self._local, "primary_until", 0.0)
+        )
+        self._local.read_your_writes = read_your_writes
+        self._local.read_your_writes_window = window
+        self._local.primary_until = 0.0
+        
+        try:
+            yield self
+        finally:
+            (self._local.read_your_writes,
+             self._local.read_your_writes_window,
+             self._local.primary_until) = previous
+    
+    def _mark_transaction_failed(self, error: Exception):
+        """
+        Marca la transacción activa para revertirla al salir del bloque
+        
+        Los métodos del sistema de reservas capturan sus excepciones, así que
+        el error se guarda para que la transacción no confirme trabajo parcial.
+        
+        Args:
+            error: Error ocurrido sobre la conexión fijada
+        """
+        transaction = getattr(self._local, "transaction", None)
+        if transaction is not None and transaction.error is None:
+            transaction.error = error
+    
+    def _abandon(self, connection, owned: bool, error: Exception):
+        """
+        Deshace una operación fallida
+        
+        La conexión propia se revierte, o se descarta si se perdió; la de una
+        transacción activa se deja y la transacción se marca como fallida.
+        
+        Args:
+            connection: Conexión usada por la operación
+            owned: Si la conexión pertenece a la operación
+            error: Error de la operación
+        """
+        if not owned:
+            self._mark_transaction_failed(error)
+        elif is_connection_lost(error):
+            connection.invalidate()
+        else:
+            connection.rollback()
+    
+    def _with_read_retry(self, read_only: bool, operation: Callable[[], Any]):
+        """
+        Ejecuta una operación y, si es una lectura y la conexión se perdió,
+        la repite una vez con una conexión nueva
+        
+        Las escrituras y las operaciones dentro de una transacción no se
+        repiten: podrían aplicarse dos veces o perder el trabajo anterior.
+        
+        Args:
+            read_only: Si la operación solo lee datos
+            operation: Función que ejecuta la operación completa
+            
+        Returns:
+            Resultado de la operación
+        """
+        try:
+            return operation()
+        except Error as e:
+            if not (read_only and is_connection_lost(e)
+                    and getattr(self._local, "transaction", None) is None):
+                raise
+            logger.warning("Conexión perdida, repitiendo la lectura con una conexión nueva: %s", e)
+            self._read_retries += 1
+            return operation()
+    
+    def in_transaction(self) -> bool:
+        """Indica si este hilo tiene una transacción activa (ver transaction)"""
+        return getattr(self._local, "transaction", None) is not None
+    
+    @contextmanager
+    def transaction(self, deadline: Optional[float] = None):
+        """
+        Abre una unidad de trabajo que fija una conexión del pool
+        
+        Todas las llamadas a execute_query, stream_query, bulk_insert,
+        execute_procedure y call_procedure hechas desde este hilo dentro del
+        bloque (incluidas las del sistema de reservas) usan la misma conexión
+        y se confirman una sola vez al salir. Si el bloque lanza una excepción
+        o alguna de esas llamadas falla, se revierte todo. Los estados de error
+        de los procedimientos no son fallos: quien llama debe comprobarlos y
+        lanzar una excepción (ver LittleLemonBookingSystem.transaction).
+        
+        Args:
+            deadline: Plazo de la unidad de trabajo; limita la espera en el
+                      pool y las esperas de bloqueos de toda la transacción
+        
+        Yields:
+            Transaction: Transacción activa
+        """
+        if self.in_transaction():
+            raise RuntimeError("Ya existe una transacción activa en este hilo")
+        
+        connection, _ = self._checkout(deadline=deadline)
+        transaction = Transaction(connection)
+        cursor = None
+        lock_waits_limited = False
+        
+        try:
+            connection.start_transaction()
+            lock_waits_limited = self._limit_lock_waits(connection, deadline)
+            cursor = connection.cursor()
+            set_unit_of_work(cursor, True)
+            self._local.transaction = transaction
+            
+            yield transaction
+            
+            if transaction.error is not None:
+                raise transaction.error
+            connection.commit()
+            self._record_write()
+            if self.query_cache is not None:
+                if transaction.touched_all_tables:
+                    self.query_cache.invalidate()
+                elif transaction.touched_tables:
+                    self.query_cache.invalidate(transaction.touched_tables)
+        except BaseException:
+            try:
+                connection.rollback()
+            except Error as e:
+                logger.warning("Error revirtiendo transacción: %s", e)
+            raise
+        finally:
+            self._local.transaction = None
+            try:
+                if cursor:
+                    set_unit_of_work(cursor, False)
+                    cursor.close()
+            except Error as e:
+                logger.warning("Error cerrando transacción: %s", e)
+            if lock_waits_limited and not self.pool.reset_session:
+                self._restore_lock_waits(connection)
+            connection.close()
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las métricas en vivo del pool de conexiones
+        
+        Returns:
+            Dict: Conexiones en uso, libres y en espera, espera media y timeouts;
+                  con réplicas, sus métricas en "replicas"
+        """
+        if not self.pool:
+            return {}
+        
+        stats = self.pool.stats()
+        stats['read_retries'] = self._read_retries
+        if self.replicas:
+            stats['replicas'] = self.replicas.stats()
+        return stats
+    
+    def execute_query(self, query: str, params: tuple = None, fetch: bool = False,
+                      prepared: Optional[bool] = None, result_format: str = "dict",
+                      read_only: Optional[bool] = None, cache_ttl: Optional[float] = None,
+                      deadline: Optional[float] = None):
+        """
+        Ejecuta una consulta SQL
+        
+        Una lectura cuya conexión se perdió (p. ej. tras wait_timeout o una
+        conmutación del servidor) se repite una vez con una conexión nueva.
+        
+        Con un plazo, las consultas SELECT llevan el hint MAX_EXECUTION_TIME y
+        las escrituras limitan las esperas de bloqueos de la sesión al tiempo
+        restante; si el plazo vence se lanza QueryTimeoutError.
+        
+        Args:
+            query: Consulta SQL a ejecutar
+            params: Parámetros para la consulta
+            fetch: Si debe retornar resultados
+            prepared: Si debe usar una sentencia preparada en el servidor
+                      (por defecto según la opción prepared_statements)
+            result_format: Formato de los resultados: "dict", "tuple"
+                           (columnas, filas), "record" o "columnar"
+            read_only: Si la consulta puede ir a una réplica (por defecto
+                       se detecta: SELECT/SHOW/WITH sin bloqueo de filas)
+            cache_ttl: Segundos que el resultado puede servirse desde la caché
+                       (None = no cachear); se invalida al escribir en sus tablas
+            deadline: Plazo de la llamada como instante de time.monotonic()
+                      (ver deadlines.deadline_after); None = sin plazo
+            
+        Returns:
+            Resultados de la consulta si fetch=True, sino None
+        """
+        use_prepared = self.prepared_statements if prepared is None else prepared
+        validate_result_format(result_format)
+        if read_only is None:
+            read_only = fetch and is_read_query(query)
+        
+        if (cache_ttl and fetch and read_only and self.query_cache is not None
+                and getattr(self._local, "transaction", None) is None):
+            key = (query, tuple(params or ()), result_format)
+            found, cached = self.query_cache.get(key)
+            if found:
+                return copy_result(cached)
+            
+            version = self.query_cache.version()
+            result = self.execute_query(query, params, fetch, prepared, result_format, read_only,
+                                        deadline=deadline)
+            self.query_cache.put(key, result, referenced_tables(query), cache_ttl, version)
+            return copy_result(result)
+        
+        return self._with_read_retry(
+            fetch and read_only,
+            lambda: self._execute(query, params, fetch, use_prepared, result_format, read_only,
+                                  deadline)
+        )
+    
+    def _execute(self, query: str, params: Optional[tuple], fetch: bool, use_prepared: bool,
+                 result_format: str, read_only: bool, deadline: Optional[float] = None):
+        """
+        Ejecuta una consulta SQL en una conexión (ver execute_query)
+        
+        Returns:
+            Resultados de la consulta si fetch=True, sino el número de filas afectadas
+        """
+        connection = None
+        owned = True
+        cursor = None
+        lock_waits_limited = False
+        statement = query
+        
+        timer = QueryTimer()
+        try:
+            connection, owned = self._checkout(read_only, deadline)
+            timer.mark("pool_wait")
+            
+            if fetch and read_only:
+                statement = with_max_execution_time(query, remaining_time(deadline))
+            else:
+                lock_waits_limited = self._limit_lock_waits(connection, deadline)
+            
+            if use_prepared:
+                # El cursor preparado pertenece a la caché de la conexión: no se cierra
+                prepared_cursor = connection.execute_prepared(statement, params)
+                timer.mark("execute")
+                if fetch:
+                    rows = prepared_cursor.fetchall()
+                    timer.mark("fetch", len(rows))
+                    return format_rows(prepared_cursor.column_names, rows, result_format)
+                if owned:
+                    connection.commit()
+                timer.mark("execute", prepared_cursor.rowcount)
+                self._record_write()
+                self._invalidate_cache(written_tables(query))
+                return prepared_cursor.rowcount
+            
+            cursor = connection.cursor(dictionary=(result_format == "dict"))
+            
+            if params:
+                cursor.execute(statement, params)
+            else:
+                cursor.execute(statement)
+            timer.mark("execute")
+            
+            if fetch:
+                results = cursor.fetchall()
+                timer.mark("fetch", len(results))
+                if result_format == "dict":
+                    return results
+                return format_rows(cursor.column_names, results, result_format)
+            else:
+                if owned:
+                    connection.commit()
+                timer.mark("execute", cursor.rowcount)
+                self._record_write()
+                self._invalidate_cache(written_tables(query))
+                return cursor.rowcount
+                
+        except Error as e:
+            if connection:
+                self._abandon(connection, owned, e)
+            timer.failed = True
+            logger.error("Error ejecutando consulta: %s", e)
+            raise_if_timeout(e)
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            # Al devolverla al pool con reinicio de sesión no hace falta restaurarla
+            if lock_waits_limited and not (owned and self.pool.reset_session):
+                self._restore_lock_waits(connection)
+            if connection and owned:
+                connection.close()
+            self._record_metrics(normalize_sql(query), timer)
+    
+    def stream_query(self, query: str, params: tuple = None,
+                     chunk_size: Optional[int] = None, result_format: str = "dict") -> Iterator[Any]:
+        """
+        Ejecuta una consulta y entrega sus resultados de forma incremental
+        
+        Usa un cursor sin buffer, de modo que las filas se leen del servidor a
+        medida que se consumen y nunca se cargan todas en memoria. La conexión
+        queda reservada mientras el iterador esté vivo y se devuelve al pool al
+        agotarlo o al cerrarlo antes de tiempo (break, excepción o close()).
+        
+        Args:
+            query: Consulta SQL a ejecutar
+            params: Parámetros para la consulta
+            chunk_size: Si se indica, entrega bloques de hasta chunk_size filas
+                        en lugar de filas individuales
+            result_format: Formato de las filas ("dict", "tuple" o "record");
+                           por bloques también admite "columnar"
+            
+        Yields:
+            Una fila, o un bloque en el formato pedido si hay chunk_size
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size debe ser al menos 1")
+        validate_result_format(result_format)
+        if result_format == "columnar" and not chunk_size:
+            raise ValueError("El formato columnar requiere chunk_size")
+        
+        connection = None
+        owned = True
+        cursor = None
+        
+        timer = QueryTimer()
+        try:
+            connection, owned = self._checkout(read_only=True)
+            timer.mark("pool_wait")
+            cursor = connection.cursor(dictionary=(result_format == "dict"), buffered=False)
+            cursor.execute(query, params or ())
+            timer.mark("execute")
+            
+            columns = cursor.column_names
+            record = record_type(tuple(columns)) if result_format == "record" else None
+            fetch_size = chunk_size or DEFAULT_STREAM_FETCH_SIZE
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                timer.mark("fetch", len(rows))
+                if not rows:
+                    break
+                if chunk_size:
+                    yield rows if result_format == "dict" else format_rows(columns, rows, result_format)
+                elif record:
+                    yield from map(record._make, rows)
+                else:
+                    yield from rows
+                # El tiempo que el consumidor dedica a cada bloque no es de la consulta
+                timer.restart()
+                    
+        except Error as e:
+            timer.failed = True
+            if not owned:
+                self._mark_transaction_failed(e)
+            elif connection and is_connection_lost(e):
+                connection.invalidate()
+                connection = None
+            logger.error("Error leyendo consulta en streaming: %s", e)
+            raise_if_timeout(e)
+            raise
+        finally:
+            if connection:
+                try:
+                    # Descartar las filas no leídas si el consumidor salió antes de tiempo
+                    if connection.unread_result:
+                        connection.consume_results()
+                    if cursor:
+                        cursor.close()
+                except Error as e:
+                    logger.warning("Error liberando cursor de streaming: %s", e)
+                if owned:
+                    connection.close()
+            self._record_metrics(normalize_sql(query), timer)
+    
+    def bulk_insert(self, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]],
+                    batch_size: Optional[int] = None,
+                    deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Inserta muchas filas con sentencias INSERT multi-fila y un solo commit
+        
+        Args:
+            table: Nombre de la tabla
+            columns: Columnas a insertar
+            rows: Filas con los valores en el orden de columns
+            batch_size: Filas por sentencia (por defecto bulk_batch_size)
+            deadline: Plazo de la carga (ver execute_query)
+            
+        Returns:
+            Dict: Filas insertadas, lotes, segundos y filas por segundo
+        """
+        return self.bulk_insert_many([(table, columns, rows)], batch_size, deadline)
+    
+    def bulk_insert_many(self, loads: Sequence[Tuple[str, Sequence[str], Sequence[Sequence[Any]]]],
+                         batch_size: Optional[int] = None,
+                         deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Inserta filas en varias tablas dentro de una misma transacción
+        
+        Las tablas se cargan en el orden indicado, de modo que las tablas padre
+        deben ir antes que las que las referencian. Si falla un lote se deshace
+        toda la carga.
+        
+        Args:
+            loads: Tuplas (tabla, columnas, filas)
+            batch_size: Filas por sentencia (por defecto bulk_batch_size)
+            deadline: Plazo de la carga (ver execute_query); se comprueba
+                      antes de cada lote
+            
+        Returns:
+            Dict: Filas insertadas, lotes, segundos y filas por segundo
+        """
+        batch_size = batch_size or self.bulk_batch_size
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser al menos 1")
+        
+        connection = None
+        owned = True
+        cursor = None
+        lock_waits_limited = False
+        total_rows = 0
+        batches = 0
+        started = time.perf_counter()
+        timer = QueryTimer()
+        
+        try:
+            connection, owned = self._checkout(deadline=deadline)
+            timer.mark("pool_wait")
+            lock_waits_limited = self._limit_lock_waits(connection, deadline)
+            cursor = connection.cursor()
+            
+            for table, columns, rows in loads:
+                rows = list(rows)
+                if not rows:
+                    continue
+                
+                # La sentencia de un lote completo se construye una sola vez por tabla
+                full_statement = build_insert_statement(table, columns, batch_size)
+                for offset in range(0, len(rows), batch_size):
+                    remaining_time(deadline)
+                    batch = rows[offset:offset + batch_size]
+                    values = []
+                    for row in batch:
+                        if len(row) != len(columns):
+                            raise ValueError(
+                                f"Fila con {len(row)} valores para {len(columns)} columnas en {table}"
+                            )
+                        values.extend(row)
+                    
+                    statement = (full_statement if len(batch) == batch_size
+                                 else build_insert_statement(table, columns, len(batch)))
+                    cursor.execute(statement, values)
+                    timer.mark("execute", len(batch))
+                    total_rows += len(batch)
+                    batches += 1
+            
+            if owned:
+                connection.commit()
+            timer.mark("execute")
+            self._record_write()
+            self._invalidate_cache([table for table, _, _ in loads])
+            elapsed = time.perf_counter() - started
+            
+            stats = {
+                'rows': total_rows,
+                'batches': batches,
+                'elapsed_seconds': elapsed,
+                'rows_per_second': total_rows / elapsed if elapsed > 0 else 0.0
+            }
+            logger.info("Carga masiva: %s filas en %s lotes (%.0f filas/s)",
+                        total_rows, batches, stats['rows_per_second'])
+            return stats
+            
+        except (Error, ValueError) as e:
+            timer.failed = True
+            if connection:
+                self._abandon(connection, owned, e)
+            logger.error("Error en carga masiva: %s", e)
+            raise_if_timeout(e)
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            if lock_waits_limited and not (owned and self.pool.reset_session):
+                self._restore_lock_waits(connection)
+            if connection and owned:
+                connection.close()
+            self._record_metrics(
+                "BULK INSERT " + ", ".join(table for table, _, _ in loads), timer
+            )
+    
+    def load_procedure_signatures(self, refresh: bool = False) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Carga y cachea las firmas de los procedimientos de la base de datos
+        
+        Las firmas se leen una sola vez de information_schema.PARAMETERS y se
+        reutilizan en las llamadas siguientes.
+        
+        Args:
+            refresh: Si debe volver a leer las firmas aunque ya estén cacheadas
+            
+        Returns:
+            Dict: Nombre del procedimiento (en minúsculas) -> lista de parámetros
+        """
+        with self._signature_lock:
+            if self._procedure_signatures is None or refresh:
+                rows = self.execute_query(PROCEDURE_SIGNATURES_QUERY, fetch=True)
+                self._procedure_signatures = parse_procedure_signatures(rows)
+                logger.info("Firmas de procedimientos cargadas: %s", len(self._procedure_signatures))
+            
+            return self._procedure_signatures
+    
+    def get_procedure_signature(self, procedure_name: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Obtiene la firma cacheada de un procedimiento
+        
+        Args:
+            procedure_name: Nombre del procedimiento
+            
+        Returns:
+            List[Dict]: Parámetros con su nombre y modo (IN, OUT, INOUT), o None si no existe
+        """
+        return self.load_procedure_signatures().get(procedure_name.lower())
+    
+    def execute_procedure(self, procedure_name: str, params: list = None,
+                          deadline: Optional[float] = None):
+        """
+        Ejecuta un procedimiento almacenado
+        
+        Los parámetros recibidos se asignan a los parámetros IN e INOUT según la
+        firma cacheada del procedimiento. Solo se leen los parámetros OUT e INOUT
+        que existen; si el procedimiento no tiene ninguno no se ejecuta la
+        consulta adicional.
+        
+        Args:
+            procedure_name: Nombre del procedimiento
+            params: Lista de parámetros de entrada del procedimiento
+            deadline: Plazo de la llamada (ver call_procedure)
+            
+        Returns:
+            Resultados del procedimiento y diccionario con los parámetros de salida
+        """
+        signature = self.get_procedure_signature(_validate_identifier(procedure_name))
+        statement, values, out_variables = build_signature_statement(
+            procedure_name, params, signature
+        )
+        return self._run_procedure_statement(
+            procedure_name, statement, values, out_variables,
+            read_only=procedure_name.lower() in self.read_only_procedures,
+            deadline=deadline
+        )
+    
+    def call_procedure(self, procedure_name: str, params: Sequence[Any] = None,
+                       out_params: List[str] = None,
+                       deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        Ejecuta un procedimiento almacenado y lee sus parámetros de salida
+        en un solo viaje de red y sobre la misma conexión
+        
+        La llamada CALL y el SELECT de las variables de salida se envían como
+        una sola sentencia múltiple, de modo que las variables de sesión se
+        leen en la misma sesión que las escribió.
+        
+        MySQL no aplica MAX_EXECUTION_TIME dentro de los procedimientos; con un
+        plazo, los procedimientos de escritura limitan las esperas de bloqueos
+        de la sesión al tiempo restante dentro de la misma sentencia múltiple.
+        
+        Args:
+            procedure_name: Nombre del procedimiento
+            params: Parámetros de entrada del procedimiento
+            out_params: Nombres de los parámetros de salida, en orden
+            deadline: Plazo de la llamada (ver execute_query)
+            
+        Returns:
+            Tuple: (filas de los result sets, diccionario con los parámetros de salida)
+        """
+        statement, values, out_variables = build_call_statement(
+            procedure_name, params, out_params
+        )
+        return self._run_procedure_statement(
+            procedure_name, statement, values, out_variables,
+            read_only=procedure_name.lower() in self.read_only_procedures,
+            deadline=deadline
+        )
+    
+    def _run_procedure_statement(self, procedure_name: str, statement: str,
+                                 values: Sequence[Any], out_variables: List[Tuple[str, str]],
+                                 read_only: bool = False,
+                                 deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        Ejecuta una sentencia CALL y lee sus variables de salida en un solo viaje
+        
+        Args:
+            procedure_name: Nombre del procedimiento (para los mensajes de error)
+            statement: Sentencia CALL ya construida, incluido el SELECT de salida
+            values: Valores para los marcadores de la sentencia
+            out_variables: Pares (nombre del parámetro, variable de sesión) a leer
+            read_only: Si el procedimiento solo lee datos y puede ir a una réplica
+                       (y repetirse con otra conexión si la conexión se pierde)
+            deadline: Plazo de la llamada
+            
+        Returns:
+            Tuple: (filas de los result sets, diccionario con los parámetros de salida)
+        """
+        return self._with_read_retry(
+            read_only,
+            lambda: self._execute_procedure_statement(procedure_name, statement, values,
+                                                      out_variables, read_only, deadline)
+        )
+    
+    def _execute_procedure_statement(self, procedure_name: str, statement: str,
+                                     values: Sequence[Any], out_variables: List[Tuple[str, str]],
+                                     read_only: bool,
+                                     deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+        """Ejecuta una sentencia CALL en una conexión (ver _run_procedure_statement)"""
+        connection = None
+        owned = True
+        cursor = None
+        lock_waits_limited = False
+        
+        timer = QueryTimer()
+        try:
+            connection, owned = self._checkout(read_only, deadline)
+            timer.mark("pool_wait")
+            cursor = connection.cursor(dictionary=True)
+            
+            # Las esperas de bloqueos se limitan en la misma sentencia múltiple,
+            # sin un viaje adicional al servidor
+            remaining = remaining_time(deadline)
+            if remaining is not None and not read_only:
+                statement = (f"{lock_wait_statement(remaining)}; {statement}; "
+                             f"{RESTORE_LOCK_WAIT_TIMEOUT_STATEMENT}")
+                lock_waits_limited = True
+            
+            # Recorrer todos los result sets de la sentencia múltiple
+            result_sets = []
+            for result in cursor.execute(statement, tuple(values), multi=True):
+                timer.mark("execute")
+                if result.with_rows:
+                    rows = result.fetchall()
+                    timer.mark("fetch", len(rows))
+                    result_sets.append(rows)
+            
+            if owned:
+                connection.commit()
+            timer.mark("execute")
+            if not read_only:
+                self._record_write()
+                self._invalidate_cache(PROCEDURE_WRITE_TABLES.get(procedure_name.lower()))
+            return split_procedure_results(result_sets, out_variables)
+            
+        except Error as e:
+            if connection:
+                self._abandon(connection, owned, e)
+            timer.failed = True
+            logger.error("Error ejecutando procedimiento %s: %s", procedure_name, e)
+            raise_if_timeout(e)
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            # Si la sentencia múltiple falló no llegó a restaurar la sesión
+            if lock_waits_limited and timer.failed and not (owned and self.pool.reset_session):
+                self._restore_lock_waits(connection)
+            if connection and owned:
+                connection.close()
+            self._record_metrics(f"CALL {procedure_name}", timer)
+    
+    def test_connection(self):
+        """
+        Prueba la conexión a la base de datos
+        
+        Returns:
+            bool: True si la conexión es exitosa
+        """
+        try:
+            connection = self.get_connection()
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            result = cursor.fetchone()
+            cursor.close()
+            connection.close()
+            logger.info("Conexión a la base de datos exitosa")
+            return True
+        except Error as e:
+            logger.error("Error de conexión: %s", e)
+            return False
+    
+    def close_pool(self):
+        """Cierra el pool de conexiones"""
+        if self.pool:
+            self.pool.close()
+            logger.info("Pool de conexiones cerrado")
+        if self.replicas:
+            self.replicas.close()
+            logger.info("Pools de réplicas cerrados")
+        if self.backend:
+            self.backend.close()
+
+
+def _reset_connections_after_fork():
+    """Reinicia en el proceso hijo las conexiones heredadas del padre"""
+    for connection in list(_live_connections):
+        connection._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_connections_after_fork)
+
+
+def get_database_config(environment: str = "local") -> Dict[str, Any]:
+    """
+    Obtiene la configuración de la base de datos según el entorno
+    
+    Args:
+        environment: Entorno de trabajo (local, development, production, sqlite)
+        
+    Returns:
+        Dict con configuración de la base de datos
+    """
+    configurations = {
+        "local": {
+            "host": "localhost",
+            "port": 3306,
+            "user": "root",
+            "password": "LittleLemon2024!",
+            "database": "little_lemon_db",
+            "charset": "utf8mb4",
+            "use_unicode": True,
+            "autocommit": False,
+            "pool_size": 5,
+            "pool_max_wait": 5.0,
+            "pool_max_waiters": 50,
+            "pool_max_lifetime": 1800.0,
+            "pool_idle_timeout": 300.0,
+            "pool_ping_after": 30.0,
+            "prepared_statements": False,
+            "bulk_batch_size": 500,
+            "replicas": [],
+            "replica_selection": "round_robin",
+            "read_your_writes": True,
+            "slow_query_threshold_ms": 200.0,
+            "booking_call_timeout": 5.0,
+            "booking_call_mode": "procedure",
+            "availability_index": True,
+            "availability_index_ttl": 5.0
+        },
+        "development": {
+            "host": "localhost",
+            "port": 3306,
+            "user": "app_user",
+            "password": "app_secure_pass",
+            "database": "little_lemon_db",
+            "charset": "utf8mb4",
+            "use_unicode": True,
+            "autocommit": False,
+            "pool_size": 5,
+            "pool_max_wait": 5.0,
+            "pool_max_waiters": 50,
+            "pool_max_lifetime": 1800.0,
+            "pool_idle_timeout": 300.0,
+            "pool_ping_after": 30.0,
+            "prepared_statements": False,
+            "bulk_batch_size": 500,
+            "replicas": [],
+            "replica_selection": "round_robin",
+            "read_your_writes": True,
+            "slow_query_threshold_ms": 200.0,
+            "booking_call_timeout": 5.0,
+            "booking_call_mode": "procedure",
+            "availability_index": True,
+            "availability_index_ttl": 5.0
+        },
+        "production": {
+            "host": "localhost",
+            "port": 3306,
+            "user": "app_user",
+            "password": "app_secure_pass",
+            "database": "little_lemon_db",
+            "charset": "utf8mb4",
+            "use_unicode": True,
+            "autocommit": False,
+            "ssl_disabled": False,
+            "pool_size": 10,
+            "pool_max_wait": 2.0,
+            "pool_max_waiters": 100,
+            "pool_max_lifetime": 1800.0,
+            "pool_idle_timeout": 300.0,
+            "pool_ping_after": 30.0,
+            "prepared_statements": False,
+            "prepared_cache_size": 64,
+            "bulk_batch_size": 1000,
+            "replicas": [],
+            "replica_selection": "least_loaded",
+            "read_your_writes": True,
+            "slow_query_threshold_ms": 100.0,
+            "booking_call_timeout": 2.0,
+            "booking_call_mode": "procedure",
+            "availability_index": True,
+            "availability_index_ttl": 5.0
+        },
+        "sqlite": {
+            "backend": "sqlite",
+            "sqlite_database": None,
+            "sqlite_sample_data": True,
+            "database": "little_lemon_db",
+            "autocommit": False,
+            "pool_size": 5,
+            "pool_max_wait": 5.0,
+            "pool_max_waiters": 50,
+            "pool_max_lifetime": 1800.0,
+            "pool_idle_timeout": 300.0,
+            "pool_ping_after": 30.0,
+            "prepared_statements": False,
+            "bulk_batch_size": 500,
+            "replicas": [],
+            "read_your_writes": True,
+            "slow_query_threshold_ms": 200.0,
+            "booking_call_timeout": 5.0,
+            "booking_call_mode": "procedure",
+            "availability_index": True,
+            "availability_index_ttl": 5.0
+        }
+    }
+    
+    # Copia para que cada instancia pueda ajustar su configuración (p. ej. pool_name)
+    return dict(configurations.get(environment, configurations["local"]))
+
+
+def create_database_connection(environment: str = "local") -> LittleLemonConnection:
+    """
+    Crea una instancia de conexión a la base de datos
+    
+    Args:
+        environment: Entorno de trabajo
+        
+    Returns:
+        LittleLemonConnection: Instancia de conexión
+    """
+    config = get_database_config(environment)
+    return LittleLemonConnection(config)
+
+
+if __name__ == "__main__":
+    # Test de la conexión
+    print("Probando conexión a la base de datos Little Lemon...")
+    
+    try:
+        # Crear conexión
+        db_connection = create_database_connection("local")
+        
+        # Probar conexión
+        if db_connection.test_connection():
+            print("✅ Conexión exitosa a la base de datos")
+            
+            # Prueba básica de consulta
+            result = db_connection.execute_query(
+                "SELECT COUNT(*) as total_customers FROM customers", 
+                fetch=True
+            )
+            print(f"Total de clientes en la base de datos: {result[0]['total_customers']}")
+            
+            # Prueba de procedimiento almacenado
+            try:
+                results, out_params = db_connection.execute_procedure("GetMaxQuantity", ["Chicken Parmigiana"])
+                print(f"Procedimiento GetMaxQuantity ejecutado exitosamente")
+            except Exception as e:
+                print(f"Error ejecutando procedimiento: {e}")
+            
+            # Métricas del pool
+            stats = db_connection.get_pool_stats()
+            print(f"Pool {stats['pool_name']}: {stats['in_use']} en uso, {stats['idle']} libres, "
+                  f"espera media {stats['average_wait_ms']:.2f} ms")
+            
+        else:
+            print("❌ Error en la conexión a la base de datos")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    
+    finally:
+        # Cerrar conexión
+        if 'db_connection' in locals():
+            db_connection.close_pool()
+            print("Conexión cerrada")
@@ -0,0 +1,634 @@
+"""
+Little Lemon Connection Pool
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+"""
+
+import itertools
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque, OrderedDict
+from typing import Optional, Dict, Any, Callable, Tuple
+
+import mysql.connector
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+
+logger = logging.getLogger(__name__)
+
+# Opciones de configuración que pertenecen al pool y no a la conexión MySQL
+POOL_OPTION_KEYS = (
+    "pool_name",
+    "pool_size",
+    "pool_max_wait",
+    "pool_max_waiters",
+    "pool_reset_session",
+    "prepared_cache_size",
+    "pool_max_lifetime",
+    "pool_idle_timeout",
+    "pool_ping_after"
+)
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_POOL_MAX_WAIT = 5.0
+DEFAULT_PREPARED_CACHE_SIZE = 32
+
+# Salud de las conexiones: muy por debajo del wait_timeout de MySQL (8 h por
+# defecto) para que el servidor nunca cierre una conexión que el pool cree viva
+DEFAULT_POOL_MAX_LIFETIME = 1800.0
+DEFAULT_POOL_IDLE_TIMEOUT = 300.0
+DEFAULT_POOL_PING_AFTER = 30.0
+
+# Contador para generar nombres de pool únicos por instancia
+_pool_counter = itertools.count(1)
+
+# Pools vivos del proceso, para reiniciarlos en el hijo tras un fork
+_live_pools = weakref.WeakSet()
+
+# Conexiones heredadas del proceso padre. Comparten socket con él, así que el
+# hijo no puede usarlas ni cerrarlas; tampoco dejar que se destruyan, porque
+# el conector hace shutdown() del socket y cortaría la conexión del padre
+_inherited_connections = []
+
+
+class PoolExhaustedError(PoolError):
+    """La cola de espera del pool está llena"""
+
+
+class PoolTimeoutError(PoolError):
+    """Se agotó el tiempo de espera por una conexión del pool"""
+
+
+def split_pool_config(config: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Separa las opciones del pool de las opciones de conexión MySQL
+    
+    Args:
+        config: Diccionario con configuración de la base de datos
+    
+    Returns:
+        Tuple: (opciones del pool, configuración de la conexión)
+    """
+    pool_options = {key: value for key, value in config.items() if key in POOL_OPTION_KEYS}
+    connection_config = {key: value for key, value in config.items() if key not in POOL_OPTION_KEYS}
+    return pool_options, connection_config
+
+
+class PreparedStatementCache:
+    """
+    Caché LRU de sentencias preparadas en el servidor para una conexión
+    
+    Cada entrada es un cursor preparado (protocolo binario) asociado al texto
+    SQL; al expulsar una entrada se cierra su cursor, lo que libera la
+    sentencia en el servidor.
+    """
+    
+    def __init__(self, connection, max_size: int = DEFAULT_PREPARED_CACHE_SIZE):
+        """
+        Inicializa la caché
+        
+        Args:
+            connection: Conexión MySQL real a la que pertenecen las sentencias
+            max_size: Número máximo de sentencias preparadas
+        """
+        self._connection = connection
+        self.max_size = max_size
+        self._statements = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def execute(self, sql: str, params: tuple = None):
+        """
+        Ejecuta una sentencia preparándola solo la primera vez
+        
+        Args:
+            sql: Texto SQL de la sentencia (clave de la caché)
+            params: Parámetros de la sentencia
+        
+        Returns:
+            Cursor preparado con el resultado de la ejecución
+        """
+        entry = self._statements.get(sql)
+        if entry is None:
+            self.misses += 1
+            entry = (sql, self._connection.cursor(prepared=True))
+            self._statements[sql] = entry
+            while len(self._statements) > self.max_size:
+                _, (_, evicted) = self._statements.popitem(last=False)
+                self._close_cursor(evicted)
+        else:
+            self.hits += 1
+            self._statements.move_to_end(sql)
+        
+        # El cursor solo reutiliza la sentencia si recibe el mismo objeto str
+        cached_sql, cursor = entry
+        try:
+            cursor.execute(cached_sql, params or ())
+        except Error:
+            # La sentencia puede haber quedado inválida (p. ej. cambio de esquema)
+            self._statements.pop(sql, None)
+            self._close_cursor(cursor)
+            raise
+        return cursor
+    
+    def __len__(self):
+        return len(self._statements)
+    
+    @staticmethod
+    def _close_cursor(cursor):
+        """Cierra un cursor preparado ignorando errores de red"""
+        try:
+            cursor.close()
+        except Error:
+            pass
+    
+    def clear(self):
+        """Libera todas las sentencias preparadas"""
+        while self._statements:
+            _, (_, cursor) = self._statements.popitem()
+            self._close_cursor(cursor)
+
+
+class PooledConnection:
+    """Conexión prestada por el pool; close() la devuelve en lugar de cerrarla"""
+    
+    def __init__(self, pool: "LittleLemonConnectionPool", connection):
+        """
+        Inicializa el préstamo de la conexión
+        
+        Args:
+            pool: Pool al que pertenece la conexión
+            connection: Conexión MySQL real
+        """
+        self._pool = pool
+        self._connection = connection
+        self._pid = os.getpid()
+    
+    def _take(self):
+        """
+        Retira la conexión del préstamo
+        
+        Returns:
+            Conexión MySQL real, o None si ya se devolvió o se prestó en el
+            proceso padre antes de un fork
+        """
+        connection, self._connection = self._connection, None
+        if connection is not None and self._pid != os.getpid():
+            _inherited_connections.append(connection)
+            return None
+        return connection
+    
+    def execute_prepared(self, sql: str, params: tuple = None):
+        """
+        Ejecuta una sentencia usando la caché de sentencias preparadas de la conexión
+        
+        Args:
+            sql: Texto SQL de la sentencia
+            params: Parámetros de la sentencia
+        
+        Returns:
+            Cursor preparado con el resultado; no debe cerrarse
+        """
+        if self._connection is None:
+            raise PoolError("La conexión ya fue devuelta al pool")
+        return self._pool.statement_cache(self._connection).execute(sql, params)
+    
+    def close(self):
+        """Devuelve la conexión al pool"""
+        connection = self._take()
+        if connection is not None:
+            self._pool.release(connection)
+    
+    def invalidate(self):
+        """Cierra la conexión perdida en lugar de devolverla al pool"""
+        connection = self._take()
+        if connection is not None:
+            self._pool.discard(connection)
+    
+    def __getattr__(self, name):
+        if self._connection is None:
+            raise PoolError("La conexión ya fue devuelta al pool")
+        return getattr(self._connection, name)
+
+
+class LittleLemonConnectionPool:
+    """
+    Pool de conexiones con cola de espera FIFO acotada y métricas en vivo
+    
+    Cuando todas las conexiones están en uso, get_connection() espera su turno
+    en una cola FIFO hasta max_wait segundos en lugar de fallar de inmediato.
+    
+    Las conexiones se reciclan al superar max_lifetime, se cierran tras
+    idle_timeout segundos libres y, si estuvieron libres más de ping_after
+    segundos, se comprueban con un ping antes de prestarlas.
+    
+    El pool es seguro ante fork: si cambia el PID, el proceso hijo abandona
+    las conexiones heredadas y abre las suyas, con un nombre de pool propio.
+    """
+    
+    def __init__(self, connection_config: Dict[str, Any], pool_name: Optional[str] = None,
+                 pool_size: int = DEFAULT_POOL_SIZE, max_wait: float = DEFAULT_POOL_MAX_WAIT,
+                 max_waiters: Optional[int] = None, reset_session: bool = True,
+                 prepared_cache_size: int = DEFAULT_PREPARED_CACHE_SIZE,
+                 connection_factory: Optional[Callable[[], Any]] = None,
+                 max_lifetime: Optional[float] = DEFAULT_POOL_MAX_LIFETIME,
+                 idle_timeout: Optional[float] = DEFAULT_POOL_IDLE_TIMEOUT,
+                 ping_after: Optional[float] = DEFAULT_POOL_PING_AFTER):
+        """
+        Inicializa el pool; las conexiones se abren bajo demanda
+        
+        Args:
+            connection_config: Configuración de la conexión MySQL
+            pool_name: Nombre del pool (por defecto uno único por instancia)
+            pool_size: Número máximo de conexiones abiertas
+            max_wait: Segundos máximos de espera por una conexión
+            max_waiters: Tamaño máximo de la cola de espera (None = sin límite)
+            reset_session: Si debe reiniciar la sesión al devolver la conexión
+            prepared_cache_size: Sentencias preparadas cacheadas por conexión
+            connection_factory: Función que abre una conexión nueva
+            max_lifetime: Segundos de vida de una conexión antes de reciclarla
+                          (None = sin límite)
+            idle_timeout: Segundos libre tras los que se cierra una conexión
+                          (None = sin límite)
+            ping_after: Segundos libre a partir de los que se comprueba la
+                        conexión antes de prestarla (None = nunca)
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size debe ser al menos 1")
+        
+        self.pool_name = pool_name or f"little_lemon_pool_{next(_pool_counter)}"
+        self.pool_size = pool_size
+        self.max_wait = max_wait
+        self.max_waiters = max_waiters
+        self.reset_session = reset_session
+        self.prepared_cache_size = prepared_cache_size
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.ping_after = ping_after
+        self._connection_factory = connection_factory or (
+            lambda: mysql.connector.connect(**connection_config)
+        )
+        self._base_name = self.pool_name
+        self._pid = os.getpid()
+        self._closed = False
+        self._reset_state()
+        _live_pools.add(self)
+    
+    def _reset_state(self):
+        """Inicializa las conexiones, la cola de espera y las métricas del pool"""
+        self._condition = threading.Condition()
+        # Conexiones libres como (conexión, libre desde); la más reciente a la derecha
+        self._idle = deque()
+        self._created_at = {}
+        self._invalidated_at = 0.0
+        self._waiters = deque()
+        self._open_connections = 0
+        self._in_use = 0
+        self._statement_caches = {}
+        
+        # Métricas
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait_seen = 0.0
+        self._timeouts = 0
+        self._rejected = 0
+        self._recycled = 0
+        self._idle_evicted = 0
+        self._pings = 0
+        self._ping_failures = 0
+        self._invalidations = 0
+    
+    def _check_process(self):
+        """
+        Rehace el pool si el proceso actual es un hijo creado con fork
+        
+        En el hijo solo sobrevive el hilo que hizo el fork, así que el lock
+        del padre pudo quedar tomado: se sustituye junto con el resto del
+        estado. Las conexiones libres heredadas se abandonan sin cerrarlas.
+        """
+        pid = os.getpid()
+        if pid == self._pid:
+            return
+        
+        _inherited_connections.extend(connection for connection, _ in self._idle)
+        self._pid = pid
+        self.pool_name = f"{self._base_name}_{pid}"
+        self._reset_state()
+        logger.info("Pool %s reiniciado en el proceso hijo %s", self.pool_name, pid)
+    
+    def _has_capacity(self) -> bool:
+        """Indica si hay una conexión libre o espacio para abrir otra"""
+        return bool(self._idle) or self._open_connections < self.pool_size
+    
+    def get_connection(self, timeout: Optional[float] = None) -> PooledConnection:
+        """
+        Obtiene una conexión del pool, esperando en cola si está agotado
+        
+        Args:
+            timeout: Segundos máximos de espera (por defecto max_wait)
+        
+        Returns:
+            PooledConnection: Conexión prestada; close() la devuelve al pool
+        """
+        self._check_process()
+        timeout = self.max_wait if timeout is None else timeout
+        started = time.monotonic()
+        
+        with self._condition:
+            if self._closed:
+                raise PoolError(f"El pool {self.pool_name} está cerrado")
+            
+            expired = self._evict_idle(started)
+            
+            # Respetar el orden de llegada: si ya hay alguien esperando, hacer cola
+            if self._waiters or not self._has_capacity():
+                if self.max_waiters is not None and len(self._waiters) >= self.max_waiters:
+                    self._rejected += 1
+                    raise PoolExhaustedError(
+                        f"Pool {self.pool_name} agotado: {len(self._waiters)} solicitudes en espera"
+                    )
+                
+                ticket = object()
+                self._waiters.append(ticket)
+                try:
+                    deadline = started + timeout
+                    while not (self._waiters[0] is ticket and self._has_capacity()):
+                        if self._closed:
+                            raise PoolError(f"El pool {self.pool_name} está cerrado")
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._timeouts += 1
+                            raise PoolTimeoutError(
+                                f"Tiempo de espera agotado ({timeout:.2f}s) en el pool {self.pool_name}"
+                            )
+                        self._condition.wait(remaining)
+                finally:
+                    self._waiters.remove(ticket)
+                    self._condition.notify_all()
+            
+            connection, idle_since = self._idle.pop() if self._idle else (None, None)
+            if connection is None:
+                # Reservar el hueco antes de abrir la conexión fuera del lock
+                self._open_connections += 1
+            self._in_use += 1
+            
+            waited = time.monotonic() - started
+            self._checkouts += 1
+            self._total_wait += waited
+            self._max_wait_seen = max(self._max_wait_seen, waited)
+        
+        for stale in expired:
+            self._close_connection(stale)
+        
+        # Una conexión vieja o caída se sustituye en el mismo hueco
+        if connection is not None and not self._is_reusable(connection, idle_since):
+            self._close_connection(connection)
+            connection = None
+        
+        if connection is None:
+            try:
+                connection = self._connection_factory()
+            except Exception:
+                with self._condition:
+                    self._open_connections -= 1
+                    self._in_use -= 1
+                    self._condition.notify_all()
+                raise
+            with self._condition:
+                self._created_at[id(connection)] = time.monotonic()
+        
+        return PooledConnection(self, connection)
+    
+    def _is_expired(self, connection, now: float) -> bool:
+        """Indica si una conexión superó su vida máxima o es anterior a una invalidación"""
+        created_at = self._created_at.get(id(connection), now)
+        if created_at <= self._invalidated_at:
+            return True
+        return self.max_lifetime is not None and now - created_at >= self.max_lifetime
+    
+    def _evict_idle(self, now: float) -> list:
+        """
+        Retira las conexiones libres durante más de idle_timeout; se llama con el lock tomado
+        
+        Returns:
+            list: Conexiones retiradas, a cerrar fuera del lock
+        """
+        expired = []
+        if self.idle_timeout is None:
+            return expired
+        
+        while self._idle and now - self._idle[0][1] >= self.idle_timeout:
+            connection, _ = self._idle.popleft()
+            expired.append(connection)
+        self._open_connections -= len(expired)
+        self._idle_evicted += len(expired)
+        if expired:
+            self._condition.notify_all()
+        return expired
+    
+    def _is_reusable(self, connection, idle_since: float) -> bool:
+        """
+        Comprueba una conexión libre antes de prestarla
+        
+        El ping solo se hace si la conexión estuvo libre más de ping_after
+        segundos, de modo que las conexiones en uso continuo no pagan un viaje
+        extra al servidor.
+        
+        Args:
+            connection: Conexión MySQL real
+            idle_since: Instante en que se devolvió al pool
+        
+        Returns:
+            bool: True si se puede prestar
+        """
+        now = time.monotonic()
+        with self._condition:
+            if self._is_expired(connection, now):
+                self._recycled += 1
+                return False
+            if self.ping_after is None or now - idle_since < self.ping_after:
+                return True
+            self._pings += 1
+        
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error as e:
+            logger.warning("Conexión caída en el pool %s, se abre otra: %s", self.pool_name, e)
+            with self._condition:
+                self._ping_failures += 1
+            return False
+    
+    def statement_cache(self, connection) -> PreparedStatementCache:
+        """
+        Obtiene la caché de sentencias preparadas de una conexión del pool
+        
+        Args:
+            connection: Conexión MySQL real
+        
+        Returns:
+            PreparedStatementCache: Caché propia de la conexión
+        """
+        with self._condition:
+            cache = self._statement_caches.get(id(connection))
+            if cache is None:
+                cache = PreparedStatementCache(connection, self.prepared_cache_size)
+                self._statement_caches[id(connection)] = cache
+            return cache
+    
+    def _drop_statement_cache(self, connection):
+        """Libera la caché de sentencias preparadas de una conexión"""
+        with self._condition:
+            cache = self._statement_caches.pop(id(connection), None)
+        if cache is not None:
+            cache.clear()
+    
+    def release(self, connection):
+        """
+        Devuelve una conexión al pool
+        
+        Args:
+            connection: Conexión MySQL real
+        """
+        healthy = True
+        try:
+            if connection.unread_result:
+                connection.consume_results()
+            if self.reset_session:
+                # Reiniciar la sesión libera en el servidor las sentencias preparadas
+                self._drop_statement_cache(connection)
+                connection.reset_session()
+            elif connection.in_transaction:
+                connection.rollback()
+        except Error as e:
+            logger.warning("Descartando conexión del pool %s: %s", self.pool_name, e)
+            healthy = False
+        
+        with self._condition:
+            now = time.monotonic()
+            self._in_use -= 1
+            if healthy and self._is_expired(connection, now):
+                self._recycled += 1
+                healthy = False
+            
+            if healthy and not self._closed:
+                self._idle.append((connection, now))
+                connection = None
+            else:
+                self._open_connections -= 1
+            expired = self._evict_idle(now)
+            self._condition.notify_all()
+        
+        if connection is not None:
+            self._close_connection(connection)
+        for stale in expired:
+            self._close_connection(stale)
+    
+    def discard(self, connection):
+        """
+        Cierra una conexión perdida en lugar de devolverla al pool
+        
+        Una conexión perdida suele indicar un reinicio o una conmutación del
+        servidor: las demás conexiones abiertas hasta ahora también se reciclan
+        (las libres de inmediato, las prestadas al devolverlas).
+        
+        Args:
+            connection: Conexión MySQL real
+        """
+        with self._condition:
+            self._in_use -= 1
+            self._invalidated_at = time.monotonic()
+            self._invalidations += 1
+            stale = [idle_connection for idle_connection, _ in self._idle]
+            self._idle.clear()
+            self._open_connections -= 1 + len(stale)
+            self._condition.notify_all()
+        
+        for stale_connection in [connection] + stale:
+            self._close_connection(stale_connection)
+    
+    def _close_connection(self, connection):
+        """Libera la caché de sentencias y cierra una conexión que sale del pool"""
+        self._drop_statement_cache(connection)
+        with self._condition:
+            self._created_at.pop(id(connection), None)
+        self._close_quietly(connection)
+    
+    @staticmethod
+    def _close_quietly(connection):
+        """Cierra una conexión ignorando errores de red"""
+        try:
+            connection.close()
+        except Error:
+            pass
+    
+    def load(self) -> float:
+        """
+        Obtiene la ocupación del pool, contando las solicitudes en espera
+        
+        Returns:
+            float: (conexiones en uso + en espera) / tamaño del pool
+        """
+        self._check_process()
+        with self._condition:
+            return (self._in_use + len(self._waiters)) / self.pool_size
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las métricas en vivo del pool
+        
+        Returns:
+            Dict: Conexiones en uso, libres y en espera, tiempos de espera y timeouts
+        """
+        self._check_process()
+        with self._condition:
+            prepared_hits = sum(cache.hits for cache in self._statement_caches.values())
+            prepared_misses = sum(cache.misses for cache in self._statement_caches.values())
+            return {
+                'pool_name': self.pool_name,
+                'pid': self._pid,
+                'pool_size': self.pool_size,
+                'open': self._open_connections,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'waiting': len(self._waiters),
+                'checkouts': self._checkouts,
+                'average_wait_ms': (self._total_wait / self._checkouts * 1000) if self._checkouts else 0.0,
+                'max_wait_ms': self._max_wait_seen * 1000,
+                'timeouts': self._timeouts,
+                'rejected': self._rejected,
+                'recycled': self._recycled,
+                'idle_evicted': self._idle_evicted,
+                'pings': self._pings,
+                'ping_failures': self._ping_failures,
+                'invalidations': self._invalidations,
+                'prepared_statements': sum(len(cache) for cache in self._statement_caches.values()),
+                'prepared_hits': prepared_hits,
+                'prepared_misses': prepared_misses
+            }
+    
+    def close(self):
+        """Cierra las conexiones libres y rechaza nuevas solicitudes"""
+        self._check_process()
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._open_connections -= len(idle)
+            self._condition.notify_all()
+        
+        for connection in idle:
+            self._close_connection(connection)
+
+
+def _reset_pools_after_fork():
+    """Rehace en el proceso hijo los pools heredados, antes de que arranquen otros hilos"""
+    for pool in list(_live_pools):
+        pool._check_process()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
@@ -0,0 +1,128 @@
+"""
+Little Lemon Deadlines Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Plazos por llamada. Un plazo (deadline) es un instante de time.monotonic();
+el tiempo que queda se envía al servidor como MAX_EXECUTION_TIME en las
+consultas SELECT y como tiempos de espera de bloqueos de la sesión en las
+escrituras y procedimientos.
+"""
+
+import math
+import re
+import time
+from typing import Optional
+
+from mysql.connector import Error, errorcode
+
+# Errores del servidor por tiempo agotado: MAX_EXECUTION_TIME y esperas de
+# bloqueos de filas (innodb_lock_wait_timeout) o de metadatos (lock_wait_timeout)
+QUERY_TIMEOUT_ERRNOS = frozenset((
+    errorcode.ER_QUERY_TIMEOUT,
+    errorcode.ER_LOCK_WAIT_TIMEOUT
+))
+
+# El hint se redondea hacia abajo a pasos de 100 ms: el texto de la consulta
+# se repite entre llamadas y las sentencias preparadas se siguen reutilizando
+MAX_EXECUTION_TIME_STEP_MS = 100
+
+SELECT_PATTERN = re.compile(r'^(\s*SELECT)\b(?!\s*/\*\+)', re.IGNORECASE)
+
+LOCK_WAIT_TIMEOUT_STATEMENT = (
+    "SET SESSION innodb_lock_wait_timeout = {seconds}, lock_wait_timeout = {seconds}"
+)
+RESTORE_LOCK_WAIT_TIMEOUT_STATEMENT = (
+    "SET SESSION innodb_lock_wait_timeout = DEFAULT, lock_wait_timeout = DEFAULT"
+)
+
+
+class QueryTimeoutError(Error):
+    """La operación no terminó dentro de su plazo"""
+
+
+def deadline_after(seconds: Optional[float]) -> Optional[float]:
+    """
+    Calcula el plazo que vence dentro de unos segundos
+    
+    Args:
+        seconds: Segundos disponibles (None = sin plazo)
+    
+    Returns:
+        float: Instante de time.monotonic(), o None
+    """
+    if seconds is None:
+        return None
+    return time.monotonic() + seconds
+
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """
+    Obtiene el tiempo que queda hasta el plazo
+    
+    Args:
+        deadline: Plazo (None = sin plazo)
+    
+    Returns:
+        float: Segundos restantes, o None si no hay plazo
+    """
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise QueryTimeoutError("Plazo vencido antes de ejecutar la operación")
+    return remaining
+
+
+def with_max_execution_time(query: str, remaining: Optional[float]) -> str:
+    """
+    Añade el hint MAX_EXECUTION_TIME a una consulta SELECT
+    
+    Las demás sentencias, y las que ya llevan un hint, se devuelven sin cambios.
+    
+    Args:
+        query: Consulta SQL
+        remaining: Segundos restantes del plazo (None = sin plazo)
+    
+    Returns:
+        str: Consulta con el hint
+    """
+    if remaining is None:
+        return query
+    
+    milliseconds = int(remaining * 1000)
+    if milliseconds >= MAX_EXECUTION_TIME_STEP_MS:
+        milliseconds -= milliseconds % MAX_EXECUTION_TIME_STEP_MS
+    return SELECT_PATTERN.sub(
+        rf'\1 /*+ MAX_EXECUTION_TIME({max(1, milliseconds)}) */', query, count=1
+    )
+
+
+def lock_wait_statement(remaining: float) -> str:
+    """
+    Construye la sentencia que limita las esperas de bloqueos de la sesión
+    
+    Args:
+        remaining: Segundos restantes del plazo
+    
+    Returns:
+        str: Sentencia SET (los tiempos de MySQL son segundos enteros, mínimo 1)
+    """
+    return LOCK_WAIT_TIMEOUT_STATEMENT.format(seconds=max(1, math.floor(remaining)))
+
+
+def raise_if_timeout(error: Exception):
+    """
+    Relanza como QueryTimeoutError un error de tiempo agotado del servidor
+    
+    Args:
+        error: Error capturado
+    """
+    if isinstance(error, QueryTimeoutError):
+        return
+    errno = getattr(error, "errno", None)
+    if errno in QUERY_TIMEOUT_ERRNOS:
+        raise QueryTimeoutError(
+            getattr(error, "msg", None) or str(error), errno=errno,
+            sqlstate=getattr(error, "sqlstate", None)
+        ) from error
@@ -0,0 +1,471 @@
+"""
+Little Lemon Direct Procedures Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Versión en SQL directo de los procedimientos almacenados. Las lecturas se
+ejecutan como consultas SELECT de solo lectura (preparadas según la opción
+prepared_statements), sin la llamada al procedimiento ni su transacción; las escrituras, como transacciones dirigidas
+desde Python. Devuelven lo mismo que LittleLemonConnection.call_procedure:
+(filas de los result sets, parámetros de salida por nombre).
+"""
+
+import sys
+import os
+import logging
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+from mysql.connector import Error
+
+# Agregar el directorio actual al path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from deadlines import raise_if_timeout
+from seating_durations import end_time_sql
+
+logger = logging.getLogger(__name__)
+
+MAX_QUANTITY_QUERY = """
+SELECT MAX(od.quantity) AS max_quantity
+FROM order_details od
+JOIN menu_items mi ON od.menu_item_id = mi.menu_item_id
+WHERE mi.item_name = %s
+"""
+
+MANAGE_BOOKING_QUERY = """
+SELECT t.table_id,
+       (SELECT COUNT(*) FROM bookings b
+        WHERE b.table_id = t.table_id
+          AND b.booking_date = %s
+          AND b.status = 'confirmed') AS existing_bookings
+FROM tables t
+WHERE t.table_number = %s AND t.is_available = TRUE
+"""
+
+# Una mesa está ocupada si una reserva confirmada se solapa con el intervalo
+# que ocuparía el grupo; cada comprobación es un rango sobre idx_bookings_table_date
+CHECK_AVAILABILITY_QUERY = f"""
+SELECT
+    t.table_id,
+    t.table_number,
+    t.seating_capacity,
+    t.location,
+    CASE
+        WHEN EXISTS (
+            SELECT 1
+            FROM bookings b
+            WHERE b.table_id = t.table_id
+                AND b.booking_date = %s
+                AND b.booking_time < {end_time_sql('%s', '%s', 't.location')}
+                AND b.end_time > %s
+                AND b.status = 'confirmed'
+        ) THEN 'Booked'
+        ELSE 'Available'
+    END AS availability_status
+FROM tables t
+WHERE t.is_available = TRUE
+    AND t.seating_capacity >= %s
+ORDER BY t.table_number
+"""
+
+BOOKINGS_BY_DATE_QUERY = """
+SELECT
+    b.booking_id,
+    b.booking_date,
+    b.booking_time,
+    b.number_of_guests,
+    b.status,
+    CONCAT(c.first_name, ' ', c.last_name) AS customer_name,
+    c.email AS customer_email,
+    c.phone AS customer_phone,
+    t.table_number,
+    t.seating_capacity,
+    b.special_requests,
+    b.created_at,
+    b.parent_booking_id
+FROM bookings b
+JOIN customers c ON b.customer_id = c.customer_id
+JOIN tables t ON b.table_id = t.table_id
+WHERE b.booking_date = %s
+ORDER BY b.booking_time
+"""
+
+# Las escrituras bloquean primero la fila que protegen; así las comprobaciones
+# posteriores ven las reservas confirmadas por transacciones concurrentes
+# Con la reserva se obtiene su reserva principal (ella misma si no es combinada)
+LOCK_BOOKING_QUERY = """
+SELECT status, COALESCE(parent_booking_id, booking_id) AS main_booking_id
+FROM bookings
+WHERE booking_id = %s
+FOR UPDATE
+"""
+
+# Con la mesa se calcula la hora de fin de la reserva (hora, comensales, mesa)
+LOCK_TABLE_QUERY = f"""
+SELECT t.seating_capacity,
+       {end_time_sql('%s', '%s', 't.location')} AS end_time
+FROM tables t
+WHERE t.table_id = %s AND t.is_available = TRUE
+FOR UPDATE
+"""
+
+# Bloquea la reserva y su mesa, y calcula la nueva hora de fin (hora, comensales, reserva)
+LOCK_MOVED_BOOKING_QUERY = f"""
+SELECT b.status, b.table_id,
+       b.parent_booking_id IS NOT NULL
+           OR EXISTS (SELECT 1 FROM bookings c WHERE c.parent_booking_id = b.booking_id) AS combined,
+       {end_time_sql('%s', '%s', 't.location')} AS end_time
+FROM bookings b
+JOIN tables t ON b.table_id = t.table_id
+WHERE b.booking_id = %s
+FOR UPDATE
+"""
+
+# Bloquea las mesas de una combinación, de la principal (menor número) a la
+# última, y calcula la hora de fin en cada una (hora, comensales, combinación)
+LOCK_COMBINATION_QUERY = f"""
+SELECT c.seating_capacity, t.table_id, t.is_available,
+       {end_time_sql('%s', '%s', 't.location')} AS end_time
+FROM table_combinations c
+JOIN table_combination_members m ON m.combination_id = c.combination_id
+JOIN tables t ON t.table_id = m.table_id
+WHERE c.combination_id = %s AND c.is_available = TRUE
+ORDER BY t.table_number
+FOR UPDATE
+"""
+
+ADD_BOOKING_CHECK_QUERY = """
+SELECT
+    (SELECT COUNT(*) FROM customers WHERE customer_id = %s) AS customer_exists,
+    (SELECT COUNT(*) FROM bookings
+     WHERE table_id = %s
+       AND booking_date = %s
+       AND booking_time < %s
+       AND end_time > %s
+       AND status = 'confirmed') AS existing_bookings
+"""
+
+ADD_COMBINED_BOOKING_CHECK_QUERY = """
+SELECT
+    (SELECT COUNT(*) FROM customers WHERE customer_id = %s) AS customer_exists,
+    (SELECT COUNT(*)
+     FROM table_combination_members m
+     JOIN bookings b ON b.table_id = m.table_id
+     WHERE m.combination_id = %s
+       AND b.booking_date = %s
+       AND b.booking_time < %s
+       AND b.end_time > %s
+       AND b.status = 'confirmed') AS existing_bookings
+"""
+
+MOVE_BOOKING_CHECK_QUERY = """
+SELECT COUNT(*) AS existing_bookings
+FROM bookings
+WHERE table_id = %s
+  AND booking_date = %s
+  AND booking_time < %s
+  AND end_time > %s
+  AND status = 'confirmed'
+  AND booking_id <> %s
+"""
+
+INSERT_BOOKING_QUERY = """
+INSERT INTO bookings (
+    customer_id, table_id, booking_date, booking_time, end_time,
+    number_of_guests, special_requests, status
+) VALUES (%s, %s, %s, %s, %s, %s, %s, 'confirmed')
+"""
+
+# Reservas sin comensales de las demás mesas de una combinación
+INSERT_COMBINED_TABLES_QUERY = """
+INSERT INTO bookings (
+    customer_id, table_id, booking_date, booking_time, end_time,
+    number_of_guests, status, parent_booking_id
+)
+SELECT %s, m.table_id, %s, %s, %s, 0, 'confirmed', %s
+FROM table_combination_members m
+WHERE m.combination_id = %s AND m.table_id <> %s
+"""
+
+LAST_INSERT_ID_QUERY = "SELECT LAST_INSERT_ID() AS booking_id"
+
+UPDATE_BOOKING_QUERY = """
+UPDATE bookings
+SET booking_date = %s,
+    booking_time = %s,
+    end_time = %s,
+    number_of_guests = %s,
+    updated_at = CURRENT_TIMESTAMP
+WHERE booking_id = %s
+"""
+
+CANCEL_BOOKING_QUERY = """
+UPDATE bookings
+SET status = 'cancelled',
+    updated_at = CURRENT_TIMESTAMP
+WHERE booking_id = %s OR parent_booking_id = %s
+"""
+
+
+class _StatusRollback(Exception):
+    """Deshace la transacción de una escritura que termina con un estado de error"""
+    
+    def __init__(self, out_params: Dict[str, Any]):
+        super().__init__(out_params)
+        self.out_params = out_params
+
+
+def _read(db_connection, query: str, params: tuple, deadline: Optional[float]) -> List[Dict]:
+    """Ejecuta una lectura de solo lectura (preparada según prepared_statements)"""
+    return db_connection.execute_query(query, params, fetch=True, prepared=None,
+                                       read_only=True, deadline=deadline)
+
+
+@contextmanager
+def _unit_of_work(db_connection, deadline: Optional[float]):
+    """
+    Ejecuta una escritura en la transacción activa o en una propia
+    
+    En una transacción propia el plazo se aplica una vez a toda ella; dentro
+    de la transacción del cliente, cada sentencia lleva el plazo.
+    
+    Yields:
+        Tuple: (plazo que deben llevar las sentencias, True si la transacción es propia)
+    """
+    if db_connection.in_transaction():
+        yield deadline, False
+        return
+    
+    with db_connection.transaction(deadline):
+        yield None, True
+
+
+def _write(db_connection, procedure_name: str, out_name: str, error_status: str,
+           body: Callable[[Optional[float]], Dict[str, Any]],
+           deadline: Optional[float]) -> Tuple[List[Dict], Dict[str, Any]]:
+    """
+    Ejecuta una escritura con la semántica de su procedimiento
+    
+    Un estado de error deshace la transacción propia (RollbackWork); un error
+    de la base de datos devuelve error_status como el EXIT HANDLER del
+    procedimiento. Dentro de la transacción del cliente el error la marca
+    como fallida (ver LittleLemonConnection.transaction).
+    
+    Args:
+        db_connection: Conexión de Little Lemon
+        procedure_name: Procedimiento equivalente (para el log)
+        out_name: Nombre del parámetro de salida
+        error_status: Estado que devuelve el procedimiento ante un error SQL
+        body: Función (plazo de las sentencias) -> parámetros de salida
+        deadline: Plazo de la llamada
+    
+    Returns:
+        Tuple: ([], parámetros de salida)
+    """
+    try:
+        with _unit_of_work(db_connection, deadline) as (statement_deadline, owned):
+            out_params = body(statement_deadline)
+            if owned and out_params[out_name].startswith("Error"):
+                raise _StatusRollback(out_params)
+            return [], out_params
+    except _StatusRollback as rollback:
+        return [], rollback.out_params
+    except Error as e:
+        raise_if_timeout(e)
+        logger.error("Error en %s (SQL directo): %s", procedure_name, e)
+        return [], {out_name: error_status}
+
+
+def get_max_quantity(db_connection, menu_item_name: str,
+                     deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+    """GetMaxQuantity: cantidad máxima pedida de un elemento del menú"""
+    rows = _read(db_connection, MAX_QUANTITY_QUERY, (menu_item_name,), deadline)
+    return [], {'max_quantity': (rows[0]['max_quantity'] if rows else None) or 0}
+
+
+def manage_booking(db_connection, booking_date, table_number: int,
+                   deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+    """ManageBooking: disponibilidad de una mesa en una fecha"""
+    rows = _read(db_connection, MANAGE_BOOKING_QUERY, (booking_date, table_number), deadline)
+    if not rows:
+        status = 'Error: Table not found or not available'
+    elif rows[0]['existing_bookings'] > 0:
+        status = f"Table {table_number} is already booked for {booking_date}"
+    else:
+        status = f"Table {table_number} is available for booking on {booking_date}"
+    return [], {'booking_status': status}
+
+
+def check_booking_availability(db_connection, check_date, check_time, required_capacity: int,
+                               deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+    """CheckBookingAvailability: mesas con capacidad suficiente y su estado a una hora"""
+    return _read(db_connection, CHECK_AVAILABILITY_QUERY,
+                 (check_date, check_time, required_capacity, check_time, required_capacity),
+                 deadline), {}
+
+
+def get_bookings_by_date(db_connection, search_date,
+                         deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+    """GetBookingsByDate: reservas de una fecha con su cliente y su mesa"""
+    return _read(db_connection, BOOKINGS_BY_DATE_QUERY, (search_date,), deadline), {}
+
+
+def add_booking(db_connection, customer_id: int, table_id: int, booking_date, booking_time,
+                number_of_guests: int, special_requests: Optional[str] = None,
+                deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+    """AddBooking: crea una reserva confirmada si la mesa está libre durante la reserva"""
+    def body(statement_deadline: Optional[float]) -> Dict[str, Any]:
+        table = db_connection.execute_query(
+            LOCK_TABLE_QUERY, (booking_time, number_of_guests, table_id), fetch=True,
+            deadline=statement_deadline
+        )
+        end_time = table[0]['end_time'] if table else booking_time
+        check = db_connection.execute_query(
+            ADD_BOOKING_CHECK_QUERY, (customer_id, table_id, booking_date, end_time, booking_time),
+            fetch=True, deadline=statement_deadline
+        )[0]
+        
+        if check['customer_exists'] == 0:
+            return {'booking_status': 'Error: Customer not found'}
+        if not table:
+            return {'booking_status': 'Error: Table not found or not available'}
+        capacity = table[0]['seating_capacity']
+        if number_of_guests is not None and number_of_guests > capacity:
+            return {'booking_status': (f"Error: Number of guests ({number_of_guests}) "
+                                       f"exceeds table capacity ({capacity})")}
+        if check['existing_bookings'] > 0:
+            return {'booking_status': 'Error: Table already booked for this date and time'}
+        
+        db_connection.execute_query(
+            INSERT_BOOKING_QUERY,
+            (customer_id, table_id, booking_date, booking_time, end_time, number_of_guests,
+             special_requests),
+            deadline=statement_deadline
+        )
+        booking_id = db_connection.execute_query(LAST_INSERT_ID_QUERY, fetch=True,
+                                                 deadline=statement_deadline)[0]['booking_id']
+        return {'booking_status': f"Booking confirmed with ID: {booking_id}"}
+    
+    return _write(db_connection, "AddBooking", 'booking_status',
+                  'Error: Booking creation failed', body, deadline)
+
+
+def update_booking(db_connection, booking_id: int, new_booking_date, new_booking_time,
+                   new_number_of_guests: int,
+                   deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+    """UpdateBooking: cambia fecha, hora y comensales de una reserva no cancelada"""
+    def body(statement_deadline: Optional[float]) -> Dict[str, Any]:
+        booking = db_connection.execute_query(
+            LOCK_MOVED_BOOKING_QUERY, (new_booking_time, new_number_of_guests, booking_id),
+            fetch=True, deadline=statement_deadline
+        )
+        if not booking:
+            return {'update_status': 'Error: Booking not found'}
+        if booking[0]['status'] == 'cancelled':
+            return {'update_status': 'Error: Cannot update cancelled booking'}
+        if booking[0]['combined']:
+            return {'update_status': 'Error: Cannot update combined booking'}
+        
+        end_time = booking[0]['end_time']
+        check = db_connection.execute_query(
+            MOVE_BOOKING_CHECK_QUERY,
+            (booking[0]['table_id'], new_booking_date, end_time, new_booking_time, booking_id),
+            fetch=True, deadline=statement_deadline
+        )[0]
+        if check['existing_bookings'] > 0:
+            return {'update_status': 'Error: Table already booked for this date and time'}
+        
+        db_connection.execute_query(
+            UPDATE_BOOKING_QUERY,
+            (new_booking_date, new_booking_time, end_time, new_number_of_guests, booking_id),
+            deadline=statement_deadline
+        )
+        return {'update_status': f"Booking ID {booking_id} updated successfully"}
+    
+    return _write(db_connection, "UpdateBooking", 'update_status',
+                  'Error: Update failed', body, deadline)
+
+
+def cancel_booking(db_connection, booking_id: int,
+                   deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+    """CancelBooking: cancela una reserva confirmada (con todas sus mesas si es combinada)"""
+    def body(statement_deadline: Optional[float]) -> Dict[str, Any]:
+        booking = db_connection.execute_query(LOCK_BOOKING_QUERY, (booking_id,), fetch=True,
+                                              deadline=statement_deadline)
+        if not booking:
+            return {'cancellation_status': 'Error: Booking not found'}
+        if booking[0]['status'] == 'cancelled':
+            return {'cancellation_status': 'Error: Booking already cancelled'}
+        if booking[0]['status'] == 'completed':
+            return {'cancellation_status': 'Error: Cannot cancel completed booking'}
+        
+        main_booking_id = booking[0]['main_booking_id']
+        db_connection.execute_query(CANCEL_BOOKING_QUERY, (main_booking_id, main_booking_id),
+                                    deadline=statement_deadline)
+        return {'cancellation_status': f"Booking ID {booking_id} cancelled successfully"}
+    
+    return _write(db_connection, "CancelBooking", 'cancellation_status',
+                  'Error: Cancellation failed', body, deadline)
+
+
+def add_combined_booking(db_connection, customer_id: int, combination_id: int, booking_date,
+                         booking_time, number_of_guests: int,
+                         special_requests: Optional[str] = None,
+                         deadline: Optional[float] = None) -> Tuple[List[Dict], Dict[str, Any]]:
+    """AddCombinedBooking: reserva juntas las mesas de una combinación si todas están libres"""
+    def body(statement_deadline: Optional[float]) -> Dict[str, Any]:
+        tables = db_connection.execute_query(
+            LOCK_COMBINATION_QUERY, (booking_time, number_of_guests, combination_id), fetch=True,
+            deadline=statement_deadline
+        )
+        end_time = tables[0]['end_time'] if tables else booking_time
+        check = db_connection.execute_query(
+            ADD_COMBINED_BOOKING_CHECK_QUERY,
+            (customer_id, combination_id, booking_date, end_time, booking_time),
+            fetch=True, deadline=statement_deadline
+        )[0]
+        
+        if check['customer_exists'] == 0:
+            return {'booking_status': 'Error: Customer not found'}
+        if not tables or not all(table['is_available'] for table in tables):
+            return {'booking_status': 'Error: Table combination not found or not available'}
+        capacity = tables[0]['seating_capacity']
+        if number_of_guests is not None and number_of_guests > capacity:
+            return {'booking_status': (f"Error: Number of guests ({number_of_guests}) "
+                                       f"exceeds combination capacity ({capacity})")}
+        if check['existing_bookings'] > 0:
+            return {'booking_status': 'Error: Table already booked for this date and time'}
+        
+        main_table_id = tables[0]['table_id']
+        db_connection.execute_query(
+            INSERT_BOOKING_QUERY,
+            (customer_id, main_table_id, booking_date, booking_time, end_time, number_of_guests,
+             special_requests),
+            deadline=statement_deadline
+        )
+        booking_id = db_connection.execute_query(LAST_INSERT_ID_QUERY, fetch=True,
+                                                 deadline=statement_deadline)[0]['booking_id']
+        db_connection.execute_query(
+            INSERT_COMBINED_TABLES_QUERY,
+            (customer_id, booking_date, booking_time, end_time, booking_id, combination_id,
+             main_table_id),
+            deadline=statement_deadline
+        )
+        return {'booking_status': f"Booking confirmed with ID: {booking_id}"}
+    
+    return _write(db_connection, "AddCombinedBooking", 'booking_status',
+                  'Error: Booking creation failed', body, deadline)
+
+
+# Implementación directa de cada procedimiento, por nombre
+DIRECT_PROCEDURES = {
+    "GetMaxQuantity": get_max_quantity,
+    "ManageBooking": manage_booking,
+    "UpdateBooking": update_booking,
+    "AddBooking": add_booking,
+    "CancelBooking": cancel_booking,
+    "CheckBookingAvailability": check_booking_availability,
+    "GetBookingsByDate": get_bookings_by_date,
+    "AddCombinedBooking": add_combined_booking
+}
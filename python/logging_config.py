@@ -0,0 +1,176 @@
+"""
+Little Lemon Logging Configuration Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Configuración del logging de la aplicación. Los módulos de la librería solo
+obtienen su logger; la aplicación llama a configure_logging() al arrancar.
+Los registros se encolan en el hilo que los emite y un hilo de fondo los
+formatea y escribe, de modo que ni el formateo ni la E/S de disco ocurren
+durante la atención de una reserva.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+DEFAULT_LOG_FILE = 'little_lemon.log'
+
+# Loggers que emiten un mensaje INFO por cada llamada; son los que se muestrean
+CALL_LOGGERS = ("booking_system", "async_booking_system", "__main__")
+
+_lock = threading.Lock()
+_listener = None
+_queue_handler = None
+_sampled_loggers = ()
+_atexit_registered = False
+
+
+class SamplingFilter(logging.Filter):
+    """Deja pasar una fracción de los registros INFO/DEBUG; WARNING o superior pasa siempre"""
+    
+    def __init__(self, rate: float):
+        """
+        Inicializa el filtro
+        
+        Args:
+            rate: Fracción de registros a conservar (entre 0 y 1)
+        """
+        super().__init__()
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"Tasa de muestreo no válida: {rate} (debe estar entre 0 y 1)")
+        self.rate = rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+class LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler para una cola del mismo proceso
+    
+    A diferencia de QueueHandler, no formatea el mensaje antes de encolarlo:
+    el formateo ocurre en el hilo del listener. Los argumentos de los mensajes
+    deben ser valores que no cambien después de emitirlos.
+    """
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+
+def configure_logging(level: int = logging.INFO, log_file: Optional[str] = DEFAULT_LOG_FILE,
+                      console: bool = True, sample_rate: float = 1.0,
+                      sampled_loggers: Iterable[str] = CALL_LOGGERS) -> QueueListener:
+    """
+    Configura el logging de la aplicación con escritura en segundo plano
+    
+    Puede llamarse de nuevo para cambiar la configuración; el listener
+    anterior se detiene tras vaciar su cola.
+    
+    Args:
+        level: Nivel mínimo del logger raíz
+        log_file: Archivo de log (None = sin archivo)
+        console: Escribir también en la salida de errores
+        sample_rate: Fracción de los mensajes INFO por llamada a conservar
+        sampled_loggers: Loggers a los que se aplica el muestreo
+    
+    Returns:
+        QueueListener: Listener que escribe los registros en segundo plano
+    """
+    global _listener, _queue_handler, _sampled_loggers, _atexit_registered
+    
+    sampling_filter = SamplingFilter(sample_rate) if sample_rate < 1.0 else None
+    
+    with _lock:
+        _stop_listener()
+        
+        formatter = logging.Formatter(LOG_FORMAT)
+        handlers = []
+        if log_file:
+            handlers.append(logging.FileHandler(log_file))
+        if console:
+            handlers.append(logging.StreamHandler())
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        _queue_handler = LocalQueueHandler(log_queue)
+        root = logging.getLogger()
+        root.addHandler(_queue_handler)
+        root.setLevel(level)
+        
+        _sampled_loggers = tuple(sampled_loggers) if sampling_filter else ()
+        for name in _sampled_loggers:
+            logging.getLogger(name).addFilter(sampling_filter)
+        
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        
+        if not _atexit_registered:
+            atexit.register(stop_logging)
+            _atexit_registered = True
+        
+        return _listener
+
+
+def _stop_listener():
+    """Detiene el listener actual y retira sus handlers; se llama con el lock tomado"""
+    global _listener, _queue_handler, _sampled_loggers
+    
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    
+    for name in _sampled_loggers:
+        logger = logging.getLogger(name)
+        for log_filter in list(logger.filters):
+            if isinstance(log_filter, SamplingFilter):
+                logger.removeFilter(log_filter)
+    _sampled_loggers = ()
+    
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def stop_logging():
+    """Escribe los registros pendientes y detiene el hilo de logging"""
+    with _lock:
+        _stop_listener()
+
+
+def _restart_listener_after_fork():
+    """
+    Arranca en el proceso hijo su propio hilo de logging
+    
+    El hilo del listener no sobrevive al fork: sin esto los registros del hijo
+    se acumularían en una cola que nadie vacía. El hijo usa una cola nueva
+    para no repetir los registros que el padre tenía pendientes.
+    """
+    global _lock, _listener
+    
+    _lock = threading.Lock()
+    if _listener is None:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    _queue_handler.queue = log_queue
+    _listener = QueueListener(log_queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
@@ -0,0 +1,302 @@
+"""
+Little Lemon Query Metrics Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Histogramas de latencia por sentencia (espera del pool, ejecución, lectura y
+filas) y registro de consultas lentas.
+"""
+
+import math
+import re
+import threading
+import time
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+DEFAULT_SLOW_QUERY_THRESHOLD_MS = 200.0
+DEFAULT_MAX_STATEMENTS = 500
+DEFAULT_SLOW_QUERY_LOG_SIZE = 100
+
+# Sentencias que no caben en el registro se agrupan bajo esta clave
+OVERFLOW_STATEMENT_KEY = "<otras sentencias>"
+
+# Los buckets crecen un 5 %: el error de cada percentil es menor al 5 %
+HISTOGRAM_GROWTH = 1.05
+HISTOGRAM_MIN_VALUE = 0.001
+
+STRING_LITERAL_PATTERN = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+NUMBER_LITERAL_PATTERN = re.compile(r'\b\d+(?:\.\d+)?\b')
+VALUE_LIST_PATTERN = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+slow_query_logger = logging.getLogger("little_lemon.slow_query")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(query: str, max_length: int = 200) -> str:
+    """
+    Normaliza una consulta para agrupar sus ejecuciones
+    
+    Sustituye literales y marcadores por ?, compacta las listas de valores y
+    los espacios en blanco.
+    
+    Args:
+        query: Consulta SQL
+        max_length: Longitud máxima de la clave
+    
+    Returns:
+        str: Consulta normalizada
+    """
+    normalized = STRING_LITERAL_PATTERN.sub("?", query)
+    normalized = normalized.replace("%s", "?")
+    normalized = NUMBER_LITERAL_PATTERN.sub("?", normalized)
+    normalized = VALUE_LIST_PATTERN.sub("(...)", normalized)
+    normalized = WHITESPACE_PATTERN.sub(" ", normalized).strip()
+    return normalized[:max_length]
+
+
+class LatencyHistogram:
+    """Histograma con buckets logarítmicos para calcular percentiles"""
+    
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+    
+    def record(self, value: float):
+        """
+        Registra un valor
+        
+        Args:
+            value: Valor a registrar (milisegundos o filas)
+        """
+        if value <= HISTOGRAM_MIN_VALUE:
+            index = 0
+        else:
+            index = int(math.log(value / HISTOGRAM_MIN_VALUE, HISTOGRAM_GROWTH)) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    def percentile(self, percent: float) -> float:
+        """
+        Calcula un percentil aproximado
+        
+        Args:
+            percent: Percentil entre 0 y 100
+        
+        Returns:
+            float: Límite superior del bucket que contiene el percentil
+        """
+        if not self.count:
+            return 0.0
+        
+        target = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                upper = HISTOGRAM_MIN_VALUE * HISTOGRAM_GROWTH ** index if index else HISTOGRAM_MIN_VALUE
+                return min(max(upper, self.min), self.max)
+        return self.max
+    
+    def summary(self) -> Dict[str, float]:
+        """
+        Resume el histograma
+        
+        Returns:
+            Dict: Media, p50, p95, p99 y máximo
+        """
+        return {
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max
+        }
+
+
+class QueryTimer:
+    """Cronómetro de las fases de una consulta: espera del pool, ejecución y lectura"""
+    
+    def __init__(self):
+        self._last = time.perf_counter()
+        self.pool_wait_ms = 0.0
+        self.execute_ms = 0.0
+        self.fetch_ms = 0.0
+        self.rows = 0
+        self.failed = False
+    
+    def mark(self, phase: str, rows: Optional[int] = None):
+        """
+        Suma a una fase el tiempo transcurrido desde la marca anterior
+        
+        Args:
+            phase: "pool_wait", "execute" o "fetch"
+            rows: Filas leídas o afectadas en la fase
+        """
+        now = time.perf_counter()
+        attribute = f"{phase}_ms"
+        setattr(self, attribute, getattr(self, attribute) + (now - self._last) * 1000)
+        self._last = now
+        if rows is not None and rows > 0:
+            self.rows += rows
+    
+    def restart(self):
+        """Descarta el tiempo transcurrido desde la última marca (p. ej. el del consumidor)"""
+        self._last = time.perf_counter()
+
+
+class StatementMetrics:
+    """Métricas acumuladas de una sentencia normalizada o procedimiento"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.pool_wait_ms = LatencyHistogram()
+        self.execute_ms = LatencyHistogram()
+        self.fetch_ms = LatencyHistogram()
+        self.total_ms = LatencyHistogram()
+        self.rows = LatencyHistogram()
+
+
+class QueryMetrics:
+    """Registro de métricas por sentencia con registro de consultas lentas"""
+    
+    def __init__(self, slow_query_threshold_ms: Optional[float] = DEFAULT_SLOW_QUERY_THRESHOLD_MS,
+                 max_statements: int = DEFAULT_MAX_STATEMENTS,
+                 slow_query_log_size: int = DEFAULT_SLOW_QUERY_LOG_SIZE):
+        """
+        Inicializa el registro
+        
+        Args:
+            slow_query_threshold_ms: Duración a partir de la cual una consulta
+                                     es lenta (None = sin registro de lentas)
+            max_statements: Sentencias distintas a registrar por separado
+            slow_query_log_size: Consultas lentas recientes a conservar
+        """
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.max_statements = max_statements
+        self._lock = threading.Lock()
+        self._statements = {}
+        self._slow_queries = deque(maxlen=slow_query_log_size)
+    
+    def _statement(self, key: str) -> StatementMetrics:
+        """Obtiene las métricas de una sentencia; se llama con el lock tomado"""
+        metrics = self._statements.get(key)
+        if metrics is None:
+            if len(self._statements) >= self.max_statements:
+                key = OVERFLOW_STATEMENT_KEY
+                metrics = self._statements.get(key)
+            if metrics is None:
+                metrics = self._statements[key] = StatementMetrics()
+        return metrics
+    
+    def record(self, key: str, pool_wait_ms: float, execute_ms: float,
+               fetch_ms: float, rows: int):
+        """
+        Registra una ejecución correcta
+        
+        Args:
+            key: Sentencia normalizada o nombre del procedimiento
+            pool_wait_ms: Espera por la conexión del pool
+            execute_ms: Tiempo de ejecución en el servidor
+            fetch_ms: Tiempo de lectura de los resultados
+            rows: Filas leídas o afectadas
+        """
+        total_ms = pool_wait_ms + execute_ms + fetch_ms
+        
+        with self._lock:
+            metrics = self._statement(key)
+            metrics.calls += 1
+            metrics.pool_wait_ms.record(pool_wait_ms)
+            metrics.execute_ms.record(execute_ms)
+            metrics.fetch_ms.record(fetch_ms)
+            metrics.total_ms.record(total_ms)
+            metrics.rows.record(rows)
+            
+            is_slow = self.slow_query_threshold_ms is not None and total_ms >= self.slow_query_threshold_ms
+            if is_slow:
+                self._slow_queries.append({
+                    'statement': key,
+                    'timestamp': time.time(),
+                    'total_ms': total_ms,
+                    'pool_wait_ms': pool_wait_ms,
+                    'execute_ms': execute_ms,
+                    'fetch_ms': fetch_ms,
+                    'rows': rows
+                })
+        
+        if is_slow:
+            slow_query_logger.warning(
+                "Consulta lenta (%.1f ms: espera %.1f, ejecución %.1f, lectura %.1f, %d filas): %s",
+                total_ms, pool_wait_ms, execute_ms, fetch_ms, rows, key
+            )
+    
+    def record_timer(self, key: str, timer: QueryTimer):
+        """
+        Registra una ejecución medida con QueryTimer
+        
+        Args:
+            key: Sentencia normalizada o nombre del procedimiento
+            timer: Cronómetro de la ejecución
+        """
+        if timer.failed:
+            self.record_error(key)
+        else:
+            self.record(key, timer.pool_wait_ms, timer.execute_ms, timer.fetch_ms, timer.rows)
+    
+    def record_error(self, key: str):
+        """
+        Registra una ejecución fallida
+        
+        Args:
+            key: Sentencia normalizada o nombre del procedimiento
+        """
+        with self._lock:
+            self._statement(key).errors += 1
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtiene los percentiles de cada sentencia
+        
+        Returns:
+            Dict: Sentencia -> llamadas, errores y resumen (media, p50, p95,
+                  p99, máximo) de espera, ejecución, lectura, total y filas
+        """
+        with self._lock:
+            return {
+                key: {
+                    'calls': metrics.calls,
+                    'errors': metrics.errors,
+                    'pool_wait_ms': metrics.pool_wait_ms.summary(),
+                    'execute_ms': metrics.execute_ms.summary(),
+                    'fetch_ms': metrics.fetch_ms.summary(),
+                    'total_ms': metrics.total_ms.summary(),
+                    'rows': metrics.rows.summary()
+                }
+                for key, metrics in self._statements.items()
+            }
+    
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        """
+        Obtiene las consultas lentas más recientes
+        
+        Returns:
+            List[Dict]: Sentencia, instante, tiempos y filas de cada consulta lenta
+        """
+        with self._lock:
+            return list(self._slow_queries)
+    
+    def reset(self):
+        """Descarta todas las métricas acumuladas"""
+        with self._lock:
+            self._statements.clear()
+            self._slow_queries.clear()
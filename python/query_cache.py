@@ -0,0 +1,259 @@
+"""
+Little Lemon Query Cache Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Caché de resultados de consultas con TTL por consulta, desalojo LRU, límite
+de memoria e invalidación por tabla tras las escrituras hechas con la librería.
+"""
+
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+DEFAULT_QUERY_CACHE_SIZE = 256
+DEFAULT_QUERY_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Tablas que modifica cada procedimiento de escritura (nombres en minúsculas);
+# un procedimiento de escritura que no aparezca aquí invalida toda la caché
+PROCEDURE_WRITE_TABLES = {
+    "addbooking": ("bookings",),
+    "updatebooking": ("bookings",),
+    "cancelbooking": ("bookings",),
+    "addcombinedbooking": ("bookings",)
+}
+
+TABLE_REFERENCE_PATTERN = re.compile(r'\b(?:FROM|JOIN)\s+`?([A-Za-z_][A-Za-z0-9_]*)`?', re.IGNORECASE)
+WRITE_TARGET_PATTERN = re.compile(
+    r'^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?([A-Za-z_][A-Za-z0-9_]*)`?',
+    re.IGNORECASE
+)
+
+
+def referenced_tables(query: str) -> Set[str]:
+    """
+    Obtiene las tablas que lee una consulta (cláusulas FROM y JOIN)
+    
+    Args:
+        query: Consulta SQL
+    
+    Returns:
+        Set[str]: Nombres de tabla en minúsculas
+    """
+    return {table.lower() for table in TABLE_REFERENCE_PATTERN.findall(query)}
+
+
+def written_tables(query: str) -> Optional[Set[str]]:
+    """
+    Obtiene las tablas que puede modificar una sentencia de escritura
+    
+    Args:
+        query: Sentencia SQL
+    
+    Returns:
+        Set[str]: Tabla modificada y tablas referenciadas, o None si la
+                  sentencia no se reconoce (se debe invalidar todo)
+    """
+    match = WRITE_TARGET_PATTERN.match(query)
+    if not match:
+        return None
+    return {match.group(1).lower()} | referenced_tables(query)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estima la memoria ocupada por un resultado
+    
+    Args:
+        value: Resultado de una consulta
+    
+    Returns:
+        int: Bytes aproximados
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(item) for item in value.values())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+def copy_result(value: Any) -> Any:
+    """
+    Copia un resultado cacheado para que quien lo recibe pueda modificarlo
+    
+    Args:
+        value: Resultado guardado en la caché
+    
+    Returns:
+        Copia de la lista y de las filas en diccionario; las tuplas y los
+        registros son inmutables y se comparten
+    """
+    if isinstance(value, list):
+        return [dict(row) if isinstance(row, dict) else row for row in value]
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], list):
+        return value[0], list(value[1])
+    if isinstance(value, dict):
+        return {name: column.copy() for name, column in value.items()}
+    return value
+
+
+class QueryResultCache:
+    """Caché LRU de resultados con TTL, límite de memoria e invalidación por tabla"""
+    
+    def __init__(self, max_entries: int = DEFAULT_QUERY_CACHE_SIZE,
+                 max_bytes: int = DEFAULT_QUERY_CACHE_MAX_BYTES):
+        """
+        Inicializa la caché
+        
+        Args:
+            max_entries: Número máximo de resultados guardados
+            max_bytes: Memoria máxima aproximada de los resultados guardados
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._keys_by_table = {}
+        self._bytes = 0
+        
+        # Versión de invalidación: evita guardar un resultado leído antes de
+        # una escritura que terminó mientras se ejecutaba la consulta
+        self._version = 0
+        self._table_versions = {}
+        self._cleared_version = 0
+        
+        # Métricas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def version(self) -> int:
+        """
+        Obtiene la versión actual, a tomar antes de ejecutar la consulta
+        
+        Returns:
+            int: Versión de invalidación
+        """
+        with self._lock:
+            return self._version
+    
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Busca un resultado vigente
+        
+        Args:
+            key: Clave de la consulta
+        
+        Returns:
+            Tuple: (True y el resultado si hay acierto, sino False y None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            
+            value, tables, expires_at, size = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return False, None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+    
+    def put(self, key: Hashable, value: Any, tables: Iterable[str], ttl: float, version: int):
+        """
+        Guarda un resultado
+        
+        Args:
+            key: Clave de la consulta
+            value: Resultado
+            tables: Tablas leídas por la consulta
+            ttl: Segundos de vigencia
+            version: Versión tomada antes de ejecutar la consulta
+        """
+        tables = frozenset(tables)
+        size = estimate_size(value)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        
+        with self._lock:
+            # Una escritura posterior a la lectura invalidó alguna de sus tablas
+            if self._cleared_version > version or any(
+                self._table_versions.get(table, 0) > version for table in tables
+            ):
+                return
+            
+            if key in self._entries:
+                self._remove(key)
+            
+            self._entries[key] = (value, tables, time.monotonic() + ttl, size)
+            self._bytes += size
+            for table in tables:
+                self._keys_by_table.setdefault(table, set()).add(key)
+            
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+    
+    def invalidate(self, tables: Optional[Iterable[str]] = None):
+        """
+        Descarta los resultados que leen alguna de las tablas
+        
+        Args:
+            tables: Tablas modificadas (None = descartar toda la caché)
+        """
+        with self._lock:
+            self._version += 1
+            
+            if tables is None:
+                self._cleared_version = self._version
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._keys_by_table.clear()
+                self._bytes = 0
+                return
+            
+            for table in tables:
+                table = table.lower()
+                self._table_versions[table] = self._version
+                for key in list(self._keys_by_table.get(table, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+    
+    def _remove(self, key: Hashable):
+        """Elimina una entrada; se llama con el lock tomado"""
+        value, tables, expires_at, size = self._entries.pop(key)
+        self._bytes -= size
+        for table in tables:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table]
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las métricas de la caché
+        
+        Returns:
+            Dict: Entradas, memoria, aciertos, fallos, desalojos e invalidaciones
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
@@ -0,0 +1,156 @@
+"""
+Little Lemon Replication Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Enrutamiento de lecturas a réplicas: cada réplica tiene su propio pool y se
+elige por turno rotatorio o por menor carga.
+"""
+
+import sys
+import os
+import itertools
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from mysql.connector import Error
+
+# Agregar el directorio actual al path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from connection_pool import PoolExhaustedError, PoolTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Estrategias de selección de réplica
+REPLICA_SELECTION_STRATEGIES = ("round_robin", "least_loaded")
+
+# Segundos que una réplica caída queda fuera de la rotación
+DEFAULT_REPLICA_COOLDOWN = 30.0
+
+# Procedimientos que solo leen datos y pueden ejecutarse en una réplica
+READ_ONLY_PROCEDURES = (
+    "GetMaxQuantity",
+    "ManageBooking",
+    "CheckBookingAvailability",
+    "GetBookingsByDate"
+)
+
+# Sentencias de solo lectura; SELECT ... FOR UPDATE / LOCK IN SHARE MODE bloquea filas
+READ_STATEMENT_PATTERN = re.compile(r'^\s*(SELECT|SHOW|WITH|DESCRIBE|DESC|EXPLAIN)\b', re.IGNORECASE)
+LOCKING_READ_PATTERN = re.compile(r'\bFOR\s+(UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b', re.IGNORECASE)
+
+
+def is_read_query(query: str) -> bool:
+    """
+    Indica si una consulta solo lee datos y puede enviarse a una réplica
+    
+    Args:
+        query: Consulta SQL
+    
+    Returns:
+        bool: True para lecturas sin bloqueo de filas
+    """
+    return bool(READ_STATEMENT_PATTERN.match(query)) and not LOCKING_READ_PATTERN.search(query)
+
+
+class ReplicaSet:
+    """Conjunto de réplicas de lectura, cada una con su propio pool"""
+    
+    def __init__(self, pools: List[Any], strategy: str = "round_robin",
+                 cooldown: float = DEFAULT_REPLICA_COOLDOWN):
+        """
+        Inicializa el conjunto de réplicas
+        
+        Args:
+            pools: Pools de conexiones de cada réplica
+            strategy: "round_robin" o "least_loaded"
+            cooldown: Segundos que una réplica caída queda fuera de la rotación
+        """
+        if strategy not in REPLICA_SELECTION_STRATEGIES:
+            raise ValueError(
+                f"Estrategia de réplica no válida: {strategy} "
+                f"(disponibles: {', '.join(REPLICA_SELECTION_STRATEGIES)})"
+            )
+        
+        self.pools = list(pools)
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._down_until = [0.0] * len(self.pools)
+        self._reads = [0] * len(self.pools)
+    
+    def __len__(self):
+        return len(self.pools)
+    
+    def _candidates(self) -> List[int]:
+        """
+        Ordena las réplicas disponibles según la estrategia
+        
+        Returns:
+            List[int]: Índices de las réplicas a intentar, en orden
+        """
+        now = time.monotonic()
+        with self._lock:
+            healthy = [index for index, until in enumerate(self._down_until) if until <= now]
+            if not healthy:
+                return []
+            if self.strategy == "least_loaded":
+                return sorted(healthy, key=lambda index: self.pools[index].load())
+            start = next(self._counter) % len(healthy)
+            return healthy[start:] + healthy[:start]
+    
+    def get_connection(self, timeout: Optional[float] = None):
+        """
+        Obtiene una conexión de la réplica elegida
+        
+        Si la réplica está agotada se prueba la siguiente; si no responde se
+        retira de la rotación durante cooldown segundos.
+        
+        Args:
+            timeout: Segundos máximos de espera en cada réplica
+        
+        Returns:
+            Connection: Conexión de una réplica, o None si ninguna está disponible
+        """
+        for index in self._candidates():
+            pool = self.pools[index]
+            try:
+                connection = pool.get_connection(timeout)
+                with self._lock:
+                    self._reads[index] += 1
+                return connection
+            except (PoolExhaustedError, PoolTimeoutError) as e:
+                logger.warning("Réplica %s sin conexiones libres: %s", pool.pool_name, e)
+            except Error as e:
+                with self._lock:
+                    self._down_until[index] = time.monotonic() + self.cooldown
+                logger.warning("Réplica %s no disponible durante %.0fs: %s",
+                               pool.pool_name, self.cooldown, e)
+        return None
+    
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Obtiene las métricas de cada réplica
+        
+        Returns:
+            List[Dict]: Métricas del pool, lecturas atendidas y disponibilidad
+        """
+        now = time.monotonic()
+        stats = []
+        for index, pool in enumerate(self.pools):
+            pool_stats = pool.stats()
+            with self._lock:
+                pool_stats['reads'] = self._reads[index]
+                pool_stats['available'] = self._down_until[index] <= now
+            stats.append(pool_stats)
+        return stats
+    
+    def close(self):
+        """Cierra los pools de todas las réplicas"""
+        for pool in self.pools:
+            pool.close()
@@ -0,0 +1,109 @@
+"""
+Little Lemon Result Formats Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Formatos compactos para los resultados de las consultas. El formato "dict"
+repite los nombres de las columnas en cada fila; los demás los guardan una
+sola vez.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Formatos disponibles:
+#   dict     -> List[Dict] (un diccionario por fila)
+#   tuple    -> (columnas, List[tuple])
+#   record   -> List[namedtuple] (clase con __slots__ vacío, creada una vez por consulta)
+#   columnar -> Dict[columna, numpy.ndarray]
+RESULT_FORMATS = ("dict", "tuple", "record", "columnar")
+
+
+def validate_result_format(result_format: str) -> str:
+    """
+    Valida el nombre de un formato de resultados
+    
+    Args:
+        result_format: Nombre del formato
+    
+    Returns:
+        str: El mismo nombre si es válido
+    """
+    if result_format not in RESULT_FORMATS:
+        raise ValueError(
+            f"Formato de resultados no válido: {result_format} "
+            f"(disponibles: {', '.join(RESULT_FORMATS)})"
+        )
+    return result_format
+
+
+@lru_cache(maxsize=128)
+def record_type(columns: Tuple[str, ...]):
+    """
+    Obtiene la clase de registro para un conjunto de columnas
+    
+    Args:
+        columns: Nombres de las columnas
+    
+    Returns:
+        type: namedtuple con esos campos (los nombres no válidos se renombran)
+    """
+    return namedtuple("Record", columns, rename=True)
+
+
+def to_columnar(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> Dict[str, Any]:
+    """
+    Convierte filas en un arreglo NumPy por columna
+    
+    Las columnas numéricas homogéneas obtienen un dtype nativo; las de texto,
+    fechas, decimales o con NULL quedan como arreglos de objetos.
+    
+    Args:
+        columns: Nombres de las columnas
+        rows: Filas como tuplas
+    
+    Returns:
+        Dict: Nombre de la columna -> numpy.ndarray
+    """
+    import numpy as np
+    
+    if not rows:
+        return {name: np.empty(0, dtype=object) for name in columns}
+    
+    result = {}
+    for name, values in zip(columns, zip(*rows)):
+        array = np.asarray(values)
+        # Evitar cadenas de ancho fijo y arreglos multidimensionales
+        if array.dtype.kind in "USV" or array.ndim != 1:
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+        result[name] = array
+    return result
+
+
+def format_rows(columns: Sequence[str], rows: List[Sequence[Any]], result_format: str):
+    """
+    Convierte filas en tupla al formato de resultados pedido
+    
+    Args:
+        columns: Nombres de las columnas
+        rows: Filas como tuplas
+        result_format: Uno de RESULT_FORMATS
+    
+    Returns:
+        Resultados en el formato pedido
+    """
+    columns = tuple(columns or ())
+    
+    if result_format == "dict":
+        return [dict(zip(columns, row)) for row in rows]
+    if result_format == "tuple":
+        return columns, rows
+    if result_format == "record":
+        record = record_type(columns)
+        return [record._make(row) for row in rows]
+    if result_format == "columnar":
+        return to_columnar(columns, rows)
+    
+    validate_result_format(result_format)
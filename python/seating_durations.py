@@ -0,0 +1,114 @@
+"""
+Little Lemon Seating Durations Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Duración de ocupación de las reservas. Cada reserva ocupa su mesa desde
+booking_time hasta end_time, y dos reservas confirmadas de una mesa chocan
+si esos intervalos se solapan. La duración depende de los comensales y de
+la ubicación de la mesa según la tabla seating_durations, con la misma regla
+que la función SeatingDuration() de stored_procedures.sql.
+"""
+
+from datetime import time, timedelta
+from typing import Optional, Dict, Any, Iterable, Union
+
+# Minutos de ocupación si ninguna regla se aplica (como SeatingDuration())
+DEFAULT_SEATING_DURATION = 120
+
+SEATING_DURATIONS_QUERY = """
+SELECT duration_id, min_guests, max_guests, location, duration_minutes
+FROM seating_durations
+"""
+
+# Expresión SQL con los minutos de ocupación; se completa con las expresiones
+# del número de comensales y de la ubicación de la mesa
+SEATING_DURATION_SQL = """COALESCE((
+        SELECT sd.duration_minutes
+        FROM seating_durations sd
+        WHERE {guests} BETWEEN sd.min_guests AND sd.max_guests
+            AND (sd.location IS NULL OR sd.location = {location})
+        ORDER BY sd.location IS NULL, sd.max_guests - sd.min_guests, sd.duration_id
+        LIMIT 1
+    ), """ + str(DEFAULT_SEATING_DURATION) + ")"
+
+
+def end_time_sql(start: str, guests: str, location: str) -> str:
+    """
+    Construye la expresión SQL de la hora de fin de una reserva
+    
+    Args:
+        start: Expresión de la hora de inicio
+        guests: Expresión del número de comensales
+        location: Expresión de la ubicación de la mesa
+    
+    Returns:
+        str: ADDTIME(start, duración) en SQL de MySQL
+    """
+    duration = SEATING_DURATION_SQL.format(guests=guests, location=location)
+    return f"ADDTIME({start}, SEC_TO_TIME(60 * {duration}))"
+
+
+def end_time(start: Union[time, timedelta], minutes: int) -> timedelta:
+    """
+    Calcula la hora de fin de una reserva
+    
+    Args:
+        start: Hora de inicio (time, o timedelta como devuelve mysql.connector)
+        minutes: Minutos de ocupación
+    
+    Returns:
+        timedelta: Hora de fin desde medianoche (puede pasar de 24 horas, como TIME)
+    """
+    if isinstance(start, time):
+        start = timedelta(hours=start.hour, minutes=start.minute, seconds=start.second)
+    return start + timedelta(minutes=minutes)
+
+
+class SeatingDurations:
+    """Reglas de seating_durations resueltas en memoria"""
+    
+    def __init__(self, rules: Iterable[Dict[str, Any]] = ()):
+        """
+        Inicializa las reglas
+        
+        Args:
+            rules: Filas de SEATING_DURATIONS_QUERY
+        """
+        # Orden de SeatingDuration(): ubicación antes que general, rango más estrecho primero
+        self.rules = tuple(sorted(
+            (row['location'] is None, row['max_guests'] - row['min_guests'], row['duration_id'],
+             row['min_guests'], row['max_guests'], row['location'], row['duration_minutes'])
+            for row in rules
+        ))
+    
+    @classmethod
+    def load(cls, db_connection, deadline: Optional[float] = None) -> "SeatingDurations":
+        """
+        Carga las reglas de la base de datos
+        
+        Args:
+            db_connection: Conexión de Little Lemon
+            deadline: Plazo de la consulta
+        
+        Returns:
+            SeatingDurations: Reglas cargadas
+        """
+        return cls(db_connection.execute_query(SEATING_DURATIONS_QUERY, fetch=True,
+                                               deadline=deadline))
+    
+    def minutes(self, guests: int, location: Optional[str]) -> int:
+        """
+        Obtiene los minutos de ocupación de una reserva
+        
+        Args:
+            guests: Número de comensales
+            location: Ubicación de la mesa
+        
+        Returns:
+            int: Minutos de ocupación
+        """
+        for _, _, _, min_guests, max_guests, rule_location, duration in self.rules:
+            if min_guests <= guests <= max_guests and rule_location in (None, location):
+                return duration
+        return DEFAULT_SEATING_DURATION
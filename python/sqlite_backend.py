@@ -0,0 +1,1084 @@
+"""
+Little Lemon SQLite Backend Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Backend embebido sobre SQLite para ejecutar el sistema sin servidor MySQL
+(p. ej. benchmarks repetibles en un entorno aislado). Crea las tablas de
+little_lemon_schema.sql, carga sample_data.sql e implementa en Python los
+procedimientos de stored_procedures.sql con los mismos resultados.
+
+Sus conexiones imitan la parte de la API de mysql.connector que usa la
+librería: LittleLemonConnection las obtiene como fábrica de conexiones del
+pool cuando la configuración indica backend = "sqlite".
+"""
+
+import itertools
+import logging
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, datetime, time as time_of_day, timedelta
+from decimal import Decimal
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Callable, Iterator
+
+from mysql.connector import errorcode, errors
+
+# Agregar el directorio actual al path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from seating_durations import end_time_sql
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "database", "schema"
+)
+SCHEMA_FILE = os.path.join(SCHEMA_DIR, "little_lemon_schema.sql")
+SAMPLE_DATA_FILE = os.path.join(SCHEMA_DIR, "sample_data.sql")
+
+# Nombre que devuelve DATABASE(), como en el servidor
+DATABASE_NAME = "little_lemon_db"
+
+# Segundos de espera por un bloqueo (equivale a innodb_lock_wait_timeout)
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+# Instrucciones de SQLite entre comprobaciones del tiempo máximo de una consulta
+PROGRESS_HANDLER_STEPS = 1000
+
+# Sentencias de los scripts que solo tienen sentido en el servidor MySQL
+SKIPPED_STATEMENT_PATTERN = re.compile(
+    r'^(DROP\s+DATABASE|CREATE\s+DATABASE|USE|SHOW|DESCRIBE|PRINT|SELECT)\b', re.IGNORECASE
+)
+
+# Traducción de los tipos y cláusulas de MySQL que SQLite no admite
+DDL_REPLACEMENTS = (
+    (re.compile(r'\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b', re.IGNORECASE),
+     'INTEGER PRIMARY KEY AUTOINCREMENT'),
+    (re.compile(r'\b(\w+)\s+ENUM\s*\(([^)]*)\)', re.IGNORECASE), r'\1 TEXT CHECK (\1 IN (\2))'),
+    (re.compile(r'\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP\b', re.IGNORECASE), '')
+)
+
+CREATE_TABLE_PATTERN = re.compile(r'^CREATE\s+TABLE\s+(\w+)', re.IGNORECASE)
+ON_UPDATE_PATTERN = re.compile(
+    r'\b(\w+)\s+TIMESTAMP\b[^,]*\bON\s+UPDATE\s+CURRENT_TIMESTAMP\b', re.IGNORECASE
+)
+
+# ON UPDATE CURRENT_TIMESTAMP se emula con un trigger por columna
+ON_UPDATE_TRIGGER = """
+CREATE TRIGGER {table}_{column}_on_update AFTER UPDATE ON {table}
+FOR EACH ROW WHEN NEW.{column} IS OLD.{column}
+BEGIN
+    UPDATE {table} SET {column} = CURRENT_TIMESTAMP WHERE rowid = NEW.rowid;
+END
+"""
+
+# Hint y sentencias de sesión que genera LittleLemonConnection (ver deadlines)
+MAX_EXECUTION_TIME_PATTERN = re.compile(r'/\*\+\s*MAX_EXECUTION_TIME\((\d+)\)\s*\*/', re.IGNORECASE)
+LOCK_WAIT_PATTERN = re.compile(r'\binnodb_lock_wait_timeout\s*=\s*(\w+)', re.IGNORECASE)
+SET_VARIABLE_PATTERN = re.compile(r'@(\w+)\s*=\s*')
+# Cláusulas y funciones de MySQL en las consultas; los bloqueos de filas no
+# hacen falta porque las transacciones de escritura reservan la base de datos
+QUERY_REPLACEMENTS = (
+    (re.compile(r'\s+FOR\s+(UPDATE|SHARE)(\s+OF\s+\w+)?\s*$', re.IGNORECASE), ''),
+    (re.compile(r'\bLAST_INSERT_ID\(\)', re.IGNORECASE), 'last_insert_rowid()')
+)
+
+CALL_PATTERN = re.compile(r'^CALL\s+(\w+)\s*\((.*)\)$', re.IGNORECASE | re.DOTALL)
+
+# Piezas de una sentencia: literales y comentarios se reconocen para no
+# interpretar los ';', ',', '%s' ni '@' que contengan
+SQL_TOKEN_PATTERN = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|%s|%%|@\w+|[;,()]"
+    r"|[^'\"%@;,()/-]+|.",
+    re.DOTALL
+)
+
+# Sentencia vacía: sin filas ni columnas
+EMPTY_RESULT = (None, (), 0, None)
+
+
+def to_sql_value(value: Any) -> Any:
+    """
+    Convierte un parámetro de Python al formato que MySQL usaría como texto
+    
+    Args:
+        value: Valor del parámetro
+    
+    Returns:
+        Valor almacenable en SQLite (fechas y horas como texto ISO)
+    """
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+    if isinstance(value, (date, time_of_day)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        # Las columnas TIME de MySQL llegan a Python como timedelta
+        seconds = int(value.total_seconds())
+        return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _to_timedelta(value: str) -> timedelta:
+    """Convierte un texto 'HH:MM:SS' (las horas pueden pasar de 24) en timedelta"""
+    hours, minutes, seconds = value.split(":")
+    return timedelta(hours=int(hours), minutes=int(minutes), seconds=float(seconds))
+
+
+def _parse_time(value: bytes) -> timedelta:
+    """Convierte una columna TIME en timedelta, como hace mysql.connector"""
+    return _to_timedelta(value.decode())
+
+
+# Adaptadores y conversores según el tipo declarado de cada columna, para que
+# las filas tengan los mismos tipos que devuelve mysql.connector
+for _python_type in (date, datetime, time_of_day, timedelta, Decimal):
+    sqlite3.register_adapter(_python_type, to_sql_value)
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()[:10]))
+sqlite3.register_converter("TIME", _parse_time)
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+sqlite3.register_converter("DECIMAL", lambda value: Decimal(value.decode()))
+
+
+def _concat(*values) -> Optional[str]:
+    """CONCAT() de MySQL: NULL si algún argumento es NULL"""
+    if any(value is None for value in values):
+        return None
+    return "".join(str(value) for value in values)
+
+
+def _addtime(value: Optional[str], interval: Optional[str]) -> Optional[str]:
+    """ADDTIME() de MySQL para horas 'HH:MM:SS'"""
+    if value is None or interval is None:
+        return None
+    return to_sql_value(_to_timedelta(value) + _to_timedelta(interval))
+
+
+def _sec_to_time(seconds: Optional[float]) -> Optional[str]:
+    """SEC_TO_TIME() de MySQL"""
+    if seconds is None:
+        return None
+    return to_sql_value(timedelta(seconds=seconds))
+
+
+def split_statements(sql: str) -> List[str]:
+    """
+    Divide un script o una sentencia múltiple en sentencias
+    
+    Args:
+        sql: Texto SQL con sentencias separadas por ';'
+    
+    Returns:
+        List[str]: Sentencias sin el ';' ni los comentarios de línea
+    """
+    statements = []
+    current = []
+    for token in SQL_TOKEN_PATTERN.findall(sql):
+        if token == ';':
+            statements.append(''.join(current).strip())
+            current = []
+        elif not token.startswith('--'):
+            current.append(token)
+    statements.append(''.join(current).strip())
+    return [statement for statement in statements if statement]
+
+
+def split_arguments(text: str) -> List[str]:
+    """
+    Divide la lista de argumentos de un CALL por las comas de primer nivel
+    
+    Args:
+        text: Texto entre los paréntesis del CALL
+    
+    Returns:
+        List[str]: Argumentos sin espacios alrededor
+    """
+    arguments = []
+    current = []
+    depth = 0
+    for token in SQL_TOKEN_PATTERN.findall(text):
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        elif token == ',' and depth == 0:
+            arguments.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(token)
+    if ''.join(current).strip():
+        arguments.append(''.join(current).strip())
+    return arguments
+
+
+def count_markers(statement: str) -> int:
+    """Cuenta los marcadores %s de una sentencia"""
+    return sum(1 for token in SQL_TOKEN_PATTERN.findall(statement) if token == '%s')
+
+
+def bind_statement(statement: str, params: Sequence[Any],
+                   variables: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """
+    Traduce los marcadores de MySQL a los de SQLite
+    
+    Cada %s toma el siguiente parámetro y cada @variable el valor de la
+    variable de sesión; %% se convierte en %.
+    
+    Args:
+        statement: Sentencia con marcadores de mysql.connector
+        params: Valores de los marcadores %s
+        variables: Variables de sesión de la conexión
+    
+    Returns:
+        Tuple: (sentencia con marcadores ?, valores en orden)
+    """
+    parts = []
+    values = []
+    remaining = iter(params)
+    for token in SQL_TOKEN_PATTERN.findall(statement):
+        if token == '%s':
+            parts.append('?')
+            values.append(next(remaining))
+        elif token == '%%':
+            parts.append('%')
+        elif token.startswith('@') and len(token) > 1:
+            parts.append('?')
+            values.append(variables.get(token[1:].lower()))
+        else:
+            parts.append(token)
+    return ''.join(parts), values
+
+
+def translate_schema(script: str) -> List[str]:
+    """
+    Traduce little_lemon_schema.sql a sentencias de SQLite
+    
+    Args:
+        script: Contenido del script de MySQL
+    
+    Returns:
+        List[str]: Tablas, índices y vistas, seguidos de los triggers que
+                   emulan ON UPDATE CURRENT_TIMESTAMP
+    """
+    statements = []
+    triggers = []
+    for statement in split_statements(script):
+        if SKIPPED_STATEMENT_PATTERN.match(statement):
+            continue
+        table = CREATE_TABLE_PATTERN.match(statement)
+        if table:
+            triggers.extend(
+                ON_UPDATE_TRIGGER.format(table=table.group(1), column=column)
+                for column in ON_UPDATE_PATTERN.findall(statement)
+            )
+        for pattern, replacement in DDL_REPLACEMENTS:
+            statement = pattern.sub(replacement, statement)
+        statements.append(statement)
+    return statements + triggers
+
+
+def translate_error(error: sqlite3.Error) -> errors.Error:
+    """
+    Convierte un error de SQLite en el error equivalente de mysql.connector
+    
+    Así el resto de la librería (reintentos, plazos, transacciones) lo trata
+    igual que un error del servidor.
+    
+    Args:
+        error: Error de SQLite
+    
+    Returns:
+        errors.Error: Error con el código de MySQL más parecido
+    """
+    message = str(error)
+    lowered = message.lower()
+    
+    if isinstance(error, sqlite3.IntegrityError):
+        if 'unique' in lowered:
+            errno = errorcode.ER_DUP_ENTRY
+        elif 'foreign key' in lowered:
+            errno = errorcode.ER_NO_REFERENCED_ROW_2
+        elif 'not null' in lowered:
+            errno = errorcode.ER_BAD_NULL_ERROR
+        else:
+            errno = errorcode.ER_CHECK_CONSTRAINT_VIOLATED
+        return errors.IntegrityError(msg=message, errno=errno)
+    if 'interrupted' in lowered:
+        return errors.DatabaseError(msg=message, errno=errorcode.ER_QUERY_TIMEOUT)
+    if 'locked' in lowered:
+        return errors.DatabaseError(msg=message, errno=errorcode.ER_LOCK_WAIT_TIMEOUT)
+    if 'closed' in lowered:
+        return errors.InterfaceError(msg=message, errno=errorcode.CR_SERVER_GONE_ERROR)
+    if 'no such table' in lowered:
+        return errors.ProgrammingError(msg=message, errno=errorcode.ER_NO_SUCH_TABLE)
+    if 'syntax error' in lowered:
+        return errors.ProgrammingError(msg=message, errno=errorcode.ER_PARSE_ERROR)
+    return errors.DatabaseError(msg=message)
+
+
+class StoredProcedure:
+    """Procedimiento de stored_procedures.sql implementado en Python"""
+    
+    def __init__(self, name: str, parameters: Sequence[Tuple[str, str]], body: Callable,
+                 error_result: Tuple[List, Dict[str, Any]], writes: bool = False):
+        """
+        Inicializa el procedimiento
+        
+        Args:
+            name: Nombre del procedimiento en MySQL
+            parameters: Pares (nombre, modo IN/OUT) en el orden de la firma
+            body: Función (conexión sqlite3, parámetros IN por nombre) ->
+                  (result sets como (columnas, filas), parámetros OUT por nombre)
+            error_result: Resultado del manejador EXIT HANDLER FOR SQLEXCEPTION
+            writes: Si el procedimiento modifica datos
+        """
+        self.name = name
+        self.parameters = tuple(parameters)
+        self.body = body
+        self.error_result = error_result
+        self.writes = writes
+    
+    def run(self, db: sqlite3.Connection, inputs: Dict[str, Any],
+            unit_of_work: bool = False) -> Tuple[List, Dict[str, Any]]:
+        """
+        Ejecuta el procedimiento dentro de un savepoint
+        
+        Como el manejador de errores del procedimiento en MySQL, un error SQL
+        deshace solo el trabajo del procedimiento y devuelve error_result;
+        dentro de una unidad de trabajo vuelve a lanzar el error (RESIGNAL)
+        para que el cliente revierta toda la transacción.
+        Fuera de una transacción, los procedimientos de escritura la abren
+        reservando la escritura desde el principio (BEGIN IMMEDIATE).
+        
+        Args:
+            db: Conexión sqlite3
+            inputs: Parámetros de entrada por nombre
+            unit_of_work: Si hay una unidad de trabajo abierta (@ll_unit_of_work)
+        
+        Returns:
+            Tuple: (result sets, parámetros de salida)
+        """
+        if self.writes and not db.in_transaction:
+            db.execute("BEGIN IMMEDIATE")
+        db.execute("SAVEPOINT little_lemon_procedure")
+        try:
+            result = self.body(db, **inputs)
+        except sqlite3.Error as e:
+            db.execute("ROLLBACK TO little_lemon_procedure")
+            db.execute("RELEASE little_lemon_procedure")
+            logger.warning("Error en el procedimiento %s: %s", self.name, e)
+            if unit_of_work:
+                raise
+            return self.error_result
+        db.execute("RELEASE little_lemon_procedure")
+        return result
+
+
+def _fetch_result_set(cursor: sqlite3.Cursor) -> Tuple[Tuple[str, ...], List[tuple]]:
+    """Lee un result set completo como (columnas, filas)"""
+    rows = cursor.fetchall()
+    return tuple(column[0] for column in cursor.description), rows
+
+
+def _get_max_quantity(db: sqlite3.Connection, menu_item_name: str):
+    row = db.execute("""
+        SELECT MAX(quantity)
+        FROM order_details od
+        JOIN menu_items mi ON od.menu_item_id = mi.menu_item_id
+        WHERE mi.item_name = ?
+    """, (menu_item_name,)).fetchone()
+    return [], {'max_quantity': row[0] or 0}
+
+
+def _manage_booking(db: sqlite3.Connection, booking_date, table_number):
+    table = db.execute(
+        "SELECT table_id FROM tables WHERE table_number = ? AND is_available = TRUE",
+        (table_number,)
+    ).fetchone()
+    if table is None:
+        return [], {'booking_status': 'Error: Table not found or not available'}
+    
+    existing_bookings = db.execute("""
+        SELECT COUNT(*) FROM bookings
+        WHERE table_id = ? AND booking_date = ? AND status = 'confirmed'
+    """, (table[0], booking_date)).fetchone()[0]
+    
+    booking_date = to_sql_value(booking_date)
+    if existing_bookings > 0:
+        status = f"Table {table_number} is already booked for {booking_date}"
+    else:
+        status = f"Table {table_number} is available for booking on {booking_date}"
+    return [], {'booking_status': status}
+
+
+def _update_booking(db: sqlite3.Connection, booking_id_param, new_booking_date,
+                    new_booking_time, new_number_of_guests):
+    booking = db.execute(f"""
+        SELECT b.status, b.table_id,
+               b.parent_booking_id IS NOT NULL
+                   OR EXISTS (SELECT 1 FROM bookings c WHERE c.parent_booking_id = b.booking_id),
+               {end_time_sql('?', '?', 't.location')}
+        FROM bookings b
+        JOIN tables t ON b.table_id = t.table_id
+        WHERE b.booking_id = ?
+    """, (new_booking_time, new_number_of_guests, booking_id_param)).fetchone()
+    if booking is None:
+        return [], {'update_status': 'Error: Booking not found'}
+    if booking[0] == 'cancelled':
+        return [], {'update_status': 'Error: Cannot update cancelled booking'}
+    if booking[2]:
+        return [], {'update_status': 'Error: Cannot update combined booking'}
+    
+    _, table_id, _, new_end_time = booking
+    overlapping_bookings = db.execute("""
+        SELECT COUNT(*) FROM bookings
+        WHERE table_id = ? AND booking_date = ? AND booking_time < ? AND end_time > ?
+            AND status = 'confirmed' AND booking_id <> ?
+    """, (table_id, new_booking_date, new_end_time, new_booking_time,
+          booking_id_param)).fetchone()[0]
+    if overlapping_bookings > 0:
+        return [], {'update_status': 'Error: Table already booked for this date and time'}
+    
+    db.execute("""
+        UPDATE bookings
+        SET booking_date = ?, booking_time = ?, end_time = ?, number_of_guests = ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE booking_id = ?
+    """, (new_booking_date, new_booking_time, new_end_time, new_number_of_guests,
+          booking_id_param))
+    return [], {'update_status': f"Booking ID {booking_id_param} updated successfully"}
+
+
+def _add_booking(db: sqlite3.Connection, customer_id_param, table_id_param, booking_date_param,
+                 booking_time_param, number_of_guests_param, special_requests_param):
+    customer = db.execute(
+        "SELECT 1 FROM customers WHERE customer_id = ?", (customer_id_param,)
+    ).fetchone()
+    if customer is None:
+        return [], {'booking_status': 'Error: Customer not found'}
+    
+    table = db.execute(f"""
+        SELECT t.seating_capacity, {end_time_sql('?', '?', 't.location')}
+        FROM tables t
+        WHERE t.table_id = ? AND t.is_available = TRUE
+    """, (booking_time_param, number_of_guests_param, table_id_param)).fetchone()
+    if table is None:
+        return [], {'booking_status': 'Error: Table not found or not available'}
+    if number_of_guests_param is not None and number_of_guests_param > table[0]:
+        return [], {'booking_status': (
+            f"Error: Number of guests ({number_of_guests_param}) "
+            f"exceeds table capacity ({table[0]})"
+        )}
+    
+    booking_end_time = table[1]
+    existing_bookings = db.execute("""
+        SELECT COUNT(*) FROM bookings
+        WHERE table_id = ? AND booking_date = ? AND booking_time < ? AND end_time > ?
+            AND status = 'confirmed'
+    """, (table_id_param, booking_date_param, booking_end_time,
+          booking_time_param)).fetchone()[0]
+    if existing_bookings > 0:
+        return [], {'booking_status': 'Error: Table already booked for this date and time'}
+    
+    cursor = db.execute("""
+        INSERT INTO bookings (
+            customer_id, table_id, booking_date, booking_time, end_time,
+            number_of_guests, special_requests, status
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, 'confirmed')
+    """, (customer_id_param, table_id_param, booking_date_param, booking_time_param,
+          booking_end_time, number_of_guests_param, special_requests_param))
+    return [], {'booking_status': f"Booking confirmed with ID: {cursor.lastrowid}"}
+
+
+def _cancel_booking(db: sqlite3.Connection, booking_id_param):
+    booking = db.execute(
+        "SELECT status, COALESCE(parent_booking_id, booking_id) FROM bookings WHERE booking_id = ?",
+        (booking_id_param,)
+    ).fetchone()
+    if booking is None:
+        return [], {'cancellation_status': 'Error: Booking not found'}
+    if booking[0] == 'cancelled':
+        return [], {'cancellation_status': 'Error: Booking already cancelled'}
+    if booking[0] == 'completed':
+        return [], {'cancellation_status': 'Error: Cannot cancel completed booking'}
+    
+    db.execute("""
+        UPDATE bookings
+        SET status = 'cancelled', updated_at = CURRENT_TIMESTAMP
+        WHERE booking_id = ? OR parent_booking_id = ?
+    """, (booking[1], booking[1]))
+    return [], {'cancellation_status': f"Booking ID {booking_id_param} cancelled successfully"}
+
+
+def _check_booking_availability(db: sqlite3.Connection, check_date, check_time, required_capacity):
+    cursor = db.execute(f"""
+        SELECT
+            t.table_id,
+            t.table_number,
+            t.seating_capacity,
+            t.location,
+            CASE
+                WHEN EXISTS (
+                    SELECT 1
+                    FROM bookings b
+                    WHERE b.table_id = t.table_id
+                        AND b.booking_date = ?
+                        AND b.booking_time < {end_time_sql('?', '?', 't.location')}
+                        AND b.end_time > ?
+                        AND b.status = 'confirmed'
+                ) THEN 'Booked'
+                ELSE 'Available'
+            END AS availability_status
+        FROM tables t
+        WHERE t.is_available = TRUE
+            AND t.seating_capacity >= ?
+        ORDER BY t.table_number
+    """, (check_date, check_time, required_capacity, check_time, required_capacity))
+    return [_fetch_result_set(cursor)], {}
+
+
+def _get_bookings_by_date(db: sqlite3.Connection, search_date):
+    cursor = db.execute("""
+        SELECT
+            b.booking_id,
+            b.booking_date,
+            b.booking_time,
+            b.number_of_guests,
+            b.status,
+            CONCAT(c.first_name, ' ', c.last_name) AS customer_name,
+            c.email AS customer_email,
+            c.phone AS customer_phone,
+            t.table_number,
+            t.seating_capacity,
+            b.special_requests,
+            b.created_at,
+            b.parent_booking_id
+        FROM bookings b
+        JOIN customers c ON b.customer_id = c.customer_id
+        JOIN tables t ON b.table_id = t.table_id
+        WHERE b.booking_date = ?
+        ORDER BY b.booking_time
+    """, (search_date,))
+    return [_fetch_result_set(cursor)], {}
+
+
+def _add_combined_booking(db: sqlite3.Connection, customer_id_param, combination_id_param,
+                          booking_date_param, booking_time_param, number_of_guests_param,
+                          special_requests_param):
+    customer = db.execute(
+        "SELECT 1 FROM customers WHERE customer_id = ?", (customer_id_param,)
+    ).fetchone()
+    if customer is None:
+        return [], {'booking_status': 'Error: Customer not found'}
+    
+    tables = db.execute(f"""
+        SELECT c.seating_capacity, t.table_id, t.is_available,
+               {end_time_sql('?', '?', 't.location')}
+        FROM table_combinations c
+        JOIN table_combination_members m ON m.combination_id = c.combination_id
+        JOIN tables t ON t.table_id = m.table_id
+        WHERE c.combination_id = ? AND c.is_available = TRUE
+        ORDER BY t.table_number
+    """, (booking_time_param, number_of_guests_param, combination_id_param)).fetchall()
+    if not tables or not all(table[2] for table in tables):
+        return [], {'booking_status': 'Error: Table combination not found or not available'}
+    capacity, main_table_id, _, booking_end_time = tables[0]
+    if number_of_guests_param is not None and number_of_guests_param > capacity:
+        return [], {'booking_status': (
+            f"Error: Number of guests ({number_of_guests_param}) "
+            f"exceeds combination capacity ({capacity})"
+        )}
+    
+    existing_bookings = db.execute("""
+        SELECT COUNT(*)
+        FROM table_combination_members m
+        JOIN bookings b ON b.table_id = m.table_id
+        WHERE m.combination_id = ? AND b.booking_date = ? AND b.booking_time < ?
+            AND b.end_time > ? AND b.status = 'confirmed'
+    """, (combination_id_param, booking_date_param, booking_end_time,
+          booking_time_param)).fetchone()[0]
+    if existing_bookings > 0:
+        return [], {'booking_status': 'Error: Table already booked for this date and time'}
+    
+    cursor = db.execute("""
+        INSERT INTO bookings (
+            customer_id, table_id, booking_date, booking_time, end_time,
+            number_of_guests, special_requests, status
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, 'confirmed')
+    """, (customer_id_param, main_table_id, booking_date_param, booking_time_param,
+          booking_end_time, number_of_guests_param, special_requests_param))
+    db.execute("""
+        INSERT INTO bookings (
+            customer_id, table_id, booking_date, booking_time, end_time,
+            number_of_guests, status, parent_booking_id
+        )
+        SELECT ?, m.table_id, ?, ?, ?, 0, 'confirmed', ?
+        FROM table_combination_members m
+        WHERE m.combination_id = ? AND m.table_id <> ?
+    """, (customer_id_param, booking_date_param, booking_time_param, booking_end_time,
+          cursor.lastrowid, combination_id_param, main_table_id))
+    return [], {'booking_status': f"Booking confirmed with ID: {cursor.lastrowid}"}
+
+
+# Los procedimientos de consulta devuelven este result set si fallan
+QUERY_FAILED_RESULT = ([(('status',), [('Error: Query failed',)])], {})
+
+PROCEDURES = {
+    procedure.name.lower(): procedure
+    for procedure in (
+        StoredProcedure(
+            "GetMaxQuantity",
+            [("menu_item_name", "IN"), ("max_quantity", "OUT")],
+            _get_max_quantity, ([], {'max_quantity': 0})
+        ),
+        StoredProcedure(
+            "ManageBooking",
+            [("booking_date", "IN"), ("table_number", "IN"), ("booking_status", "OUT")],
+            _manage_booking, ([], {'booking_status': 'Error: Transaction failed'})
+        ),
+        StoredProcedure(
+            "UpdateBooking",
+            [("booking_id_param", "IN"), ("new_booking_date", "IN"), ("new_booking_time", "IN"),
+             ("new_number_of_guests", "IN"), ("update_status", "OUT")],
+            _update_booking, ([], {'update_status': 'Error: Update failed'}), writes=True
+        ),
+        StoredProcedure(
+            "AddBooking",
+            [("customer_id_param", "IN"), ("table_id_param", "IN"), ("booking_date_param", "IN"),
+             ("booking_time_param", "IN"), ("number_of_guests_param", "IN"),
+             ("special_requests_param", "IN"), ("booking_status", "OUT")],
+            _add_booking, ([], {'booking_status': 'Error: Booking creation failed'}), writes=True
+        ),
+        StoredProcedure(
+            "CancelBooking",
+            [("booking_id_param", "IN"), ("cancellation_status", "OUT")],
+            _cancel_booking, ([], {'cancellation_status': 'Error: Cancellation failed'}),
+            writes=True
+        ),
+        StoredProcedure(
+            "CheckBookingAvailability",
+            [("check_date", "IN"), ("check_time", "IN"), ("required_capacity", "IN")],
+            _check_booking_availability, QUERY_FAILED_RESULT
+        ),
+        StoredProcedure(
+            "GetBookingsByDate",
+            [("search_date", "IN")],
+            _get_bookings_by_date, QUERY_FAILED_RESULT
+        ),
+        StoredProcedure(
+            "AddCombinedBooking",
+            [("customer_id_param", "IN"), ("combination_id_param", "IN"),
+             ("booking_date_param", "IN"), ("booking_time_param", "IN"),
+             ("number_of_guests_param", "IN"), ("special_requests_param", "IN"),
+             ("booking_status", "OUT")],
+            _add_combined_booking, ([], {'booking_status': 'Error: Booking creation failed'}),
+            writes=True
+        )
+    )
+}
+
+# Filas de information_schema.PARAMETERS para la carga de firmas de LittleLemonConnection
+PARAMETER_ROWS = [
+    (DATABASE_NAME, procedure.name, "PROCEDURE", position, name, mode)
+    for procedure in PROCEDURES.values()
+    for position, (name, mode) in enumerate(procedure.parameters, start=1)
+]
+
+
+class SQLiteCursor:
+    """Cursor con la API de mysql.connector sobre una conexión SQLite"""
+    
+    def __init__(self, connection: "SQLiteConnection", dictionary: bool = False):
+        """
+        Inicializa el cursor
+        
+        Args:
+            connection: Conexión a la que pertenece
+            dictionary: Si las filas se entregan como diccionarios
+        """
+        self._connection = connection
+        self._dictionary = dictionary
+        self._rows = iter(())
+        self.column_names = ()
+        self.with_rows = False
+        self.rowcount = -1
+        self.lastrowid = None
+    
+    def execute(self, operation: str, params: Sequence[Any] = (), multi: bool = False):
+        """
+        Ejecuta una sentencia, o varias con multi=True
+        
+        Args:
+            operation: Sentencia con marcadores %s
+            params: Valores de los marcadores
+            multi: Si la operación contiene varias sentencias
+        
+        Returns:
+            Con multi=True, iterador que entrega este cursor por cada resultado
+        """
+        statements = split_statements(operation)
+        if multi:
+            return self._execute_multi(statements, list(params or ()))
+        if len(statements) > 1:
+            raise errors.InterfaceError("Use multi=True when executing multiple statements")
+        
+        results = self._run(statements[0], list(params or ())) if statements else [EMPTY_RESULT]
+        self._load(results[0])
+        return None
+    
+    def _execute_multi(self, statements: List[str], params: List[Any]) -> Iterator["SQLiteCursor"]:
+        """Ejecuta las sentencias en orden, repartiendo los parámetros entre ellas"""
+        for statement in statements:
+            count = count_markers(statement)
+            values, params = params[:count], params[count:]
+            for result in self._run(statement, values):
+                self._load(result)
+                yield self
+    
+    def _run(self, statement: str, params: List[Any]) -> List[tuple]:
+        """Ejecuta una sentencia traduciendo los errores de SQLite"""
+        try:
+            return self._connection.run_statement(statement, params)
+        except sqlite3.Error as e:
+            raise translate_error(e) from e
+    
+    def _load(self, result: tuple):
+        """Deja un resultado (columnas, filas, filas afectadas, último id) listo para leer"""
+        columns, rows, self.rowcount, self.lastrowid = result
+        self.with_rows = columns is not None
+        self.column_names = columns or ()
+        self._rows = iter(rows)
+    
+    def _format(self, rows: List[tuple]) -> List[Any]:
+        """Convierte las filas en diccionarios si el cursor es de diccionarios"""
+        if self._dictionary:
+            return [dict(zip(self.column_names, row)) for row in rows]
+        return rows
+    
+    def fetchmany(self, size: int = 1) -> List[Any]:
+        try:
+            return self._format(list(itertools.islice(self._rows, size)))
+        except sqlite3.Error as e:
+            raise translate_error(e) from e
+    
+    def fetchall(self) -> List[Any]:
+        try:
+            return self._format(list(self._rows))
+        except sqlite3.Error as e:
+            raise translate_error(e) from e
+    
+    def fetchone(self) -> Optional[Any]:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+    
+    def close(self):
+        self._rows = iter(())
+
+
+class SQLiteConnection:
+    """
+    Conexión SQLite con la parte de la API de mysql.connector que usa la
+    librería: cursores, transacciones, variables de sesión y CALL
+    """
+    
+    def __init__(self, db: sqlite3.Connection):
+        """
+        Inicializa la conexión
+        
+        Args:
+            db: Conexión sqlite3 ya preparada (ver SQLiteBackend.open)
+        """
+        self._db = db
+        self._variables = {}
+        self.unread_result = False
+    
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Conexión sqlite3; falla como una conexión perdida si ya se cerró"""
+        if self._db is None:
+            raise errors.InterfaceError(msg="Conexión SQLite cerrada",
+                                        errno=errorcode.CR_SERVER_GONE_ERROR)
+        return self._db
+    
+    @property
+    def in_transaction(self) -> bool:
+        return self.db.in_transaction
+    
+    def cursor(self, dictionary: bool = False, buffered: Optional[bool] = None,
+               prepared: bool = False) -> SQLiteCursor:
+        """
+        Crea un cursor; SQLite cachea por sí mismo las sentencias preparadas
+        
+        Args:
+            dictionary: Si las filas se entregan como diccionarios
+            buffered: Ignorado: las filas se leen a medida que se consumen
+            prepared: Ignorado (ver arriba)
+        """
+        self.db
+        return SQLiteCursor(self, dictionary)
+    
+    def _call(self, operation: Callable[[], Any]) -> Any:
+        """Ejecuta una operación de la conexión traduciendo los errores de SQLite"""
+        try:
+            return operation()
+        except sqlite3.Error as e:
+            raise translate_error(e) from e
+    
+    def start_transaction(self, readonly: bool = False, **kwargs):
+        """Abre una transacción; si va a escribir reserva la escritura desde el principio"""
+        self._call(lambda: self.db.execute("BEGIN" if readonly else "BEGIN IMMEDIATE"))
+    
+    def commit(self):
+        self._call(lambda: self.db.commit())
+    
+    def rollback(self):
+        self._call(lambda: self.db.rollback())
+    
+    def consume_results(self):
+        """Las filas no leídas no bloquean la conexión en SQLite"""
+    
+    def reset_session(self, user_variables: Optional[Dict[str, Any]] = None,
+                      session_variables: Optional[Dict[str, Any]] = None):
+        """Deshace la transacción pendiente y reinicia las variables de sesión"""
+        self.rollback()
+        self._variables = dict(user_variables or {})
+        self._set_busy_timeout(DEFAULT_BUSY_TIMEOUT)
+    
+    def ping(self, reconnect: bool = False, attempts: int = 1, delay: int = 0):
+        """Comprueba que la conexión sigue abierta"""
+        self._call(lambda: self.db.execute("SELECT 1").fetchone())
+    
+    def is_connected(self) -> bool:
+        return self._db is not None
+    
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def _set_busy_timeout(self, seconds: float):
+        """Ajusta la espera por bloqueos de la conexión"""
+        self.db.execute(f"PRAGMA busy_timeout = {int(seconds * 1000)}")
+    
+    def run_statement(self, statement: str, params: List[Any]) -> List[tuple]:
+        """
+        Ejecuta una sentencia de MySQL sobre SQLite
+        
+        Args:
+            statement: Sentencia sin ';' con marcadores %s
+            params: Valores de los marcadores
+        
+        Returns:
+            List[tuple]: Resultados como (columnas, filas, filas afectadas, último id);
+                         columnas es None si la sentencia no devuelve filas
+        """
+        keyword = statement.split(None, 1)[0].upper()
+        if keyword == 'SET':
+            self._set(statement[3:], params)
+            return [EMPTY_RESULT]
+        if keyword == 'CALL':
+            return self._call_procedure(statement, params)
+        return [self._query(statement, params)]
+    
+    def _set(self, assignments: str, params: List[Any]):
+        """
+        Ejecuta un SET: variables de sesión (@variable) o esperas de bloqueos
+        
+        Las demás variables del servidor no tienen equivalente y se ignoran.
+        """
+        names = [name.lower() for name in SET_VARIABLE_PATTERN.findall(assignments)]
+        if names:
+            query, values = bind_statement(
+                "SELECT " + SET_VARIABLE_PATTERN.sub('', assignments), params, self._variables
+            )
+            self._variables.update(zip(names, self.db.execute(query, values).fetchone()))
+            return
+        
+        lock_wait = LOCK_WAIT_PATTERN.search(assignments)
+        if lock_wait:
+            value = lock_wait.group(1)
+            self._set_busy_timeout(DEFAULT_BUSY_TIMEOUT if value.upper() == 'DEFAULT' else int(value))
+    
+    def _query(self, statement: str, params: List[Any]) -> tuple:
+        """Ejecuta una sentencia SQL corriente"""
+        for pattern, replacement in QUERY_REPLACEMENTS:
+            statement = pattern.sub(replacement, statement)
+        query, values = bind_statement(statement, params, self._variables)
+        db = self.db
+        cursor = db.cursor()
+        
+        # MAX_EXECUTION_TIME se aplica interrumpiendo la consulta desde el
+        # manejador de progreso; sus filas se leen antes de retirarlo
+        hint = MAX_EXECUTION_TIME_PATTERN.search(query)
+        if hint is None:
+            cursor.execute(query, values)
+            rows = cursor
+        else:
+            limit = time.monotonic() + int(hint.group(1)) / 1000
+            db.set_progress_handler(lambda: time.monotonic() > limit, PROGRESS_HANDLER_STEPS)
+            try:
+                cursor.execute(query, values)
+                rows = cursor.fetchall()
+            finally:
+                db.set_progress_handler(None, 0)
+        
+        columns = tuple(column[0] for column in cursor.description) if cursor.description else None
+        return columns, rows, cursor.rowcount, cursor.lastrowid
+    
+    def _call_procedure(self, statement: str, params: List[Any]) -> List[tuple]:
+        """
+        Ejecuta un CALL con la implementación en Python del procedimiento
+        
+        Los argumentos %s son de entrada; los @variable de los parámetros OUT
+        reciben el valor de salida en las variables de sesión.
+        """
+        match = CALL_PATTERN.match(statement)
+        procedure = PROCEDURES.get(match.group(1).lower()) if match else None
+        if procedure is None:
+            raise errors.ProgrammingError(
+                msg=f"PROCEDURE {DATABASE_NAME}.{match.group(1) if match else statement} does not exist",
+                errno=errorcode.ER_SP_DOES_NOT_EXIST
+            )
+        
+        arguments = split_arguments(match.group(2))
+        if len(arguments) != len(procedure.parameters):
+            raise errors.ProgrammingError(
+                msg=f"Incorrect number of arguments for PROCEDURE {DATABASE_NAME}.{procedure.name}; "
+                    f"expected {len(procedure.parameters)}, got {len(arguments)}",
+                errno=errorcode.ER_SP_WRONG_NO_OF_ARGS
+            )
+        
+        remaining = iter(params)
+        inputs = {}
+        outputs = {}
+        for (name, mode), argument in zip(procedure.parameters, arguments):
+            if mode == 'OUT':
+                if argument.startswith('@'):
+                    outputs[name] = argument[1:].lower()
+                continue
+            if argument == '%s':
+                inputs[name] = next(remaining)
+            elif argument.startswith('@'):
+                inputs[name] = self._variables.get(argument[1:].lower())
+            else:
+                inputs[name] = self.db.execute("SELECT " + argument).fetchone()[0]
+        
+        unit_of_work = self._variables.get('ll_unit_of_work') is not None
+        result_sets, out_values = procedure.run(self.db, inputs, unit_of_work)
+        for name, variable in outputs.items():
+            self._variables[variable] = out_values.get(name)
+        
+        # Como en MySQL, el CALL termina con un resultado sin filas
+        return [
+            (columns, rows, len(rows), None) for columns, rows in result_sets
+        ] + [EMPTY_RESULT]
+
+
+class SQLiteBackend:
+    """Base de datos SQLite embebida con el esquema y los procedimientos de Little Lemon"""
+    
+    def __init__(self, database: Optional[str] = None, sample_data: bool = True):
+        """
+        Inicializa la base de datos, creando el esquema si no existe
+        
+        Args:
+            database: Archivo de la base de datos (None = archivo temporal que
+                      se borra al cerrar el backend)
+            sample_data: Si carga sample_data.sql al crear el esquema
+        """
+        self.temporary = database is None
+        if self.temporary:
+            descriptor, database = tempfile.mkstemp(prefix="little_lemon_", suffix=".sqlite3")
+            os.close(descriptor)
+        self.database = database
+        self._pid = os.getpid()
+        
+        try:
+            self._initialize(sample_data)
+        except sqlite3.Error as e:
+            self.close()
+            raise translate_error(e) from e
+    
+    def open(self) -> sqlite3.Connection:
+        """
+        Abre una conexión sqlite3 con las funciones de MySQL que usan las consultas
+        
+        Returns:
+            sqlite3.Connection: Conexión lista para usar desde cualquier hilo
+        """
+        db = sqlite3.connect(self.database, timeout=DEFAULT_BUSY_TIMEOUT,
+                             detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+        db.execute("PRAGMA foreign_keys = ON")
+        db.create_function("CONCAT", -1, _concat, deterministic=True)
+        db.create_function("ADDTIME", 2, _addtime, deterministic=True)
+        db.create_function("SEC_TO_TIME", 1, _sec_to_time, deterministic=True)
+        db.create_function("DATABASE", 0, lambda: DATABASE_NAME)
+        
+        # Firmas de los procedimientos para PROCEDURE_SIGNATURES_QUERY
+        db.execute("ATTACH DATABASE ':memory:' AS information_schema")
+        db.execute("""
+            CREATE TABLE information_schema.PARAMETERS (
+                SPECIFIC_SCHEMA TEXT, SPECIFIC_NAME TEXT, ROUTINE_TYPE TEXT,
+                ORDINAL_POSITION INTEGER, PARAMETER_NAME TEXT, PARAMETER_MODE TEXT
+            )
+        """)
+        db.executemany("INSERT INTO information_schema.PARAMETERS VALUES (?, ?, ?, ?, ?, ?)",
+                       PARAMETER_ROWS)
+        db.commit()
+        return db
+    
+    def connect(self) -> SQLiteConnection:
+        """
+        Abre una conexión nueva; es la fábrica de conexiones del pool
+        
+        Returns:
+            SQLiteConnection: Conexión con la API de mysql.connector
+        """
+        try:
+            return SQLiteConnection(self.open())
+        except sqlite3.Error as e:
+            raise translate_error(e) from e
+    
+    def _initialize(self, sample_data: bool):
+        """Crea el esquema y los datos de ejemplo si la base de datos está vacía"""
+        db = self.open()
+        try:
+            # WAL permite leer mientras otra conexión escribe
+            db.execute("PRAGMA journal_mode = WAL")
+            if db.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'bookings'"
+            ).fetchone()[0]:
+                return
+            
+            with open(SCHEMA_FILE, encoding='utf-8') as schema_file:
+                statements = translate_schema(schema_file.read())
+            if sample_data:
+                with open(SAMPLE_DATA_FILE, encoding='utf-8') as data_file:
+                    statements.extend(
+                        statement for statement in split_statements(data_file.read())
+                        if not SKIPPED_STATEMENT_PATTERN.match(statement)
+                    )
+            
+            db.execute("BEGIN")
+            for statement in statements:
+                db.execute(statement)
+            db.commit()
+            logger.info("Base de datos SQLite creada en %s (%s sentencias)",
+                        self.database, len(statements))
+        finally:
+            db.close()
+    
+    def close(self):
+        """Borra la base de datos si es temporal (solo en el proceso que la creó)"""
+        if not self.temporary or os.getpid() != self._pid:
+            return
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.database + suffix)
+            except FileNotFoundError:
+                pass
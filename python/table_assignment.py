@@ -0,0 +1,312 @@
+"""
+Little Lemon Table Assignment Module
+Database Engineer Capstone Project
+Fecha: 10 de Julio, 2025
+
+Asignación automática de mesas. Para cada reserva se elige la mesa libre más
+pequeña que admite el grupo (best fit), preferiblemente en la ubicación
+pedida; la búsqueda usa los bits de mesas e intervalos ocupados del índice
+de disponibilidad, así que cuesta lo mismo que una comprobación de
+disponibilidad.
+
+Los grupos que no caben en ninguna mesa se sientan en la combinación de
+mesas libre más barata (la de menos asientos y, a igualdad, menos mesas).
+
+El reequilibrio de un día vuelve a repartir las reservas confirmadas que aún
+no han empezado entre las mesas para sentar más comensales (por ejemplo, a
+los grupos en lista de espera) o, con los mismos comensales, desperdiciar
+menos asientos. Las reservas combinadas no se mueven.
+"""
+
+import sys
+import os
+import bisect
+from datetime import time as time_of_day, timedelta
+from typing import Optional, Dict, Any, Sequence, Tuple
+
+# Agregar el directorio actual al path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from availability_index import DateSlots, TableLayout, location_matches, slot_key
+
+# Reservas confirmadas de una fecha, con lo necesario para volver a sentarlas
+DAY_BOOKINGS_QUERY = """
+SELECT booking_id, table_id, booking_time, end_time, number_of_guests, parent_booking_id
+FROM bookings
+WHERE booking_date = %s AND status = 'confirmed'
+ORDER BY booking_time, booking_id
+"""
+
+# La misma lectura bloqueando las reservas hasta guardar el nuevo reparto
+DAY_BOOKINGS_LOCK_QUERY = DAY_BOOKINGS_QUERY.rstrip() + "\nFOR UPDATE\n"
+
+# Cambio de mesa de una reserva; la hora de fin depende de la ubicación de la mesa
+REASSIGN_TABLE_QUERY = """
+UPDATE bookings
+SET table_id = %s,
+    end_time = %s,
+    updated_at = CURRENT_TIMESTAMP
+WHERE booking_id = %s AND status = 'confirmed'
+"""
+
+
+def preferred_mask(layout: TableLayout, preferred_location: Optional[str]) -> int:
+    """Bits de las mesas en la ubicación pedida (ninguna si es None)"""
+    return layout.location_mask(preferred_location) if preferred_location is not None else 0
+
+
+def best_fit_position(entry: DateSlots, start: int, party_size: int,
+                      preferred_location: Optional[str] = None,
+                      strict: bool = False) -> Optional[int]:
+    """
+    Elige la mesa libre más pequeña que admite un grupo
+    
+    A igual capacidad se elige la de menor número. Con una ubicación pedida
+    se elige entre las mesas libres de esa ubicación y, si no queda ninguna,
+    entre las demás (salvo con strict).
+    
+    Args:
+        entry: Reservas de la fecha
+        start: Hora de inicio en segundos desde medianoche
+        party_size: Tamaño del grupo
+        preferred_location: Ubicación pedida (None = cualquiera)
+        strict: No ofrecer mesas de otra ubicación
+    
+    Returns:
+        int: Posición de la mesa en entry.layout, o None si no hay mesa libre
+    """
+    layout = entry.layout
+    fitting = layout.fitting_mask(party_size)
+    free = fitting & ~entry.booked_mask(start, layout.seconds_seated(party_size), fitting)
+    if preferred_location is not None:
+        preferred = free & preferred_mask(layout, preferred_location)
+        if preferred or strict:
+            free = preferred
+    if not free:
+        return None
+    return (free & -free).bit_length() - 1
+
+
+def table_row(layout: TableLayout, position: int) -> Dict[str, Any]:
+    """Mesa de una posición con el formato de CheckBookingAvailability"""
+    return dict(zip(('table_id', 'table_number', 'seating_capacity', 'location'),
+                    layout.tables[position]))
+
+
+def cheapest_combination(entry: DateSlots, start: int, party_size: int,
+                         preferred_location: Optional[str] = None,
+                         strict: bool = False) -> Optional[int]:
+    """
+    Elige la combinación de mesas libre más barata que admite un grupo
+    
+    Las combinaciones están ordenadas por capacidad y número de mesas, así
+    que la primera libre con capacidad suficiente es la más barata; una
+    búsqueda binaria salta las pequeñas. Con una ubicación pedida gana la
+    primera libre de esa ubicación y, si no hay ninguna, la primera de las
+    demás (salvo con strict).
+    
+    Args:
+        entry: Reservas de la fecha
+        start: Hora de inicio en segundos desde medianoche
+        party_size: Tamaño del grupo
+        preferred_location: Ubicación pedida (None = cualquiera)
+        strict: No ofrecer combinaciones de otra ubicación
+    
+    Returns:
+        int: Índice de la combinación en entry.layout.combinations, o None
+             si no hay ninguna libre
+    """
+    layout = entry.layout
+    fallback = None
+    first = bisect.bisect_left(layout.combination_capacities, party_size)
+    for index in range(first, len(layout.combinations)):
+        location, positions = layout.combinations[index][3:]
+        preferred = preferred_location is None or location_matches(location, preferred_location)
+        if not preferred and (strict or fallback is not None):
+            continue
+        
+        # Todas las mesas ocupan el intervalo de la mesa principal
+        end = start + layout.durations.minutes(party_size, location) * 60
+        if any(position in entry.tables and entry.tables[position].overlaps(start, end)
+               for position in positions):
+            continue
+        if preferred:
+            return index
+        fallback = index
+    return fallback
+
+
+def combination_row(layout: TableLayout, index: int) -> Dict[str, Any]:
+    """Combinación con sus mesas (la principal primero)"""
+    combination_id, combination_name, seating_capacity, location, positions = \
+        layout.combinations[index]
+    return {
+        'combination_id': combination_id,
+        'combination_name': combination_name,
+        'seating_capacity': seating_capacity,
+        'location': location,
+        'tables': [table_row(layout, position) for position in positions]
+    }
+
+
+def _seat(plan: DateSlots, key: Any, start: int, party_size: int,
+          preferred_location: Optional[str]) -> Optional[int]:
+    """Sienta un grupo en la mejor mesa libre del plan; devuelve su posición"""
+    position = best_fit_position(plan, start, party_size, preferred_location)
+    if position is not None:
+        layout = plan.layout
+        plan.add(key, layout.tables[position][0], start,
+                 start + layout.seconds_seated(party_size)[position])
+    return position
+
+
+def _build_plan(layout: TableLayout, fixed: Sequence[Dict[str, Any]],
+                movable: Sequence[Dict[str, Any]], requests: Sequence[Dict[str, Any]],
+                rebalance: bool, together: bool) -> Optional[Tuple[DateSlots, Dict, Dict]]:
+    """
+    Construye un reparto de las reservas y de los grupos en espera
+    
+    Los grupos se sientan de mayor a menor (tienen menos mesas posibles) y, a
+    igual tamaño, por hora. Cada reserva existente prefiere la ubicación de
+    su mesa actual.
+    
+    Args:
+        layout: Distribución de mesas
+        fixed: Reservas que no se mueven
+        movable: Reservas que pueden cambiar de mesa
+        requests: Grupos en espera
+        rebalance: Volver a sentar las reservas movibles (si no, se quedan en su mesa)
+        together: Sentar reservas y grupos en espera en un solo orden (si
+                  no, primero las reservas)
+    
+    Returns:
+        Tuple: (plan, posición por booking_id, posición por índice de grupo), o
+               None si alguna reserva existente se queda sin mesa
+    """
+    plan = DateSlots(layout)
+    for booking in fixed:
+        plan.add(booking['booking_id'], booking['table_id'],
+                 slot_key(booking['booking_time']), slot_key(booking['end_time']))
+    
+    bookings = {}
+    seated = {}
+    pending = [(request['number_of_guests'], slot_key(request['booking_time']), 1, index)
+               for index, request in enumerate(requests)]
+    
+    if rebalance:
+        existing = [(booking['number_of_guests'], slot_key(booking['booking_time']), 0, index)
+                    for index, booking in enumerate(movable)]
+        queues = [existing + pending] if together else [existing, pending]
+    else:
+        for booking in movable:
+            plan.add(booking['booking_id'], booking['table_id'],
+                     slot_key(booking['booking_time']), slot_key(booking['end_time']))
+            bookings[booking['booking_id']] = layout.positions[booking['table_id']]
+        queues = [pending]
+    
+    for queue in queues:
+        for party_size, start, kind, index in sorted(queue, key=lambda item: (-item[0], item[1:])):
+            if kind == 0:
+                booking = movable[index]
+                current_location = layout.tables[layout.positions[booking['table_id']]][3]
+                position = _seat(plan, booking['booking_id'], start, party_size, current_location)
+                if position is None:
+                    return None
+                bookings[booking['booking_id']] = position
+            else:
+                position = _seat(plan, ('request', index), start, party_size,
+                                 requests[index].get('preferred_location'))
+                if position is not None:
+                    seated[index] = position
+    return plan, bookings, seated
+
+
+def plan_rebalance(layout: TableLayout, day_bookings: Sequence[Dict[str, Any]],
+                   requests: Sequence[Dict[str, Any]] = (),
+                   fixed_before: Optional[time_of_day] = None) -> Dict[str, Any]:
+    """
+    Calcula el reparto de mesas de un día que sienta más comensales
+    
+    Se comparan el reparto actual (con los grupos en espera en los huecos) y
+    dos repartos nuevos; gana el que sienta más comensales y, a igualdad, el
+    que desperdicia menos asientos. Ante un empate se mantiene el actual.
+    Todas las reservas existentes conservan una mesa, y las combinadas, sus
+    mesas. Los grupos en espera solo se sientan en mesas sueltas.
+    
+    Args:
+        layout: Distribución de mesas (y reglas de duración)
+        day_bookings: Reservas confirmadas del día (filas de DAY_BOOKINGS_QUERY)
+        requests: Grupos en espera con booking_time, number_of_guests y,
+                  opcionalmente, preferred_location
+        fixed_before: Las reservas que empiezan antes de esta hora no se mueven
+    
+    Returns:
+        Dict: moves (booking_id, from_table_id, table_id, table_number,
+              end_time), seated_requests (request, mesa), unseated_requests
+              (índices), covers (comensales sentados), wasted_seats (asientos
+              vacíos en las mesas de las reservas movibles y de los grupos
+              sentados) y los mismos valores del reparto actual como
+              baseline_covers y baseline_wasted_seats
+    """
+    fixed_until = slot_key(fixed_before) if fixed_before is not None else None
+    combined = {booking['parent_booking_id'] for booking in day_bookings
+                if booking['parent_booking_id'] is not None}
+    fixed, movable = [], []
+    for booking in day_bookings:
+        if (booking['table_id'] not in layout.positions
+                or booking['parent_booking_id'] is not None
+                or booking['booking_id'] in combined
+                or (fixed_until is not None and slot_key(booking['booking_time']) < fixed_until)):
+            fixed.append(booking)
+        else:
+            movable.append(booking)
+    
+    movable_guests = {booking['booking_id']: booking['number_of_guests'] for booking in movable}
+    
+    def score(result) -> Tuple[int, int]:
+        _, bookings, seated = result
+        seats = [(movable_guests[booking_id], position) for booking_id, position in bookings.items()]
+        seats += [(requests[index]['number_of_guests'], position) for index, position in seated.items()]
+        covers = sum(guests for guests, _ in seats)
+        wasted = sum(layout.tables[position][2] - guests for guests, position in seats)
+        return covers, wasted
+    
+    baseline = _build_plan(layout, fixed, movable, requests, rebalance=False, together=False)
+    best, best_score = baseline, score(baseline)
+    for together in (False, True):
+        candidate = _build_plan(layout, fixed, movable, requests, rebalance=True, together=together)
+        if candidate is None:
+            continue
+        candidate_score = score(candidate)
+        if (candidate_score[0], -candidate_score[1]) > (best_score[0], -best_score[1]):
+            best, best_score = candidate, candidate_score
+    
+    plan, bookings, seated = best
+    moves = []
+    for booking in movable:
+        position = bookings[booking['booking_id']]
+        table_id = layout.tables[position][0]
+        if table_id != booking['table_id']:
+            end = plan.bookings[booking['booking_id']][2]
+            moves.append({
+                'booking_id': booking['booking_id'],
+                'from_table_id': booking['table_id'],
+                'table_id': table_id,
+                'table_number': layout.tables[position][1],
+                'end_time': timedelta(seconds=end)
+            })
+    
+    fixed_covers = sum(booking['number_of_guests'] for booking in fixed)
+    baseline_score = score(baseline)
+    return {
+        'moves': moves,
+        'seated_requests': [
+            dict(table_row(layout, position), request=requests[index])
+            for index, position in sorted(seated.items())
+        ],
+        'unseated_requests': [index for index in range(len(requests)) if index not in seated],
+        'covers': fixed_covers + best_score[0],
+        'wasted_seats': best_score[1],
+        'baseline_covers': fixed_covers + baseline_score[0],
+        'baseline_wasted_seats': baseline_score[1]
+    }